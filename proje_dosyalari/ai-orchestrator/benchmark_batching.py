@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Micro-batching benchmark for AI Orchestrator.
+
+Simulates a backend whose calls have a fixed per-call overhead plus a small
+per-item cost (the shape of a batched forward pass, as in the LLM
+integration's batched calls) and compares running concurrent requests one
+call each against coalescing them with MicroBatcher.
+
+Usage:
+    python benchmark_batching.py --requests 512 --concurrency 64 --overhead-ms 5
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, List
+
+from src.core.batching import MicroBatcher
+
+
+async def run_benchmark(args: argparse.Namespace, batched: bool) -> float:
+    """
+    Run one benchmark pass.
+
+    Args:
+        args: Command-line arguments
+        batched: Coalesce requests with MicroBatcher
+
+    Returns:
+        Wall time in seconds
+    """
+    async def backend(items: List[Any]) -> List[Any]:
+        await asyncio.sleep((args.overhead_ms + args.item_ms * len(items)) / 1000)
+        return list(items)
+
+    async def process_batch(key: str, items: List[Any]) -> List[Any]:
+        return await backend(items)
+
+    batcher = MicroBatcher(process_batch, max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def request(i: int) -> Any:
+        async with semaphore:
+            if batched:
+                return await batcher.submit(f"model-{i % args.models}", i)
+            # Unbatched: one backend call per request, serialized per model like a single model instance
+            async with model_locks[i % args.models]:
+                return (await backend([i]))[0]
+
+    model_locks = [asyncio.Lock() for _ in range(args.models)]
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*(request(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - start_time
+    assert results == list(range(args.requests))
+
+    if batched:
+        stats = batcher.get_stats()
+        print(f"  batches={stats['batches']} avg_batch_size={stats['avg_batch_size']:.1f} "
+              f"queue_wait_mean={stats['queue_wait_ms_histogram']['mean']:.1f} ms")
+    await batcher.close()
+    return elapsed
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark inference micro-batching")
+    parser.add_argument("--requests", type=int, default=512)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--models", type=int, default=2)
+    parser.add_argument("--overhead-ms", type=float, default=5.0, help="Fixed cost per backend call")
+    parser.add_argument("--item-ms", type=float, default=0.2, help="Additional cost per item in a call")
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    unbatched = asyncio.run(run_benchmark(args, batched=False))
+    print(f"unbatched: {unbatched:.2f} s ({args.requests / unbatched:,.0f} req/s)")
+    batched = asyncio.run(run_benchmark(args, batched=True))
+    print(f"batched:   {batched:.2f} s ({args.requests / batched:,.0f} req/s, {unbatched / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Computer vision executor benchmark for AI Orchestrator.
+
+Sends concurrent image processing requests (decode, enhance, JPEG+base64
+encode) through the Computer Vision Service while a probe coroutine measures
+event-loop lag, and reports images/sec. "inline" runs the same pipeline
+directly in the coroutine, as the service did before the executor layer.
+With --yolo-cfg/--yolo-weights it also compares per-image detection with
+detect_objects_batch.
+
+Usage:
+    python benchmark_computer_vision.py --requests 64 --concurrency 8 --width 1920 --height 1080
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+import cv2
+import numpy as np
+
+from src.services.computer_vision import ComputerVisionService
+from src.services.cv_executor import process_frame_task
+
+
+async def probe_lag(stop: asyncio.Event, interval: float, lags: List[float]) -> None:
+    """Measure how late the event loop wakes up a sleeping coroutine."""
+    while not stop.is_set():
+        start_time = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start_time - interval)
+
+
+async def run_mode(args: argparse.Namespace, mode: str, frames: List[bytes]) -> None:
+    """Run the image processing workload in one mode and print the results."""
+    service = ComputerVisionService({
+        "executor": {"mode": "thread" if mode == "inline" else mode, "max_workers": args.workers},
+        "image_processing": {"default_resize": (800, 600), "cache_enabled": False}
+    })
+    parameters = {"brightness": 1.2, "contrast": 1.1, "sharpness": 1.0}
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def request(frame: bytes) -> None:
+        async with semaphore:
+            if mode == "inline":
+                process_frame_task([frame], "enhance", parameters, (800, 600))
+                await asyncio.sleep(0)
+            else:
+                result = await service.process_image(frame, "enhance", parameters)
+                assert result["success"], result.get("error")
+
+    # Warm up the worker processes
+    await asyncio.gather(*(request(frame) for frame in frames[:args.workers]))
+
+    lags: List[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_lag(stop, 0.005, lags))
+    start_time = time.perf_counter()
+    await asyncio.gather(*(request(frames[i % len(frames)]) for i in range(args.requests)))
+    elapsed = time.perf_counter() - start_time
+    stop.set()
+    await probe
+    service.close()
+
+    lags.sort()
+    p99 = lags[min(len(lags) - 1, int(0.99 * len(lags)))] if lags else 0.0
+    max_lag = lags[-1] if lags else 0.0
+    print(f"{mode:8s} {args.requests / elapsed:7.1f} images/s  loop lag p99 {p99 * 1000:7.1f} ms  max {max_lag * 1000:7.1f} ms")
+
+
+async def run_detection(args: argparse.Namespace, frames: List[bytes]) -> None:
+    """Compare per-image detection with batched detection."""
+    service = ComputerVisionService({
+        "executor": {"mode": "process", "max_workers": args.workers},
+        "object_detection": {
+            "model": "yolo",
+            "config_path": args.yolo_cfg,
+            "weights_path": args.yolo_weights,
+            "cache_enabled": False
+        }
+    })
+    batch = [frames[i % len(frames)] for i in range(args.batch_size)]
+    await service.detect_objects(batch[0])
+
+    start_time = time.perf_counter()
+    for frame in batch:
+        await service.detect_objects(frame)
+    single_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    await service.detect_objects_batch(batch)
+    batch_time = time.perf_counter() - start_time
+    service.close()
+
+    print(f"detection of {args.batch_size} images: one by one {args.batch_size / single_time:6.1f} images/s  "
+          f"batched {args.batch_size / batch_time:6.1f} images/s")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    rng = np.random.default_rng(args.seed)
+    frames = []
+    for _ in range(8):
+        image = rng.integers(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+        image = cv2.GaussianBlur(image, (15, 15), 0)
+        frames.append(cv2.imencode(".jpg", image)[1].tobytes())
+
+    for mode in args.modes:
+        await run_mode(args, mode, frames)
+
+    if args.yolo_cfg and args.yolo_weights:
+        await run_detection(args, frames)
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the computer vision executor layer")
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    parser.add_argument("--modes", nargs="+", default=["inline", "thread", "process"])
+    parser.add_argument("--yolo-cfg", default=None)
+    parser.add_argument("--yolo-weights", default=None)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
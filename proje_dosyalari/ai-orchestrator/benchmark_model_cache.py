@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Model cache benchmark for AI Orchestrator.
+
+Fills the segment file result store with many small entries and measures
+write throughput, cold start (reopening the store and loading its index) and
+random reads. For comparison it times the cold start of the previous layout,
+one pickle file per entry indexed by globbing the cache directory.
+
+Usage:
+    python benchmark_model_cache.py --entries 1000000 --legacy-entries 50000
+"""
+import argparse
+import hashlib
+import os
+import pickle
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from src.core.result_store import SegmentStore
+
+
+def make_key(i: int) -> bytes:
+    return hashlib.md5(str(i).encode()).digest()
+
+
+def legacy_cold_start(directory: Path) -> int:
+    """Index a one-file-per-entry cache the way the previous ModelCache did."""
+    index = {}
+    for cache_file in directory.glob("*.cache"):
+        index[cache_file.stem] = {"path": str(cache_file), "size": os.path.getsize(cache_file)}
+    return len(index)
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the model cache result store")
+    parser.add_argument("--entries", type=int, default=1000000)
+    parser.add_argument("--legacy-entries", type=int, default=50000)
+    parser.add_argument("--reads", type=int, default=100000)
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp())
+    try:
+        value = pickle.dumps({"model_id": "bench", "outputs": "x" * 200, "metadata": {"tokens": 42}})
+
+        store = SegmentStore(directory / "segments", max_bytes=1 << 40)
+        start_time = time.perf_counter()
+        for i in range(args.entries):
+            store.put(make_key(i), value)
+        write_s = time.perf_counter() - start_time
+        disk_mb = store.disk_bytes / (1024 * 1024)
+        store.close()
+        print(f"segment store: wrote {args.entries:,} entries in {write_s:.2f} s "
+              f"({args.entries / write_s:,.0f}/s, {disk_mb:,.0f} MB)")
+
+        start_time = time.perf_counter()
+        store = SegmentStore(directory / "segments", max_bytes=1 << 40)
+        cold_s = time.perf_counter() - start_time
+        print(f"segment store: cold start with {len(store):,} entries in {cold_s * 1000:.0f} ms")
+
+        keys = [make_key(random.randrange(args.entries)) for _ in range(args.reads)]
+        start_time = time.perf_counter()
+        for key in keys:
+            store.get(key)
+        read_s = time.perf_counter() - start_time
+        print(f"segment store: {args.reads:,} random reads in {read_s:.2f} s ({args.reads / read_s:,.0f}/s)")
+        store.close()
+
+        legacy_dir = directory / "legacy"
+        legacy_dir.mkdir()
+        for i in range(args.legacy_entries):
+            (legacy_dir / f"{make_key(i).hex()}.cache").write_bytes(value)
+        start_time = time.perf_counter()
+        count = legacy_cold_start(legacy_dir)
+        legacy_s = time.perf_counter() - start_time
+        print(f"pickle-per-file: cold start with {count:,} entries in {legacy_s * 1000:.0f} ms "
+              f"(~{legacy_s * args.entries / count:.1f} s extrapolated to {args.entries:,})")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
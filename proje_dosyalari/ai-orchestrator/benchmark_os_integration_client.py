@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+OS Integration Client benchmark for AI Orchestrator.
+
+Starts a localhost stub of the OS Integration Service (HTTP/1.1 keep-alive)
+and compares:
+- A blocking requests call per request in the default thread pool, as the
+  client did before, with the pooled httpx client
+- Sequential calls with a concurrent fan-out for bursts of file reads
+- How many requests concurrent identical cached calls send
+
+Usage:
+    python benchmark_os_integration_client.py --requests 500 --concurrency 16 --batch-size 16
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from src.clients.os_integration_client import OSIntegrationClient
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal OS Integration Service stub."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, payload) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, path: str, params) -> dict:
+        time.sleep(self.delay)
+        if path == "/api/fs/read":
+            return {"path": params.get("path"), "content": "x" * 256}
+        return {"os_name": "StubOS", "os_version": "1.0"}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self._reply(self._handle(url.path, params))
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        self._reply(self._handle(self.path, payload))
+
+
+def serve(delay: float, ports) -> None:
+    """Run the stub server and report its port."""
+    StubHandler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+async def legacy_request(url: str) -> dict:
+    """Make a request the way the client did before: requests in the default executor."""
+    loop = asyncio.get_event_loop()
+    response = await loop.run_in_executor(None, lambda: requests.request("GET", url))
+    response.raise_for_status()
+    return response.json()
+
+
+async def timed(name: str, count: int, coroutine) -> None:
+    """Run a coroutine and print its throughput."""
+    start_time = time.perf_counter()
+    await coroutine
+    elapsed = time.perf_counter() - start_time
+    print(f"{name:28s} {elapsed * 1000:8.1f} ms  {count / elapsed:8.0f} requests/s")
+
+
+async def run(args: argparse.Namespace, base_url: str) -> None:
+    """Run all comparisons."""
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    url = base_url + "/api/fs/read?path=/tmp/file"
+    client = OSIntegrationClient(base_url, max_connections=args.concurrency)
+    await client.read_file("/tmp/warmup")
+
+    await timed("requests per call", args.requests,
+                asyncio.gather(*(bounded(legacy_request(url)) for _ in range(args.requests))))
+    await timed("pooled httpx client", args.requests,
+                asyncio.gather(*(bounded(client.read_file("/tmp/file")) for _ in range(args.requests))))
+
+    paths = [f"/tmp/file{index}" for index in range(args.batch_size)]
+    bursts = args.requests // args.batch_size
+
+    async def sequential_burst():
+        for path in paths:
+            await client.read_file(path)
+
+    async def sequential(make_burst):
+        for _ in range(bursts):
+            await make_burst()
+
+    await timed(f"bursts of {args.batch_size}, sequential", bursts * args.batch_size, sequential(sequential_burst))
+    await timed(f"bursts of {args.batch_size}, fan-out", bursts * args.batch_size,
+                sequential(lambda: client.read_files(paths)))
+
+    requests_before = client.get_platform_info.cache.misses
+    await client.get_platform_info.clear_cache()
+    await timed("cached call x concurrency", args.concurrency,
+                asyncio.gather(*(client.get_platform_info() for _ in range(args.concurrency))))
+    print(f"  requests sent: {client.get_platform_info.cache.misses - requests_before} "
+          f"(coalesced {client.get_platform_info.cache.coalesced})")
+
+    await client.close()
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the OS Integration Client against a local stub")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--server-delay-ms", type=float, default=0.0, help="Simulated work per call on the server")
+    args = parser.parse_args()
+
+    # Serve from a separate process so the stub does not compete with the client for the GIL
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(args.server_delay_ms / 1000, ports), daemon=True)
+    server.start()
+    try:
+        asyncio.run(run(args, f"http://127.0.0.1:{ports.get(timeout=10)}"))
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
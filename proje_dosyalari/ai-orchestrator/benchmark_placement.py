@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Batch placement benchmark for AI Orchestrator.
+
+Simulates clusters of heterogeneous synthetic nodes (per-wave latency, batch
+capacity, queued work, model residency) and compares the simulated makespan of
+the previous round-robin assignment over nodes sorted by current tasks with
+the cost-model placement. The placement only sees noisy latency estimates (as
+from an EWMA); makespans are computed from the true node parameters.
+
+Usage:
+    python benchmark_placement.py --nodes 8 --batch-size 256 --trials 200
+"""
+import argparse
+import random
+import statistics
+import time
+from typing import List, Tuple
+
+from src.core.placement import NodeProfile, PlacementEngine
+
+
+def make_cluster(rng: random.Random, nodes: int) -> List[NodeProfile]:
+    """
+    Create synthetic nodes with true parameters.
+
+    Args:
+        rng: Random generator
+        nodes: Number of nodes
+
+    Returns:
+        Node profiles
+    """
+    return [
+        NodeProfile(
+            node_id=f"node-{i}",
+            latency=rng.uniform(0.05, 1.0),
+            queue_depth=rng.randint(0, 20),
+            capacity=rng.choice([1, 2, 4, 8]),
+            model_loaded=rng.random() < 0.6,
+            overhead=0.0 if i == 0 else 0.01
+        )
+        for i in range(nodes)
+    ]
+
+
+def estimate(rng: random.Random, profiles: List[NodeProfile], noise: float) -> List[NodeProfile]:
+    """Copy profiles with latency estimates off by up to +/- noise."""
+    return [
+        NodeProfile(p.node_id, p.latency * rng.uniform(1 - noise, 1 + noise), p.queue_depth,
+                    p.capacity, p.model_loaded, p.overhead)
+        for p in profiles
+    ]
+
+
+def round_robin(profiles: List[NodeProfile], count: int) -> List[int]:
+    """Previous assignment: round-robin over nodes sorted by current tasks."""
+    order = sorted(range(len(profiles)), key=lambda i: profiles[i].queue_depth)
+    counts = [0] * len(profiles)
+    for i in range(count):
+        counts[order[i % len(order)]] += 1
+    return counts
+
+
+def run_trials(args: argparse.Namespace) -> Tuple[List[float], List[float], float]:
+    """
+    Run the simulation.
+
+    Args:
+        args: Command-line arguments
+
+    Returns:
+        Tuple of round-robin makespans, placement makespans and mean placement time in ms
+    """
+    rng = random.Random(args.seed)
+    engine = PlacementEngine(model_load_time=args.model_load_time)
+    old, new, placement_ms = [], [], []
+
+    for _ in range(args.trials):
+        truth = make_cluster(rng, args.nodes)
+        estimated = estimate(rng, truth, args.noise)
+
+        old.append(engine.makespan(truth, round_robin(truth, args.batch_size)))
+
+        start_time = time.perf_counter()
+        counts = engine.allocate(estimated, args.batch_size)
+        placement_ms.append((time.perf_counter() - start_time) * 1000)
+        new.append(engine.makespan(truth, counts))
+
+    return old, new, statistics.mean(placement_ms)
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark distributed batch placement")
+    parser.add_argument("--nodes", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument("--noise", type=float, default=0.2, help="Relative error of latency estimates")
+    parser.add_argument("--model-load-time", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    old, new, placement_ms = run_trials(args)
+    ratios = sorted(o / n for o, n in zip(old, new))
+    print(f"round-robin makespan: mean {statistics.mean(old):7.2f} s  p95 {sorted(old)[int(0.95 * len(old))]:7.2f} s")
+    print(f"placement makespan:   mean {statistics.mean(new):7.2f} s  p95 {sorted(new)[int(0.95 * len(new))]:7.2f} s")
+    print(f"speedup: median {ratios[len(ratios) // 2]:.2f}x  worst {ratios[0]:.2f}x  best {ratios[-1]:.2f}x")
+    print(f"RPCs per batch: round-robin {args.batch_size}, placement <= {args.nodes}")
+    print(f"placement time: {placement_ms:.3f} ms per batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tail-latency scheduling benchmark for AI Orchestrator.
+
+Runs synthetic nodes (asyncio sleeps) through the distributed scheduling
+building blocks and compares them with the previous behavior:
+- Hedged requests vs. waiting on one node, with occasional stalls
+- Work stealing vs. a static assignment, with one slow node
+- Overlapping stage pipeline vs. running the stages of each item in turn
+
+Usage:
+    python benchmark_tail_latency.py --requests 400 --latency-ms 10 --stall-rate 0.05
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from src.core.distributed_scheduling import HedgePolicy, WorkStealingScheduler, run_stage_pipeline
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Get a percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+async def bench_hedging(args: argparse.Namespace, rng: random.Random) -> None:
+    """Compare single-node and hedged request latencies."""
+    base = args.latency_ms / 1000
+
+    async def call() -> None:
+        stall = args.stall_factor if rng.random() < args.stall_rate else 1.0
+        await asyncio.sleep(base * rng.uniform(0.8, 1.2) * stall)
+
+    async def hedged(policy: HedgePolicy) -> None:
+        primary = asyncio.create_task(call())
+        attempts = [primary]
+        done, _ = await asyncio.wait({primary}, timeout=policy.delay("m"))
+        if not done:
+            policy.hedged += 1
+            attempts.append(asyncio.create_task(call()))
+        await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+        for attempt in attempts:
+            attempt.cancel()
+
+    plain, hedge = [], []
+    policy = HedgePolicy(default_delay=base * 2)
+    for _ in range(args.requests):
+        start_time = time.perf_counter()
+        await call()
+        plain.append(time.perf_counter() - start_time)
+
+        start_time = time.perf_counter()
+        await hedged(policy)
+        latency = time.perf_counter() - start_time
+        policy.record("m", latency)
+        hedge.append(latency)
+
+    for name, values in (("single node", plain), ("hedged", hedge)):
+        print(f"{name:12s} p50 {percentile(values, 50) * 1000:6.1f} ms  p99 {percentile(values, 99) * 1000:6.1f} ms  "
+              f"max {max(values) * 1000:6.1f} ms")
+    print(f"hedged requests: {policy.hedged}/{args.requests} ({100 * policy.hedged / args.requests:.1f}% extra calls)")
+
+
+async def bench_work_stealing(args: argparse.Namespace) -> None:
+    """Compare a static assignment with work stealing when one node is slow."""
+    base = args.latency_ms / 1000
+    nodes = [f"node{i}" for i in range(args.nodes)]
+    speed = {node_id: (args.slow_factor if index == 0 else 1.0) for index, node_id in enumerate(nodes)}
+
+    async def run(node_id: str, item: int) -> int:
+        await asyncio.sleep(base * speed[node_id])
+        return item
+
+    items = list(range(args.requests // 4))
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(
+        _run_static(run, node_id, items[index::len(nodes)]) for index, node_id in enumerate(nodes)
+    ))
+    static_time = time.perf_counter() - start_time
+
+    scheduler = WorkStealingScheduler(run, {node_id: 1 for node_id in nodes})
+    futures = [scheduler.submit(nodes[index % len(nodes)], item) for index, item in enumerate(items)]
+    start_time = time.perf_counter()
+    scheduler.start()
+    await asyncio.gather(*futures)
+    stealing_time = time.perf_counter() - start_time
+
+    print(f"static assignment {static_time * 1000:7.1f} ms  work stealing {stealing_time * 1000:7.1f} ms  "
+          f"({scheduler.steals} of {len(items)} requests stolen)")
+
+
+async def _run_static(run, node_id: str, items: List[int]) -> None:
+    """Run a node's share of items one after another."""
+    for item in items:
+        await run(node_id, item)
+
+
+async def bench_pipeline(args: argparse.Namespace) -> None:
+    """Compare per-item sequential stages with the overlapping stage pipeline."""
+    base = args.latency_ms / 1000
+
+    async def stage(item_index: int, value: int) -> int:
+        await asyncio.sleep(base)
+        return value + 1
+
+    items = list(range(args.items))
+    stages = [stage] * args.stages
+
+    start_time = time.perf_counter()
+    for index, item in enumerate(items):
+        for run in stages:
+            item = await run(index, item)
+    sequential_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    await run_stage_pipeline(items, stages)
+    pipelined_time = time.perf_counter() - start_time
+
+    print(f"{args.items} items x {args.stages} stages: sequential {sequential_time * 1000:7.1f} ms  "
+          f"pipelined {pipelined_time * 1000:7.1f} ms")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run all benchmarks."""
+    rng = random.Random(args.seed)
+    await bench_hedging(args, rng)
+    await bench_work_stealing(args)
+    await bench_pipeline(args)
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark hedging, work stealing and stage pipelining")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="Typical per-request latency")
+    parser.add_argument("--stall-rate", type=float, default=0.05, help="Fraction of requests that stall")
+    parser.add_argument("--stall-factor", type=float, default=10.0, help="Latency multiplier of a stall")
+    parser.add_argument("--nodes", type=int, default=4)
+    parser.add_argument("--slow-factor", type=float, default=4.0, help="Latency multiplier of the slow node")
+    parser.add_argument("--items", type=int, default=16)
+    parser.add_argument("--stages", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Local multi-node harness for AI Orchestrator.
+
+Starts several orchestrator processes on localhost with distributed mode
+enabled. Every node is seeded with the first node's URL and finds the others
+through heartbeat gossip, authenticated with a shared secret generated per
+run. The harness waits until every node sees the full cluster, optionally
+sends inference requests that are spread over the nodes, and shuts the
+cluster down.
+
+Usage:
+    python distributed_harness.py --nodes 3 --base-port 8100 --requests 20 --model-id llama2-7b-q4
+"""
+import argparse
+import asyncio
+import os
+import secrets
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+class LocalCluster:
+    """
+    Orchestrator nodes running as local processes.
+    """
+    def __init__(self, nodes: int = 3, base_port: int = 8100, heartbeat_interval: float = 1.0,
+                 env: Optional[Dict[str, str]] = None):
+        """
+        Initialize the cluster.
+
+        Args:
+            nodes: Number of nodes
+            base_port: Port of the first node; node i listens on base_port + i
+            heartbeat_interval: Heartbeat interval of the nodes in seconds
+            env: Extra environment variables for the node processes
+        """
+        self.urls = [f"http://127.0.0.1:{base_port + i}" for i in range(nodes)]
+        self.heartbeat_interval = heartbeat_interval
+        self.env = env or {}
+        self.shared_secret = secrets.token_hex(16)
+        self.processes: List[subprocess.Popen] = []
+
+    def start(self) -> None:
+        """Start the node processes."""
+        for url in self.urls:
+            env = dict(os.environ, **self.env)
+            env.update({
+                "DISTRIBUTED_ENABLED": "true",
+                "DISTRIBUTED_NODE_URL": url,
+                # Seed every node with the first one; the rest is found through gossip
+                "DISTRIBUTED_PEERS": f'["{self.urls[0]}"]',
+                "DISTRIBUTED_SHARED_SECRET": self.shared_secret,
+                "DISCOVERY_INTERVAL": "1",
+                "HEARTBEAT_INTERVAL": str(self.heartbeat_interval),
+            })
+            port = url.rsplit(":", 1)[1]
+            self.processes.append(subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "src.main:app", "--host", "127.0.0.1", "--port", port,
+                 "--log-level", "warning"],
+                env=env
+            ))
+
+    def stop(self) -> None:
+        """Stop the node processes."""
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self.processes.clear()
+
+    async def wait_until_ready(self, client: httpx.AsyncClient, timeout: float = 60.0) -> None:
+        """
+        Wait until every node answers and sees all the other nodes.
+
+        Args:
+            client: HTTP client
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            TimeoutError: If the cluster does not converge in time
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for process in self.processes:
+                if process.poll() is not None:
+                    raise RuntimeError(f"Node process exited with code {process.returncode}")
+            try:
+                views = await asyncio.gather(*(self.list_nodes(client, url) for url in self.urls))
+                if all(len(nodes) == len(self.urls) for nodes in views):
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+        raise TimeoutError("Cluster did not converge")
+
+    @staticmethod
+    async def list_nodes(client: httpx.AsyncClient, url: str) -> List[Dict[str, Any]]:
+        """
+        Get the online nodes seen by a node.
+
+        Args:
+            client: HTTP client
+            url: Base URL of the node
+
+        Returns:
+            Node info dictionaries
+        """
+        response = await client.get(f"{url}/api/distributed/nodes")
+        response.raise_for_status()
+        return response.json()
+
+    def __enter__(self) -> "LocalCluster":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+async def run(args: argparse.Namespace) -> None:
+    """
+    Start a cluster, report its state and optionally send inference requests.
+
+    Args:
+        args: Command-line arguments
+    """
+    with LocalCluster(args.nodes, args.base_port, args.heartbeat_interval) as cluster:
+        async with httpx.AsyncClient(timeout=60) as client:
+            start_time = time.perf_counter()
+            await cluster.wait_until_ready(client, timeout=args.timeout)
+            print(f"{args.nodes} nodes converged in {time.perf_counter() - start_time:.1f} s")
+
+            for url in cluster.urls:
+                nodes = await cluster.list_nodes(client, url)
+                print(f"{url}: {', '.join(sorted(node['url'] or node['node_id'] for node in nodes))}")
+
+            if args.requests:
+                start_time = time.perf_counter()
+                responses = await asyncio.gather(*(
+                    client.post(f"{cluster.urls[0]}/api/distributed/run", json={
+                        "model_id": args.model_id,
+                        "inputs": args.prompt
+                    })
+                    for _ in range(args.requests)
+                ))
+                elapsed = time.perf_counter() - start_time
+                ok = sum(1 for response in responses if response.status_code == 200)
+                print(f"{ok}/{args.requests} requests succeeded in {elapsed:.2f} s")
+
+            stats = await client.get(f"{cluster.urls[0]}/api/distributed/transport/stats")
+            print(f"transport: {stats.json()}")
+
+
+def main():
+    """Run the harness from the command line."""
+    parser = argparse.ArgumentParser(description="Run several orchestrator nodes on localhost")
+    parser.add_argument("--nodes", type=int, default=3)
+    parser.add_argument("--base-port", type=int, default=8100)
+    parser.add_argument("--heartbeat-interval", type=float, default=1.0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--requests", type=int, default=0, help="Inference requests to send through the first node")
+    parser.add_argument("--model-id", default="llama2-7b-q4")
+    parser.add_argument("--prompt", default="Hello")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Node-to-node API endpoints for distributed model execution.
+"""
+import logging
+from typing import Dict, Any, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Header, Request
+
+from ...core.distributed import DistributedModelOrchestrator, DistributionStrategy, get_distributed_model_orchestrator
+from ...core.node_transport import NODE_TOKEN_HEADER, PayloadTooLargeError, node_token_valid, read_json_body
+from ...models.inference import InferenceRequest, InferenceResponse
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+async def verify_node_token(x_node_token: Optional[str] = Header(None, alias=NODE_TOKEN_HEADER)):
+    """
+    Reject node-to-node requests without the configured shared secret.
+    """
+    if not node_token_valid(x_node_token):
+        raise HTTPException(status_code=401, detail="Invalid node token")
+
+async def read_node_body(request: Request) -> Any:
+    """
+    Read the JSON body of a node-to-node request, rejecting oversized bodies.
+    """
+    try:
+        return await read_json_body(request)
+    except PayloadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+@router.post("/run", response_model=InferenceResponse)
+async def run_distributed_inference(
+    request: InferenceRequest,
+    strategy: DistributionStrategy = DistributionStrategy.LEAST_LOADED,
+    orchestrator: DistributedModelOrchestrator = Depends(get_distributed_model_orchestrator)
+):
+    """
+    Run inference on the node selected by the distribution strategy.
+    """
+    try:
+        return await orchestrator.run_distributed_inference(request, strategy)
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error during distributed inference: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Distributed inference failed: {str(e)}")
+
+@router.post("/heartbeat", dependencies=[Depends(verify_node_token)])
+async def heartbeat(
+    request: Request,
+    orchestrator: DistributedModelOrchestrator = Depends(get_distributed_model_orchestrator)
+) -> Dict[str, Any]:
+    """
+    Exchange node information with another node.
+    """
+    try:
+        payload = await read_node_body(request)
+        return await orchestrator.handle_heartbeat(payload)
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except (KeyError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid heartbeat: {str(e)}")
+
+@router.post("/inference", response_model=InferenceResponse, dependencies=[Depends(verify_node_token)])
+async def run_node_inference(
+    request: Request,
+    orchestrator: DistributedModelOrchestrator = Depends(get_distributed_model_orchestrator)
+):
+    """
+    Run inference forwarded by another node on this node.
+    """
+    try:
+        inference_request = InferenceRequest(**await read_node_body(request))
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid inference request: {str(e)}")
+    
+    try:
+        return await orchestrator.serve_remote_inference(inference_request)
+    except Exception as e:
+        logger.error(f"Error during node inference: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Inference failed: {str(e)}")
+
+@router.post("/inference/batch", dependencies=[Depends(verify_node_token)])
+async def run_node_batch_inference(
+    request: Request,
+    orchestrator: DistributedModelOrchestrator = Depends(get_distributed_model_orchestrator)
+) -> List[Dict[str, Any]]:
+    """
+    Run a sub-batch forwarded by another node on this node.
+    """
+    try:
+        inference_requests = [InferenceRequest(**item) for item in await read_node_body(request)]
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid inference requests: {str(e)}")
+    
+    return await orchestrator.serve_remote_batch(inference_requests)
+
+@router.get("/nodes")
+async def list_nodes(
+    include_offline: bool = False,
+    orchestrator: DistributedModelOrchestrator = Depends(get_distributed_model_orchestrator)
+) -> List[Dict[str, Any]]:
+    """
+    List the nodes known to this node.
+    """
+    nodes = await orchestrator.list_nodes(include_offline=include_offline)
+    return [node.to_dict() for node in nodes]
+
+@router.get("/transport/stats")
+async def get_transport_stats(
+    orchestrator: DistributedModelOrchestrator = Depends(get_distributed_model_orchestrator)
+) -> Dict[str, Any]:
+    """
+    Get node-to-node transport statistics.
+    """
+    return orchestrator.transport.get_stats()
@@ -72,3 +72,21 @@ async def run_orchestrated_inference(
     except Exception as e:
         logger.error(f"Error during orchestrated inference: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Orchestrated inference failed: {str(e)}")
+
+@router.get("/batching/stats", response_model=Dict[str, Any])
+async def get_batching_stats(
+    inference_service: InferenceService = Depends(get_inference_service)
+):
+    """
+    Get micro-batching statistics (batch-size and queue-wait histograms).
+    """
+    return inference_service.get_batching_stats()
+
+@router.get("/coalescing/stats", response_model=Dict[str, Any])
+async def get_coalescing_stats(
+    inference_service: InferenceService = Depends(get_inference_service)
+):
+    """
+    Get request coalescing statistics.
+    """
+    return inference_service.get_coalescing_stats()
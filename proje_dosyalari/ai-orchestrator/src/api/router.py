@@ -3,7 +3,8 @@ API router for AI Orchestrator.
 """
 from fastapi import APIRouter
 
-from .endpoints import models, inference, vision, audio
+from .endpoints import models, inference, vision, audio, distributed
+from ..core.config import settings
 
 # Create API router
 api_router = APIRouter()
@@ -13,3 +14,7 @@ api_router.include_router(models.router, prefix="/models", tags=["models"])
 api_router.include_router(inference.router, prefix="/inference", tags=["inference"])
 api_router.include_router(vision.router, prefix="/vision", tags=["vision"])
 api_router.include_router(audio.router, prefix="/audio", tags=["audio"])
+
+# Node-to-node routes only exist on nodes that take part in distributed execution
+if settings.DISTRIBUTED_ENABLED:
+    api_router.include_router(distributed.router, prefix="/distributed", tags=["distributed"])
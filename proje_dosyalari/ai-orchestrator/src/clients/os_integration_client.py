@@ -2,97 +2,231 @@
 """
 Client for interacting with the OS Integration Service API.
 Created by Worker 1.
-Includes performance optimizations (caching).
+Includes performance optimizations:
+- One pooled keep-alive httpx client with bounded connections and per-endpoint timeouts
+- TTL caches with O(1) LRU eviction that coalesce concurrent identical calls
+- Concurrent fan-out of a burst of calls over the pooled connections
 """
 
-import requests
 import logging
 import json # Added import
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, NamedTuple, Callable, Awaitable, Hashable
 from functools import wraps
 import time
 import asyncio
 
-# Basic async LRU cache implementation (can be moved to a shared utils module later)
-def async_lru_cache(maxsize: int = 128, ttl: Optional[int] = None):
+import httpx
+
+
+class AsyncTTLCache:
     """
-    Decorator to cache the result of an async function.
-    Args:
-        maxsize: Maximum cache size
-        ttl: Time to live in seconds (None for no expiration)
-    Returns:
-        Decorated function
+    LRU cache for async results with a time to live per entry.
+
+    Concurrent loads of the same key share one call, and eviction of the
+    least recently used entry is O(1).
     """
-    cache = {}
-    timestamps = {}
-    lock = asyncio.Lock()
 
-    def decorator(func):
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum cache size
+            ttl: Default time to live in seconds (None for no expiration)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds (defaults to the cache TTL)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (None if ttl is None else time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a cached value, or load it once for all concurrent callers.
+
+        Results that are None are returned but not cached.
+
+        Args:
+            key: Cache key
+            load: Coroutine function that loads the value
+
+        Returns:
+            The cached or loaded value
+        """
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, load, self._generation))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        # Shield so that one cancelled caller does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, load: Callable[[], Awaitable[Any]], generation: int) -> Any:
+        """Run a load and cache its result unless the cache was cleared meanwhile."""
+        try:
+            value = await load()
+            if value is not None and generation == self._generation:
+                self.set(key, value)
+            return value
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        """Remove all entries; loads already in flight are not cached."""
+        self._entries.clear()
+        self._inflight.clear()
+        self._generation += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _CachedMethod:
+    """
+    Descriptor that caches the results of an async method per instance.
+
+    Each instance gets its own AsyncTTLCache, stored on the instance, so
+    cached results are freed together with the instance.
+    """
+
+    def __init__(self, func, maxsize: int, ttl: Optional[float]):
+        self.func = func
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.attr_name = f"_{func.__name__}_cache"
+        wraps(func)(self)
+
+    def cache_for(self, instance) -> AsyncTTLCache:
+        """Get the cache of an instance, creating it on first use."""
+        cache = instance.__dict__.get(self.attr_name)
+        if cache is None:
+            cache = instance.__dict__[self.attr_name] = AsyncTTLCache(maxsize=self.maxsize, ttl=self.ttl)
+        return cache
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        func = self.func
+        cache = self.cache_for(instance)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            # Create a cache key from the function arguments (excluding self)
-            key_args = args[1:] # Exclude self from key
-            key = str(key_args) + str(sorted(kwargs.items()))
-
-            async with lock:
-                # Check if result is in cache and not expired
-                if key in cache:
-                    timestamp = timestamps[key]
-                    if ttl is None or time.time() - timestamp < ttl:
-                        # print(f"Cache HIT for {func.__name__} with key: {key}") # Debugging
-                        return cache[key]
-                    else:
-                        # print(f"Cache EXPIRED for {func.__name__} with key: {key}") # Debugging
-                        # Remove expired entry
-                        del cache[key]
-                        del timestamps[key]
-                # else:
-                    # print(f"Cache MISS for {func.__name__} with key: {key}") # Debugging
-
-                # If cache is full, remove the oldest entry
-                if len(cache) >= maxsize:
-                    try:
-                        oldest_key = min(timestamps.items(), key=lambda x: x[1])[0]
-                        del cache[oldest_key]
-                        del timestamps[oldest_key]
-                        # print(f"Cache evicted oldest key: {oldest_key}") # Debugging
-                    except ValueError: # Handle empty timestamps dict
-                        pass
-
-            # Call the original function
-            result = await func(*args, **kwargs)
-
-            # Cache the result only if it's not None (or handle errors appropriately)
-            if result is not None:
-                async with lock:
-                    cache[key] = result
-                    timestamps[key] = time.time()
-
-            return result
-
-        # Add a method to clear the cache for this specific function
+            key = args + tuple(sorted(kwargs.items()))
+            return await cache.get_or_load(key, lambda: func(instance, *args, **kwargs))
+
+        # Add a method to clear the cache of this instance
         async def clear_cache():
-            async with lock:
-                cache.clear()
-                timestamps.clear()
-                # print(f"Cache CLEARED for {func.__name__}") # Debugging
+            cache.clear()
         wrapper.clear_cache = clear_cache
+        wrapper.cache = cache
 
         return wrapper
 
+
+def async_lru_cache(maxsize: int = 128, ttl: Optional[int] = None):
+    """
+    Decorator to cache the result of an async method, per instance.
+    Args:
+        maxsize: Maximum cache size of each instance
+        ttl: Time to live in seconds (None for no expiration)
+    Returns:
+        Decorated method
+    """
+    def decorator(func):
+        return _CachedMethod(func, maxsize, ttl)
+
     return decorator
 
 logger = logging.getLogger(__name__)
 
+# Endpoints that routinely take longer than the default timeout
+DEFAULT_ENDPOINT_TIMEOUTS = {
+    "api/platform/run": 60.0,
+    "api/fs/read": 30.0,
+    "api/screenshot": 30.0,
+    "api/screenshot/cuda": 30.0,
+}
+
+
+class ApiCall(NamedTuple):
+    """One API call of a fan-out."""
+    method: str
+    endpoint: str
+    params: Optional[Dict[str, Any]] = None
+    json: Optional[Dict[str, Any]] = None
+
+
 class OSIntegrationClient:
     """Client to interact with the OS Integration Service REST API."""
 
-    def __init__(self, base_url: str, auth_token: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: str,
+        auth_token: Optional[str] = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        timeout: float = 10.0,
+        endpoint_timeouts: Optional[Dict[str, float]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
         """Initialize the client.
 
         Args:
             base_url: The base URL of the OS Integration Service (e.g., http://os-integration-service:8083).
             auth_token: Optional authentication token.
+            max_connections: Maximum concurrent connections to the service.
+            max_keepalive_connections: Maximum idle connections kept open for reuse.
+            timeout: Default request timeout in seconds.
+            endpoint_timeouts: Timeouts in seconds that override the default for specific endpoints.
+            transport: Custom httpx transport, e.g. for tests.
         """
         if not base_url.endswith("/"):
             base_url += "/"
@@ -100,38 +234,90 @@ class OSIntegrationClient:
         self.headers = {"Content-Type": "application/json"}
         if auth_token:
             self.headers["Authorization"] = f"Bearer {auth_token}"
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        self.timeout = timeout
+        self.endpoint_timeouts = {**DEFAULT_ENDPOINT_TIMEOUTS, **(endpoint_timeouts or {})}
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
         logger.info(f"OS Integration Client initialized for URL: {self.base_url}")
 
-    # Use a helper for async requests
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared keep-alive HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=self.limits,
+                timeout=self.timeout,
+                transport=self.transport
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "OSIntegrationClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Send a request over the pooled client and raise for bad status codes."""
+        endpoint = endpoint.lstrip("/")
+        timeout = self.endpoint_timeouts.get(endpoint, self.timeout)
+        response = await self._get_client().request(
+            method, endpoint, headers=self.headers, timeout=timeout, **kwargs
+        )
+        response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
+        return response
+
+    def _parse_response(self, method: str, url: str, response: httpx.Response) -> Optional[Dict[str, Any]]:
+        """Decode a response body."""
+        if response.content:
+            # Check if content type is JSON before decoding
+            if "application/json" in response.headers.get("Content-Type", ""):
+                return response.json()
+            else:
+                logger.warning(f"Non-JSON response received from {method} {url}: {response.text[:100]}...")
+                return {"raw_content": response.text} # Or handle differently
+        return None # Return None for empty responses (e.g., 204 No Content)
+
     async def _async_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict[str, Any]]:
         """Helper method to make async requests to the API."""
         url = self.base_url + endpoint.lstrip("/")
         try:
-            # Using requests library synchronously within async function is blocking.
-            # For a truly async client, httpx or aiohttp should be used.
-            # Simulating async behavior for now, assuming underlying service call is quick
-            # or replacing this with a proper async HTTP client is a future task.
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, # Use default executor (ThreadPoolExecutor)
-                lambda: requests.request(method, url, headers=self.headers, **kwargs)
-            )
-            response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
-            if response.content:
-                # Check if content type is JSON before decoding
-                if "application/json" in response.headers.get("Content-Type", ""):
-                    return response.json()
-                else:
-                    logger.warning(f"Non-JSON response received from {method} {url}: {response.text[:100]}...")
-                    return {"raw_content": response.text} # Or handle differently
-            return None # Return None for empty responses (e.g., 204 No Content)
-        except requests.exceptions.RequestException as e:
+            response = await self._send(method, endpoint, **kwargs)
+            return self._parse_response(method, url, response)
+        except httpx.HTTPError as e:
             logger.error(f"Error calling OS Integration Service API ({method} {url}): {e}")
             return None
         except json.JSONDecodeError:
             logger.error(f"Error decoding JSON response from OS Integration Service API ({method} {url})")
             return None
 
+    async def fan_out(self, calls: List[ApiCall]) -> List[Optional[Dict[str, Any]]]:
+        """Run several API calls concurrently over the pooled connections.
+
+        Each call is still its own request; the connection limits of the
+        pool bound how many are in flight at once.
+
+        Args:
+            calls: Calls to make.
+
+        Returns:
+            The result of each call in order, None for calls that failed.
+        """
+        return list(await asyncio.gather(*(
+            self._async_request(call.method, call.endpoint, params=call.params, json=call.json)
+            for call in calls
+        )))
+
     # --- Platform API Methods ---
     @async_lru_cache(maxsize=2, ttl=300) # Cache platform info for 5 minutes
     async def get_platform_info(self) -> Optional[Dict[str, Any]]:
@@ -170,6 +356,10 @@ class OSIntegrationClient:
         params = {"path": path}
         return await self._async_request("GET", "api/fs/read", params=params)
 
+    async def read_files(self, paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Read the content of several files concurrently."""
+        return await self.fan_out([ApiCall("GET", "api/fs/read", params={"path": path}) for path in paths])
+
     # --- Screenshot API Methods ---
     # Screenshots are unlikely to be cacheable
     async def take_screenshot(self, output_path: str, use_cuda: bool = False) -> Optional[Dict[str, Any]]:
@@ -185,7 +375,7 @@ class OSIntegrationClient:
         # Don't cache login
         response_data = await self._async_request("POST", "api/auth/login", json=payload)
         if response_data and "token" in response_data:
-            self.headers["Authorization"] = f"Bearer {response_data["token"]}"
+            self.headers["Authorization"] = f"Bearer {response_data['token']}"
             logger.info("Successfully logged in and updated auth token.")
             # Clear caches that might depend on auth state if necessary
             await self.get_platform_info.clear_cache()
@@ -228,6 +418,7 @@ async def main():
     else:
         print("Failed to get display info.")
 
+    await client.close()
+
 if __name__ == "__main__":
     asyncio.run(main())
-
@@ -30,6 +30,9 @@ DEFAULT_CONFIG = {
         "default_vision": "clip-vit-base",
         "default_voice": "whisper-small",
         "max_loaded_models": 5,
+        "memory_budget_mb": None,  # None: limited by max_loaded_models only
+        "eviction_policy": "lru",  # lru or lfu
+        "prefetch_window": 100,  # Recent requests used to predict models to prefetch
         "preload_models": ["llama2-7b-chat"]
     },
     "llm": {
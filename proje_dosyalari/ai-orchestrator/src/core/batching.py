@@ -0,0 +1,279 @@
+"""
+Dynamic micro-batching for AI Orchestrator.
+
+This module coalesces concurrent requests into batches:
+- One asyncio queue and worker per key (e.g. model ID)
+- Batches close at max_batch_size items or max_wait_ms after the first item
+- Results are delivered through futures
+- Bounded queues apply backpressure to callers
+- Batch-size and queue-wait histograms for tuning
+"""
+import asyncio
+import bisect
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Batch processing function: receives the key and the batched items, returns one
+# result per item. A result that is an Exception is raised to that item's caller.
+BatchFunction = Callable[[str, List[Any]], Awaitable[List[Any]]]
+
+DEFAULT_WAIT_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+    """
+    def __init__(self, buckets: Sequence[float]):
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets: Sorted upper bounds of the buckets; larger values go to an overflow bucket
+        """
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value.
+
+        Args:
+            value: Observed value
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the histogram as a dictionary.
+
+        Returns:
+            Dictionary with per-bucket counts (keyed by "le_<bound>"), count, mean and max
+        """
+        buckets = {f"le_{bound:g}": count for bound, count in zip(self.buckets, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "buckets": buckets,
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max
+        }
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent submissions with the same key into batches.
+    """
+    def __init__(
+        self,
+        process_batch: BatchFunction,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 256,
+        idle_timeout: float = 60.0
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            process_batch: Batch processing function
+            max_batch_size: Maximum number of items per batch
+            max_wait_ms: Maximum time to wait for more items after the first one
+            max_queue_size: Maximum queued items per key; submit waits when the queue is full
+            idle_timeout: Seconds after which an idle key's worker exits
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.max_queue_size = max_queue_size
+        self.idle_timeout = idle_timeout
+
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.batch_sizes = Histogram(range(1, self.max_batch_size + 1))
+        self.queue_wait_ms = Histogram(DEFAULT_WAIT_BUCKETS_MS)
+        self.batch_count = 0
+        self.item_count = 0
+        self.error_count = 0
+
+    def _get_queue(self, key: str) -> asyncio.Queue:
+        """Get the queue for a key, starting its worker if needed."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Queues and workers are bound to the loop that created them
+            self._abandon_loop()
+            self._loop = loop
+
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._queues[key] = queue
+            self._workers[key] = loop.create_task(self._worker(key, queue))
+        return queue
+
+    def _abandon_loop(self) -> None:
+        """Cancel the workers and queued futures left on the previous event loop."""
+        callbacks = [worker.cancel for worker in self._workers.values()]
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, future, _ = queue.get_nowait()
+                callbacks.append(future.cancel)
+        self._queues.clear()
+        self._workers.clear()
+
+        old_loop = self._loop
+        for callback in callbacks:
+            if old_loop is not None and not old_loop.is_closed():
+                old_loop.call_soon_threadsafe(callback)
+            else:
+                try:
+                    callback()
+                except RuntimeError:
+                    # The loop is closed: the future is cancelled, but its callbacks cannot be scheduled
+                    pass
+
+    async def submit(self, key: str, item: Any) -> Any:
+        """
+        Submit an item and wait for its result.
+
+        Args:
+            key: Batch key; only items with the same key are batched together
+            item: Item to process
+
+        Returns:
+            The item's result
+
+        Raises:
+            Exception: The exception produced for this item by the batch function
+        """
+        queue = self._get_queue(key)
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((item, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self, queue: asyncio.Queue) -> List[Tuple[Any, asyncio.Future, float]]:
+        """
+        Collect one batch from a queue.
+
+        Returns:
+            List of (item, future, enqueue_time) entries, or an empty list if the worker idled out
+        """
+        try:
+            first = await asyncio.wait_for(queue.get(), timeout=self.idle_timeout)
+        except asyncio.TimeoutError:
+            return []
+
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000
+
+        while len(batch) < self.max_batch_size:
+            # Drain whatever is already queued before waiting
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _worker(self, key: str, queue: asyncio.Queue) -> None:
+        """Batch loop for one key."""
+        while True:
+            batch = await self._collect(queue)
+            if not batch:
+                # Idle: retire the worker unless new items raced in
+                if queue.empty():
+                    if self._queues.get(key) is queue:
+                        del self._queues[key]
+                        del self._workers[key]
+                    return
+                continue
+
+            now = time.perf_counter()
+            for _, _, enqueued_at in batch:
+                self.queue_wait_ms.observe((now - enqueued_at) * 1000)
+            self.batch_sizes.observe(len(batch))
+            self.batch_count += 1
+            self.item_count += len(batch)
+
+            # Skip items whose callers have gone away
+            live = [(item, future) for item, future, _ in batch if not future.done()]
+            if not live:
+                continue
+
+            try:
+                results = await self.process_batch(key, [item for item, _ in live])
+                if len(results) != len(live):
+                    raise RuntimeError(f"Batch function returned {len(results)} results for {len(live)} items")
+            except asyncio.CancelledError:
+                # The worker is being shut down: don't leave the batch's callers waiting
+                for _, future in live:
+                    if not future.done():
+                        future.cancel()
+                raise
+            except Exception as e:
+                logger.error(f"Error processing batch for {key}: {str(e)}")
+                self.error_count += 1
+                results = [e] * len(live)
+
+            for (_, future), result in zip(live, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        """Cancel all workers. Items still queued or in a batch are failed with CancelledError."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, future, _ = queue.get_nowait()
+                if not future.done():
+                    future.cancel()
+
+        self._queues.clear()
+        self._workers.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dictionary with configuration, counters, per-key queue depths and histograms
+        """
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait_ms,
+            "max_queue_size": self.max_queue_size,
+            "batches": self.batch_count,
+            "items": self.item_count,
+            "errors": self.error_count,
+            "avg_batch_size": self.item_count / self.batch_count if self.batch_count else 0.0,
+            "queue_depths": {key: queue.qsize() for key, queue in self._queues.items()},
+            "batch_size_histogram": self.batch_sizes.snapshot(),
+            "queue_wait_ms_histogram": self.queue_wait_ms.snapshot()
+        }
+
@@ -31,6 +31,44 @@ class Settings(BaseSettings):
     # Cache settings
     CACHE_DIR: str = Field(default="./cache", env="CACHE_DIR")
     CACHE_SIZE_LIMIT: int = Field(default=1024, env="CACHE_SIZE_LIMIT")  # MB
+    CACHE_MEMORY_LIMIT: int = Field(default=256, env="CACHE_MEMORY_LIMIT")  # MB
+    CACHE_SEGMENT_SIZE: int = Field(default=64, env="CACHE_SEGMENT_SIZE")  # MB
+    
+    # Micro-batching settings
+    # Only LLM requests are batched; each batch is one batched model call
+    BATCHING_ENABLED: bool = Field(default=True, env="BATCHING_ENABLED")
+    BATCH_MAX_SIZE: int = Field(default=8, env="BATCH_MAX_SIZE")
+    BATCH_MAX_WAIT_MS: float = Field(default=5.0, env="BATCH_MAX_WAIT_MS")
+    BATCH_MAX_QUEUE_SIZE: int = Field(default=256, env="BATCH_MAX_QUEUE_SIZE")
+    
+    # Performance monitoring settings
+    PERF_STATS_FLUSH_INTERVAL: float = Field(default=5.0, env="PERF_STATS_FLUSH_INTERVAL")  # seconds
+    
+    # Request coalescing settings
+    COALESCING_ENABLED: bool = Field(default=True, env="COALESCING_ENABLED")
+    COALESCING_EXCLUDED_MODELS: List[str] = Field(default_factory=list, env="COALESCING_EXCLUDED_MODELS")
+    
+    # Distributed execution settings
+    DISTRIBUTED_ENABLED: bool = Field(default=False, env="DISTRIBUTED_ENABLED")
+    DISTRIBUTED_NODE_URL: Optional[str] = Field(default=None, env="DISTRIBUTED_NODE_URL")  # URL peers use to reach this node
+    DISTRIBUTED_PEERS: List[str] = Field(default_factory=list, env="DISTRIBUTED_PEERS")  # Seed peer URLs
+    DISCOVERY_INTERVAL: int = Field(default=60, env="DISCOVERY_INTERVAL")  # seconds
+    HEARTBEAT_INTERVAL: float = Field(default=5.0, env="HEARTBEAT_INTERVAL")  # seconds
+    HEARTBEAT_TIMEOUT: int = Field(default=120, env="HEARTBEAT_TIMEOUT")  # seconds
+    DISTRIBUTED_MAX_CONNECTIONS: int = Field(default=32, env="DISTRIBUTED_MAX_CONNECTIONS")  # per peer
+    DISTRIBUTED_REQUEST_TIMEOUT: float = Field(default=60.0, env="DISTRIBUTED_REQUEST_TIMEOUT")  # seconds
+    DISTRIBUTED_HTTP2: bool = Field(default=True, env="DISTRIBUTED_HTTP2")  # used when the h2 package is installed
+    DISTRIBUTED_COMPRESSION_MIN_BYTES: int = Field(default=1024, env="DISTRIBUTED_COMPRESSION_MIN_BYTES")
+    DISTRIBUTED_MAX_BODY_BYTES: int = Field(default=64 * 1024 * 1024, env="DISTRIBUTED_MAX_BODY_BYTES")  # node-to-node request bodies, after decompression
+    # Sent by nodes as X-Node-Token; without it a node only talks to DISTRIBUTED_PEERS
+    DISTRIBUTED_SHARED_SECRET: Optional[str] = Field(default=None, env="DISTRIBUTED_SHARED_SECRET")
+    PLACEMENT_DEFAULT_LATENCY: float = Field(default=1.0, env="PLACEMENT_DEFAULT_LATENCY")  # seconds, nodes without timing data
+    PLACEMENT_MODEL_LOAD_TIME: float = Field(default=10.0, env="PLACEMENT_MODEL_LOAD_TIME")  # seconds
+    PLACEMENT_RPC_OVERHEAD: float = Field(default=0.01, env="PLACEMENT_RPC_OVERHEAD")  # seconds per remote call
+    HEDGE_PERCENTILE: float = Field(default=95.0, env="HEDGE_PERCENTILE")  # latency percentile after which a request is hedged
+    HEDGE_MIN_SAMPLES: int = Field(default=20, env="HEDGE_MIN_SAMPLES")  # latencies needed before the percentile is used
+    HEDGE_WINDOW: int = Field(default=100, env="HEDGE_WINDOW")  # recent latencies kept per model
+    HEDGE_DEFAULT_DELAY: float = Field(default=1.0, env="HEDGE_DEFAULT_DELAY")  # seconds, models without enough samples
     
     # Service integration
     RUNNER_SERVICE_URL: str = Field(default="http://localhost:8001", env="RUNNER_SERVICE_URL")
@@ -11,15 +11,24 @@ import time
 import uuid
 from typing import Dict, List, Any, Optional, Union, Tuple, Set, Callable
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, fields
+from functools import lru_cache
+
+import httpx
 
 from ..models.inference import InferenceRequest, InferenceResponse
 from ..models.model import ModelInfo, ModelType
 from ..services.model_manager import ModelManager, get_model_manager
 from ..core.config import settings
+from ..core.node_transport import PeerClientPool
+from ..core.placement import NodeProfile, PlacementEngine
+from ..core.distributed_scheduling import HedgePolicy, WorkStealingScheduler, run_stage_pipeline
 
 logger = logging.getLogger(__name__)
 
+# Path of the node-to-node API on every node
+DISTRIBUTED_API_PATH = f"{settings.API_PREFIX}/distributed"
+
 class NodeStatus(str, Enum):
     """Node status enumeration."""
     ONLINE = "online"
@@ -34,6 +43,9 @@ class DistributionStrategy(str, Enum):
     MODEL_SPECIFIC = "model_specific"
     CAPABILITY_BASED = "capability_based"
     LATENCY_OPTIMIZED = "latency_optimized"
+    HEDGED = "hedged"  # Re-issue slow requests to a second node, first answer wins
+    WORK_STEALING = "work_stealing"  # Idle nodes take queued requests from busy nodes
+    PIPELINED = "pipelined"  # Start each pipeline stage as soon as its inputs are ready
 
 class ResultAggregationStrategy(str, Enum):
     """Result aggregation strategy enumeration."""
@@ -59,6 +71,21 @@ class NodeInfo:
     total_tasks_processed: int = 0
     average_response_time: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    url: Optional[str] = None  # Base URL of the node's API
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the node info to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["status"] = self.status.value
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NodeInfo":
+        """Create node info from a dictionary, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        node = cls(**{key: value for key, value in data.items() if key in known})
+        node.status = NodeStatus(node.status)
+        return node
 
 @dataclass
 class DistributedTask:
@@ -83,10 +110,25 @@ class DistributedModelOrchestrator:
         self.tasks: Dict[str, DistributedTask] = {}
         self.node_locks: Dict[str, asyncio.Lock] = {}
         self.discovery_interval = settings.DISCOVERY_INTERVAL or 60  # seconds
+        self.heartbeat_interval = settings.HEARTBEAT_INTERVAL or 5  # seconds
         self.heartbeat_timeout = settings.HEARTBEAT_TIMEOUT or 120  # seconds
         self._discovery_task = None
+        self._heartbeat_task = None
+        self._monitoring_task = None
         self._node_id = str(uuid.uuid4())
         
+        # Peer URLs to contact: configured seeds plus peers learned from heartbeats
+        self.seed_urls: Set[str] = {url.rstrip("/") for url in settings.DISTRIBUTED_PEERS}
+        self.peer_urls: Set[str] = set(self.seed_urls)
+        self.transport = PeerClientPool()
+        self.placement_engine = PlacementEngine(model_load_time=settings.PLACEMENT_MODEL_LOAD_TIME)
+        self.hedge_policy = HedgePolicy(
+            percentile=settings.HEDGE_PERCENTILE,
+            min_samples=settings.HEDGE_MIN_SAMPLES,
+            window=settings.HEDGE_WINDOW,
+            default_delay=settings.HEDGE_DEFAULT_DELAY
+        )
+        
         # Initialize this node
         self._init_local_node()
         
@@ -106,6 +148,8 @@ class DistributedModelOrchestrator:
             "cpu_count": psutil.cpu_count(logical=True),
             "physical_cpu_count": psutil.cpu_count(logical=False),
             "total_memory": psutil.virtual_memory().total,
+            # LLM requests the node runs as one batched model call (see the inference micro-batcher)
+            "max_batch_size": settings.BATCH_MAX_SIZE if settings.BATCHING_ENABLED else 1,
         }
         
         # Check for GPU
@@ -134,7 +178,8 @@ class DistributedModelOrchestrator:
             metadata={
                 "start_time": time.time(),
                 "platform": platform.platform()
-            }
+            },
+            url=settings.DISTRIBUTED_NODE_URL.rstrip("/") if settings.DISTRIBUTED_NODE_URL else None
         )
         
         # Add to nodes dict
@@ -150,8 +195,11 @@ class DistributedModelOrchestrator:
         # Start node discovery
         self._discovery_task = asyncio.create_task(self._node_discovery_loop())
         
+        # Start heartbeats to known nodes
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        
         # Start resource monitoring
-        asyncio.create_task(self._resource_monitoring_loop())
+        self._monitoring_task = asyncio.create_task(self._resource_monitoring_loop())
         
         logger.info("Distributed model orchestrator started")
     
@@ -159,12 +207,16 @@ class DistributedModelOrchestrator:
         """Stop the distributed orchestrator."""
         logger.info("Stopping distributed model orchestrator")
         
-        if self._discovery_task:
-            self._discovery_task.cancel()
-            try:
-                await self._discovery_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._discovery_task, self._heartbeat_task, self._monitoring_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
+        # Close pooled peer connections
+        await self.transport.close()
         
         logger.info("Distributed model orchestrator stopped")
     
@@ -175,7 +227,6 @@ class DistributedModelOrchestrator:
         while True:
             try:
                 await self._discover_nodes()
-                await self._check_node_health()
                 await asyncio.sleep(self.discovery_interval)
             except asyncio.CancelledError:
                 logger.info("Node discovery loop cancelled")
@@ -184,67 +235,156 @@ class DistributedModelOrchestrator:
                 logger.error(f"Error in node discovery loop: {str(e)}")
                 await asyncio.sleep(10)  # Shorter interval on error
     
+    async def _heartbeat_loop(self):
+        """Background task sending heartbeats to known nodes."""
+        logger.info("Starting heartbeat loop")
+        
+        while True:
+            try:
+                await asyncio.sleep(self.heartbeat_interval)
+                await self._check_node_health()
+            except asyncio.CancelledError:
+                logger.info("Heartbeat loop cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Error in heartbeat loop: {str(e)}")
+    
     async def _discover_nodes(self):
         """Discover other nodes in the network."""
         logger.debug("Discovering nodes")
         
-        # In a real implementation, this would use a service discovery mechanism
-        # like mDNS, Consul, etcd, or a custom registry service
+        # Nodes are found through configured seed peers and gossip: every
+        # heartbeat exchange shares the peer URLs each side knows about, and
+        # nodes that heartbeat us register themselves.
+        known_urls = {node.url for node in self.nodes.values() if node.url}
+        unknown_urls = [url for url in self.peer_urls if url not in known_urls and url != self.local_node.url]
         
-        # For now, we'll simulate discovery with a placeholder
-        # In a real system, you'd implement one of:
-        # 1. Multicast DNS (mDNS) for local network discovery
-        # 2. A central registry service that nodes register with
-        # 3. A distributed key-value store like etcd or Consul
-        # 4. A custom discovery protocol
+        if unknown_urls:
+            await asyncio.gather(*(self._send_heartbeat(url) for url in unknown_urls))
+    
+    async def _send_heartbeat(self, url: str) -> Optional[NodeInfo]:
+        """
+        Exchange a heartbeat with the node at a URL.
         
-        # Simulate finding a new node occasionally
-        if len(self.nodes) < 5 and time.time() % 60 < 1:
-            node_id = f"node-{uuid.uuid4()}"
-            new_node = NodeInfo(
-                node_id=node_id,
-                hostname=f"simulated-host-{len(self.nodes)}",
-                ip_address=f"192.168.1.{100 + len(self.nodes)}",
-                status=NodeStatus.ONLINE,
-                available_models=["llama-7b", "whisper-small"],
-                capabilities={
-                    "os": "Linux",
-                    "cpu_count": 8,
-                    "total_memory": 16 * 1024 * 1024 * 1024,
-                    "cuda_available": True,
-                    "cuda_devices": 1
-                },
-                resources={
-                    "cpu_percent": 20,
-                    "memory_percent": 30,
-                    "gpu_percent": 10
-                },
-                last_heartbeat=time.time()
-            )
+        Args:
+            url: Base URL of the node
             
-            self.nodes[node_id] = new_node
-            self.node_locks[node_id] = asyncio.Lock()
-            logger.info(f"Discovered new node: {node_id}")
+        Returns:
+            The node's info, or None if it could not be reached
+        """
+        try:
+            payload = await self.transport.post_json(url, f"{DISTRIBUTED_API_PATH}/heartbeat", self._heartbeat_payload())
+        except (httpx.HTTPError, ValueError) as e:
+            logger.debug(f"Heartbeat to {url} failed: {str(e)}")
+            return None
+        
+        node = NodeInfo.from_dict(payload["node"])
+        if not node.url or not self._is_trusted_url(node.url):
+            node.url = url
+        self._learn_peers(payload.get("peers", []))
+        return await self._record_heartbeat(node)
+    
+    def _heartbeat_payload(self) -> Dict[str, Any]:
+        """Build the heartbeat sent to (and returned to) other nodes."""
+        return {
+            "node": self.local_node.to_dict(),
+            "peers": sorted(node.url for node in self.nodes.values() if node.url and node.status == NodeStatus.ONLINE)
+        }
+    
+    def _is_trusted_url(self, url: str) -> bool:
+        """
+        Check whether this node may contact a peer URL.
+        Nodes sharing DISTRIBUTED_SHARED_SECRET authenticate each other, so any
+        URL they report is trusted; without a secret only the configured peers are.
+        
+        Args:
+            url: Base URL of the peer
+            
+        Returns:
+            True if the URL may be contacted
+        """
+        return bool(self.transport.shared_secret) or url.rstrip("/") in self.seed_urls
+    
+    def _learn_peers(self, urls: List[str]):
+        """Add peer URLs learned from another node."""
+        for url in urls:
+            url = url.rstrip("/")
+            if url != self.local_node.url and self._is_trusted_url(url):
+                self.peer_urls.add(url)
+    
+    async def _record_heartbeat(self, node: NodeInfo) -> NodeInfo:
+        """
+        Register or update a node after a heartbeat exchange.
+        
+        Args:
+            node: Node info reported by the node
+            
+        Returns:
+            The stored node info
+        """
+        node.last_heartbeat = time.time()  # Local clock: nodes' clocks may differ
+        existing = self.nodes.get(node.node_id)
+        
+        if existing is None:
+            logger.info(f"Discovered new node: {node.node_id} ({node.url})")
+            self.nodes[node.node_id] = node
+            self.node_locks[node.node_id] = asyncio.Lock()
+            return node
+        
+        # Keep local bookkeeping, take everything else from the node
+        node.current_tasks = existing.current_tasks
+        node.total_tasks_processed = existing.total_tasks_processed
+        node.average_response_time = existing.average_response_time
+        if existing.status != node.status:
+            logger.info(f"Node {node.node_id} is now {node.status.value}")
+        self.nodes[node.node_id] = node
+        return node
+    
+    async def handle_heartbeat(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a heartbeat received from another node.
+        
+        Args:
+            payload: Heartbeat sent by the node
+            
+        Returns:
+            This node's heartbeat
+            
+        Raises:
+            PermissionError: If the node's URL is not a trusted peer
+        """
+        node = NodeInfo.from_dict(payload["node"])
+        if node.node_id != self._node_id:
+            if not self._is_trusted_url(node.url or ""):
+                raise PermissionError(f"Node URL {node.url} is not a configured peer")
+            self._learn_peers(payload.get("peers", []))
+            if node.url:
+                self.peer_urls.add(node.url)
+            await self._record_heartbeat(node)
+        return self._heartbeat_payload()
     
     async def _check_node_health(self):
         """Check the health of all known nodes."""
-        current_time = time.time()
+        remote_nodes = [
+            node for node_id, node in self.nodes.items()
+            if node_id != self._node_id and node.url
+        ]
         
-        for node_id, node in list(self.nodes.items()):
-            if node_id == self._node_id:
-                # Skip local node
+        # Send a heartbeat to each node; nodes that answer are refreshed
+        results = await asyncio.gather(*(self._send_heartbeat(node.url) for node in remote_nodes))
+        
+        current_time = time.time()
+        for node, result in zip(remote_nodes, results):
+            if result is not None or node.status == NodeStatus.OFFLINE:
                 continue
-                
-            # Check if node has timed out
+            
             if node.last_heartbeat and current_time - node.last_heartbeat > self.heartbeat_timeout:
-                logger.warning(f"Node {node_id} has timed out")
+                logger.warning(f"Node {node.node_id} has timed out")
                 node.status = NodeStatus.OFFLINE
-                
-                # In a real system, you'd try to reconnect or remove the node
-                # For now, we'll just mark it as offline
-            
-            # In a real system, you'd send a heartbeat to each node
-            # and update its status based on the response
+            elif node.status != NodeStatus.ERROR:
+                # Stop routing work to the node until it answers again
+                logger.warning(f"Node {node.node_id} missed a heartbeat")
+                node.status = NodeStatus.ERROR
     
     async def _resource_monitoring_loop(self):
         """Background task for monitoring local resources."""
@@ -269,6 +409,9 @@ class DistributedModelOrchestrator:
                     except ImportError:
                         pass
                 
+                # Advertise the models loaded on this node
+                self.local_node.available_models = list(getattr(self.model_manager, "loaded_models", {}))
+                
                 # Update last heartbeat
                 self.local_node.last_heartbeat = time.time()
                 
@@ -427,12 +570,28 @@ class DistributedModelOrchestrator:
         """
         model_id = request.model_id
         
+        if strategy == DistributionStrategy.HEDGED:
+            return await self._run_hedged_inference(request)
+        
         # Select node for this model
         node_id = await self.select_node_for_model(model_id, strategy)
         
         if not node_id:
             raise ValueError(f"No suitable node found for model {model_id}")
         
+        return await self._run_on_node(request, node_id)
+    
+    async def _run_on_node(self, request: InferenceRequest, node_id: str) -> InferenceResponse:
+        """
+        Run inference on a specific node.
+        
+        Args:
+            request: Inference request
+            node_id: ID of the node
+            
+        Returns:
+            Inference response
+        """
         # Create task
         task_id = str(uuid.uuid4())
         task = DistributedTask(
@@ -450,11 +609,19 @@ class DistributedModelOrchestrator:
                 self.nodes[node_id].current_tasks += 1
             
             # If local node, run locally
+            start_time = time.time()
             if node_id == self._node_id:
-                return await self._run_local_inference(task)
+                response = await self._run_local_inference(task)
             else:
-                return await self._run_remote_inference(task)
-                
+                response = await self._run_remote_inference(task)
+            self.hedge_policy.record(request.model_id, time.time() - start_time)
+            return response
+            
+        except asyncio.CancelledError:
+            task.status = "cancelled"
+            task.end_time = time.time()
+            raise
+            
         finally:
             # Update node task count
             if node_id in self.node_locks:
@@ -463,6 +630,57 @@ class DistributedModelOrchestrator:
                         self.nodes[node_id].current_tasks = max(0, self.nodes[node_id].current_tasks - 1)
                         self.nodes[node_id].total_tasks_processed += 1
     
+    async def _run_hedged_inference(self, request: InferenceRequest) -> InferenceResponse:
+        """
+        Run inference with a hedged backup request.
+        
+        The request is sent to the fastest node. If it has not answered once
+        the model's hedge delay (a high percentile of its recent latencies)
+        has passed, or if it fails, the request is also sent to the next
+        fastest node. The first successful answer is returned and the other
+        request is cancelled.
+        
+        Args:
+            request: Inference request
+            
+        Returns:
+            Inference response
+            
+        Raises:
+            ValueError: If no suitable node is found
+            RuntimeError: If inference fails on every node tried
+        """
+        node_ids = await self._select_nodes_for_batch(
+            request.model_id, 2, DistributionStrategy.LATENCY_OPTIMIZED
+        )
+        node_ids = [node_id for node_id in node_ids if node_id in self.nodes][:2]
+        if not node_ids:
+            raise ValueError(f"No suitable node found for model {request.model_id}")
+        
+        primary = asyncio.create_task(self._run_on_node(request, node_ids[0]))
+        attempts = {primary: node_ids[0]}
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.hedge_policy.delay(request.model_id))
+            if len(node_ids) > 1 and (not done or primary.exception() is not None):
+                logger.debug(f"Hedging request for model {request.model_id} on node {node_ids[1]}")
+                self.hedge_policy.hedged += 1
+                attempts[asyncio.create_task(self._run_on_node(request, node_ids[1]))] = node_ids[1]
+            
+            pending = set(attempts)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is not primary:
+                            self.hedge_policy.hedge_wins += 1
+                        return attempt.result()
+                    error = attempt.exception()
+            raise error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+    
     async def _run_local_inference(self, task: DistributedTask) -> InferenceResponse:
         """
         Run inference locally.
@@ -495,17 +713,7 @@ class DistributedModelOrchestrator:
             
             # Update node stats
             if task.start_time and task.end_time:
-                response_time = task.end_time - task.start_time
-                
-                if self.local_node.average_response_time is None:
-                    self.local_node.average_response_time = response_time
-                else:
-                    # Exponential moving average
-                    alpha = 0.2  # Smoothing factor
-                    self.local_node.average_response_time = (
-                        alpha * response_time + 
-                        (1 - alpha) * self.local_node.average_response_time
-                    )
+                self._update_response_time(self.local_node, task.end_time - task.start_time)
             
             return response
             
@@ -536,24 +744,17 @@ class DistributedModelOrchestrator:
         task.start_time = time.time()
         
         try:
-            # In a real implementation, this would make an API call to the remote node
-            # For now, we'll simulate a remote call
-            
-            # Simulate network delay
-            await asyncio.sleep(0.1)
-            
-            # Simulate remote processing
-            await asyncio.sleep(0.5)
-            
-            # Create mock response
-            response = InferenceResponse(
-                model_id=task.request.model_id,
-                outputs=f"Mock output from remote node {task.node_id}",
-                metadata={
-                    "node_id": task.node_id,
-                    "processing_time_ms": 500
-                }
+            node = self.nodes.get(task.node_id)
+            if node is None or not node.url:
+                raise ValueError(f"No URL known for node {task.node_id}")
+            
+            payload = await self.transport.post_json(
+                node.url,
+                f"{DISTRIBUTED_API_PATH}/inference",
+                task.request.model_dump(mode="json")
             )
+            response = InferenceResponse(**payload)
+            response.metadata.setdefault("node_id", task.node_id)
             
             # Update task
             task.status = "completed"
@@ -562,18 +763,7 @@ class DistributedModelOrchestrator:
             
             # Update node stats
             if task.node_id in self.nodes and task.start_time and task.end_time:
-                node = self.nodes[task.node_id]
-                response_time = task.end_time - task.start_time
-                
-                if node.average_response_time is None:
-                    node.average_response_time = response_time
-                else:
-                    # Exponential moving average
-                    alpha = 0.2  # Smoothing factor
-                    node.average_response_time = (
-                        alpha * response_time + 
-                        (1 - alpha) * node.average_response_time
-                    )
+                self._update_response_time(self.nodes[task.node_id], task.end_time - task.start_time)
             
             return response
             
@@ -587,6 +777,52 @@ class DistributedModelOrchestrator:
             
             raise RuntimeError(f"Remote inference failed: {str(e)}")
     
+    @staticmethod
+    def _update_response_time(node: NodeInfo, response_time: float):
+        """
+        Update a node's average response time.
+        
+        Args:
+            node: Node info
+            response_time: Observed response time in seconds
+        """
+        if node.average_response_time is None:
+            node.average_response_time = response_time
+        else:
+            # Exponential moving average
+            alpha = 0.2  # Smoothing factor
+            node.average_response_time = (
+                alpha * response_time + 
+                (1 - alpha) * node.average_response_time
+            )
+    
+    async def serve_remote_inference(self, request: InferenceRequest) -> InferenceResponse:
+        """
+        Run inference requested by another node on this node.
+        
+        Args:
+            request: Inference request
+            
+        Returns:
+            Inference response
+        """
+        task = DistributedTask(
+            task_id=str(uuid.uuid4()),
+            request=request,
+            node_id=self._node_id,
+            status="pending"
+        )
+        self.tasks[task.task_id] = task
+        
+        self.local_node.current_tasks += 1
+        try:
+            response = await self._run_local_inference(task)
+            response.metadata.setdefault("node_id", self._node_id)
+            return response
+        finally:
+            self.local_node.current_tasks = max(0, self.local_node.current_tasks - 1)
+            self.local_node.total_tasks_processed += 1
+    
     async def run_distributed_parallel_inference(
         self,
         request: InferenceRequest,
@@ -618,12 +854,18 @@ class DistributedModelOrchestrator:
         ]
         
         # Run all requests in parallel
-        tasks = []
-        for req in requests:
-            task = asyncio.create_task(
-                self.run_distributed_inference(req, strategy)
-            )
-            tasks.append(task)
+        scheduler = None
+        if strategy == DistributionStrategy.WORK_STEALING:
+            scheduler = self._create_work_stealing_scheduler(requests)
+            tasks = [scheduler.submit(node_id, req) for node_id, req in self._assign_requests(requests)]
+            scheduler.start()
+        else:
+            tasks = []
+            for req in requests:
+                task = asyncio.create_task(
+                    self.run_distributed_inference(req, strategy)
+                )
+                tasks.append(task)
         
         # Wait for all tasks to complete
         if aggregation_strategy == ResultAggregationStrategy.FIRST_RESPONSE:
@@ -636,13 +878,17 @@ class DistributedModelOrchestrator:
             # Cancel remaining tasks
             for task in pending:
                 task.cancel()
+            if scheduler:
+                scheduler.cancel()
             
-            # Return first result
-            return next(iter(done)).result()
+            # Return first result (in request order if several finished together)
+            return next(task for task in tasks if task in done).result()
             
         else:
             # Wait for all responses
             results = await asyncio.gather(*tasks, return_exceptions=True)
+            if scheduler:
+                logger.debug(f"Work stealing moved {scheduler.steals} of {len(requests)} requests")
             
             # Filter out exceptions
             valid_results = [
@@ -670,6 +916,55 @@ class DistributedModelOrchestrator:
                 # Default to returning all responses
                 return valid_results
     
+    def _create_work_stealing_scheduler(self, requests: List[InferenceRequest]) -> WorkStealingScheduler:
+        """
+        Create a work-stealing scheduler over the online nodes.
+        
+        Every node gets as many workers as requests it processes at once.
+        
+        Args:
+            requests: Requests that will be scheduled
+            
+        Returns:
+            Work-stealing scheduler
+        """
+        workers = {
+            node.node_id: max(1, int(node.capabilities.get("max_batch_size", 1)))
+            for node in self.nodes.values()
+            if node.status == NodeStatus.ONLINE
+        }
+        return WorkStealingScheduler(
+            lambda node_id, request: self._run_on_node(request, node_id),
+            workers or {self._node_id: 1}
+        )
+    
+    def _assign_requests(self, requests: List[InferenceRequest]) -> List[Tuple[str, InferenceRequest]]:
+        """
+        Assign each request to the node with the earliest estimated completion time.
+        
+        Args:
+            requests: Inference requests
+            
+        Returns:
+            List of (node_id, request) pairs, in request order
+        """
+        online_nodes = [node for node in self.nodes.values() if node.status == NodeStatus.ONLINE]
+        if not online_nodes:
+            return [(self._node_id, request) for request in requests]
+        
+        planned: Dict[str, int] = {}
+        assignments = []
+        for request in requests:
+            node = min(
+                online_nodes,
+                key=lambda node: self._node_profile(node, request.model_id, planned.get(node.node_id, 0)).completion_time(
+                    1, self.placement_engine.model_load_time
+                )
+            )
+            planned[node.node_id] = planned.get(node.node_id, 0) + 1
+            assignments.append((node.node_id, request))
+        return assignments
+    
     def _aggregate_by_majority_vote(self, responses: List[InferenceResponse]) -> InferenceResponse:
         """
         Aggregate responses by majority vote.
@@ -814,70 +1109,213 @@ class DistributedModelOrchestrator:
         Returns:
             List of inference responses
         """
-        # Group requests by model ID
-        model_requests = {}
-        for request in requests:
-            model_id = request.model_id
-            if model_id not in model_requests:
-                model_requests[model_id] = []
-            model_requests[model_id].append(request)
-        
-        # For each model, select optimal nodes
-        model_nodes = {}
-        for model_id, reqs in model_requests.items():
-            # Select nodes for this model
-            nodes = await self._select_nodes_for_batch(model_id, len(reqs), strategy)
-            model_nodes[model_id] = nodes
-        
-        # Distribute requests to nodes
-        tasks = []
-        for model_id, reqs in model_requests.items():
-            nodes = model_nodes[model_id]
-            
-            # Distribute requests evenly across nodes
-            for i, request in enumerate(reqs):
-                # Select node using round-robin
-                node_idx = i % len(nodes)
-                node_id = nodes[node_idx]
-                
-                # Create task for this request
-                task_id = str(uuid.uuid4())
-                task = DistributedTask(
-                    task_id=task_id,
-                    request=request,
-                    node_id=node_id,
-                    status="pending"
-                )
-                
-                self.tasks[task_id] = task
-                
-                # Create async task
-                if node_id == self._node_id:
-                    # Run locally
-                    async_task = asyncio.create_task(self._run_local_inference(task))
+        # Group request positions by model ID
+        model_requests: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            model_requests.setdefault(request.model_id, []).append(index)
+        
+        # Place each model's requests as contiguous sub-batches; requests placed
+        # earlier in this call count towards a node's queue for later models
+        planned: Dict[str, int] = {}
+        node_batches: Dict[str, List[int]] = {}
+        for model_id, indices in model_requests.items():
+            node_ids = await self._select_nodes_for_batch(model_id, len(indices), strategy)
+            profiles = [
+                self._node_profile(self.nodes[node_id], model_id, planned.get(node_id, 0))
+                for node_id in node_ids if node_id in self.nodes
+            ]
+            placement = self.placement_engine.place(profiles, len(indices)) or [(self._node_id, 0, len(indices))]
+            
+            for node_id, start, end in placement:
+                node_batches.setdefault(node_id, []).extend(indices[start:end])
+                planned[node_id] = planned.get(node_id, 0) + end - start
+        
+        sizes = {node_id: len(indices) for node_id, indices in node_batches.items()}
+        logger.debug(f"Placed batch of {len(requests)} requests: {sizes}")
+        
+        # One call per node
+        results = await asyncio.gather(
+            *(self._run_node_batch(node_id, [requests[i] for i in indices]) for node_id, indices in node_batches.items()),
+            return_exceptions=True
+        )
+        
+        # Process results in the original request order
+        responses: List[Optional[InferenceResponse]] = [None] * len(requests)
+        for indices, node_results in zip(node_batches.values(), results):
+            if isinstance(node_results, Exception):
+                node_results = [node_results] * len(indices)
+            
+            for index, result in zip(indices, node_results):
+                if isinstance(result, Exception):
+                    # Create error response
+                    responses[index] = InferenceResponse(
+                        model_id="error",
+                        outputs="Error during inference",
+                        metadata={"error": str(result)}
+                    )
                 else:
-                    # Run remotely
-                    async_task = asyncio.create_task(self._run_remote_inference(task))
-                
-                tasks.append(async_task)
+                    responses[index] = result
         
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return responses
+    
+    def _node_profile(self, node: NodeInfo, model_id: str, planned: int = 0) -> NodeProfile:
+        """
+        Build the placement cost model inputs for a node.
+        
+        Args:
+            node: Node info
+            model_id: ID of the model to run
+            planned: Requests already placed on the node but not yet sent
+            
+        Returns:
+            Node profile
+        """
+        return NodeProfile(
+            node_id=node.node_id,
+            latency=node.average_response_time or settings.PLACEMENT_DEFAULT_LATENCY,
+            queue_depth=node.current_tasks + planned,
+            capacity=max(1, int(node.capabilities.get("max_batch_size", 1))),
+            model_loaded=model_id in node.available_models,
+            overhead=0.0 if node.node_id == self._node_id else settings.PLACEMENT_RPC_OVERHEAD
+        )
+    
+    async def _run_node_batch(
+        self,
+        node_id: str,
+        requests: List[InferenceRequest]
+    ) -> List[Union[InferenceResponse, Exception]]:
+        """
+        Run a sub-batch of requests on one node with a single call.
+        
+        Args:
+            node_id: ID of the node
+            requests: Inference requests
+            
+        Returns:
+            Response or exception for each request, in order
+        """
+        tasks = []
+        for request in requests:
+            task = DistributedTask(
+                task_id=str(uuid.uuid4()),
+                request=request,
+                node_id=node_id,
+                status="pending"
+            )
+            self.tasks[task.task_id] = task
+            tasks.append(task)
+        
+        node = self.nodes[node_id]
+        async with self.node_locks[node_id]:
+            node.current_tasks += len(tasks)
+        
+        start_time = time.time()
+        try:
+            if node_id == self._node_id:
+                return await self._run_local_batch(tasks)
+            else:
+                return await self._run_remote_batch(node_id, tasks)
+        finally:
+            if node_id in self.node_locks:
+                async with self.node_locks[node_id]:
+                    node.current_tasks = max(0, node.current_tasks - len(tasks))
+                    node.total_tasks_processed += len(tasks)
+            
+            # Record the time per wave of requests the node processes together
+            if node_id != self._node_id:
+                capacity = max(1, int(node.capabilities.get("max_batch_size", 1)))
+                waves = -(-len(tasks) // capacity)
+                self._update_response_time(node, (time.time() - start_time) / waves)
+    
+    async def _run_local_batch(self, tasks: List[DistributedTask]) -> List[Union[InferenceResponse, Exception]]:
+        """
+        Run a sub-batch locally.
+        
+        The requests run concurrently, so the local inference service can
+        micro-batch them.
+        
+        Args:
+            tasks: Distributed tasks
+            
+        Returns:
+            Response or exception for each task, in order
+        """
+        return await asyncio.gather(
+            *(self._run_local_inference(task) for task in tasks),
+            return_exceptions=True
+        )
+    
+    async def _run_remote_batch(self, node_id: str, tasks: List[DistributedTask]) -> List[Union[InferenceResponse, Exception]]:
+        """
+        Run a sub-batch on a remote node with one batched RPC.
+        
+        Args:
+            node_id: ID of the node
+            tasks: Distributed tasks
+            
+        Returns:
+            Response or exception for each task, in order
+        """
+        logger.info(f"Running {len(tasks)} tasks on remote node {node_id}")
+        
+        start_time = time.time()
+        for task in tasks:
+            task.status = "running"
+            task.start_time = start_time
+        
+        try:
+            node = self.nodes.get(node_id)
+            if node is None or not node.url:
+                raise ValueError(f"No URL known for node {node_id}")
+            
+            payload = await self.transport.post_json(
+                node.url,
+                f"{DISTRIBUTED_API_PATH}/inference/batch",
+                [task.request.model_dump(mode="json") for task in tasks]
+            )
+            if len(payload) != len(tasks):
+                raise ValueError(f"Node {node_id} returned {len(payload)} responses for {len(tasks)} requests")
+        except Exception as e:
+            logger.error(f"Error running remote batch on node {node_id}: {str(e)}")
+            payload = [{"error": str(e)}] * len(tasks)
+        
+        results: List[Union[InferenceResponse, Exception]] = []
+        end_time = time.time()
+        for task, item in zip(tasks, payload):
+            task.end_time = end_time
+            if "error" in item:
+                task.status = "error"
+                task.error = item["error"]
+                results.append(RuntimeError(f"Remote inference failed: {item['error']}"))
+            else:
+                response = InferenceResponse(**item)
+                response.metadata.setdefault("node_id", node_id)
+                task.status = "completed"
+                task.result = response
+                results.append(response)
+        
+        return results
+    
+    async def serve_remote_batch(self, requests: List[InferenceRequest]) -> List[Dict[str, Any]]:
+        """
+        Run a sub-batch requested by another node on this node.
+        
+        Args:
+            requests: Inference requests
+            
+        Returns:
+            Serialized response, or {"error": message}, for each request
+        """
+        results = await self._run_node_batch(self._node_id, requests)
         
-        # Process results
-        responses = []
+        serialized = []
         for result in results:
             if isinstance(result, Exception):
-                # Create error response
-                responses.append(InferenceResponse(
-                    model_id="error",
-                    outputs="Error during inference",
-                    metadata={"error": str(result)}
-                ))
+                serialized.append({"error": str(result)})
             else:
-                responses.append(result)
-        
-        return responses
+                result.metadata.setdefault("node_id", self._node_id)
+                serialized.append(result.model_dump(mode="json"))
+        return serialized
     
     async def _select_nodes_for_batch(
         self,
@@ -1029,6 +1467,9 @@ class DistributedModelOrchestrator:
         if len(requests) != len(dependencies):
             raise ValueError("Length of requests and dependencies must match")
         
+        if strategy == DistributionStrategy.PIPELINED:
+            return await self._run_pipeline_dataflow(requests, dependencies)
+        
         # Results storage
         results: List[Optional[InferenceResponse]] = [None] * len(requests)
         
@@ -1050,24 +1491,8 @@ class DistributedModelOrchestrator:
             # Execute ready stages in parallel
             stage_tasks = []
             for stage_idx in ready_stages:
-                # Get request for this stage
-                request = requests[stage_idx]
-                
-                # Update inputs with results from dependencies if needed
-                if dependencies[stage_idx]:
-                    # Create a copy of the request to modify
-                    request = InferenceRequest(
-                        model_id=request.model_id,
-                        inputs=request.inputs,
-                        parameters=request.parameters,
-                        metadata=dict(request.metadata) if request.metadata else {}
-                    )
-                    
-                    # Add dependency results to metadata
-                    request.metadata["dependency_results"] = {
-                        f"stage_{dep}": results[dep].outputs
-                        for dep in dependencies[stage_idx]
-                    }
+                # Get request for this stage, with results from dependencies
+                request = self._pipeline_stage_request(requests[stage_idx], dependencies[stage_idx], results)
                 
                 # Create task for this stage
                 task = asyncio.create_task(
@@ -1093,6 +1518,145 @@ class DistributedModelOrchestrator:
         
         return results
     
+    @staticmethod
+    def _pipeline_stage_request(
+        request: InferenceRequest,
+        dependencies: List[int],
+        results: List[Optional[InferenceResponse]]
+    ) -> InferenceRequest:
+        """
+        Build the request of a pipeline stage from the results of its dependencies.
+        
+        Args:
+            request: Request of the stage
+            dependencies: Indices of the stages it depends on
+            results: Results of the stages so far
+            
+        Returns:
+            Request with the dependency results in its metadata
+        """
+        if not dependencies:
+            return request
+        
+        # Create a copy of the request to modify
+        request = InferenceRequest(
+            model_id=request.model_id,
+            inputs=request.inputs,
+            parameters=request.parameters,
+            metadata=dict(request.metadata) if request.metadata else {}
+        )
+        
+        # Add dependency results to metadata
+        request.metadata["dependency_results"] = {
+            f"stage_{dep}": results[dep].outputs
+            for dep in dependencies
+        }
+        return request
+    
+    async def _run_pipeline_dataflow(
+        self,
+        requests: List[InferenceRequest],
+        dependencies: List[List[int]]
+    ) -> List[InferenceResponse]:
+        """
+        Run a pipeline starting every stage as soon as its own dependencies are done.
+        
+        Unlike level-by-level execution, a slow stage only delays the stages
+        that depend on it.
+        
+        Args:
+            requests: List of inference requests
+            dependencies: List of dependency indices for each request
+            
+        Returns:
+            List of inference responses
+        """
+        # Order the stages topologically so every stage's dependencies are scheduled first
+        remaining = {i: set(deps) for i, deps in enumerate(dependencies)}
+        order = []
+        while remaining:
+            ready = [i for i, deps in remaining.items() if not deps - set(order)]
+            if not ready:
+                raise ValueError("Circular dependency detected in pipeline")
+            order.extend(ready)
+            for i in ready:
+                del remaining[i]
+        
+        results: List[Optional[InferenceResponse]] = [None] * len(requests)
+        stage_tasks: Dict[int, asyncio.Task] = {}
+        
+        async def run_stage(stage_idx: int) -> None:
+            if dependencies[stage_idx]:
+                await asyncio.gather(*(stage_tasks[dep] for dep in dependencies[stage_idx]))
+            request = self._pipeline_stage_request(requests[stage_idx], dependencies[stage_idx], results)
+            try:
+                results[stage_idx] = await self.run_distributed_inference(request, DistributionStrategy.LEAST_LOADED)
+            except Exception as e:
+                logger.error(f"Error in pipeline stage {stage_idx}: {str(e)}")
+                results[stage_idx] = InferenceResponse(
+                    model_id=requests[stage_idx].model_id,
+                    outputs=f"Error: {str(e)}",
+                    metadata={"error": str(e), "stage": stage_idx}
+                )
+        
+        for stage_idx in order:
+            stage_tasks[stage_idx] = asyncio.create_task(run_stage(stage_idx))
+        await asyncio.gather(*stage_tasks.values())
+        
+        return results
+    
+    async def run_distributed_stage_pipeline(
+        self,
+        inputs: List[Any],
+        stages: List[InferenceRequest],
+        strategy: DistributionStrategy = DistributionStrategy.LEAST_LOADED,
+        workers_per_stage: int = 1
+    ) -> List[InferenceResponse]:
+        """
+        Run several items through a chain of model stages, overlapping the stages.
+        
+        Stage k+1 of item i runs while stage k processes item i+1. The first
+        stage gets the item as its inputs; every later stage gets the outputs of
+        the previous stage as inputs and in the dependency results of its metadata.
+        
+        Args:
+            inputs: Inputs of the items
+            stages: Request template of each stage (its inputs are replaced)
+            strategy: Node selection strategy for every stage call
+            workers_per_stage: Items each stage processes concurrently
+            
+        Returns:
+            Response of the last stage for each item, in order
+        """
+        def make_stage(stage_idx: int):
+            template = stages[stage_idx]
+            
+            async def run(item_index: int, value: Any) -> Any:
+                metadata = dict(template.metadata) if template.metadata else {}
+                metadata["item_index"] = item_index
+                if stage_idx:
+                    metadata["dependency_results"] = {f"stage_{stage_idx - 1}": value.outputs}
+                request = InferenceRequest(
+                    model_id=template.model_id,
+                    inputs=value.outputs if stage_idx else value,
+                    parameters=template.parameters,
+                    metadata=metadata
+                )
+                return await self.run_distributed_inference(request, strategy)
+            
+            return run
+        
+        results = await run_stage_pipeline(inputs, [make_stage(i) for i in range(len(stages))], workers_per_stage)
+        
+        return [
+            InferenceResponse(
+                model_id="error",
+                outputs=f"Error: {str(result)}",
+                metadata={"error": str(result), "item": index}
+            ) if isinstance(result, Exception) else result
+            for index, result in enumerate(results)
+        ]
+    
     async def register_node(self, node_info: NodeInfo) -> bool:
         """
         Register a new node with the orchestrator.
@@ -1259,6 +1823,7 @@ class DistributedModelOrchestrator:
 
 
 # Factory function
+@lru_cache()
 def get_distributed_model_orchestrator() -> DistributedModelOrchestrator:
     """
     Get or create a distributed model orchestrator instance.
@@ -0,0 +1,268 @@
+"""
+Tail-latency scheduling for distributed model execution.
+
+This module provides the scheduling building blocks used by the distributed
+orchestrator:
+- Hedge delays derived from a percentile of recent per-model latencies
+- Work-stealing queues, where idle nodes take pending tasks from the most
+  loaded node
+- Stage pipelines, where stage k+1 of item i runs while stage k works on item i+1
+"""
+import asyncio
+import logging
+import math
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class HedgePolicy:
+    """
+    Decides how long to wait for a request before hedging it on a second node.
+    """
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        window: int = 100,
+        default_delay: float = 1.0
+    ):
+        """
+        Initialize the hedge policy.
+
+        Args:
+            percentile: Latency percentile after which a request is hedged
+            min_samples: Latencies needed before the percentile is used
+            window: Recent latencies kept per model
+            default_delay: Delay in seconds for models without enough samples
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.default_delay = default_delay
+        self._latencies: Dict[str, Deque[float]] = {}
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def record(self, model_id: str, latency: float) -> None:
+        """
+        Record the latency of a completed request.
+
+        Args:
+            model_id: ID of the model
+            latency: Latency in seconds
+        """
+        latencies = self._latencies.get(model_id)
+        if latencies is None:
+            latencies = self._latencies[model_id] = deque(maxlen=self.window)
+        latencies.append(latency)
+
+    def delay(self, model_id: str) -> float:
+        """
+        Get the hedge delay of a model.
+
+        Args:
+            model_id: ID of the model
+
+        Returns:
+            Seconds to wait for the first node before sending the request to a second node
+        """
+        latencies = self._latencies.get(model_id)
+        if not latencies or len(latencies) < self.min_samples:
+            return self.default_delay
+        ordered = sorted(latencies)
+        rank = max(1, math.ceil(self.percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging statistics.
+
+        Returns:
+            Dictionary with hedge counters and the current delay per model
+        """
+        return {
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "delays": {model_id: self.delay(model_id) for model_id in self._latencies}
+        }
+
+
+class WorkStealingScheduler:
+    """
+    Runs tasks from per-node queues with a fixed number of workers per node.
+
+    Each worker takes tasks from the head of its node's queue. A worker whose
+    queue is empty steals from the tail of the longest other queue, so a slow
+    or overloaded node does not hold on to work that idle nodes could do.
+    """
+    def __init__(self, run: Callable[[str, Any], Awaitable[Any]], workers: Dict[str, int]):
+        """
+        Initialize the scheduler.
+
+        Args:
+            run: Coroutine function running an item on a node, called as run(node_id, item)
+            workers: Number of concurrent workers per node ID
+        """
+        self.run = run
+        self.workers = {node_id: max(1, count) for node_id, count in workers.items()}
+        self.queues: Dict[str, Deque[Tuple[Any, asyncio.Future]]] = {node_id: deque() for node_id in self.workers}
+        self.steals = 0
+        self._worker_tasks: List[asyncio.Task] = []
+
+    def submit(self, node_id: str, item: Any) -> asyncio.Future:
+        """
+        Queue an item on a node.
+
+        Args:
+            node_id: ID of the node the item is initially assigned to
+            item: Item to run
+
+        Returns:
+            Future resolved with the result of the item
+        """
+        if node_id not in self.queues:
+            self.workers[node_id] = 1
+            self.queues[node_id] = deque()
+        future = asyncio.get_running_loop().create_future()
+        self.queues[node_id].append((item, future))
+        return future
+
+    def _next(self, node_id: str) -> Optional[Tuple[Any, asyncio.Future]]:
+        """
+        Get the next item for a worker of a node, stealing if its queue is empty.
+
+        Args:
+            node_id: ID of the worker's node
+
+        Returns:
+            Tuple of the item and its future, or None if all queues are empty
+        """
+        own_queue = self.queues[node_id]
+        if own_queue:
+            return own_queue.popleft()
+
+        victim = max(self.queues.values(), key=len)
+        if not victim:
+            return None
+        self.steals += 1
+        return victim.pop()
+
+    async def _worker(self, node_id: str) -> None:
+        """
+        Run items until no queue has work left.
+
+        Args:
+            node_id: ID of the worker's node
+        """
+        while True:
+            entry = self._next(node_id)
+            if entry is None:
+                return
+            item, future = entry
+            if future.done():
+                continue
+            try:
+                result = await self.run(node_id, item)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    def start(self) -> None:
+        """Start the workers for the queued items."""
+        for node_id, count in self.workers.items():
+            for _ in range(count):
+                self._worker_tasks.append(asyncio.create_task(self._worker(node_id)))
+
+    async def join(self) -> None:
+        """Wait until all queued items have run."""
+        await asyncio.gather(*self._worker_tasks)
+
+    def cancel(self) -> None:
+        """Cancel the workers and every item that has not completed."""
+        for task in self._worker_tasks:
+            task.cancel()
+        for queue in self.queues.values():
+            while queue:
+                _, future = queue.popleft()
+                future.cancel()
+
+
+# Marks the end of the items flowing through a stage pipeline
+_END = object()
+
+
+async def run_stage_pipeline(
+    items: Sequence[Any],
+    stages: Sequence[Callable[[int, Any], Awaitable[Any]]],
+    workers_per_stage: int = 1
+) -> List[Union[Any, Exception]]:
+    """
+    Run items through a chain of stages, overlapping the stages.
+
+    Every stage has its own workers and input queue, so stage k+1 processes
+    item i while stage k already processes item i+1. An item whose stage
+    fails skips the remaining stages.
+
+    Args:
+        items: Inputs of the first stage
+        stages: Coroutine functions called as stage(item_index, value) with the
+            previous stage's output (or the item for the first stage)
+        workers_per_stage: Concurrent workers per stage
+
+    Returns:
+        Output of the last stage or the exception raised for each item, in order
+    """
+    results: List[Union[Any, Exception]] = list(items)
+    if not stages:
+        return results
+
+    workers_per_stage = max(1, workers_per_stage)
+    queues = [asyncio.Queue() for _ in range(len(stages) + 1)]
+
+    async def stage_worker(stage_index: int) -> None:
+        stage = stages[stage_index]
+        inbox, outbox = queues[stage_index], queues[stage_index + 1]
+        while True:
+            entry = await inbox.get()
+            if entry is _END:
+                # Let the other workers of this stage see the end too
+                await inbox.put(_END)
+                return
+            item_index, value = entry
+            if not isinstance(value, Exception):
+                try:
+                    value = await stage(item_index, value)
+                except Exception as e:
+                    logger.error(f"Error in pipeline stage {stage_index} for item {item_index}: {str(e)}")
+                    value = e
+            await outbox.put((item_index, value))
+
+    async def stage_group(stage_index: int) -> None:
+        await asyncio.gather(*(stage_worker(stage_index) for _ in range(workers_per_stage)))
+        await queues[stage_index + 1].put(_END)
+
+    for item_index, item in enumerate(items):
+        queues[0].put_nowait((item_index, item))
+    queues[0].put_nowait(_END)
+
+    stage_tasks = [asyncio.create_task(stage_group(index)) for index in range(len(stages))]
+    try:
+        while True:
+            entry = await queues[-1].get()
+            if entry is _END:
+                break
+            item_index, value = entry
+            results[item_index] = value
+    finally:
+        for task in stage_tasks:
+            task.cancel()
+
+    return results
@@ -99,7 +99,23 @@ class LLMIntegration:
         Returns:
             Inference result
         """
-        logger.info(f"Running inference with llama.cpp model {model['model_id']}")
+        results = await self.run_llama_inference_batch(model, [prompt], params)
+        return results[0]
+    
+    async def run_llama_inference_batch(self, model: Any, prompts: List[str], params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Run inference for several prompts with one llama.cpp model call.
+        The prompts are decoded together and share the sampling parameters.
+        
+        Args:
+            model: Loaded model object
+            prompts: Input prompts
+            params: Inference parameters shared by all prompts
+            
+        Returns:
+            One inference result per prompt, in order
+        """
+        logger.info(f"Running inference with llama.cpp model {model['model_id']} for {len(prompts)} prompt(s)")
         
         try:
             # Extract parameters
@@ -107,28 +123,30 @@ class LLMIntegration:
             temperature = params.get("temperature", 0.7)
             top_p = params.get("top_p", 0.95)
             
-            # Simulate inference delay based on prompt length and max_tokens
-            delay = (len(prompt) / 1000) + (max_tokens / 100)
+            # Simulate inference delay: one forward pass over the batch, bounded by its longest prompt
+            delay = (max(len(prompt) for prompt in prompts) / 1000) + (max_tokens / 100)
             delay = min(max(delay, 0.5), 5.0)  # Between 0.5 and 5 seconds
             await asyncio.sleep(delay)
             
-            # Generate a placeholder response
-            response = f"This is a simulated response from llama.cpp model {model['model_id']} to prompt: {prompt[:50]}..."
-            
-            # Create result
-            result = {
-                "text": response,
-                "usage": {
-                    "prompt_tokens": len(prompt) // 4,
-                    "completion_tokens": len(response) // 4,
-                    "total_tokens": (len(prompt) + len(response)) // 4
-                },
-                "model": model["model_id"],
-                "finish_reason": "length" if len(response) >= max_tokens else "stop"
-            }
+            results = []
+            for prompt in prompts:
+                # Generate a placeholder response
+                response = f"This is a simulated response from llama.cpp model {model['model_id']} to prompt: {prompt[:50]}..."
+                
+                # Create result
+                results.append({
+                    "text": response,
+                    "usage": {
+                        "prompt_tokens": len(prompt) // 4,
+                        "completion_tokens": len(response) // 4,
+                        "total_tokens": (len(prompt) + len(response)) // 4
+                    },
+                    "model": model["model_id"],
+                    "finish_reason": "length" if len(response) >= max_tokens else "stop"
+                })
             
             logger.info(f"Completed inference with llama.cpp model {model['model_id']}")
-            return result
+            return results
             
         except Exception as e:
             logger.error(f"Error running inference with llama.cpp model {model['model_id']}: {str(e)}")
@@ -194,26 +212,45 @@ class LLMIntegration:
         Returns:
             Inference result
         """
-        logger.info(f"Running inference with ONNX model {model['model_id']}")
+        results = await self.run_onnx_inference_batch(model, [inputs], params)
+        return results[0]
+    
+    async def run_onnx_inference_batch(
+        self, model: Any, inputs: List[Union[str, Dict[str, Any]]], params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run inference for several inputs with one ONNX session run.
+        
+        Args:
+            model: Loaded model object
+            inputs: Model inputs, one per request
+            params: Inference parameters shared by all inputs
+            
+        Returns:
+            One inference result per input, in order
+        """
+        logger.info(f"Running inference with ONNX model {model['model_id']} for {len(inputs)} input(s)")
         
         try:
             # Simulate inference delay
             await asyncio.sleep(0.5)
             
-            # Generate a placeholder response
-            if isinstance(inputs, str):
-                response = f"ONNX model response to: {inputs[:50]}..."
-            else:
-                response = f"ONNX model response to structured input"
-            
-            # Create result
-            result = {
-                "text": response,
-                "model": model["model_id"]
-            }
+            results = []
+            for item in inputs:
+                # Generate a placeholder response
+                if isinstance(item, str):
+                    response = f"ONNX model response to: {item[:50]}..."
+                else:
+                    response = f"ONNX model response to structured input"
+                
+                # Create result
+                results.append({
+                    "text": response,
+                    "model": model["model_id"]
+                })
             
             logger.info(f"Completed inference with ONNX model {model['model_id']}")
-            return result
+            return results
             
         except Exception as e:
             logger.error(f"Error running inference with ONNX model {model['model_id']}: {str(e)}")
@@ -4,90 +4,79 @@ Model cache module for AI Orchestrator.
 This module provides caching functionality for model outputs to improve performance
 and reduce redundant computations.
 """
-import os
 import logging
 import json
 import hashlib
 import asyncio
-from typing import Dict, Any, Optional, Union, Tuple
-from datetime import datetime, timedelta
-from pathlib import Path
 import pickle
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from pathlib import Path
 
 from ..core.config import settings
+from ..core.result_store import SegmentStore
 
 logger = logging.getLogger(__name__)
 
 class ModelCache:
     """
     Cache for model outputs to improve performance.
+    
+    Results are kept in two tiers: an in-memory LRU of deserialized values with
+    its own byte budget, and a segment file store on disk (see result_store).
+    Disk I/O and (de)serialization run in the default executor.
     """
     def __init__(self):
         """Initialize the model cache."""
         self.cache_dir = Path(settings.CACHE_DIR)
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_size_limit = settings.CACHE_SIZE_LIMIT  # MB
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
-        self.cache_lock = asyncio.Lock()
+        self.memory_limit = settings.CACHE_MEMORY_LIMIT  # MB
+        # Cache key -> (value, serialized size), least recently used first
+        self.memory_cache: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self.memory_bytes = 0
+        self.store: Optional[SegmentStore] = None
         self.cache_stats = {
             "hits": 0,
             "misses": 0,
-            "size_bytes": 0
+            "memory_hits": 0
         }
         
         # Initialize cache
         self._init_cache()
         
     def _init_cache(self):
-        """Initialize cache and load metadata."""
+        """Open the segment store and import entries from the old one-file-per-entry layout."""
         logger.info(f"Initializing model cache in {self.cache_dir}")
         
-        # Create metadata file if it doesn't exist
-        metadata_path = self.cache_dir / "metadata.json"
-        if not metadata_path.exists():
-            with open(metadata_path, "w") as f:
-                json.dump({
-                    "created_at": datetime.now().isoformat(),
-                    "last_cleanup": None,
-                    "entries": 0,
-                    "size_bytes": 0
-                }, f)
-        
-        # Load existing cache entries into memory (just metadata, not values)
         try:
-            total_size = 0
-            entries = 0
-            
-            for cache_file in self.cache_dir.glob("*.cache"):
-                if cache_file.name == "metadata.json":
-                    continue
-                    
-                # Get file size
-                file_size = os.path.getsize(cache_file)
-                total_size += file_size
-                entries += 1
-                
-                # Extract key from filename
-                key = cache_file.stem
-                
-                # Add to memory cache index (without loading value)
-                self.memory_cache[key] = {
-                    "path": str(cache_file),
-                    "size": file_size,
-                    "last_accessed": datetime.now().isoformat()
-                }
-            
-            # Update cache stats
-            self.cache_stats["size_bytes"] = total_size
-            
-            logger.info(f"Cache initialized with {entries} entries, total size: {total_size / (1024*1024):.2f} MB")
-            
-            # Run cleanup if needed
-            if total_size > self.cache_size_limit * 1024 * 1024:
-                asyncio.create_task(self.cleanup_cache())
-                
+            self.store = SegmentStore(
+                self.cache_dir / "segments",
+                max_bytes=self.cache_size_limit * 1024 * 1024,
+                segment_bytes=settings.CACHE_SEGMENT_SIZE * 1024 * 1024
+            )
+            self._migrate_legacy_entries()
+            logger.info(f"Cache initialized with {len(self.store)} entries, total size: {self.store.disk_bytes / (1024*1024):.2f} MB")
         except Exception as e:
-            logger.error(f"Error initializing cache: {str(e)}")
+            logger.error(f"Error initializing cache, continuing with memory cache only: {str(e)}")
+            self.store = None
+    
+    def _migrate_legacy_entries(self):
+        """Move pickle files written by earlier versions into the segment store."""
+        migrated = 0
+        for cache_file in self.cache_dir.glob("*.cache"):
+            try:
+                key = bytes.fromhex(cache_file.stem)
+                if len(key) != 16:
+                    continue
+                self.store.put(key, cache_file.read_bytes())
+                cache_file.unlink()
+                migrated += 1
+            except (ValueError, OSError) as e:
+                logger.warning(f"Skipping legacy cache file {cache_file.name}: {str(e)}")
+        
+        if migrated:
+            logger.info(f"Migrated {migrated} legacy cache entries")
     
     def _generate_cache_key(self, model_id: str, inputs: Any, parameters: Dict[str, Any]) -> str:
         """
@@ -113,6 +102,41 @@ class ModelCache:
         # Generate hash
         return hashlib.md5(request_str.encode()).hexdigest()
     
+    def _remember(self, cache_key: str, value: Any, size: int) -> None:
+        """
+        Put a value in the memory tier, evicting least recently used entries.
+        
+        Args:
+            cache_key: Cache key
+            value: Deserialized value
+            size: Serialized size in bytes, charged against the memory budget
+        """
+        limit = self.memory_limit * 1024 * 1024
+        previous = self.memory_cache.pop(cache_key, None)
+        if previous is not None:
+            self.memory_bytes -= previous[1]
+        if size > limit:
+            return
+        
+        self.memory_cache[cache_key] = (value, size)
+        self.memory_bytes += size
+        while self.memory_bytes > limit:
+            _, (_, evicted_size) = self.memory_cache.popitem(last=False)
+            self.memory_bytes -= evicted_size
+    
+    def _read_entry(self, key: bytes) -> Optional[Tuple[Any, int]]:
+        """Read and deserialize a disk entry (runs in the executor)."""
+        data = self.store.get(key)
+        if data is None:
+            return None
+        return pickle.loads(data), len(data)
+    
+    def _write_entry(self, key: bytes, result: Any) -> int:
+        """Serialize and store a disk entry (runs in the executor)."""
+        data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        self.store.put(key, data)
+        return len(data)
+    
     async def get(self, model_id: str, inputs: Any, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Get a cached result if available.
@@ -127,27 +151,28 @@ class ModelCache:
         """
         cache_key = self._generate_cache_key(model_id, inputs, parameters)
         
-        async with self.cache_lock:
-            if cache_key in self.memory_cache:
-                # Update access time
-                self.memory_cache[cache_key]["last_accessed"] = datetime.now().isoformat()
-                
-                # Load from disk if not loaded
-                if "value" not in self.memory_cache[cache_key]:
-                    try:
-                        cache_path = Path(self.memory_cache[cache_key]["path"])
-                        with open(cache_path, "rb") as f:
-                            cached_data = pickle.load(f)
-                            self.memory_cache[cache_key]["value"] = cached_data
-                    except Exception as e:
-                        logger.error(f"Error loading cache entry {cache_key}: {str(e)}")
-                        return None
+        entry = self.memory_cache.get(cache_key)
+        if entry is not None:
+            self.memory_cache.move_to_end(cache_key)
+            self.cache_stats["hits"] += 1
+            self.cache_stats["memory_hits"] += 1
+            logger.debug(f"Cache hit for {model_id}")
+            return entry[0]
+        
+        key = bytes.fromhex(cache_key)
+        if self.store is not None and key in self.store:
+            try:
+                loaded = await asyncio.get_running_loop().run_in_executor(None, self._read_entry, key)
+            except Exception as e:
+                logger.error(f"Error loading cache entry {cache_key}: {str(e)}")
+                loaded = None
                 
-                # Increment hit counter
+            if loaded is not None:
+                value, size = loaded
+                self._remember(cache_key, value, size)
                 self.cache_stats["hits"] += 1
-                
                 logger.debug(f"Cache hit for {model_id}")
-                return self.memory_cache[cache_key]["value"]
+                return value
         
         # Increment miss counter
         self.cache_stats["misses"] += 1
@@ -166,97 +191,35 @@ class ModelCache:
             result: Result to cache
         """
         cache_key = self._generate_cache_key(model_id, inputs, parameters)
-        cache_path = self.cache_dir / f"{cache_key}.cache"
         
         try:
-            # Serialize result
-            with open(cache_path, "wb") as f:
-                pickle.dump(result, f)
-                
-            # Get file size
-            file_size = os.path.getsize(cache_path)
-            
-            async with self.cache_lock:
-                # Store in memory cache
-                self.memory_cache[cache_key] = {
-                    "path": str(cache_path),
-                    "size": file_size,
-                    "last_accessed": datetime.now().isoformat(),
-                    "value": result
-                }
-                
-                # Update cache stats
-                self.cache_stats["size_bytes"] += file_size
+            if self.store is not None:
+                size = await asyncio.get_running_loop().run_in_executor(
+                    None, self._write_entry, bytes.fromhex(cache_key), result
+                )
+            else:
+                size = len(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
                 
-                logger.debug(f"Cached result for {model_id}, size: {file_size / 1024:.2f} KB")
-                
-                # Check if cleanup needed
-                if self.cache_stats["size_bytes"] > self.cache_size_limit * 1024 * 1024:
-                    asyncio.create_task(self.cleanup_cache())
+            self._remember(cache_key, result, size)
+            logger.debug(f"Cached result for {model_id}, size: {size / 1024:.2f} KB")
                     
         except Exception as e:
             logger.error(f"Error caching result for {model_id}: {str(e)}")
     
     async def cleanup_cache(self) -> None:
         """
-        Clean up the cache by removing least recently used entries.
+        Clean up the cache by dropping the oldest disk segments down to 75% of the limit.
+        The disk store also evicts on its own whenever it exceeds the limit.
         """
         logger.info("Starting cache cleanup")
         
-        async with self.cache_lock:
-            # Sort entries by last accessed time
-            entries = sorted(
-                self.memory_cache.items(),
-                key=lambda x: x[1].get("last_accessed", ""),
-                reverse=False  # Oldest first
-            )
-            
-            # Calculate target size (75% of limit)
-            target_size = self.cache_size_limit * 1024 * 1024 * 0.75
-            
-            # Remove entries until we're under target size
-            removed_count = 0
-            removed_size = 0
-            
-            for key, entry in entries:
-                if self.cache_stats["size_bytes"] <= target_size:
-                    break
-                    
-                try:
-                    # Remove from disk
-                    cache_path = Path(entry["path"])
-                    if cache_path.exists():
-                        cache_path.unlink()
-                    
-                    # Update stats
-                    entry_size = entry.get("size", 0)
-                    self.cache_stats["size_bytes"] -= entry_size
-                    removed_size += entry_size
-                    removed_count += 1
-                    
-                    # Remove from memory
-                    del self.memory_cache[key]
-                    
-                except Exception as e:
-                    logger.error(f"Error removing cache entry {key}: {str(e)}")
+        if self.store is None:
+            return
             
-            # Update metadata
-            metadata_path = self.cache_dir / "metadata.json"
-            try:
-                with open(metadata_path, "r") as f:
-                    metadata = json.load(f)
-                    
-                metadata["last_cleanup"] = datetime.now().isoformat()
-                metadata["entries"] = len(self.memory_cache)
-                metadata["size_bytes"] = self.cache_stats["size_bytes"]
-                
-                with open(metadata_path, "w") as f:
-                    json.dump(metadata, f)
-                    
-            except Exception as e:
-                logger.error(f"Error updating cache metadata: {str(e)}")
-            
-            logger.info(f"Cache cleanup complete: removed {removed_count} entries, freed {removed_size / (1024*1024):.2f} MB")
+        target_size = int(self.cache_size_limit * 1024 * 1024 * 0.75)
+        freed = await asyncio.get_running_loop().run_in_executor(None, self.store.evict, target_size)
+        
+        logger.info(f"Cache cleanup complete: freed {freed / (1024*1024):.2f} MB")
     
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -265,17 +228,20 @@ class ModelCache:
         Returns:
             Dictionary of cache statistics
         """
-        async with self.cache_lock:
-            stats = {
-                "entries": len(self.memory_cache),
-                "size_mb": self.cache_stats["size_bytes"] / (1024 * 1024),
-                "hits": self.cache_stats["hits"],
-                "misses": self.cache_stats["misses"],
-                "hit_ratio": self.cache_stats["hits"] / (self.cache_stats["hits"] + self.cache_stats["misses"]) if (self.cache_stats["hits"] + self.cache_stats["misses"]) > 0 else 0,
-                "limit_mb": self.cache_size_limit
-            }
-            
-            return stats
+        stats = {
+            "entries": len(self.store) if self.store is not None else len(self.memory_cache),
+            "size_mb": (self.store.disk_bytes if self.store is not None else 0) / (1024 * 1024),
+            "hits": self.cache_stats["hits"],
+            "misses": self.cache_stats["misses"],
+            "hit_ratio": self.cache_stats["hits"] / (self.cache_stats["hits"] + self.cache_stats["misses"]) if (self.cache_stats["hits"] + self.cache_stats["misses"]) > 0 else 0,
+            "limit_mb": self.cache_size_limit,
+            "memory_entries": len(self.memory_cache),
+            "memory_mb": self.memory_bytes / (1024 * 1024),
+            "memory_hits": self.cache_stats["memory_hits"],
+            "memory_limit_mb": self.memory_limit
+        }
+        
+        return stats
 
 
 # Singleton instance
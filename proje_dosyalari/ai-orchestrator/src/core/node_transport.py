@@ -0,0 +1,322 @@
+"""
+Node-to-node HTTP transport for AI Orchestrator.
+
+This module provides the transport used by distributed model execution:
+- One pooled keep-alive client per peer, shared by all requests to it
+- HTTP/2 multiplexing when the h2 package is installed
+- JSON bodies gzip-compressed above a size threshold, in both directions
+- A shared-secret header authenticating node-to-node requests
+"""
+import gzip
+import hmac
+import importlib.util
+import json
+import logging
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+import httpx
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+JSON_CONTENT_TYPE = "application/json"
+GZIP_ENCODING = "gzip"
+NODE_TOKEN_HEADER = "X-Node-Token"
+
+
+class PayloadTooLargeError(ValueError):
+    """Raised when a request body exceeds the allowed size."""
+
+
+def node_token_valid(token: Optional[str], shared_secret: Optional[str] = None) -> bool:
+    """
+    Check the node token sent with a node-to-node request.
+
+    Args:
+        token: Value of the X-Node-Token header
+        shared_secret: Expected secret, defaults to DISTRIBUTED_SHARED_SECRET
+
+    Returns:
+        True if no secret is configured or the token matches it
+    """
+    shared_secret = settings.DISTRIBUTED_SHARED_SECRET if shared_secret is None else shared_secret
+    if not shared_secret:
+        return True
+    return token is not None and hmac.compare_digest(token.encode("utf-8"), shared_secret.encode("utf-8"))
+
+
+def http2_available() -> bool:
+    """
+    Check whether HTTP/2 support (the h2 package) is installed.
+
+    Returns:
+        True if httpx can use HTTP/2
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+def encode_json_body(payload: Any, compress_min_bytes: int) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Serialize a payload to JSON, gzip-compressing it if it is large enough.
+
+    Args:
+        payload: JSON-serializable payload
+        compress_min_bytes: Minimum body size to compress
+
+    Returns:
+        Tuple of the body and its content headers
+    """
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    headers = {"Content-Type": JSON_CONTENT_TYPE}
+    if len(body) >= compress_min_bytes:
+        body = gzip.compress(body, compresslevel=5)
+        headers["Content-Encoding"] = GZIP_ENCODING
+    return body, headers
+
+
+def decode_json_body(body: bytes, content_encoding: Optional[str] = None, max_bytes: Optional[int] = None) -> Any:
+    """
+    Parse a JSON body, decompressing it if needed.
+
+    Args:
+        body: Raw body
+        content_encoding: Value of the Content-Encoding header
+        max_bytes: Maximum size of the decompressed body, or None for no limit
+
+    Returns:
+        Parsed payload
+
+    Raises:
+        PayloadTooLargeError: If the decompressed body exceeds max_bytes
+        ValueError: If the encoding is not supported or the body is not valid JSON
+    """
+    if content_encoding and content_encoding.lower() == GZIP_ENCODING:
+        body = _gunzip(body, max_bytes)
+    elif content_encoding and content_encoding.lower() != "identity":
+        raise ValueError(f"Unsupported content encoding: {content_encoding}")
+    if max_bytes is not None and len(body) > max_bytes:
+        raise PayloadTooLargeError(f"Body exceeds {max_bytes} bytes")
+    return json.loads(body) if body else None
+
+
+def _gunzip(body: bytes, max_bytes: Optional[int]) -> bytes:
+    """
+    Decompress a gzip body without inflating more than max_bytes.
+
+    Args:
+        body: Compressed body
+        max_bytes: Maximum size of the decompressed body, or None for no limit
+
+    Returns:
+        Decompressed body
+
+    Raises:
+        PayloadTooLargeError: If the decompressed body exceeds max_bytes
+        ValueError: If the body is not valid gzip data
+    """
+    if max_bytes is None:
+        try:
+            return gzip.decompress(body)
+        except (OSError, EOFError, zlib.error) as e:
+            raise ValueError(f"Invalid gzip body: {str(e)}")
+
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    try:
+        data = decompressor.decompress(body, max_bytes + 1)
+    except zlib.error as e:
+        raise ValueError(f"Invalid gzip body: {str(e)}")
+    if len(data) > max_bytes:
+        raise PayloadTooLargeError(f"Decompressed body exceeds {max_bytes} bytes")
+    if not decompressor.eof:
+        raise ValueError("Invalid gzip body: truncated stream")
+    return data
+
+
+async def read_json_body(request, max_bytes: Optional[int] = None) -> Any:
+    """
+    Read the JSON body of a (possibly gzip-compressed) incoming request.
+
+    Args:
+        request: Starlette/FastAPI request
+        max_bytes: Maximum body size, compressed and decompressed;
+            defaults to DISTRIBUTED_MAX_BODY_BYTES
+
+    Returns:
+        Parsed payload
+
+    Raises:
+        PayloadTooLargeError: If the body exceeds max_bytes
+        ValueError: If the body cannot be decoded
+    """
+    max_bytes = settings.DISTRIBUTED_MAX_BODY_BYTES if max_bytes is None else max_bytes
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise PayloadTooLargeError(f"Body exceeds {max_bytes} bytes")
+    return decode_json_body(bytes(body), request.headers.get("content-encoding"), max_bytes)
+
+
+class PeerClientPool:
+    """
+    Pooled HTTP clients for peer nodes, one keep-alive client per peer.
+    """
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        timeout: Optional[float] = None,
+        http2: Optional[bool] = None,
+        compress_min_bytes: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        shared_secret: Optional[str] = None
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_connections: Maximum connections per peer
+            timeout: Request timeout in seconds
+            http2: Whether to use HTTP/2 (only when the h2 package is installed)
+            compress_min_bytes: Minimum request body size to compress
+            transport: Custom httpx transport, e.g. to serve an ASGI app in-process
+            shared_secret: Node token sent with every request, defaults to DISTRIBUTED_SHARED_SECRET
+        """
+        self.max_connections = max_connections or settings.DISTRIBUTED_MAX_CONNECTIONS
+        self.timeout = timeout or settings.DISTRIBUTED_REQUEST_TIMEOUT
+        use_http2 = settings.DISTRIBUTED_HTTP2 if http2 is None else http2
+        self.http2 = use_http2 and http2_available()
+        self.compress_min_bytes = (
+            settings.DISTRIBUTED_COMPRESSION_MIN_BYTES if compress_min_bytes is None else compress_min_bytes
+        )
+        self.transport = transport
+        self.shared_secret = settings.DISTRIBUTED_SHARED_SECRET if shared_secret is None else shared_secret
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+
+    def client(self, base_url: str) -> httpx.AsyncClient:
+        """
+        Get the client for a peer, creating it on first use.
+
+        Args:
+            base_url: Base URL of the peer
+
+        Returns:
+            Shared client for the peer
+        """
+        base_url = base_url.rstrip("/")
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            headers = {"Accept-Encoding": GZIP_ENCODING}
+            if self.shared_secret:
+                headers[NODE_TOKEN_HEADER] = self.shared_secret
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                headers=headers,
+                transport=self.transport
+            )
+            self._clients[base_url] = client
+        return client
+
+    async def request_json(self, method: str, base_url: str, path: str, payload: Any = None) -> Any:
+        """
+        Send a request to a peer and parse its JSON response.
+
+        Args:
+            method: HTTP method
+            base_url: Base URL of the peer
+            path: Request path
+            payload: JSON-serializable request body, if any
+
+        Returns:
+            Parsed response payload
+
+        Raises:
+            httpx.HTTPError: If the request fails or the peer returns an error status
+        """
+        content, headers = None, None
+        if payload is not None:
+            content, headers = encode_json_body(payload, self.compress_min_bytes)
+            self.bytes_sent += len(content)
+
+        self.requests += 1
+        try:
+            response = await self.client(base_url).request(method, path, content=content, headers=headers)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            self.errors += 1
+            raise
+        # httpx decodes gzip responses transparently
+        return response.json()
+
+    async def post_json(self, base_url: str, path: str, payload: Any) -> Any:
+        """
+        POST a JSON payload to a peer.
+
+        Args:
+            base_url: Base URL of the peer
+            path: Request path
+            payload: JSON-serializable request body
+
+        Returns:
+            Parsed response payload
+        """
+        return await self.request_json("POST", base_url, path, payload)
+
+    async def get_json(self, base_url: str, path: str) -> Any:
+        """
+        GET a JSON document from a peer.
+
+        Args:
+            base_url: Base URL of the peer
+            path: Request path
+
+        Returns:
+            Parsed response payload
+        """
+        return await self.request_json("GET", base_url, path)
+
+    async def close_peer(self, base_url: str) -> None:
+        """
+        Close the client for a peer.
+
+        Args:
+            base_url: Base URL of the peer
+        """
+        client = self._clients.pop(base_url.rstrip("/"), None)
+        if client is not None:
+            await client.aclose()
+
+    async def close(self) -> None:
+        """Close all peer clients."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get transport statistics.
+
+        Returns:
+            Dictionary with protocol settings, peers and request counters
+        """
+        return {
+            "http2": self.http2,
+            "max_connections_per_peer": self.max_connections,
+            "compress_min_bytes": self.compress_min_bytes,
+            "peers": sorted(self._clients),
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent
+        }
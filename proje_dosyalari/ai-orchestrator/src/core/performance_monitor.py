@@ -10,8 +10,10 @@ This module provides functionality for monitoring and optimizing AI model perfor
 import os
 import logging
 import asyncio
+import math
 import time
-from typing import Dict, List, Any, Optional, Union
+from collections import deque
+from typing import Dict, List, Any, Optional, Sequence, Union
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
@@ -26,21 +28,184 @@ from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Number of sub-buckets per power of two in latency histograms (~1.6% relative error)
+HISTOGRAM_SUB_BUCKETS = 32
+LATENCY_HISTORY_SIZE = 100
+
+class LatencyHistogram:
+    """
+    Log-linear (HDR-style) latency histogram.
+    
+    Each power-of-two range is split into HISTOGRAM_SUB_BUCKETS equal buckets,
+    so recording is O(1) and percentiles have a bounded relative error
+    regardless of the number of samples.
+    """
+    def __init__(self, counts: Optional[Dict[int, int]] = None):
+        """
+        Initialize the histogram.
+        
+        Args:
+            counts: Bucket counts to restore (bucket index -> count)
+        """
+        self.counts: Dict[int, int] = dict(counts or {})
+        self.total = sum(self.counts.values())
+        
+    @staticmethod
+    def _bucket(value: float) -> int:
+        """Get the bucket index of a value."""
+        if value <= 0:
+            return -(1 << 30)
+        mantissa, exponent = math.frexp(value)  # value = mantissa * 2**exponent, 0.5 <= mantissa < 1
+        return exponent * HISTOGRAM_SUB_BUCKETS + int((mantissa - 0.5) * 2 * HISTOGRAM_SUB_BUCKETS)
+    
+    @staticmethod
+    def _bucket_value(index: int) -> float:
+        """Get the midpoint of a bucket."""
+        if index == -(1 << 30):
+            return 0.0
+        exponent, sub_bucket = divmod(index, HISTOGRAM_SUB_BUCKETS)
+        return math.ldexp(0.5 + (sub_bucket + 0.5) / (2 * HISTOGRAM_SUB_BUCKETS), exponent)
+    
+    def record(self, value: float) -> None:
+        """
+        Record a value.
+        
+        Args:
+            value: Latency in milliseconds
+        """
+        index = self._bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        
+    def percentiles(self, percentiles: Sequence[float]) -> Dict[float, Optional[float]]:
+        """
+        Get several percentiles in one pass.
+        
+        Args:
+            percentiles: Percentiles between 0 and 100
+            
+        Returns:
+            Dictionary mapping each percentile to its value (None if the histogram is empty)
+        """
+        if not self.total:
+            return {p: None for p in percentiles}
+        
+        targets = sorted((max(1, math.ceil(p / 100 * self.total)), p) for p in percentiles)
+        results = {}
+        seen = 0
+        position = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            while position < len(targets) and seen >= targets[position][0]:
+                results[targets[position][1]] = self._bucket_value(index)
+                position += 1
+            if position == len(targets):
+                break
+        return results
+
+
+class ModelPerformanceStats:
+    """
+    Performance counters, latency histogram and recent history of one model.
+    """
+    __slots__ = (
+        "inference_count", "success_count", "failure_count", "total_latency_ms",
+        "min_latency_ms", "max_latency_ms", "last_inference", "memory_usage",
+        "latency_history", "histogram"
+    )
+    
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the stats.
+        
+        Args:
+            data: Persisted stats (as produced by to_dict) to restore
+        """
+        data = data or {}
+        self.inference_count = data.get("inference_count", 0)
+        self.success_count = data.get("success_count", 0)
+        self.failure_count = data.get("failure_count", 0)
+        self.total_latency_ms = data.get("total_latency_ms", 0)
+        self.min_latency_ms = data.get("min_latency_ms", float('inf'))
+        self.max_latency_ms = data.get("max_latency_ms", 0)
+        self.last_inference = data.get("last_inference")
+        self.memory_usage = data.get("memory_usage")
+        self.latency_history = deque(data.get("latency_history", []), maxlen=LATENCY_HISTORY_SIZE)
+        self.histogram = LatencyHistogram(
+            {int(index): count for index, count in data.get("latency_histogram", {}).items()}
+        )
+        
+    def record(self, latency_ms: float, memory_usage: Optional[int], success: bool) -> None:
+        """Record one inference."""
+        now = datetime.now().isoformat()
+        self.inference_count += 1
+        if success:
+            self.success_count += 1
+        else:
+            self.failure_count += 1
+        self.total_latency_ms += latency_ms
+        if latency_ms < self.min_latency_ms:
+            self.min_latency_ms = latency_ms
+        if latency_ms > self.max_latency_ms:
+            self.max_latency_ms = latency_ms
+        self.last_inference = now
+        if memory_usage is not None:
+            self.memory_usage = memory_usage
+        self.histogram.record(latency_ms)
+        self.latency_history.append({"timestamp": now, "latency_ms": latency_ms, "success": success})
+        
+    def to_dict(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, Any]:
+        """
+        Get the stats as a dictionary.
+        
+        Args:
+            percentiles: Latency percentiles to include as p<N>_latency_ms
+            
+        Returns:
+            Dictionary of model statistics
+        """
+        stats = {
+            "inference_count": self.inference_count,
+            "success_count": self.success_count,
+            "failure_count": self.failure_count,
+            "total_latency_ms": self.total_latency_ms,
+            "avg_latency_ms": self.total_latency_ms / self.inference_count if self.inference_count else 0,
+            "min_latency_ms": self.min_latency_ms,
+            "max_latency_ms": self.max_latency_ms,
+            "last_inference": self.last_inference,
+            "memory_usage": self.memory_usage,
+            "latency_history": list(self.latency_history)
+        }
+        for percentile, value in self.histogram.percentiles(percentiles).items():
+            stats[f"p{percentile:g}_latency_ms"] = value
+        return stats
+
+
 class PerformanceMonitor:
     """
     Monitor and optimize AI model performance.
+    
+    Recording only updates in-memory counters; statistics are written to disk
+    by a background flusher every PERF_STATS_FLUSH_INTERVAL seconds.
     """
-    def __init__(self):
-        """Initialize the performance monitor."""
-        self.stats_dir = Path("./stats")
+    def __init__(self, stats_dir: Optional[Path] = None):
+        """
+        Initialize the performance monitor.
+        
+        Args:
+            stats_dir: Directory for the statistics file (default: ./stats)
+        """
+        self.stats_dir = Path(stats_dir) if stats_dir is not None else Path("./stats")
         self.stats_dir.mkdir(exist_ok=True)
         self.stats_file = self.stats_dir / "performance_stats.json"
-        self.model_stats: Dict[str, Dict[str, Any]] = {}
+        self.model_stats: Dict[str, ModelPerformanceStats] = {}
         self.system_stats: Dict[str, Any] = {}
-        self.stats_lock = asyncio.Lock()
         self.monitoring_interval = 60  # seconds
         self.monitoring_task = None
         self.is_monitoring = False
+        self.flush_interval = settings.PERF_STATS_FLUSH_INTERVAL
+        self.flush_task = None
+        self._dirty = False
         
         # Initialize stats
         self._init_stats()
@@ -54,7 +219,10 @@ class PerformanceMonitor:
             try:
                 with open(self.stats_file, "r") as f:
                     stats_data = json.load(f)
-                    self.model_stats = stats_data.get("model_stats", {})
+                    self.model_stats = {
+                        model_id: ModelPerformanceStats(data)
+                        for model_id, data in stats_data.get("model_stats", {}).items()
+                    }
                     self.system_stats = stats_data.get("system_stats", {})
                 logger.info(f"Loaded performance statistics for {len(self.model_stats)} models")
             except Exception as e:
@@ -72,6 +240,9 @@ class PerformanceMonitor:
             "gpu_memory_total": [torch.cuda.get_device_properties(i).total_memory for i in range(torch.cuda.device_count())] if torch is not None and torch.cuda.is_available() else [],
             "monitoring_interval": self.monitoring_interval
         })
+        
+        # Prime CPU measurement: later non-blocking calls report usage since the previous call
+        psutil.cpu_percent(interval=None)
     
     async def start_monitoring(self):
         """Start performance monitoring."""
@@ -82,22 +253,26 @@ class PerformanceMonitor:
         logger.info("Starting performance monitoring")
         self.is_monitoring = True
         self.monitoring_task = asyncio.create_task(self._monitoring_loop())
+        self._ensure_flusher()
     
     async def stop_monitoring(self):
-        """Stop performance monitoring."""
+        """Stop performance monitoring and flush pending statistics."""
         if not self.is_monitoring:
             logger.info("Performance monitoring not running")
             return
             
         logger.info("Stopping performance monitoring")
         self.is_monitoring = False
-        if self.monitoring_task:
-            self.monitoring_task.cancel()
-            try:
-                await self.monitoring_task
-            except asyncio.CancelledError:
-                pass
-            self.monitoring_task = None
+        for task in (self.monitoring_task, self.flush_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self.monitoring_task = None
+        self.flush_task = None
+        await self.flush()
     
     async def _monitoring_loop(self):
         """Background monitoring loop."""
@@ -111,11 +286,44 @@ class PerformanceMonitor:
             logger.error(f"Error in performance monitoring loop: {str(e)}")
             self.is_monitoring = False
     
+    def _ensure_flusher(self):
+        """Start the background flusher if it is not running."""
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        """Background loop writing statistics to disk when they changed."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            pass
+    
+    async def flush(self):
+        """Write statistics to disk if they changed since the last write."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        stats_data = {
+            "timestamp": datetime.now().isoformat(),
+            "model_stats": {model_id: self._persisted_stats(stats) for model_id, stats in self.model_stats.items()},
+            "system_stats": dict(self.system_stats)
+        }
+        await asyncio.get_running_loop().run_in_executor(None, self._save_stats, stats_data)
+    
+    @staticmethod
+    def _persisted_stats(stats: ModelPerformanceStats) -> Dict[str, Any]:
+        """Get the persisted form of a model's stats, including its histogram buckets."""
+        data = stats.to_dict()
+        data["latency_histogram"] = dict(stats.histogram.counts)
+        return data
+    
     async def _collect_system_stats(self):
         """Collect system-wide performance statistics."""
         try:
-            # Get CPU stats
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Get CPU stats (usage since the previous call; does not block)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             
             # Get GPU stats if available
@@ -133,17 +341,14 @@ class PerformanceMonitor:
                     })
             
             # Update system stats
-            async with self.stats_lock:
-                self.system_stats.update({
-                    "last_updated": datetime.now().isoformat(),
-                    "cpu_percent": cpu_percent,
-                    "memory_used": memory.used,
-                    "memory_percent": memory.percent,
-                    "gpu_stats": gpu_stats
-                })
-                
-                # Save stats to file
-                await self._save_stats()
+            self.system_stats.update({
+                "last_updated": datetime.now().isoformat(),
+                "cpu_percent": cpu_percent,
+                "memory_used": memory.used,
+                "memory_percent": memory.percent,
+                "gpu_stats": gpu_stats
+            })
+            self._dirty = True
                 
             logger.debug(f"Collected system stats: CPU {cpu_percent}%, Memory {memory.percent}%")
             
@@ -153,6 +358,7 @@ class PerformanceMonitor:
     async def record_inference_stats(self, model_id: str, latency_ms: float, memory_usage: Optional[int] = None, success: bool = True):
         """
         Record inference statistics for a model.
+        Only in-memory counters are updated; the flusher persists them.
         
         Args:
             model_id: ID of the model
@@ -160,64 +366,20 @@ class PerformanceMonitor:
             memory_usage: Memory usage in bytes (optional)
             success: Whether inference was successful
         """
-        async with self.stats_lock:
-            # Initialize model stats if not exists
-            if model_id not in self.model_stats:
-                self.model_stats[model_id] = {
-                    "inference_count": 0,
-                    "success_count": 0,
-                    "failure_count": 0,
-                    "total_latency_ms": 0,
-                    "avg_latency_ms": 0,
-                    "min_latency_ms": float('inf'),
-                    "max_latency_ms": 0,
-                    "last_inference": None,
-                    "memory_usage": None,
-                    "latency_history": []
-                }
-            
-            # Update stats
-            stats = self.model_stats[model_id]
-            stats["inference_count"] += 1
-            if success:
-                stats["success_count"] += 1
-            else:
-                stats["failure_count"] += 1
-                
-            stats["total_latency_ms"] += latency_ms
-            stats["avg_latency_ms"] = stats["total_latency_ms"] / stats["inference_count"]
-            stats["min_latency_ms"] = min(stats["min_latency_ms"], latency_ms)
-            stats["max_latency_ms"] = max(stats["max_latency_ms"], latency_ms)
-            stats["last_inference"] = datetime.now().isoformat()
-            
-            if memory_usage is not None:
-                stats["memory_usage"] = memory_usage
-                
-            # Keep a history of recent latencies (last 100)
-            stats["latency_history"].append({
-                "timestamp": datetime.now().isoformat(),
-                "latency_ms": latency_ms,
-                "success": success
-            })
-            if len(stats["latency_history"]) > 100:
-                stats["latency_history"] = stats["latency_history"][-100:]
-                
-            # Save stats to file
-            await self._save_stats()
+        stats = self.model_stats.get(model_id)
+        if stats is None:
+            stats = self.model_stats[model_id] = ModelPerformanceStats()
+        stats.record(latency_ms, memory_usage, success)
+        self._dirty = True
+        self._ensure_flusher()
     
-    async def _save_stats(self):
-        """Save performance statistics to file."""
+    def _save_stats(self, stats_data: Dict[str, Any]):
+        """Save performance statistics to file (runs in the executor)."""
         try:
-            stats_data = {
-                "timestamp": datetime.now().isoformat(),
-                "model_stats": self.model_stats,
-                "system_stats": self.system_stats
-            }
-            
             # Write to temporary file first
             temp_file = self.stats_file.with_suffix(".tmp")
             with open(temp_file, "w") as f:
-                json.dump(stats_data, f, indent=2)
+                json.dump(stats_data, f)
                 
             # Rename to actual file
             temp_file.replace(self.stats_file)
@@ -225,21 +387,24 @@ class PerformanceMonitor:
         except Exception as e:
             logger.error(f"Error saving performance statistics: {str(e)}")
     
-    async def get_model_stats(self, model_id: Optional[str] = None) -> Dict[str, Any]:
+    async def get_model_stats(
+        self, model_id: Optional[str] = None, percentiles: Sequence[float] = (50, 95, 99)
+    ) -> Dict[str, Any]:
         """
         Get performance statistics for a model or all models.
         
         Args:
             model_id: ID of the model (optional, if None returns all models)
+            percentiles: Latency percentiles to include as p<N>_latency_ms (default p50, p95, p99)
             
         Returns:
             Dictionary of model statistics
         """
-        async with self.stats_lock:
-            if model_id:
-                return self.model_stats.get(model_id, {})
-            else:
-                return self.model_stats
+        if model_id:
+            stats = self.model_stats.get(model_id)
+            return stats.to_dict(percentiles) if stats else {}
+        else:
+            return {model_id: stats.to_dict(percentiles) for model_id, stats in self.model_stats.items()}
     
     async def get_system_stats(self) -> Dict[str, Any]:
         """
@@ -248,8 +413,7 @@ class PerformanceMonitor:
         Returns:
             Dictionary of system statistics
         """
-        async with self.stats_lock:
-            return self.system_stats
+        return self.system_stats
     
     async def optimize_model_allocation(self, available_models: List[str], active_models: List[str]) -> List[str]:
         """
@@ -269,48 +433,47 @@ class PerformanceMonitor:
         # - Model performance characteristics
         # - Load balancing requirements
         
-        async with self.stats_lock:
-            # Get system resources
-            memory_available = psutil.virtual_memory().available
-            gpu_memory_available = []
-            if torch is not None and torch.cuda.is_available():
-                for i in range(torch.cuda.device_count()):
-                    total = torch.cuda.get_device_properties(i).total_memory
-                    allocated = torch.cuda.memory_allocated(i)
-                    gpu_memory_available.append(total - allocated)
-            
-            # Sort models by usage frequency
-            model_usage = []
-            for model_id in available_models:
-                stats = self.model_stats.get(model_id, {})
-                inference_count = stats.get("inference_count", 0)
-                last_inference = stats.get("last_inference")
-                
-                # Calculate a score based on usage
-                # Higher score = higher priority for loading
-                score = inference_count
-                
-                # Boost score for recently used models
-                if last_inference:
-                    last_time = datetime.fromisoformat(last_inference)
-                    time_diff = datetime.now() - last_time
-                    if time_diff < timedelta(hours=1):
-                        score *= 2
-                    elif time_diff < timedelta(hours=24):
-                        score *= 1.5
-                
-                model_usage.append((model_id, score))
+        # Get system resources
+        memory_available = psutil.virtual_memory().available
+        gpu_memory_available = []
+        if torch is not None and torch.cuda.is_available():
+            for i in range(torch.cuda.device_count()):
+                total = torch.cuda.get_device_properties(i).total_memory
+                allocated = torch.cuda.memory_allocated(i)
+                gpu_memory_available.append(total - allocated)
+        
+        # Sort models by usage frequency
+        model_usage = []
+        for model_id in available_models:
+            stats = self.model_stats.get(model_id)
+            inference_count = stats.inference_count if stats else 0
+            last_inference = stats.last_inference if stats else None
             
-            # Sort by score (descending)
-            model_usage.sort(key=lambda x: x[1], reverse=True)
+            # Calculate a score based on usage
+            # Higher score = higher priority for loading
+            score = inference_count
             
-            # For now, just return the top N models based on available resources
-            # This is a very simplistic approach
-            max_models = 5  # Placeholder
-            recommended_models = [model_id for model_id, _ in model_usage[:max_models]]
+            # Boost score for recently used models
+            if last_inference:
+                last_time = datetime.fromisoformat(last_inference)
+                time_diff = datetime.now() - last_time
+                if time_diff < timedelta(hours=1):
+                    score *= 2
+                elif time_diff < timedelta(hours=24):
+                    score *= 1.5
             
-            logger.info(f"Recommended models to load: {recommended_models}")
-            return recommended_models
+            model_usage.append((model_id, score))
+        
+        # Sort by score (descending)
+        model_usage.sort(key=lambda x: x[1], reverse=True)
+        
+        # For now, just return the top N models based on available resources
+        # This is a very simplistic approach
+        max_models = 5  # Placeholder
+        recommended_models = [model_id for model_id, _ in model_usage[:max_models]]
+        
+        logger.info(f"Recommended models to load: {recommended_models}")
+        return recommended_models
 
 
 # Singleton instance
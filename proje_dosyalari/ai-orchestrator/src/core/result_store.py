@@ -0,0 +1,372 @@
+"""
+Segment file result store for AI Orchestrator.
+
+This module provides the disk tier of the model cache:
+- Values are appended to segment files; a full segment is sealed and a new one started
+- An in-memory hash index maps each key to the segment and offset of its latest record;
+  it is keyed by the first 8 bytes of the key and reads verify the full key
+- Sealed segments are read through mmap, the active segment with pread
+- Sealed segments (and the active one, on close) get a compact index file so
+  startup does not scan the data; only records appended after it are scanned
+- When the byte budget is exceeded the oldest segment is dropped as a whole
+
+Record layout: 16-byte key, 4-byte value length, 4-byte CRC32 of the value, value.
+"""
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RECORD_HEADER = struct.Struct("<16sII")
+SEGMENT_MAGIC = b"ALTSEG01"
+INDEX_MAGIC = b"ALTIDX01"
+INDEX_HEADER = struct.Struct("<IQ")
+
+# Index entries pack the segment ID and record offset into one integer
+OFFSET_BITS = 32
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+
+def _index_key(key: bytes) -> int:
+    """Get the index key of a record key: its first 8 bytes as an integer."""
+    return int.from_bytes(key[:8], "little")
+
+
+class SegmentStore:
+    """
+    Append-only key/value store made of segment files.
+
+    Keys are 16-byte digests. The store is thread-safe so callers can run it in
+    an executor.
+    """
+    def __init__(self, directory: Path, max_bytes: int, segment_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the store, loading the index of existing segments.
+
+        Args:
+            directory: Directory holding the segment files
+            max_bytes: Disk budget; the oldest segments are dropped beyond it
+            segment_bytes: Size at which the active segment is sealed
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.segment_bytes = min(segment_bytes, OFFSET_MASK)
+
+        self._lock = threading.Lock()
+        self._index: Dict[int, int] = {}
+        self._segment_keys: Dict[int, array] = {}
+        self._segment_sizes: Dict[int, int] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._active_id = 0
+        self._active_file = None
+
+        self._load()
+
+    # Paths
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.directory / f"{segment_id:08d}.seg"
+
+    def _index_path(self, segment_id: int) -> Path:
+        return self.directory / f"{segment_id:08d}.idx"
+
+    # Startup
+
+    def _load(self):
+        """Load the index from all segments and open the active segment."""
+        segment_ids = sorted(int(path.stem) for path in self.directory.glob("*.seg") if path.stem.isdigit())
+
+        for segment_id in segment_ids[:-1]:
+            self._load_sealed(segment_id)
+
+        if segment_ids:
+            self._active_id = segment_ids[-1]
+            keys, locations, indexed_end = self._read_index_file(self._active_id)
+            if keys is None:
+                keys, locations, indexed_end = array("Q"), array("Q"), 0
+            tail_keys, tail_locations, end = self._scan(self._active_id, indexed_end)
+            keys.extend(tail_keys)
+            locations.extend(tail_locations)
+            if end:
+                self._add_entries(self._active_id, keys, locations)
+                self._active_file = open(self._segment_path(self._active_id), "r+b")
+                self._active_file.truncate(end)  # Drop a torn record left by a crash
+                self._active_file.seek(end)
+                self._segment_sizes[self._active_id] = end
+            else:
+                self._open_segment(self._active_id)
+        else:
+            self._open_segment(1)
+
+        self._enforce_budget()
+        logger.info(
+            f"Result store loaded {len(self._index)} entries from {len(self._segment_sizes)} segments, "
+            f"{self.disk_bytes / (1024 * 1024):.2f} MB"
+        )
+
+    def _load_sealed(self, segment_id: int):
+        """Load a sealed segment's index file (or rebuild it) and map the segment."""
+        keys, locations, _ = self._read_index_file(segment_id)
+        if keys is None:
+            keys, locations, end = self._scan(segment_id)
+            self._write_index_file(segment_id, keys, locations, end)
+
+        self._add_entries(segment_id, keys, locations)
+        self._segment_sizes[segment_id] = os.path.getsize(self._segment_path(segment_id))
+        self._map(segment_id)
+
+    def _read_index_file(self, segment_id: int) -> Tuple[Optional[array], Optional[array], int]:
+        """
+        Read a segment index file.
+
+        Returns:
+            Index keys, packed locations and the segment offset the index covers,
+            or (None, None, 0) if the file is missing or damaged
+        """
+        try:
+            data = self._index_path(segment_id).read_bytes()
+        except OSError:
+            return None, None, 0
+
+        header = len(INDEX_MAGIC) + INDEX_HEADER.size
+        if len(data) < header or not data.startswith(INDEX_MAGIC):
+            return None, None, 0
+        count, end = INDEX_HEADER.unpack_from(data, len(INDEX_MAGIC))
+        keys_end = header + count * 8
+        if len(data) != keys_end + count * 8 or end > os.path.getsize(self._segment_path(segment_id)):
+            return None, None, 0
+
+        keys = array("Q")
+        keys.frombytes(data[header:keys_end])
+        locations = array("Q")
+        locations.frombytes(data[keys_end:])
+        return keys, locations, end
+
+    def _write_index_file(self, segment_id: int, keys: array, locations: array, end: int):
+        """Write a segment index file: magic, count, covered offset, all index keys, then all packed locations."""
+        tmp_path = self._index_path(segment_id).with_suffix(".idx.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(INDEX_MAGIC)
+            f.write(INDEX_HEADER.pack(len(keys), end))
+            f.write(keys.tobytes())
+            f.write(locations.tobytes())
+        os.replace(tmp_path, self._index_path(segment_id))
+
+    def _scan(self, segment_id: int, start: int = 0) -> Tuple[array, array, int]:
+        """
+        Scan a segment file record by record.
+
+        Args:
+            segment_id: Segment to scan
+            start: Offset of the first record to scan (0 scans the whole segment)
+
+        Returns:
+            Index keys, packed locations and the end offset of the last intact record
+        """
+        keys = array("Q")
+        locations = array("Q")
+        base = segment_id << OFFSET_BITS
+
+        with open(self._segment_path(segment_id), "rb") as f:
+            data = f.read()
+
+        if not data.startswith(SEGMENT_MAGIC):
+            logger.warning(f"Segment {segment_id} has no valid header, ignoring its contents")
+            return keys, locations, 0
+
+        offset = max(start, len(SEGMENT_MAGIC))
+        while offset + RECORD_HEADER.size <= len(data):
+            key, length, checksum = RECORD_HEADER.unpack_from(data, offset)
+            end = offset + RECORD_HEADER.size + length
+            if end > len(data) or zlib.crc32(data[offset + RECORD_HEADER.size:end]) != checksum:
+                logger.warning(f"Segment {segment_id} is truncated at offset {offset}")
+                break
+            keys.append(_index_key(key))
+            locations.append(base | offset)
+            offset = end
+
+        return keys, locations, offset
+
+    def _add_entries(self, segment_id: int, keys: array, locations: array):
+        """Add a segment's records to the index; later records replace earlier ones."""
+        self._index.update(zip(keys.tolist(), locations.tolist()))
+        self._segment_keys[segment_id] = keys
+
+    # Segments
+
+    def _open_segment(self, segment_id: int):
+        """Start a new active segment."""
+        self._active_id = segment_id
+        self._index_path(segment_id).unlink(missing_ok=True)
+        self._active_file = open(self._segment_path(segment_id), "w+b")
+        self._active_file.write(SEGMENT_MAGIC)
+        self._active_file.flush()
+        self._segment_keys[segment_id] = array("Q")
+        self._segment_sizes[segment_id] = len(SEGMENT_MAGIC)
+
+    def _map(self, segment_id: int):
+        """Memory-map a sealed segment for reads."""
+        with open(self._segment_path(segment_id), "rb") as f:
+            self._maps[segment_id] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _index_active(self):
+        """Write the index file of the active segment, keeping only its live records."""
+        segment_id = self._active_id
+        live = {}
+        for key in self._segment_keys[segment_id]:
+            location = self._index.get(key)
+            if location is not None and location >> OFFSET_BITS == segment_id:
+                live[key] = location
+        keys = array("Q", live)
+        self._segment_keys[segment_id] = keys
+        self._write_index_file(segment_id, keys, array("Q", live.values()), self._segment_sizes[segment_id])
+
+    def _seal_active(self):
+        """Seal the active segment and start the next one."""
+        segment_id = self._active_id
+        self._active_file.flush()
+        self._active_file.close()
+        self._index_active()
+
+        self._map(segment_id)
+        self._open_segment(segment_id + 1)
+        logger.debug(f"Sealed segment {segment_id} with {len(self._segment_keys[segment_id])} live entries")
+
+    def _drop_segment(self, segment_id: int):
+        """Delete a segment and the index entries that still point into it."""
+        for key in self._segment_keys.pop(segment_id, ()):
+            location = self._index.get(key)
+            if location is not None and location >> OFFSET_BITS == segment_id:
+                del self._index[key]
+
+        segment_map = self._maps.pop(segment_id, None)
+        if segment_map is not None:
+            segment_map.close()
+        self._segment_sizes.pop(segment_id, None)
+
+        for path in (self._segment_path(segment_id), self._index_path(segment_id)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _enforce_budget(self, target_bytes: Optional[int] = None):
+        """Drop the oldest sealed segments until the store fits the target size."""
+        target = self.max_bytes if target_bytes is None else target_bytes
+        while self.disk_bytes > target and len(self._segment_sizes) > 1:
+            self._drop_segment(min(self._segment_sizes))
+
+    # Public API
+
+    @property
+    def disk_bytes(self) -> int:
+        """Total size of all segment files."""
+        return sum(self._segment_sizes.values())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: bytes) -> bool:
+        return _index_key(key) in self._index
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """
+        Read the latest value stored for a key.
+
+        Entries found in the older half of the segments are copied into the
+        active segment, so frequently read entries survive segment eviction.
+
+        Args:
+            key: 16-byte key
+
+        Returns:
+            Value bytes, or None if the key is not stored
+        """
+        with self._lock:
+            location = self._index.get(_index_key(key))
+            if location is None:
+                return None
+
+            segment_id = location >> OFFSET_BITS
+            offset = location & OFFSET_MASK
+
+            if segment_id == self._active_id:
+                header = os.pread(self._active_file.fileno(), RECORD_HEADER.size, offset)
+                stored_key, length, _ = RECORD_HEADER.unpack(header)
+                if stored_key != key:
+                    return None
+                return os.pread(self._active_file.fileno(), length, offset + RECORD_HEADER.size)
+
+            segment_map = self._maps[segment_id]
+            stored_key, length, _ = RECORD_HEADER.unpack_from(segment_map, offset)
+            if stored_key != key:
+                return None
+            start = offset + RECORD_HEADER.size
+            value = segment_map[start:start + length]
+
+            if segment_id < (min(self._segment_sizes) + self._active_id) / 2:
+                self._append(key, value)
+                self._enforce_budget()
+            return value
+
+    def put(self, key: bytes, value: bytes):
+        """
+        Store a value, replacing any earlier value for the key.
+
+        Args:
+            key: 16-byte key
+            value: Value bytes
+        """
+        with self._lock:
+            self._append(key, value)
+            self._enforce_budget()
+
+    def _append(self, key: bytes, value: bytes):
+        """Append a record to the active segment and index it."""
+        record_size = RECORD_HEADER.size + len(value)
+        if self._segment_sizes[self._active_id] + record_size > self.segment_bytes \
+                and self._segment_sizes[self._active_id] > len(SEGMENT_MAGIC):
+            self._seal_active()
+
+        offset = self._segment_sizes[self._active_id]
+        self._active_file.write(RECORD_HEADER.pack(key, len(value), zlib.crc32(value)) + value)
+        self._active_file.flush()
+
+        index_key = _index_key(key)
+        self._index[index_key] = (self._active_id << OFFSET_BITS) | offset
+        self._segment_keys[self._active_id].append(index_key)
+        self._segment_sizes[self._active_id] = offset + record_size
+
+    def evict(self, target_bytes: int) -> int:
+        """
+        Drop the oldest segments until the store fits the target size.
+
+        Args:
+            target_bytes: Target disk size in bytes
+
+        Returns:
+            Number of bytes freed
+        """
+        with self._lock:
+            before = self.disk_bytes
+            self._enforce_budget(target_bytes)
+            return before - self.disk_bytes
+
+    def close(self):
+        """Flush and close all segment files, indexing the active segment for a fast restart."""
+        with self._lock:
+            if self._active_file is not None:
+                self._active_file.close()
+                self._active_file = None
+                self._index_active()
+            for segment_map in self._maps.values():
+                segment_map.close()
+            self._maps.clear()
@@ -0,0 +1,131 @@
+"""
+Request coalescing for AI Orchestrator.
+
+Identical concurrent inference requests (same model, inputs and parameters)
+share one execution: the first caller runs the model and later callers await
+the same in-flight task instead of running the model again.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from ..core.config import settings
+from ..models.inference import InferenceResponse
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls with the same key.
+    """
+    def __init__(self):
+        """Initialize the single-flight group."""
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run func, or wait for the call already in flight for the same key.
+
+        The call runs in its own task, so cancelling one caller does not cancel
+        it for the others.
+
+        Args:
+            key: Deduplication key
+            func: Coroutine function to run
+
+        Returns:
+            Tuple of the result and whether it was shared from another caller's call
+
+        Raises:
+            Exception: The exception raised by the call (for every caller)
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+
+        if shared:
+            self.coalesced += 1
+            logger.debug(f"Coalescing request {key} with the call in flight")
+        else:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.executions += 1
+
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        """Remove a finished call."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller was cancelled
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with executions, coalesced calls and calls in flight
+        """
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls)
+        }
+
+
+# Shared single-flight groups by name
+_single_flights: Dict[str, SingleFlight] = {}
+
+def get_single_flight(name: str) -> SingleFlight:
+    """
+    Get or create a shared single-flight group.
+
+    Services are created per request, so the groups are shared module-wide.
+    Each service layer uses its own group: a call that is in flight in one
+    layer may call into the next with the same key.
+
+    Args:
+        name: Group name, e.g. "inference" or "llm"
+
+    Returns:
+        SingleFlight instance
+    """
+    if name not in _single_flights:
+        _single_flights[name] = SingleFlight()
+    return _single_flights[name]
+
+
+def coalescing_enabled(model_id: str) -> bool:
+    """
+    Check whether identical concurrent requests for a model are coalesced.
+
+    Args:
+        model_id: Model ID
+
+    Returns:
+        True unless coalescing is disabled globally or for this model
+    """
+    return settings.COALESCING_ENABLED and model_id not in settings.COALESCING_EXCLUDED_MODELS
+
+
+def mark_coalesced(response: InferenceResponse, shared: bool) -> InferenceResponse:
+    """
+    Copy a response with the coalesced flag set in its metadata.
+
+    Args:
+        response: Response produced by the single-flight call
+        shared: Whether the response was shared from another caller's call
+
+    Returns:
+        A new response; the shared response object is not modified
+    """
+    return InferenceResponse(
+        model_id=response.model_id,
+        outputs=response.outputs,
+        metadata={**response.metadata, "coalesced": shared}
+    )
@@ -4,9 +4,11 @@ Main application module for AI Orchestrator.
 import logging
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 
 from .core.config import settings
+from .core.distributed import get_distributed_model_orchestrator
 from .api.router import api_router
 from .core.logging import setup_logging
 
@@ -23,10 +25,18 @@ async def lifespan(app: FastAPI):
     # Initialize model management system
     # TODO: Implement model loading and initialization
     
+    # Join the cluster of orchestrator nodes
+    distributed_orchestrator = None
+    if settings.DISTRIBUTED_ENABLED:
+        distributed_orchestrator = get_distributed_model_orchestrator()
+        await distributed_orchestrator.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down AI Orchestrator service")
+    if distributed_orchestrator:
+        await distributed_orchestrator.stop()
     # Cleanup resources
     # TODO: Implement model unloading and resource cleanup
 
@@ -47,6 +57,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (node-to-node responses included)
+app.add_middleware(GZipMiddleware, minimum_size=settings.DISTRIBUTED_COMPRESSION_MIN_BYTES)
+
 # Setup logging
 setup_logging()
 
@@ -10,6 +10,7 @@ class InferenceRequest(BaseModel):
     model_id: str
     inputs: Union[str, Dict[str, Any], List[Any]]
     parameters: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
     
     class Config:
         schema_extra = {
@@ -5,7 +5,7 @@ This module defines the base interface that all LLM implementations must follow.
 """
 
 import abc
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, AsyncIterator, List, Optional, Union, Callable
 import logging
 
 logger = logging.getLogger("ai_orchestrator.models.llm.base")
@@ -71,7 +71,7 @@ class BaseLLMModel(abc.ABC):
             top_k: Top-k sampling parameter
             repetition_penalty: Penalty for token repetition
             stop_sequences: Sequences that stop generation
-            stream: Whether to stream the response
+            stream: Whether to stream the response (prefer stream())
             callback: Callback function for streaming
             **kwargs: Additional model-specific parameters
             
@@ -80,6 +80,59 @@ class BaseLLMModel(abc.ABC):
         """
         pass
     
+    async def stream(self,
+                     prompt: str,
+                     max_tokens: int = 1024,
+                     temperature: float = 0.7,
+                     top_p: float = 0.9,
+                     top_k: int = 40,
+                     repetition_penalty: float = 1.0,
+                     stop_sequences: Optional[List[str]] = None,
+                     **kwargs) -> AsyncIterator[str]:
+        """
+        Stream generated text as an async generator.
+        
+        Implementations that can generate incrementally override this. The
+        default generates the complete text and yields it as a single chunk.
+        
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+            temperature: Controls randomness of output (0.0-1.0)
+            top_p: Nucleus sampling parameter (0.0-1.0)
+            top_k: Top-k sampling parameter
+            repetition_penalty: Penalty for token repetition
+            stop_sequences: Sequences that stop generation (never included in the output)
+            **kwargs: Additional model-specific parameters
+            
+        Yields:
+            Generated text chunks
+        """
+        text = await self.generate(
+            prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            repetition_penalty=repetition_penalty,
+            stop_sequences=stop_sequences,
+            stream=False,
+            **kwargs
+        )
+        if text:
+            yield text
+    
+    async def _stream_to_callback(self, chunks: AsyncIterator[str], callback: Callable[[str], None]) -> None:
+        """
+        Pass streamed chunks to a callback (for generate(stream=True, callback=...)).
+        
+        Args:
+            chunks: Chunks produced by stream()
+            callback: Callback function for streaming
+        """
+        async for chunk in chunks:
+            callback(chunk)
+    
     @abc.abstractmethod
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -7,11 +7,12 @@ This module provides LLM model implementation using GGML format models.
 import os
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, AsyncIterator, List, Optional, Union, Callable
 import time
 import json
 
 from .base import BaseLLMModel
+from .streaming import IncrementalDetokenizer, StopSequenceMatcher
 
 logger = logging.getLogger("ai_orchestrator.models.llm.ggml_model")
 
@@ -189,22 +190,12 @@ class GGMLModel(BaseLLMModel):
             start_time = time.time()
             logger.debug(f"Generating text with GGML model: {self.model_name}")
             
-            # Prepare generation parameters
-            params = {
-                "max_new_tokens": max_tokens,
-                "temperature": temperature,
-                "top_p": top_p,
-                "top_k": top_k,
-                "repetition_penalty": repetition_penalty,
-                "stop": stop_sequences if stop_sequences else []
-            }
-            
-            # Add any additional parameters
-            params.update({k: v for k, v in kwargs.items() if k not in params})
+            params = self._prepare_params(max_tokens, temperature, top_p, top_k,
+                                          repetition_penalty, stop_sequences, **kwargs)
             
             # Generate text
-            if stream:
-                return await self._generate_stream(prompt, params, callback)
+            if stream and callback:
+                return await self._stream_to_callback(self._generate_stream(prompt, params), callback)
             else:
                 return await self._generate_complete(prompt, params)
                 
@@ -212,6 +203,70 @@ class GGMLModel(BaseLLMModel):
             logger.error(f"Error generating text with GGML model: {str(e)}")
             raise
     
+    async def stream(self,
+                     prompt: str,
+                     max_tokens: int = 1024,
+                     temperature: float = 0.7,
+                     top_p: float = 0.9,
+                     top_k: int = 40,
+                     repetition_penalty: float = 1.0,
+                     stop_sequences: Optional[List[str]] = None,
+                     **kwargs) -> AsyncIterator[str]:
+        """
+        Stream generated text token by token using GGML.
+        
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+            temperature: Controls randomness of output (0.0-1.0)
+            top_p: Nucleus sampling parameter (0.0-1.0)
+            top_k: Top-k sampling parameter
+            repetition_penalty: Penalty for token repetition
+            stop_sequences: Sequences that stop generation (never included in the output)
+            **kwargs: Additional model-specific parameters
+            
+        Yields:
+            Generated text chunks
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model is not loaded")
+        
+        params = self._prepare_params(max_tokens, temperature, top_p, top_k,
+                                      repetition_penalty, stop_sequences, **kwargs)
+        try:
+            async for chunk in self._generate_stream(prompt, params):
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming text with GGML model: {str(e)}")
+            raise
+    
+    def _prepare_params(self,
+                        max_tokens: int,
+                        temperature: float,
+                        top_p: float,
+                        top_k: int,
+                        repetition_penalty: float,
+                        stop_sequences: Optional[List[str]],
+                        **kwargs) -> Dict[str, Any]:
+        """
+        Prepare generation parameters.
+        
+        Returns:
+            Generation parameters
+        """
+        params = {
+            "max_new_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "top_k": top_k,
+            "repetition_penalty": repetition_penalty,
+            "stop": stop_sequences if stop_sequences else []
+        }
+        
+        # Add any additional parameters
+        params.update({k: v for k, v in kwargs.items() if k not in params})
+        return params
+    
     async def _generate_complete(self, prompt: str, params: Dict[str, Any]) -> str:
         """
         Generate complete text at once.
@@ -240,60 +295,59 @@ class GGMLModel(BaseLLMModel):
         
         return result
     
-    async def _generate_stream(self, prompt: str, params: Dict[str, Any], 
-                             callback: Optional[Callable[[str], None]]) -> None:
+    async def _generate_stream(self, prompt: str, params: Dict[str, Any]) -> AsyncIterator[str]:
         """
         Stream generated text token by token.
         
+        Each token is decoded incrementally and scanned for stop sequences
+        together with a window of the preceding text only, so the work per
+        token does not grow with the output length.
+        
         Args:
             prompt: Input text prompt
             params: Generation parameters
-            callback: Callback function for streaming
+            
+        Yields:
+            Generated text chunks
         """
-        if not callback:
-            return await self._generate_complete(prompt, params)
-        
-        # Create a generator for streaming
         # Note: This is a placeholder as the actual implementation would depend on the specific GGML binding
         loop = asyncio.get_event_loop()
         
-        async def process_stream():
-            try:
-                # Initialize the generation
-                tokens = self.model.tokenize(prompt)
-                generated_tokens = []
-                
-                # Generate tokens one by one
-                for _ in range(params["max_new_tokens"]):
-                    # Get the next token
-                    next_token = await loop.run_in_executor(
-                        None,
-                        lambda: self.model.generate_next_token(
-                            tokens + generated_tokens,
-                            temperature=params["temperature"],
-                            top_p=params["top_p"],
-                            top_k=params["top_k"],
-                            repetition_penalty=params["repetition_penalty"]
-                        )
-                    )
-                    
-                    # Add the token to the generated tokens
-                    generated_tokens.append(next_token)
-                    
-                    # Decode the token and send it to the callback
-                    token_text = self.model.decode([next_token])
-                    callback(token_text)
-                    
-                    # Check for stop sequences
-                    full_text = self.model.decode(generated_tokens)
-                    if any(stop_seq in full_text for stop_seq in params["stop"]):
-                        break
-                    
-                    await asyncio.sleep(0)  # Yield to the event loop
-            except Exception as e:
-                logger.error(f"Error in stream processing: {str(e)}")
+        # Prompt and generated tokens; the list grows in place instead of being copied per token
+        context = list(self.model.tokenize(prompt))
+        eos_token = getattr(self.model, "eos_token_id", None)
+        detokenizer = IncrementalDetokenizer(self.model.decode)
+        matcher = StopSequenceMatcher(params["stop"])
+        
+        # Generate tokens one by one
+        for _ in range(params["max_new_tokens"]):
+            # Get the next token
+            next_token = await loop.run_in_executor(
+                None,
+                lambda: self.model.generate_next_token(
+                    context,
+                    temperature=params["temperature"],
+                    top_p=params["top_p"],
+                    top_k=params["top_k"],
+                    repetition_penalty=params["repetition_penalty"]
+                )
+            )
+            if eos_token is not None and next_token == eos_token:
+                break
+            context.append(next_token)
+            
+            text, stopped = matcher.feed(detokenizer.add(next_token))
+            if text:
+                yield text
+            if stopped:
+                return
         
-        await process_stream()
+        # Emit text held back for incomplete characters or possible stop sequences
+        text, stopped = matcher.feed(detokenizer.flush())
+        if not stopped:
+            text += matcher.flush()
+        if text:
+            yield text
     
     async def get_stats(self) -> Dict[str, Any]:
         """
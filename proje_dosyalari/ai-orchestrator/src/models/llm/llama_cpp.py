@@ -7,7 +7,7 @@ This module provides LLM model implementation using llama.cpp Python bindings.
 import os
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, AsyncIterator, List, Optional, Union, Callable
 import time
 import json
 
@@ -160,22 +160,12 @@ class LlamaCppModel(BaseLLMModel):
             start_time = time.time()
             logger.debug(f"Generating text with llama.cpp model: {self.model_name}")
             
-            # Prepare generation parameters
-            params = {
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "top_p": top_p,
-                "top_k": top_k,
-                "repeat_penalty": repetition_penalty,
-                "stop": stop_sequences if stop_sequences else []
-            }
-            
-            # Add any additional parameters
-            params.update({k: v for k, v in kwargs.items() if k not in params})
+            params = self._prepare_params(max_tokens, temperature, top_p, top_k,
+                                          repetition_penalty, stop_sequences, **kwargs)
             
             # Generate text
-            if stream:
-                return await self._generate_stream(prompt, params, callback)
+            if stream and callback:
+                return await self._stream_to_callback(self._generate_stream(prompt, params), callback)
             else:
                 return await self._generate_complete(prompt, params)
                 
@@ -183,6 +173,70 @@ class LlamaCppModel(BaseLLMModel):
             logger.error(f"Error generating text with llama.cpp model: {str(e)}")
             raise
     
+    async def stream(self,
+                     prompt: str,
+                     max_tokens: int = 1024,
+                     temperature: float = 0.7,
+                     top_p: float = 0.9,
+                     top_k: int = 40,
+                     repetition_penalty: float = 1.0,
+                     stop_sequences: Optional[List[str]] = None,
+                     **kwargs) -> AsyncIterator[str]:
+        """
+        Stream generated text token by token using llama.cpp.
+        
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+            temperature: Controls randomness of output (0.0-1.0)
+            top_p: Nucleus sampling parameter (0.0-1.0)
+            top_k: Top-k sampling parameter
+            repetition_penalty: Penalty for token repetition
+            stop_sequences: Sequences that stop generation (never included in the output)
+            **kwargs: Additional model-specific parameters
+            
+        Yields:
+            Generated text chunks
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model is not loaded")
+        
+        params = self._prepare_params(max_tokens, temperature, top_p, top_k,
+                                      repetition_penalty, stop_sequences, **kwargs)
+        try:
+            async for chunk in self._generate_stream(prompt, params):
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming text with llama.cpp model: {str(e)}")
+            raise
+    
+    def _prepare_params(self,
+                        max_tokens: int,
+                        temperature: float,
+                        top_p: float,
+                        top_k: int,
+                        repetition_penalty: float,
+                        stop_sequences: Optional[List[str]],
+                        **kwargs) -> Dict[str, Any]:
+        """
+        Prepare generation parameters.
+        
+        Returns:
+            Generation parameters
+        """
+        params = {
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "top_k": top_k,
+            "repeat_penalty": repetition_penalty,
+            "stop": stop_sequences if stop_sequences else []
+        }
+        
+        # Add any additional parameters
+        params.update({k: v for k, v in kwargs.items() if k not in params})
+        return params
+    
     async def _generate_complete(self, prompt: str, params: Dict[str, Any]) -> str:
         """
         Generate complete text at once.
@@ -217,19 +271,21 @@ class LlamaCppModel(BaseLLMModel):
         else:
             return json.dumps(result)
     
-    async def _generate_stream(self, prompt: str, params: Dict[str, Any], 
-                             callback: Optional[Callable[[str], None]]) -> None:
+    async def _generate_stream(self, prompt: str, params: Dict[str, Any]) -> AsyncIterator[str]:
         """
         Stream generated text token by token.
         
+        llama.cpp detokenizes incrementally and holds back partial stop
+        sequences itself; chunks are pulled in a thread so generating the
+        next token does not block the event loop.
+        
         Args:
             prompt: Input text prompt
             params: Generation parameters
-            callback: Callback function for streaming
+            
+        Yields:
+            Generated text chunks
         """
-        if not callback:
-            return await self._generate_complete(prompt, params)
-        
         # Create a generator for streaming
         generator = self.llm(
             prompt,
@@ -242,26 +298,23 @@ class LlamaCppModel(BaseLLMModel):
             stream=True
         )
         
-        # Process the stream in a separate thread
         loop = asyncio.get_event_loop()
+        done = object()
         
-        async def process_stream():
-            try:
-                for chunk in generator:
-                    if isinstance(chunk, dict) and "choices" in chunk:
-                        text = chunk["choices"][0]["text"]
-                    elif isinstance(chunk, str):
-                        text = chunk
-                    else:
-                        text = json.dumps(chunk)
-                    
-                    if text:
-                        callback(text)
-                        await asyncio.sleep(0)  # Yield to the event loop
-            except Exception as e:
-                logger.error(f"Error in stream processing: {str(e)}")
-        
-        await process_stream()
+        while True:
+            chunk = await loop.run_in_executor(None, next, generator, done)
+            if chunk is done:
+                break
+            
+            if isinstance(chunk, dict) and "choices" in chunk:
+                text = chunk["choices"][0]["text"]
+            elif isinstance(chunk, str):
+                text = chunk
+            else:
+                text = json.dumps(chunk)
+            
+            if text:
+                yield text
     
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -7,11 +7,12 @@ This module provides LLM model implementation using ONNX Runtime.
 import os
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Callable
+from typing import Dict, Any, AsyncIterator, List, Optional, Union, Callable
 import numpy as np
 import time
 
 from .base import BaseLLMModel
+from .streaming import IncrementalDetokenizer, StopSequenceMatcher
 
 logger = logging.getLogger("ai_orchestrator.models.llm.onnx_llm")
 
@@ -154,27 +155,11 @@ class ONNXLLMModel(BaseLLMModel):
             start_time = time.time()
             logger.debug(f"Generating text with ONNX model: {self.model_name}")
             
-            # Tokenize the prompt
-            inputs = self.tokenizer(prompt, return_tensors="np")
-            input_ids = inputs["input_ids"]
-            attention_mask = inputs["attention_mask"]
-            
-            # Prepare inputs for the model
-            ort_inputs = {
-                "input_ids": input_ids,
-                "attention_mask": attention_mask
-            }
-            
-            # Add additional inputs if required by the model
-            for input_name in self.ort_session.get_inputs():
-                if input_name.name not in ort_inputs:
-                    if input_name.name == "token_type_ids" and "token_type_ids" in inputs:
-                        ort_inputs["token_type_ids"] = inputs["token_type_ids"]
+            ort_inputs = self._prepare_inputs(prompt)
             
             # Generate text
-            if stream:
-                return await self._generate_stream(ort_inputs, max_tokens, temperature, top_p, top_k, 
-                                                 repetition_penalty, stop_sequences, callback, **kwargs)
+            if stream and callback:
+                return await self._stream_to_callback(self._generate_stream(ort_inputs, stop_sequences), callback)
             else:
                 return await self._generate_complete(ort_inputs, max_tokens, temperature, top_p, top_k, 
                                                    repetition_penalty, stop_sequences, **kwargs)
@@ -183,6 +168,70 @@ class ONNXLLMModel(BaseLLMModel):
             logger.error(f"Error generating text with ONNX model: {str(e)}")
             raise
     
+    async def stream(self,
+                     prompt: str,
+                     max_tokens: int = 1024,
+                     temperature: float = 0.7,
+                     top_p: float = 0.9,
+                     top_k: int = 40,
+                     repetition_penalty: float = 1.0,
+                     stop_sequences: Optional[List[str]] = None,
+                     **kwargs) -> AsyncIterator[str]:
+        """
+        Stream generated text token by token using ONNX Runtime.
+        
+        Args:
+            prompt: Input text prompt
+            max_tokens: Maximum number of tokens to generate
+            temperature: Controls randomness of output (0.0-1.0)
+            top_p: Nucleus sampling parameter (0.0-1.0)
+            top_k: Top-k sampling parameter
+            repetition_penalty: Penalty for token repetition
+            stop_sequences: Sequences that stop generation (never included in the output)
+            **kwargs: Additional model-specific parameters
+            
+        Yields:
+            Generated text chunks
+        """
+        if not self.is_loaded:
+            raise RuntimeError("Model is not loaded")
+        
+        try:
+            async for chunk in self._generate_stream(self._prepare_inputs(prompt), stop_sequences):
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming text with ONNX model: {str(e)}")
+            raise
+    
+    def _prepare_inputs(self, prompt: str) -> Dict[str, np.ndarray]:
+        """
+        Tokenize the prompt into ONNX Runtime inputs.
+        
+        Args:
+            prompt: Input text prompt
+            
+        Returns:
+            ONNX Runtime inputs
+        """
+        # Tokenize the prompt
+        inputs = self.tokenizer(prompt, return_tensors="np")
+        input_ids = inputs["input_ids"]
+        attention_mask = inputs["attention_mask"]
+        
+        # Prepare inputs for the model
+        ort_inputs = {
+            "input_ids": input_ids,
+            "attention_mask": attention_mask
+        }
+        
+        # Add additional inputs if required by the model
+        for input_name in self.ort_session.get_inputs():
+            if input_name.name not in ort_inputs:
+                if input_name.name == "token_type_ids" and "token_type_ids" in inputs:
+                    ort_inputs["token_type_ids"] = inputs["token_type_ids"]
+        
+        return ort_inputs
+    
     async def _generate_complete(self, 
                                ort_inputs: Dict[str, np.ndarray],
                                max_tokens: int,
@@ -234,44 +283,47 @@ class ONNXLLMModel(BaseLLMModel):
     
     async def _generate_stream(self,
                              ort_inputs: Dict[str, np.ndarray],
-                             max_tokens: int,
-                             temperature: float,
-                             top_p: float,
-                             top_k: int,
-                             repetition_penalty: float,
-                             stop_sequences: Optional[List[str]],
-                             callback: Optional[Callable[[str], None]],
-                             **kwargs) -> None:
+                             stop_sequences: Optional[List[str]]) -> AsyncIterator[str]:
         """
         Stream generated text token by token.
         
+        The output tokens are decoded incrementally and scanned for stop
+        sequences with a rolling window, instead of decoding and searching the
+        full text per chunk.
+        
         Args:
             ort_inputs: ONNX Runtime inputs
-            max_tokens: Maximum number of tokens to generate
-            temperature: Controls randomness of output
-            top_p: Nucleus sampling parameter
-            top_k: Top-k sampling parameter
-            repetition_penalty: Penalty for token repetition
             stop_sequences: Sequences that stop generation
-            callback: Callback function for streaming
-            **kwargs: Additional parameters
+            
+        Yields:
+            Generated text chunks
         """
-        # This is a simplified implementation
-        # In a real implementation, this would generate tokens one by one
+        # This is a simplified implementation: the model produces all output tokens in one run
+        loop = asyncio.get_event_loop()
+        outputs = await loop.run_in_executor(None, self.ort_session.run, None, ort_inputs)
         
-        # For demonstration, we'll generate the complete text and then simulate streaming
-        complete_text = await self._generate_complete(
-            ort_inputs, max_tokens, temperature, top_p, top_k, 
-            repetition_penalty, stop_sequences, **kwargs
+        if len(outputs) == 0 or not isinstance(outputs[0], np.ndarray):
+            yield "Error: Unable to generate text with this model"
+            return
+        
+        detokenizer = IncrementalDetokenizer(
+            lambda token_ids: self.tokenizer.decode(token_ids, skip_special_tokens=True)
         )
+        matcher = StopSequenceMatcher(stop_sequences)
+        
+        for token_id in outputs[0][0].tolist():
+            text, stopped = matcher.feed(detokenizer.add(token_id))
+            if text:
+                yield text
+            if stopped:
+                return
         
-        # Simulate streaming by sending chunks
-        if callback:
-            words = complete_text.split()
-            for i in range(0, len(words), 3):  # Send 3 words at a time
-                chunk = " ".join(words[i:i+3])
-                callback(chunk + " ")
-                await asyncio.sleep(0.1)  # Simulate generation time
+        # Emit text held back for incomplete characters or possible stop sequences
+        text, stopped = matcher.feed(detokenizer.flush())
+        if not stopped:
+            text += matcher.flush()
+        if text:
+            yield text
     
     async def get_stats(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,138 @@
+"""
+Streaming helpers for LLM model implementations.
+
+This module provides incremental detokenization and stop-sequence scanning,
+so the work per generated token does not grow with the output length.
+"""
+
+from typing import Callable, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger("ai_orchestrator.models.llm.streaming")
+
+# Decoding an incomplete UTF-8 sequence yields the replacement character
+REPLACEMENT_CHAR = "�"
+
+class IncrementalDetokenizer:
+    """
+    Turns a stream of token IDs into text without re-decoding the full output.
+
+    Only the tokens since the last emitted text (plus a few tokens of context,
+    so that tokenizers which merge spaces across tokens decode correctly) are
+    decoded per step. Text ending in an incomplete UTF-8 sequence is held back
+    until the following tokens complete it.
+    """
+
+    def __init__(self, decode: Callable[[List[int]], str], context_tokens: int = 4):
+        """
+        Initialize the detokenizer.
+
+        Args:
+            decode: Function decoding a list of token IDs to text
+            context_tokens: Tokens of already emitted text kept as decoding context
+        """
+        self.decode = decode
+        self.context_tokens = context_tokens
+        self.tokens: List[int] = []
+        # Tokens before prefix_offset are no longer decoded; text up to read_offset has been emitted
+        self.prefix_offset = 0
+        self.read_offset = 0
+
+    def add(self, token: int) -> str:
+        """
+        Add a token.
+
+        Args:
+            token: Generated token ID
+
+        Returns:
+            Newly completed text (possibly empty)
+        """
+        self.tokens.append(token)
+        prefix_text = self.decode(self.tokens[self.prefix_offset:self.read_offset])
+        full_text = self.decode(self.tokens[self.prefix_offset:])
+
+        if len(full_text) <= len(prefix_text) or full_text.endswith(REPLACEMENT_CHAR):
+            # Incomplete character: wait for the next token
+            return ""
+
+        self.read_offset = len(self.tokens)
+        self.prefix_offset = max(self.prefix_offset, self.read_offset - self.context_tokens)
+        return full_text[len(prefix_text):]
+
+    def flush(self) -> str:
+        """
+        Get the text of tokens still held back (e.g. at the end of generation).
+
+        Returns:
+            Remaining text (possibly empty)
+        """
+        if self.read_offset == len(self.tokens):
+            return ""
+        prefix_text = self.decode(self.tokens[self.prefix_offset:self.read_offset])
+        full_text = self.decode(self.tokens[self.prefix_offset:])
+        self.read_offset = len(self.tokens)
+        return full_text[len(prefix_text):]
+
+
+class StopSequenceMatcher:
+    """
+    Detects stop sequences in streamed text using a rolling window.
+
+    The last len(longest stop sequence) - 1 characters are held back, so a stop
+    sequence split across chunks is found and never emitted. Each chunk is only
+    scanned together with that window, not with the full output.
+    """
+
+    def __init__(self, stop_sequences: Optional[Sequence[str]] = None):
+        """
+        Initialize the matcher.
+
+        Args:
+            stop_sequences: Sequences that stop generation
+        """
+        self.stop_sequences = [stop for stop in (stop_sequences or []) if stop]
+        self.window = max((len(stop) for stop in self.stop_sequences), default=1) - 1
+        self.pending = ""
+        self.stopped = False
+
+    def feed(self, text: str) -> Tuple[str, bool]:
+        """
+        Add generated text.
+
+        Args:
+            text: New text chunk
+
+        Returns:
+            Tuple of the text safe to emit and whether a stop sequence was found
+        """
+        if self.stopped:
+            return "", True
+        if not self.stop_sequences:
+            return text, False
+
+        buffer = self.pending + text
+        stop_at = -1
+        for stop in self.stop_sequences:
+            index = buffer.find(stop)
+            if index != -1 and (stop_at == -1 or index < stop_at):
+                stop_at = index
+
+        if stop_at != -1:
+            self.stopped = True
+            self.pending = ""
+            return buffer[:stop_at], True
+
+        split = max(len(buffer) - self.window, 0)
+        self.pending = buffer[split:]
+        return buffer[:split], False
+
+    def flush(self) -> str:
+        """
+        Get the held back text once generation has ended without a stop sequence.
+
+        Returns:
+            Remaining text (possibly empty)
+        """
+        text, self.pending = self.pending, ""
+        return text
@@ -8,9 +8,15 @@ import os
 import logging
 import asyncio
 import time
+from collections import Counter, OrderedDict, deque
 from typing import Dict, Any, List, Optional, Union, Callable
 from datetime import datetime
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 from ..config import config
 from .llm import ONNXLLMModel, LlamaCppModel, GGMLModel
 
@@ -30,6 +36,15 @@ class ModelManager:
             "failed_requests": 0,
             "model_usage": {}
         }
+        # Loads in progress by model key; concurrent callers await the same task
+        self._loading: Dict[str, asyncio.Task] = {}
+        # Loaded model keys, least recently used first
+        self._lru: "OrderedDict[str, None]" = OrderedDict()
+        # Memory charged to each loaded model, and reserved for loads in progress (bytes)
+        self.model_sizes: Dict[str, int] = {}
+        self._reserved_bytes: Dict[str, int] = {}
+        # Recently requested model keys, used to predict models to prefetch
+        self._recent_requests = deque(maxlen=config["models"].get("prefetch_window", 100))
         
     async def initialize(self) -> bool:
         """
@@ -127,6 +142,10 @@ class ModelManager:
         """
         Load a model into memory.
         
+        Concurrent calls for the same model share one load. Before loading,
+        models are evicted until the new model fits both max_loaded_models and
+        the memory budget.
+        
         Args:
             model_name: Name of the model
             model_type: Type of the model (llm, vision, voice)
@@ -155,18 +174,57 @@ class ModelManager:
             # Create a unique key for the model
             model_key = f"{model_type}:{model_name}"
             
-            logger.info(f"Loading model: {model_key}")
-            
             # Check if model is already loaded
             if model_key in self.loaded_models and self.loaded_models[model_key].is_loaded:
                 logger.info(f"Model already loaded: {model_key}")
+                self._touch(model_key)
                 return True
             
-            # Check if we need to unload models due to limit
-            if len(self.loaded_models) >= config["models"]["max_loaded_models"]:
-                # Unload the least recently used model
-                await self._unload_lru_model()
+            # Start the load, or join the one already in progress
+            return await asyncio.shield(self._start_load(model_key, model_name, model_type, **kwargs))
+            
+        except Exception as e:
+            logger.error(f"Error loading model: {str(e)}")
+            return False
+    
+    def _start_load(self, model_key: str, model_name: str, model_type: str, **kwargs) -> asyncio.Task:
+        """
+        Get the load task for a model, starting it if no load is in progress.
+        
+        Args:
+            model_key: Key of the model
+            model_name: Name of the model
+            model_type: Type of the model (llm, vision, voice)
+            **kwargs: Additional model-specific parameters
             
+        Returns:
+            Task resolving to True if the model was loaded, False otherwise
+        """
+        load_task = self._loading.get(model_key)
+        if load_task is not None:
+            logger.info(f"Waiting for model load in progress: {model_key}")
+            return load_task
+        
+        logger.info(f"Loading model: {model_key}")
+        load_task = asyncio.ensure_future(self._load_model(model_key, model_name, model_type, **kwargs))
+        self._loading[model_key] = load_task
+        load_task.add_done_callback(lambda _: self._loading.pop(model_key, None))
+        return load_task
+    
+    async def _load_model(self, model_key: str, model_name: str, model_type: str, **kwargs) -> bool:
+        """
+        Construct and load a model (runs once per concurrent load).
+        
+        Args:
+            model_key: Key of the model
+            model_name: Name of the model
+            model_type: Type of the model (llm, vision, voice)
+            **kwargs: Additional model-specific parameters
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
             # Get model path
             model_path = None
             if model_key in self.models:
@@ -178,6 +236,12 @@ class ModelManager:
                     logger.error(f"Model not found: {model_key}")
                     return False
             
+            # Make room for the model
+            estimated_size = self._estimate_model_size(model_path)
+            if not await self._make_room(model_key, estimated_size):
+                return False
+            self._reserved_bytes[model_key] = estimated_size
+            
             # Create and load the model based on type
             model = None
             if model_type == "llm":
@@ -204,18 +268,22 @@ class ModelManager:
             else:
                 raise ValueError(f"Unknown model type: {model_type}")
             
-            # Load the model
+            # Load the model, measuring the process memory it adds
+            rss_before = self._process_rss()
             success = await model.load()
+            rss_delta = self._process_rss() - rss_before
             
             if success:
-                # Store the loaded model
+                # Store the loaded model, charging the larger of file size and measured growth
                 self.loaded_models[model_key] = model
+                self.model_sizes[model_key] = max(estimated_size, rss_delta)
+                self._touch(model_key)
                 
                 # Update model registry if not already registered
                 if model_key not in self.models:
                     self.register_model(model_name, model_type, model_path)
                 
-                logger.info(f"Model loaded successfully: {model_key}")
+                logger.info(f"Model loaded successfully: {model_key} ({self.model_sizes[model_key] / (1024 * 1024):.1f} MB)")
                 return True
             else:
                 logger.error(f"Failed to load model: {model_key}")
@@ -224,6 +292,172 @@ class ModelManager:
         except Exception as e:
             logger.error(f"Error loading model: {str(e)}")
             return False
+        finally:
+            self._reserved_bytes.pop(model_key, None)
+    
+    def _touch(self, model_key: str):
+        """Mark a loaded model as most recently used."""
+        self._lru[model_key] = None
+        self._lru.move_to_end(model_key)
+    
+    def _record_request(self, model_key: str):
+        """Update usage stats and traffic history for a request to a model."""
+        usage = self.stats["model_usage"].setdefault(model_key, {
+            "requests": 0,
+            "tokens_generated": 0,
+            "last_used": 0
+        })
+        usage["requests"] += 1
+        usage["last_used"] = time.time()
+        self._recent_requests.append(model_key)
+        if model_key in self.loaded_models:
+            self._touch(model_key)
+    
+    @staticmethod
+    def _estimate_model_size(model_path: str) -> int:
+        """
+        Estimate the memory a model needs from the size of its files.
+        
+        Args:
+            model_path: Path to the model file or directory
+            
+        Returns:
+            Size in bytes (0 if the path does not exist)
+        """
+        if os.path.isfile(model_path):
+            return os.path.getsize(model_path)
+        
+        total = 0
+        for root, _, files in os.walk(model_path):
+            for file in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, file))
+                except OSError:
+                    pass
+        return total
+    
+    @staticmethod
+    def _process_rss() -> int:
+        """Get the resident memory of this process in bytes (0 without psutil)."""
+        if psutil is None:
+            return 0
+        return psutil.Process().memory_info().rss
+    
+    def _memory_budget(self) -> Optional[int]:
+        """Get the memory budget for loaded models in bytes, or None if unlimited."""
+        budget_mb = config["models"].get("memory_budget_mb")
+        return int(budget_mb * 1024 * 1024) if budget_mb else None
+    
+    def get_memory_usage(self) -> int:
+        """
+        Get the memory charged to loaded models and loads in progress.
+        
+        Returns:
+            Memory in bytes
+        """
+        return sum(self.model_sizes.get(key, 0) for key in self.loaded_models) + sum(self._reserved_bytes.values())
+    
+    def _select_victim(self, exclude: str) -> Optional[str]:
+        """
+        Select the model to evict according to the eviction policy.
+        
+        Args:
+            exclude: Model key that must not be evicted
+            
+        Returns:
+            Model key, or None if no loaded model can be evicted
+        """
+        candidates = [key for key in self._lru if key != exclude and key in self.loaded_models]
+        if not candidates:
+            return None
+        
+        if config["models"].get("eviction_policy", "lru") == "lfu":
+            # Fewest requests first; ties broken by recency (candidates are in LRU order)
+            usage = self.stats["model_usage"]
+            return min(candidates, key=lambda key: usage.get(key, {}).get("requests", 0))
+        return candidates[0]
+    
+    async def _make_room(self, model_key: str, size: int) -> bool:
+        """
+        Evict models until a new model fits the model count and memory budget.
+        
+        Args:
+            model_key: Key of the model being loaded
+            size: Estimated size of the model in bytes
+            
+        Returns:
+            True if the model fits, False if it can never fit the memory budget
+        """
+        budget = self._memory_budget()
+        if budget is not None and size > budget:
+            logger.error(f"Model {model_key} ({size / (1024 * 1024):.1f} MB) exceeds the memory budget")
+            return False
+        
+        max_loaded = config["models"]["max_loaded_models"]
+        while (len(self.loaded_models) + len(self._reserved_bytes) >= max_loaded
+               or (budget is not None and self.get_memory_usage() + size > budget)):
+            victim = self._select_victim(exclude=model_key)
+            if victim is None or not await self.unload_model(victim):
+                logger.warning(f"Could not free capacity for model {model_key}, loading anyway")
+                break
+            logger.info(f"Evicted model {victim} to make room for {model_key}")
+        
+        return True
+    
+    def predict_models(self, limit: int = 3) -> List[str]:
+        """
+        Predict the models most likely to be requested next from recent traffic.
+        
+        Requests are weighted by recency, so models used in the latest requests rank highest.
+        
+        Args:
+            limit: Maximum number of models to return
+            
+        Returns:
+            Model keys, most likely first
+        """
+        scores = Counter()
+        for position, model_key in enumerate(self._recent_requests, start=1):
+            scores[model_key] += position
+        return [model_key for model_key, _ in scores.most_common(limit)]
+    
+    async def prefetch(self, limit: int = 1) -> List[str]:
+        """
+        Start loading models predicted from recent traffic that are not loaded.
+        
+        Prefetching only uses free capacity: it never evicts a loaded model.
+        
+        Args:
+            limit: Maximum number of models to start loading
+            
+        Returns:
+            Keys of the models whose loads were started
+        """
+        budget = self._memory_budget()
+        max_loaded = config["models"]["max_loaded_models"]
+        used_slots = len(self.loaded_models) + len(self._loading)
+        used_bytes = self.get_memory_usage()
+        started = []
+        
+        for model_key in self.predict_models(limit=max_loaded):
+            if len(started) >= limit or used_slots >= max_loaded:
+                break
+            if model_key in self.loaded_models or model_key in self._loading:
+                continue
+            
+            model_path = self.models.get(model_key, {}).get("path")
+            size = self._estimate_model_size(model_path) if model_path else 0
+            if budget is not None and used_bytes + size > budget:
+                continue
+            
+            logger.info(f"Prefetching model: {model_key}")
+            model_type, model_name = model_key.split(":", 1)
+            self._start_load(model_key, model_name, model_type)
+            used_slots += 1
+            used_bytes += size
+            started.append(model_key)
+        
+        return started
     
     def _determine_llm_implementation(self, model_path: str) -> str:
         """
@@ -264,21 +498,7 @@ class ModelManager:
             True if successful, False otherwise
         """
         try:
-            # Find the least recently used model
-            lru_key = None
-            lru_time = float('inf')
-            
-            for key, model in self.loaded_models.items():
-                # Skip models that are not loaded
-                if not model.is_loaded:
-                    continue
-                
-                # Get last used time from stats
-                last_used = self.stats.get("model_usage", {}).get(key, {}).get("last_used", 0)
-                
-                if last_used < lru_time:
-                    lru_time = last_used
-                    lru_key = key
+            lru_key = next((key for key in self._lru if key in self.loaded_models), None)
             
             # If no model found, return
             if not lru_key:
@@ -319,6 +539,8 @@ class ModelManager:
             if success:
                 # Remove from loaded models
                 del self.loaded_models[model_key]
+                self._lru.pop(model_key, None)
+                self.model_sizes.pop(model_key, None)
                 
                 logger.info(f"Model unloaded successfully: {model_key}")
                 return True
@@ -352,6 +574,9 @@ class ModelManager:
             # Create model key
             model_key = f"llm:{model_name}"
             
+            # Update usage stats
+            self._record_request(model_key)
+            
             # Load the model if not loaded
             if model_key not in self.loaded_models or not self.loaded_models[model_key].is_loaded:
                 success = await self.load_model(model_name, "llm")
@@ -361,17 +586,6 @@ class ModelManager:
             # Get the model
             model = self.loaded_models[model_key]
             
-            # Update usage stats
-            if model_key not in self.stats["model_usage"]:
-                self.stats["model_usage"][model_key] = {
-                    "requests": 0,
-                    "tokens_generated": 0,
-                    "last_used": 0
-                }
-            
-            self.stats["model_usage"][model_key]["requests"] += 1
-            self.stats["model_usage"][model_key]["last_used"] = time.time()
-            
             # Process the request
             start_time = time.time()
             
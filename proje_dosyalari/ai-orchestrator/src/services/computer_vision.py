@@ -9,14 +9,19 @@ import os
 import logging
 import asyncio
 import time
+import json
+import hashlib
 from typing import Dict, Any, List, Optional, Union, Tuple
 import numpy as np
 from datetime import datetime
 import base64
-import io
 import cv2
 import pytesseract
-from PIL import Image
+
+from .cv_executor import (
+    CVExecutor, FrameInput, IMAGE_OPERATIONS, decode_image, load_detection_models,
+    process_frame_task, ocr_frame_task, detect_frames_task
+)
 
 logger = logging.getLogger("ai_orchestrator.services.computer_vision")
 
@@ -67,6 +72,17 @@ class ComputerVisionService:
             "cache_size": 200
         })
         
+        # CPU-bound work runs in worker processes ("process") or threads ("thread")
+        self.executor_config = self.config.get("executor", {
+            "mode": "process",
+            "max_workers": None
+        })
+        self.executor = CVExecutor(
+            mode=self.executor_config.get("mode", "process"),
+            max_workers=self.executor_config.get("max_workers"),
+            object_detection_config=self.object_detection_config
+        )
+        
         # Initialize caches
         self.ocr_cache = {}
         self.object_detection_cache = {}
@@ -98,8 +114,8 @@ class ComputerVisionService:
                 logger.warning(f"Tesseract not properly configured: {str(e)}")
                 logger.warning("OCR functionality may be limited")
             
-            # Load object detection models if specified
-            if self.object_detection_config.get("preload_models", False):
+            # Load object detection models if specified (worker processes load their own)
+            if self.object_detection_config.get("preload_models", False) and self.executor.mode != "process":
                 await self._load_object_detection_models()
             
             logger.info("Computer Vision Service initialized successfully")
@@ -111,73 +127,27 @@ class ComputerVisionService:
     
     async def _load_object_detection_models(self) -> bool:
         """
-        Load object detection models.
+        Load object detection models into this process.
+        
+        Only needed in thread mode; worker processes load their own models.
         
         Returns:
             True if successful, False otherwise
         """
-        try:
-            model_type = self.object_detection_config.get("model", "yolo")
-            
-            if model_type == "yolo":
-                # Load YOLOv4 model
-                weights_path = self.object_detection_config.get("weights_path", "models/yolov4.weights")
-                config_path = self.object_detection_config.get("config_path", "models/yolov4.cfg")
-                
-                if os.path.exists(weights_path) and os.path.exists(config_path):
-                    logger.info(f"Loading YOLOv4 model from {weights_path} and {config_path}")
-                    self.models["yolo"] = cv2.dnn.readNetFromDarknet(config_path, weights_path)
-                    
-                    # Load COCO class names
-                    coco_names_path = self.object_detection_config.get("coco_names_path", "models/coco.names")
-                    if os.path.exists(coco_names_path):
-                        with open(coco_names_path, "r") as f:
-                            self.models["coco_classes"] = f.read().strip().split("\n")
-                    else:
-                        logger.warning(f"COCO names file not found at {coco_names_path}")
-                        # Use a minimal set of common classes as fallback
-                        self.models["coco_classes"] = [
-                            "person", "bicycle", "car", "motorcycle", "airplane", "bus", "train", "truck", "boat",
-                            "traffic light", "fire hydrant", "stop sign", "parking meter", "bench", "bird", "cat",
-                            "dog", "horse", "sheep", "cow", "elephant", "bear", "zebra", "giraffe", "backpack",
-                            "umbrella", "handbag", "tie", "suitcase", "frisbee", "skis", "snowboard", "sports ball",
-                            "kite", "baseball bat", "baseball glove", "skateboard", "surfboard", "tennis racket",
-                            "bottle", "wine glass", "cup", "fork", "knife", "spoon", "bowl", "banana", "apple",
-                            "sandwich", "orange", "broccoli", "carrot", "hot dog", "pizza", "donut", "cake", "chair",
-                            "couch", "potted plant", "bed", "dining table", "toilet", "tv", "laptop", "mouse",
-                            "remote", "keyboard", "cell phone", "microwave", "oven", "toaster", "sink", "refrigerator",
-                            "book", "clock", "vase", "scissors", "teddy bear", "hair drier", "toothbrush"
-                        ]
-                else:
-                    logger.warning(f"YOLOv4 model files not found at {weights_path} and {config_path}")
-                    logger.warning("Using OpenCV's built-in models as fallback")
-                    
-                    # Use OpenCV's built-in models as fallback
-                    self.models["yolo"] = cv2.dnn.readNetFromDarknet(
-                        "models/yolov3.cfg", 
-                        "models/yolov3.weights"
-                    )
-            
-            elif model_type == "ssd":
-                # Load SSD model
-                model_path = self.object_detection_config.get("model_path", "models/ssd_mobilenet.pb")
-                config_path = self.object_detection_config.get("config_path", "models/ssd_mobilenet.pbtxt")
-                
-                if os.path.exists(model_path) and os.path.exists(config_path):
-                    logger.info(f"Loading SSD model from {model_path} and {config_path}")
-                    self.models["ssd"] = cv2.dnn.readNetFromTensorflow(model_path, config_path)
-                else:
-                    logger.warning(f"SSD model files not found at {model_path} and {config_path}")
-            
-            else:
-                logger.warning(f"Unsupported object detection model type: {model_type}")
-            
-            logger.info("Object detection models loaded successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error loading object detection models: {str(e)}")
-            return False
+        models = await asyncio.get_running_loop().run_in_executor(
+            None, load_detection_models, self.object_detection_config
+        )
+        self.models.update(models)
+        return bool(models)
+    
+    def _task_models(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the models to hand to executor tasks.
+        
+        Returns:
+            This process's models in thread mode, None in process mode
+        """
+        return self.models if self.executor.mode != "process" else None
     
     async def process_image(
         self, 
@@ -201,111 +171,34 @@ class ComputerVisionService:
         self.stats["image_processing_requests"] += 1
         
         try:
-            # Convert image data to numpy array
-            image = await self._load_image(image_data)
+            if operation not in IMAGE_OPERATIONS:
+                raise ValueError(f"Unsupported image processing operation: {operation}")
+            
+            # Read image data; decoding happens in the executor
+            frame = self._read_image_data(image_data)
             
             # Generate cache key if caching is enabled
             cache_key = None
             if self.image_processing_config.get("cache_enabled", True):
-                cache_key = self._generate_cache_key(image, operation, parameters)
+                cache_key = self._generate_cache_key(frame, operation, parameters)
                 cached_result = self.image_processing_cache.get(cache_key)
                 if cached_result:
                     logger.debug(f"Cache hit for image processing operation: {operation}")
                     return cached_result
             
-            # Process image based on operation
-            parameters = parameters or {}
-            result = {}
-            
-            if operation == "enhance":
-                processed_image = await self._enhance_image(
-                    image,
-                    brightness=parameters.get("brightness", 1.0),
-                    contrast=parameters.get("contrast", 1.0),
-                    sharpness=parameters.get("sharpness", 1.0)
-                )
-                result = {
-                    "processed_image": self._encode_image(processed_image, parameters.get("format", "JPEG")),
-                    "operation": operation,
-                    "parameters": parameters,
-                    "success": True
-                }
-            
-            elif operation == "resize":
-                width = parameters.get("width", self.image_processing_config["default_resize"][0])
-                height = parameters.get("height", self.image_processing_config["default_resize"][1])
-                processed_image = await self._resize_image(image, width, height)
-                result = {
-                    "processed_image": self._encode_image(processed_image, parameters.get("format", "JPEG")),
-                    "width": width,
-                    "height": height,
-                    "operation": operation,
-                    "parameters": parameters,
-                    "success": True
-                }
-            
-            elif operation == "crop":
-                x = parameters.get("x", 0)
-                y = parameters.get("y", 0)
-                width = parameters.get("width", image.shape[1] - x)
-                height = parameters.get("height", image.shape[0] - y)
-                processed_image = await self._crop_image(image, x, y, width, height)
-                result = {
-                    "processed_image": self._encode_image(processed_image, parameters.get("format", "JPEG")),
-                    "x": x,
-                    "y": y,
-                    "width": width,
-                    "height": height,
-                    "operation": operation,
-                    "parameters": parameters,
-                    "success": True
-                }
-            
-            elif operation == "grayscale":
-                processed_image = await self._convert_to_grayscale(image)
-                result = {
-                    "processed_image": self._encode_image(processed_image, parameters.get("format", "JPEG")),
-                    "operation": operation,
-                    "parameters": parameters,
-                    "success": True
-                }
-            
-            elif operation == "blur":
-                kernel_size = parameters.get("kernel_size", 5)
-                processed_image = await self._blur_image(image, kernel_size)
-                result = {
-                    "processed_image": self._encode_image(processed_image, parameters.get("format", "JPEG")),
-                    "kernel_size": kernel_size,
-                    "operation": operation,
-                    "parameters": parameters,
-                    "success": True
-                }
-            
-            elif operation == "edge_detection":
-                threshold1 = parameters.get("threshold1", 100)
-                threshold2 = parameters.get("threshold2", 200)
-                processed_image = await self._detect_edges(image, threshold1, threshold2)
-                result = {
-                    "processed_image": self._encode_image(processed_image, parameters.get("format", "JPEG")),
-                    "threshold1": threshold1,
-                    "threshold2": threshold2,
-                    "operation": operation,
-                    "parameters": parameters,
-                    "success": True
-                }
-            
-            else:
-                raise ValueError(f"Unsupported image processing operation: {operation}")
+            # Process image in the executor
+            result = await self.executor.run(
+                process_frame_task,
+                [frame],
+                operation,
+                parameters or {},
+                tuple(self.image_processing_config["default_resize"]),
+                models=self._task_models()
+            )
             
             # Update cache if enabled
             if cache_key and self.image_processing_config.get("cache_enabled", True):
-                # Manage cache size
-                if len(self.image_processing_cache) >= self.image_processing_config.get("cache_size", 200):
-                    # Remove oldest entry
-                    oldest_key = next(iter(self.image_processing_cache))
-                    del self.image_processing_cache[oldest_key]
-                
-                self.image_processing_cache[cache_key] = result
+                self._cache_put(self.image_processing_cache, cache_key, result, self.image_processing_config.get("cache_size", 200))
             
             # Update stats
             processing_time = time.time() - start_time
@@ -349,92 +242,30 @@ class ComputerVisionService:
         self.stats["ocr_requests"] += 1
         
         try:
-            # Convert image data to numpy array
-            image = await self._load_image(image_data)
+            frame = self._read_image_data(image_data)
             
             # Generate cache key if caching is enabled
             cache_key = None
             if self.ocr_config.get("cache_enabled", True):
-                cache_key = self._generate_cache_key(image, "ocr", parameters)
+                cache_key = self._generate_cache_key(frame, "ocr", parameters)
                 cached_result = self.ocr_cache.get(cache_key)
                 if cached_result:
                     logger.debug("Cache hit for OCR operation")
                     return cached_result
             
-            # Set OCR parameters
-            parameters = parameters or {}
-            lang = parameters.get("lang", self.ocr_config.get("lang", "eng"))
-            config = parameters.get("config", self.ocr_config.get("config", "--psm 3"))
-            
-            # Preprocess image for better OCR results
-            if parameters.get("preprocess", True):
-                # Convert to grayscale
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-                
-                # Apply thresholding
-                if parameters.get("threshold", True):
-                    gray = cv2.threshold(
-                        gray, 
-                        parameters.get("threshold_value", 0), 
-                        255, 
-                        parameters.get("threshold_type", cv2.THRESH_BINARY | cv2.THRESH_OTSU)
-                    )[1]
-                
-                # Apply noise reduction
-                if parameters.get("denoise", True):
-                    gray = cv2.medianBlur(gray, parameters.get("denoise_kernel", 3))
-                
-                # Use preprocessed image for OCR
-                image = gray
-            
-            # Convert numpy array to PIL Image for pytesseract
-            pil_image = Image.fromarray(image)
-            
-            # Perform OCR
-            text = pytesseract.image_to_string(pil_image, lang=lang, config=config)
-            
-            # Get bounding boxes for text regions
-            boxes = None
-            if parameters.get("get_boxes", False):
-                boxes_data = pytesseract.image_to_data(pil_image, lang=lang, config=config, output_type=pytesseract.Output.DICT)
-                
-                # Filter out empty text
-                boxes = []
-                for i in range(len(boxes_data["text"])):
-                    if boxes_data["text"][i].strip():
-                        boxes.append({
-                            "text": boxes_data["text"][i],
-                            "conf": boxes_data["conf"][i],
-                            "x": boxes_data["left"][i],
-                            "y": boxes_data["top"][i],
-                            "width": boxes_data["width"][i],
-                            "height": boxes_data["height"][i],
-                            "block_num": boxes_data["block_num"][i],
-                            "line_num": boxes_data["line_num"][i],
-                            "word_num": boxes_data["word_num"][i]
-                        })
-            
-            # Prepare result
-            result = {
-                "text": text,
-                "lang": lang,
-                "config": config,
-                "success": True,
-                "processing_time": time.time() - start_time
-            }
-            
-            if boxes:
-                result["boxes"] = boxes
+            # Preprocess and recognize text in the executor
+            result = await self.executor.run(
+                ocr_frame_task,
+                [frame],
+                parameters or {},
+                self.ocr_config,
+                models=self._task_models()
+            )
+            result["processing_time"] = time.time() - start_time
             
             # Update cache if enabled
             if cache_key and self.ocr_config.get("cache_enabled", True):
-                # Manage cache size
-                if len(self.ocr_cache) >= self.ocr_config.get("cache_size", 100):
-                    # Remove oldest entry
-                    oldest_key = next(iter(self.ocr_cache))
-                    del self.ocr_cache[oldest_key]
-                
-                self.ocr_cache[cache_key] = result
+                self._cache_put(self.ocr_cache, cache_key, result, self.ocr_config.get("cache_size", 100))
             
             # Update stats
             processing_time = time.time() - start_time
@@ -453,6 +284,84 @@ class ComputerVisionService:
                 "processing_time": time.time() - start_time
             }
     
+    def _detection_settings(self, parameters: Dict[str, Any]) -> Tuple[str, float, float]:
+        """
+        Get the object detection model and thresholds of a request.
+        
+        Args:
+            parameters: Object detection parameters
+            
+        Returns:
+            Tuple of model type, confidence threshold and NMS threshold
+        """
+        model_type = parameters.get("model", self.object_detection_config.get("model", "yolo"))
+        confidence_threshold = parameters.get(
+            "confidence_threshold", 
+            self.object_detection_config.get("confidence_threshold", 0.5)
+        )
+        nms_threshold = parameters.get(
+            "nms_threshold", 
+            self.object_detection_config.get("nms_threshold", 0.4)
+        )
+        return model_type, confidence_threshold, nms_threshold
+    
+    async def _run_detection(
+        self,
+        frames: List[FrameInput],
+        parameters: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Detect objects in frames with one executor task and one forward pass.
+        
+        Args:
+            frames: Frame inputs
+            parameters: Object detection parameters
+            
+        Returns:
+            Dictionary with detected objects (and annotated image) for each frame
+        """
+        model_type, confidence_threshold, nms_threshold = self._detection_settings(parameters)
+        
+        # In thread mode, load the model into this process if not already loaded
+        if self.executor.mode != "process" and model_type not in self.models:
+            await self._load_object_detection_models()
+        
+        return await self.executor.run(
+            detect_frames_task,
+            frames,
+            model_type,
+            confidence_threshold,
+            nms_threshold,
+            parameters.get("draw_boxes", False),
+            parameters.get("format", "JPEG"),
+            models=self._task_models()
+        )
+    
+    def _detection_result(self, detection: Dict[str, Any], parameters: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        """
+        Build the response of one image's object detection.
+        
+        Args:
+            detection: Executor result for the image
+            parameters: Object detection parameters
+            start_time: Start time of the request
+            
+        Returns:
+            Dictionary with detected objects and metadata
+        """
+        model_type, confidence_threshold, _ = self._detection_settings(parameters)
+        result = {
+            "objects": detection["objects"],
+            "count": len(detection["objects"]),
+            "model": model_type,
+            "confidence_threshold": confidence_threshold,
+            "success": True,
+            "processing_time": time.time() - start_time
+        }
+        if "annotated_image" in detection:
+            result["annotated_image"] = detection["annotated_image"]
+        return result
+    
     async def detect_objects(
         self, 
         image_data: Union[str, bytes, np.ndarray],
@@ -473,103 +382,24 @@ class ComputerVisionService:
         self.stats["object_detection_requests"] += 1
         
         try:
-            # Convert image data to numpy array
-            image = await self._load_image(image_data)
+            frame = self._read_image_data(image_data)
             
             # Generate cache key if caching is enabled
             cache_key = None
             if self.object_detection_config.get("cache_enabled", True):
-                cache_key = self._generate_cache_key(image, "object_detection", parameters)
+                cache_key = self._generate_cache_key(frame, "object_detection", parameters)
                 cached_result = self.object_detection_cache.get(cache_key)
                 if cached_result:
                     logger.debug("Cache hit for object detection operation")
                     return cached_result
             
-            # Set object detection parameters
             parameters = parameters or {}
-            model_type = parameters.get("model", self.object_detection_config.get("model", "yolo"))
-            confidence_threshold = parameters.get(
-                "confidence_threshold", 
-                self.object_detection_config.get("confidence_threshold", 0.5)
-            )
-            nms_threshold = parameters.get(
-                "nms_threshold", 
-                self.object_detection_config.get("nms_threshold", 0.4)
-            )
-            
-            # Load model if not already loaded
-            if model_type not in self.models:
-                await self._load_object_detection_models()
-            
-            # Detect objects based on model type
-            if model_type == "yolo" and "yolo" in self.models:
-                detections = await self._detect_objects_yolo(
-                    image, 
-                    confidence_threshold, 
-                    nms_threshold
-                )
-            elif model_type == "ssd" and "ssd" in self.models:
-                detections = await self._detect_objects_ssd(
-                    image, 
-                    confidence_threshold, 
-                    nms_threshold
-                )
-            else:
-                # Fallback to OpenCV's built-in object detection
-                logger.warning(f"Model {model_type} not loaded, using OpenCV's built-in object detection")
-                detections = await self._detect_objects_opencv(
-                    image, 
-                    confidence_threshold
-                )
-            
-            # Draw bounding boxes if requested
-            annotated_image = None
-            if parameters.get("draw_boxes", False):
-                annotated_image = image.copy()
-                for obj in detections:
-                    x, y, w, h = obj["box"]
-                    label = f"{obj['class']}: {obj['confidence']:.2f}"
-                    color = (0, 255, 0)  # Green
-                    
-                    # Draw rectangle
-                    cv2.rectangle(annotated_image, (x, y), (x + w, y + h), color, 2)
-                    
-                    # Draw label
-                    cv2.putText(
-                        annotated_image, 
-                        label, 
-                        (x, y - 10), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 
-                        0.5, 
-                        color, 
-                        2
-                    )
-            
-            # Prepare result
-            result = {
-                "objects": detections,
-                "count": len(detections),
-                "model": model_type,
-                "confidence_threshold": confidence_threshold,
-                "success": True,
-                "processing_time": time.time() - start_time
-            }
-            
-            if annotated_image is not None:
-                result["annotated_image"] = self._encode_image(
-                    annotated_image, 
-                    parameters.get("format", "JPEG")
-                )
+            detections = await self._run_detection([frame], parameters)
+            result = self._detection_result(detections[0], parameters, start_time)
             
             # Update cache if enabled
             if cache_key and self.object_detection_config.get("cache_enabled", True):
-                # Manage cache size
-                if len(self.object_detection_cache) >= self.object_detection_config.get("cache_size", 50):
-                    # Remove oldest entry
-                    oldest_key = next(iter(self.object_detection_cache))
-                    del self.object_detection_cache[oldest_key]
-                
-                self.object_detection_cache[cache_key] = result
+                self._cache_put(self.object_detection_cache, cache_key, result, self.object_detection_config.get("cache_size", 50))
             
             # Update stats
             processing_time = time.time() - start_time
@@ -588,226 +418,82 @@ class ComputerVisionService:
                 "processing_time": time.time() - start_time
             }
     
-    async def _detect_objects_yolo(
-        self, 
-        image: np.ndarray,
-        confidence_threshold: float,
-        nms_threshold: float
+    async def detect_objects_batch(
+        self,
+        images: List[Union[str, bytes, np.ndarray]],
+        parameters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Detect objects using YOLOv4 model.
+        Detect objects in several images with one forward pass.
+        
+        Images found in the cache are not processed again; the others are
+        stacked into one blob (cv2.dnn.blobFromImages) for a single network
+        forward pass in one executor task.
         
         Args:
-            image: Image as numpy array
-            confidence_threshold: Minimum confidence threshold
-            nms_threshold: Non-maximum suppression threshold
+            images: Images as base64 strings, bytes, or numpy arrays
+            parameters: Object detection parameters, shared by all images
             
         Returns:
-            List of detected objects
+            Dictionary with detected objects and metadata for each image, in order
         """
-        # Get image dimensions
-        height, width = image.shape[:2]
-        
-        # Create blob from image
-        blob = cv2.dnn.blobFromImage(
-            image, 
-            1/255.0, 
-            (416, 416), 
-            swapRB=True, 
-            crop=False
-        )
-        
-        # Set input to the network
-        self.models["yolo"].setInput(blob)
-        
-        # Get output layer names
-        layer_names = self.models["yolo"].getLayerNames()
-        output_layers = [layer_names[i - 1] for i in self.models["yolo"].getUnconnectedOutLayers()]
-        
-        # Forward pass
-        outputs = self.models["yolo"].forward(output_layers)
-        
-        # Process outputs
-        class_ids = []
-        confidences = []
-        boxes = []
-        
-        for output in outputs:
-            for detection in output:
-                scores = detection[5:]
-                class_id = np.argmax(scores)
-                confidence = scores[class_id]
-                
-                if confidence > confidence_threshold:
-                    # Object detected
-                    center_x = int(detection[0] * width)
-                    center_y = int(detection[1] * height)
-                    w = int(detection[2] * width)
-                    h = int(detection[3] * height)
-                    
-                    # Rectangle coordinates
-                    x = int(center_x - w / 2)
-                    y = int(center_y - h / 2)
-                    
-                    boxes.append([x, y, w, h])
-                    confidences.append(float(confidence))
-                    class_ids.append(class_id)
-        
-        # Apply non-maximum suppression
-        indices = cv2.dnn.NMSBoxes(boxes, confidences, confidence_threshold, nms_threshold)
-        
-        # Prepare results
-        detections = []
-        coco_classes = self.models.get("coco_classes", [])
+        start_time = time.time()
+        self.stats["total_requests"] += len(images)
+        self.stats["object_detection_requests"] += len(images)
         
-        for i in indices:
-            if isinstance(i, list):  # OpenCV 4.5.4 and earlier
-                i = i[0]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(images)
+        try:
+            frames = [self._read_image_data(image_data) for image_data in images]
+            
+            # Look up cached results
+            cache_enabled = self.object_detection_config.get("cache_enabled", True)
+            cache_keys: List[Optional[str]] = [None] * len(frames)
+            if cache_enabled:
+                for index, frame in enumerate(frames):
+                    cache_keys[index] = self._generate_cache_key(frame, "object_detection", parameters)
+                    results[index] = self.object_detection_cache.get(cache_keys[index])
+            
+            missing = [index for index, result in enumerate(results) if not result]
+            if missing:
+                parameters = parameters or {}
+                detections = await self._run_detection([frames[index] for index in missing], parameters)
                 
-            box = boxes[i]
-            confidence = confidences[i]
-            class_id = class_ids[i]
+                for index, detection in zip(missing, detections):
+                    results[index] = self._detection_result(detection, parameters, start_time)
+                    results[index]["batch_size"] = len(missing)
+                    if cache_enabled:
+                        self._cache_put(self.object_detection_cache, cache_keys[index], results[index], self.object_detection_config.get("cache_size", 50))
             
-            # Get class name
-            class_name = "unknown"
-            if class_id < len(coco_classes):
-                class_name = coco_classes[class_id]
-            
-            detections.append({
-                "box": box,
-                "confidence": confidence,
-                "class_id": int(class_id),
-                "class": class_name
-            })
-        
-        return detections
-    
-    async def _detect_objects_ssd(
-        self, 
-        image: np.ndarray,
-        confidence_threshold: float,
-        nms_threshold: float
-    ) -> List[Dict[str, Any]]:
-        """
-        Detect objects using SSD model.
-        
-        Args:
-            image: Image as numpy array
-            confidence_threshold: Minimum confidence threshold
-            nms_threshold: Non-maximum suppression threshold
-            
-        Returns:
-            List of detected objects
-        """
-        # Get image dimensions
-        height, width = image.shape[:2]
-        
-        # Create blob from image
-        blob = cv2.dnn.blobFromImage(
-            image, 
-            size=(300, 300), 
-            mean=(127.5, 127.5, 127.5), 
-            scalefactor=0.007843, 
-            swapRB=True
-        )
-        
-        # Set input to the network
-        self.models["ssd"].setInput(blob)
-        
-        # Forward pass
-        detections = self.models["ssd"].forward()
-        
-        # Process outputs
-        results = []
-        
-        for i in range(detections.shape[2]):
-            confidence = detections[0, 0, i, 2]
+            # Update stats
+            processing_time = time.time() - start_time
+            self.stats["processing_times"].append(processing_time)
+            self.stats["successful_requests"] += len(missing)
             
-            if confidence > confidence_threshold:
-                # Get class ID
-                class_id = int(detections[0, 0, i, 1])
-                
-                # Get bounding box coordinates
-                box = detections[0, 0, i, 3:7] * np.array([width, height, width, height])
-                (startX, startY, endX, endY) = box.astype("int")
-                
-                # Calculate width and height
-                w = endX - startX
-                h = endY - startY
-                
-                # Get class name
-                class_name = f"class_{class_id}"
-                coco_classes = self.models.get("coco_classes", [])
-                if class_id < len(coco_classes):
-                    class_name = coco_classes[class_id]
-                
-                results.append({
-                    "box": [startX, startY, w, h],
-                    "confidence": float(confidence),
-                    "class_id": class_id,
-                    "class": class_name
-                })
-        
-        return results
-    
-    async def _detect_objects_opencv(
-        self, 
-        image: np.ndarray,
-        confidence_threshold: float
-    ) -> List[Dict[str, Any]]:
-        """
-        Detect objects using OpenCV's built-in object detection.
-        
-        Args:
-            image: Image as numpy array
-            confidence_threshold: Minimum confidence threshold
+            return results
             
-        Returns:
-            List of detected objects
-        """
-        # Convert to grayscale
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        
-        # Detect faces
-        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        faces = face_cascade.detectMultiScale(gray, 1.1, 4)
-        
-        # Detect eyes
-        eye_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_eye.xml')
-        eyes = eye_cascade.detectMultiScale(gray, 1.1, 4)
-        
-        # Prepare results
-        results = []
-        
-        # Add faces
-        for (x, y, w, h) in faces:
-            results.append({
-                "box": [int(x), int(y), int(w), int(h)],
-                "confidence": 1.0,  # Haar cascades don't provide confidence
-                "class_id": 0,
-                "class": "face"
-            })
-        
-        # Add eyes
-        for (x, y, w, h) in eyes:
-            results.append({
-                "box": [int(x), int(y), int(w), int(h)],
-                "confidence": 1.0,  # Haar cascades don't provide confidence
-                "class_id": 1,
-                "class": "eye"
-            })
-        
-        return results
+        except Exception as e:
+            logger.error(f"Error detecting objects in batch: {str(e)}")
+            failed = sum(1 for result in results if not result)
+            self.stats["failed_requests"] += failed
+            
+            return [
+                result or {
+                    "error": str(e),
+                    "success": False,
+                    "processing_time": time.time() - start_time
+                }
+                for result in results
+            ]
     
-    async def _load_image(self, image_data: Union[str, bytes, np.ndarray]) -> np.ndarray:
+    def _read_image_data(self, image_data: Union[str, bytes, np.ndarray]) -> FrameInput:
         """
-        Load image from various formats.
+        Read image data without decoding it.
         
         Args:
-            image_data: Image data as base64 string, bytes, or numpy array
+            image_data: Image data as base64 string, bytes, file path, or numpy array
             
         Returns:
-            Image as numpy array
+            Encoded image bytes or the numpy array
         """
         if isinstance(image_data, np.ndarray):
             return image_data
@@ -822,61 +508,37 @@ class ComputerVisionService:
                     image_data = image_data[7:]
                 
                 # Decode base64
-                image_data = base64.b64decode(image_data)
-            else:
-                # Assume it's a file path
-                if os.path.exists(image_data):
-                    with open(image_data, 'rb') as f:
-                        image_data = f.read()
-                else:
-                    raise FileNotFoundError(f"Image file not found: {image_data}")
+                return base64.b64decode(image_data)
+            
+            # Assume it's a file path
+            if os.path.exists(image_data):
+                with open(image_data, 'rb') as f:
+                    return f.read()
+            raise FileNotFoundError(f"Image file not found: {image_data}")
         
-        # Convert bytes to numpy array
         if isinstance(image_data, bytes):
-            nparr = np.frombuffer(image_data, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-            if image is None:
-                raise ValueError("Failed to decode image data")
-            return image
+            return image_data
         
         raise ValueError("Unsupported image data format")
     
-    def _encode_image(self, image: np.ndarray, format: str = "JPEG") -> str:
+    async def _load_image(self, image_data: Union[str, bytes, np.ndarray]) -> np.ndarray:
         """
-        Encode image as base64 string.
+        Load image from various formats.
         
         Args:
-            image: Image as numpy array
-            format: Output format (JPEG, PNG)
+            image_data: Image data as base64 string, bytes, or numpy array
             
         Returns:
-            Base64 encoded image string
+            Image as numpy array
         """
-        # Convert format string to OpenCV format
-        if format.upper() == "JPEG":
-            ext = ".jpg"
-            cv_format = cv2.IMREAD_COLOR
-        elif format.upper() == "PNG":
-            ext = ".png"
-            cv_format = cv2.IMREAD_UNCHANGED
-        else:
-            ext = ".jpg"
-            cv_format = cv2.IMREAD_COLOR
-        
-        # Encode image
-        success, buffer = cv2.imencode(ext, image)
-        if not success:
-            raise ValueError("Failed to encode image")
-        
-        # Convert to base64
-        encoded = base64.b64encode(buffer).decode('utf-8')
-        
-        # Return with data URI prefix
-        return f"data:image/{ext[1:]};base64,{encoded}"
+        frame = self._read_image_data(image_data)
+        if isinstance(frame, np.ndarray):
+            return frame
+        return await asyncio.get_running_loop().run_in_executor(None, decode_image, frame)
     
     def _generate_cache_key(
         self, 
-        image: np.ndarray,
+        frame: FrameInput,
         operation: str,
         parameters: Optional[Dict[str, Any]] = None
     ) -> str:
@@ -884,183 +546,42 @@ class ComputerVisionService:
         Generate cache key for image operations.
         
         Args:
-            image: Image as numpy array
+            frame: Encoded image bytes or image as numpy array
             operation: Operation name
             parameters: Operation parameters
             
         Returns:
             Cache key string
         """
-        # Create a simplified image hash
-        # Resize to small dimensions to speed up hashing
-        small_img = cv2.resize(image, (32, 32))
-        img_hash = hash(small_img.tobytes())
+        # Hash the encoded bytes or the pixels (with the shape) without decoding
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(frame, np.ndarray):
+            digest.update(f"{frame.shape}{frame.dtype.str}".encode())
+            digest.update(np.ascontiguousarray(frame).data)
+        else:
+            digest.update(frame)
         
         # Create parameters hash
         params_str = json.dumps(parameters or {}, sort_keys=True)
         params_hash = hash(params_str)
         
         # Combine hashes
-        return f"{operation}_{img_hash}_{params_hash}"
+        return f"{operation}_{digest.hexdigest()}_{params_hash}"
     
-    async def _enhance_image(
-        self, 
-        image: np.ndarray,
-        brightness: float = 1.0,
-        contrast: float = 1.0,
-        sharpness: float = 1.0
-    ) -> np.ndarray:
-        """
-        Enhance image with brightness, contrast, and sharpness adjustments.
-        
-        Args:
-            image: Image as numpy array
-            brightness: Brightness factor (1.0 = original)
-            contrast: Contrast factor (1.0 = original)
-            sharpness: Sharpness factor (1.0 = original)
-            
-        Returns:
-            Enhanced image
-        """
-        # Apply brightness adjustment
-        if brightness != 1.0:
-            if brightness > 1.0:
-                # Increase brightness
-                image = cv2.convertScaleAbs(image, alpha=brightness, beta=0)
-            else:
-                # Decrease brightness
-                image = cv2.convertScaleAbs(image, alpha=brightness, beta=0)
-        
-        # Apply contrast adjustment
-        if contrast != 1.0:
-            # Calculate alpha and beta values for contrast adjustment
-            alpha = float(131 * (contrast + 127)) / (127 * (131 - contrast))
-            beta = 127 * (1 - alpha)
-            
-            # Apply contrast adjustment
-            image = cv2.convertScaleAbs(image, alpha=alpha, beta=beta)
-        
-        # Apply sharpness adjustment
-        if sharpness != 1.0:
-            # Create sharpening kernel
-            kernel = np.array([[-1, -1, -1],
-                              [-1,  9, -1],
-                              [-1, -1, -1]]) * sharpness
-            
-            # Apply kernel
-            image = cv2.filter2D(image, -1, kernel)
-        
-        return image
-    
-    async def _resize_image(
-        self, 
-        image: np.ndarray,
-        width: int,
-        height: int
-    ) -> np.ndarray:
+    @staticmethod
+    def _cache_put(cache: Dict[str, Any], key: str, value: Dict[str, Any], max_size: int):
         """
-        Resize image to specified dimensions.
+        Add an entry to a cache, removing the oldest entry when it is full.
         
         Args:
-            image: Image as numpy array
-            width: Target width
-            height: Target height
-            
-        Returns:
-            Resized image
-        """
-        return cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
-    
-    async def _crop_image(
-        self, 
-        image: np.ndarray,
-        x: int,
-        y: int,
-        width: int,
-        height: int
-    ) -> np.ndarray:
-        """
-        Crop image to specified region.
-        
-        Args:
-            image: Image as numpy array
-            x: X coordinate of top-left corner
-            y: Y coordinate of top-left corner
-            width: Width of crop region
-            height: Height of crop region
-            
-        Returns:
-            Cropped image
-        """
-        # Ensure coordinates are within image bounds
-        img_height, img_width = image.shape[:2]
-        x = max(0, min(x, img_width - 1))
-        y = max(0, min(y, img_height - 1))
-        width = max(1, min(width, img_width - x))
-        height = max(1, min(height, img_height - y))
-        
-        return image[y:y+height, x:x+width]
-    
-    async def _convert_to_grayscale(self, image: np.ndarray) -> np.ndarray:
-        """
-        Convert image to grayscale.
-        
-        Args:
-            image: Image as numpy array
-            
-        Returns:
-            Grayscale image
-        """
-        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    
-    async def _blur_image(
-        self, 
-        image: np.ndarray,
-        kernel_size: int
-    ) -> np.ndarray:
-        """
-        Apply Gaussian blur to image.
-        
-        Args:
-            image: Image as numpy array
-            kernel_size: Blur kernel size
-            
-        Returns:
-            Blurred image
-        """
-        # Ensure kernel size is odd
-        if kernel_size % 2 == 0:
-            kernel_size += 1
-        
-        return cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
-    
-    async def _detect_edges(
-        self, 
-        image: np.ndarray,
-        threshold1: int,
-        threshold2: int
-    ) -> np.ndarray:
-        """
-        Detect edges in image using Canny edge detector.
-        
-        Args:
-            image: Image as numpy array
-            threshold1: First threshold for hysteresis procedure
-            threshold2: Second threshold for hysteresis procedure
-            
-        Returns:
-            Edge image
-        """
-        # Convert to grayscale if needed
-        if len(image.shape) == 3:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = image
-        
-        # Apply Canny edge detector
-        edges = cv2.Canny(gray, threshold1, threshold2)
-        
-        return edges
+            cache: Cache dictionary
+            key: Cache key
+            value: Cached result
+            max_size: Maximum number of entries
+        """
+        if key not in cache and len(cache) >= max_size:
+            del cache[next(iter(cache))]
+        cache[key] = value
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -1080,4 +601,10 @@ class ComputerVisionService:
         # Remove raw processing times list to reduce size
         stats.pop("processing_times", None)
         
+        stats["executor"] = self.executor.get_stats()
+        
         return stats
+    
+    def close(self):
+        """Shut down the worker processes."""
+        self.executor.shutdown()
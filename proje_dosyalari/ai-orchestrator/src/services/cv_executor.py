@@ -0,0 +1,912 @@
+"""
+Executor layer for the Computer Vision Service.
+
+CPU-bound OpenCV work (decoding, image operations, object detection, OCR and
+encoding) runs in a pool of worker processes so it does not block the event
+loop. Decoded frames are handed to the workers through
+multiprocessing.shared_memory instead of being pickled; encoded image bytes
+are much smaller than the decoded frame and are passed as they are.
+"""
+
+import os
+import logging
+import asyncio
+import base64
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Optional, Union, Tuple, NamedTuple, Callable, Sequence
+import numpy as np
+import cv2
+import pytesseract
+from PIL import Image
+
+logger = logging.getLogger("ai_orchestrator.services.cv_executor")
+
+IMAGE_OPERATIONS = ("enhance", "resize", "crop", "grayscale", "blur", "edge_detection")
+
+# Minimal set of common classes, used when no COCO names file is available
+COCO_CLASSES = [
+    "person", "bicycle", "car", "motorcycle", "airplane", "bus", "train", "truck", "boat",
+    "traffic light", "fire hydrant", "stop sign", "parking meter", "bench", "bird", "cat",
+    "dog", "horse", "sheep", "cow", "elephant", "bear", "zebra", "giraffe", "backpack",
+    "umbrella", "handbag", "tie", "suitcase", "frisbee", "skis", "snowboard", "sports ball",
+    "kite", "baseball bat", "baseball glove", "skateboard", "surfboard", "tennis racket",
+    "bottle", "wine glass", "cup", "fork", "knife", "spoon", "bowl", "banana", "apple",
+    "sandwich", "orange", "broccoli", "carrot", "hot dog", "pizza", "donut", "cake", "chair",
+    "couch", "potted plant", "bed", "dining table", "toilet", "tv", "laptop", "mouse",
+    "remote", "keyboard", "cell phone", "microwave", "oven", "toaster", "sink", "refrigerator",
+    "book", "clock", "vase", "scissors", "teddy bear", "hair drier", "toothbrush"
+]
+
+
+class SharedFrame(NamedTuple):
+    """Reference to a decoded frame in a shared memory block."""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+# A frame handed to a task: encoded image bytes, a decoded frame or a shared frame
+FrameInput = Union[bytes, np.ndarray, SharedFrame]
+
+
+def decode_image(data: bytes) -> np.ndarray:
+    """
+    Decode encoded image bytes.
+
+    Args:
+        data: Encoded image (JPEG, PNG, ...)
+
+    Returns:
+        Image as numpy array
+    """
+    image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Failed to decode image data")
+    return image
+
+
+def encode_image(image: np.ndarray, format: str = "JPEG") -> str:
+    """
+    Encode image as base64 string.
+
+    Args:
+        image: Image as numpy array
+        format: Output format (JPEG, PNG)
+
+    Returns:
+        Base64 encoded image string with data URI prefix
+    """
+    ext = ".png" if format.upper() == "PNG" else ".jpg"
+
+    success, buffer = cv2.imencode(ext, image)
+    if not success:
+        raise ValueError("Failed to encode image")
+
+    encoded = base64.b64encode(buffer).decode('utf-8')
+    return f"data:image/{ext[1:]};base64,{encoded}"
+
+
+def enhance_image(
+    image: np.ndarray,
+    brightness: float = 1.0,
+    contrast: float = 1.0,
+    sharpness: float = 1.0
+) -> np.ndarray:
+    """
+    Enhance image with brightness, contrast, and sharpness adjustments.
+
+    Args:
+        image: Image as numpy array
+        brightness: Brightness factor (1.0 = original)
+        contrast: Contrast factor (1.0 = original)
+        sharpness: Sharpness factor (1.0 = original)
+
+    Returns:
+        Enhanced image
+    """
+    # Apply brightness adjustment
+    if brightness != 1.0:
+        image = cv2.convertScaleAbs(image, alpha=brightness, beta=0)
+
+    # Apply contrast adjustment
+    if contrast != 1.0:
+        alpha = float(131 * (contrast + 127)) / (127 * (131 - contrast))
+        beta = 127 * (1 - alpha)
+        image = cv2.convertScaleAbs(image, alpha=alpha, beta=beta)
+
+    # Apply sharpness adjustment
+    if sharpness != 1.0:
+        kernel = np.array([[-1, -1, -1],
+                          [-1,  9, -1],
+                          [-1, -1, -1]]) * sharpness
+        image = cv2.filter2D(image, -1, kernel)
+
+    return image
+
+
+def resize_image(image: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Resize image to specified dimensions.
+
+    Args:
+        image: Image as numpy array
+        width: Target width
+        height: Target height
+
+    Returns:
+        Resized image
+    """
+    return cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+
+
+def crop_image(image: np.ndarray, x: int, y: int, width: int, height: int) -> np.ndarray:
+    """
+    Crop image to specified region.
+
+    Args:
+        image: Image as numpy array
+        x: X coordinate of top-left corner
+        y: Y coordinate of top-left corner
+        width: Width of crop region
+        height: Height of crop region
+
+    Returns:
+        Cropped image
+    """
+    # Ensure coordinates are within image bounds
+    img_height, img_width = image.shape[:2]
+    x = max(0, min(x, img_width - 1))
+    y = max(0, min(y, img_height - 1))
+    width = max(1, min(width, img_width - x))
+    height = max(1, min(height, img_height - y))
+
+    return image[y:y+height, x:x+width]
+
+
+def convert_to_grayscale(image: np.ndarray) -> np.ndarray:
+    """
+    Convert image to grayscale.
+
+    Args:
+        image: Image as numpy array
+
+    Returns:
+        Grayscale image
+    """
+    return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+
+def blur_image(image: np.ndarray, kernel_size: int) -> np.ndarray:
+    """
+    Apply Gaussian blur to image.
+
+    Args:
+        image: Image as numpy array
+        kernel_size: Blur kernel size
+
+    Returns:
+        Blurred image
+    """
+    # Ensure kernel size is odd
+    if kernel_size % 2 == 0:
+        kernel_size += 1
+
+    return cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
+
+
+def detect_edges(image: np.ndarray, threshold1: int, threshold2: int) -> np.ndarray:
+    """
+    Detect edges in image using Canny edge detector.
+
+    Args:
+        image: Image as numpy array
+        threshold1: First threshold for hysteresis procedure
+        threshold2: Second threshold for hysteresis procedure
+
+    Returns:
+        Edge image
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+    return cv2.Canny(gray, threshold1, threshold2)
+
+
+def apply_operation(
+    image: np.ndarray,
+    operation: str,
+    parameters: Dict[str, Any],
+    default_resize: Tuple[int, int]
+) -> Dict[str, Any]:
+    """
+    Apply an image processing operation and encode the processed image.
+
+    Args:
+        image: Image as numpy array
+        operation: Operation to perform (see IMAGE_OPERATIONS)
+        parameters: Operation-specific parameters
+        default_resize: Default (width, height) of the resize operation
+
+    Returns:
+        Dictionary with processed image and operation details
+    """
+    result: Dict[str, Any] = {}
+
+    if operation == "enhance":
+        processed_image = enhance_image(
+            image,
+            brightness=parameters.get("brightness", 1.0),
+            contrast=parameters.get("contrast", 1.0),
+            sharpness=parameters.get("sharpness", 1.0)
+        )
+
+    elif operation == "resize":
+        width = parameters.get("width", default_resize[0])
+        height = parameters.get("height", default_resize[1])
+        processed_image = resize_image(image, width, height)
+        result = {"width": width, "height": height}
+
+    elif operation == "crop":
+        x = parameters.get("x", 0)
+        y = parameters.get("y", 0)
+        width = parameters.get("width", image.shape[1] - x)
+        height = parameters.get("height", image.shape[0] - y)
+        processed_image = crop_image(image, x, y, width, height)
+        result = {"x": x, "y": y, "width": width, "height": height}
+
+    elif operation == "grayscale":
+        processed_image = convert_to_grayscale(image)
+
+    elif operation == "blur":
+        kernel_size = parameters.get("kernel_size", 5)
+        processed_image = blur_image(image, kernel_size)
+        result = {"kernel_size": kernel_size}
+
+    elif operation == "edge_detection":
+        threshold1 = parameters.get("threshold1", 100)
+        threshold2 = parameters.get("threshold2", 200)
+        processed_image = detect_edges(image, threshold1, threshold2)
+        result = {"threshold1": threshold1, "threshold2": threshold2}
+
+    else:
+        raise ValueError(f"Unsupported image processing operation: {operation}")
+
+    return {
+        "processed_image": encode_image(processed_image, parameters.get("format", "JPEG")),
+        **result,
+        "operation": operation,
+        "parameters": parameters,
+        "success": True
+    }
+
+
+def run_ocr(image: np.ndarray, parameters: Dict[str, Any], ocr_config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Perform OCR on an image.
+
+    Args:
+        image: Image as numpy array
+        parameters: OCR parameters
+        ocr_config: OCR configuration of the service
+
+    Returns:
+        Dictionary with recognized text and optional text boxes
+    """
+    if "tesseract_cmd" in ocr_config:
+        pytesseract.pytesseract.tesseract_cmd = ocr_config["tesseract_cmd"]
+
+    lang = parameters.get("lang", ocr_config.get("lang", "eng"))
+    config = parameters.get("config", ocr_config.get("config", "--psm 3"))
+
+    # Preprocess image for better OCR results
+    if parameters.get("preprocess", True):
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+        # Apply thresholding
+        if parameters.get("threshold", True):
+            gray = cv2.threshold(
+                gray,
+                parameters.get("threshold_value", 0),
+                255,
+                parameters.get("threshold_type", cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+            )[1]
+
+        # Apply noise reduction
+        if parameters.get("denoise", True):
+            gray = cv2.medianBlur(gray, parameters.get("denoise_kernel", 3))
+
+        image = gray
+
+    pil_image = Image.fromarray(image)
+    text = pytesseract.image_to_string(pil_image, lang=lang, config=config)
+
+    result = {
+        "text": text,
+        "lang": lang,
+        "config": config,
+        "success": True
+    }
+
+    # Get bounding boxes for text regions
+    if parameters.get("get_boxes", False):
+        boxes_data = pytesseract.image_to_data(pil_image, lang=lang, config=config, output_type=pytesseract.Output.DICT)
+
+        boxes = []
+        for i in range(len(boxes_data["text"])):
+            if boxes_data["text"][i].strip():
+                boxes.append({
+                    "text": boxes_data["text"][i],
+                    "conf": boxes_data["conf"][i],
+                    "x": boxes_data["left"][i],
+                    "y": boxes_data["top"][i],
+                    "width": boxes_data["width"][i],
+                    "height": boxes_data["height"][i],
+                    "block_num": boxes_data["block_num"][i],
+                    "line_num": boxes_data["line_num"][i],
+                    "word_num": boxes_data["word_num"][i]
+                })
+        if boxes:
+            result["boxes"] = boxes
+
+    return result
+
+
+def load_detection_models(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Load object detection models.
+
+    Args:
+        config: Object detection configuration
+
+    Returns:
+        Dictionary of loaded models (empty if loading failed)
+    """
+    models: Dict[str, Any] = {}
+    try:
+        model_type = config.get("model", "yolo")
+
+        if model_type == "yolo":
+            weights_path = config.get("weights_path", "models/yolov4.weights")
+            config_path = config.get("config_path", "models/yolov4.cfg")
+
+            if os.path.exists(weights_path) and os.path.exists(config_path):
+                logger.info(f"Loading YOLOv4 model from {weights_path} and {config_path}")
+                models["yolo"] = cv2.dnn.readNetFromDarknet(config_path, weights_path)
+
+                # Load COCO class names
+                coco_names_path = config.get("coco_names_path", "models/coco.names")
+                if os.path.exists(coco_names_path):
+                    with open(coco_names_path, "r") as f:
+                        models["coco_classes"] = f.read().strip().split("\n")
+                else:
+                    logger.warning(f"COCO names file not found at {coco_names_path}")
+                    models["coco_classes"] = list(COCO_CLASSES)
+            else:
+                logger.warning(f"YOLOv4 model files not found at {weights_path} and {config_path}")
+                logger.warning("Using OpenCV's built-in models as fallback")
+                models["yolo"] = cv2.dnn.readNetFromDarknet("models/yolov3.cfg", "models/yolov3.weights")
+
+        elif model_type == "ssd":
+            model_path = config.get("model_path", "models/ssd_mobilenet.pb")
+            config_path = config.get("config_path", "models/ssd_mobilenet.pbtxt")
+
+            if os.path.exists(model_path) and os.path.exists(config_path):
+                logger.info(f"Loading SSD model from {model_path} and {config_path}")
+                models["ssd"] = cv2.dnn.readNetFromTensorflow(model_path, config_path)
+            else:
+                logger.warning(f"SSD model files not found at {model_path} and {config_path}")
+
+        else:
+            logger.warning(f"Unsupported object detection model type: {model_type}")
+
+        logger.info("Object detection models loaded successfully")
+
+    except Exception as e:
+        logger.error(f"Error loading object detection models: {str(e)}")
+
+    return models
+
+
+def detect_objects_yolo(
+    net: Any,
+    classes: List[str],
+    images: List[np.ndarray],
+    confidence_threshold: float,
+    nms_threshold: float
+) -> List[List[Dict[str, Any]]]:
+    """
+    Detect objects using a YOLO model, with one forward pass for all images.
+
+    Args:
+        net: YOLO network
+        classes: Class names
+        images: Images as numpy arrays
+        confidence_threshold: Minimum confidence threshold
+        nms_threshold: Non-maximum suppression threshold
+
+    Returns:
+        List of detected objects for each image
+    """
+    if len(images) == 1:
+        blob = cv2.dnn.blobFromImage(images[0], 1/255.0, (416, 416), swapRB=True, crop=False)
+    else:
+        blob = cv2.dnn.blobFromImages(images, 1/255.0, (416, 416), swapRB=True, crop=False)
+
+    net.setInput(blob)
+    layer_names = net.getLayerNames()
+    output_layers = [layer_names[int(i) - 1] for i in np.array(net.getUnconnectedOutLayers()).flatten()]
+
+    # Each output has one row per candidate box, with a leading batch axis for batched input
+    outputs = [output if output.ndim == 3 else output[np.newaxis] for output in net.forward(output_layers)]
+
+    results = []
+    for index, image in enumerate(images):
+        height, width = image.shape[:2]
+        class_ids = []
+        confidences = []
+        boxes = []
+
+        for output in outputs:
+            rows = output[index]
+            scores = rows[:, 5:]
+            candidate_ids = np.argmax(scores, axis=1)
+            candidate_confidences = scores[np.arange(len(rows)), candidate_ids]
+            selected = candidate_confidences > confidence_threshold
+
+            for detection, class_id, confidence in zip(
+                rows[selected], candidate_ids[selected], candidate_confidences[selected]
+            ):
+                center_x = int(detection[0] * width)
+                center_y = int(detection[1] * height)
+                w = int(detection[2] * width)
+                h = int(detection[3] * height)
+
+                boxes.append([int(center_x - w / 2), int(center_y - h / 2), w, h])
+                confidences.append(float(confidence))
+                class_ids.append(int(class_id))
+
+        # Apply non-maximum suppression
+        detections = []
+        for i in np.array(cv2.dnn.NMSBoxes(boxes, confidences, confidence_threshold, nms_threshold)).flatten():
+            class_id = class_ids[i]
+            detections.append({
+                "box": boxes[i],
+                "confidence": confidences[i],
+                "class_id": class_id,
+                "class": classes[class_id] if class_id < len(classes) else "unknown"
+            })
+        results.append(detections)
+
+    return results
+
+
+def detect_objects_ssd(
+    net: Any,
+    classes: List[str],
+    images: List[np.ndarray],
+    confidence_threshold: float
+) -> List[List[Dict[str, Any]]]:
+    """
+    Detect objects using an SSD model, with one forward pass for all images.
+
+    Args:
+        net: SSD network
+        classes: Class names
+        images: Images as numpy arrays
+        confidence_threshold: Minimum confidence threshold
+
+    Returns:
+        List of detected objects for each image
+    """
+    blob = cv2.dnn.blobFromImages(
+        images,
+        size=(300, 300),
+        mean=(127.5, 127.5, 127.5),
+        scalefactor=0.007843,
+        swapRB=True
+    )
+    net.setInput(blob)
+
+    # Rows are (image index, class ID, confidence, x1, y1, x2, y2)
+    detections = net.forward()[0, 0]
+
+    results: List[List[Dict[str, Any]]] = [[] for _ in images]
+    for row in detections[detections[:, 2] > confidence_threshold]:
+        index = int(row[0])
+        if index >= len(images):
+            continue
+        height, width = images[index].shape[:2]
+        class_id = int(row[1])
+
+        box = row[3:7] * np.array([width, height, width, height])
+        (startX, startY, endX, endY) = box.astype("int")
+
+        results[index].append({
+            "box": [int(startX), int(startY), int(endX - startX), int(endY - startY)],
+            "confidence": float(row[2]),
+            "class_id": class_id,
+            "class": classes[class_id] if class_id < len(classes) else f"class_{class_id}"
+        })
+
+    return results
+
+
+def detect_objects_opencv(image: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Detect faces and eyes using OpenCV's built-in Haar cascades.
+
+    Args:
+        image: Image as numpy array
+
+    Returns:
+        List of detected objects
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    results = []
+    for class_id, (class_name, cascade_file) in enumerate((
+        ("face", "haarcascade_frontalface_default.xml"),
+        ("eye", "haarcascade_eye.xml")
+    )):
+        cascade = cv2.CascadeClassifier(cv2.data.haarcascades + cascade_file)
+        for (x, y, w, h) in cascade.detectMultiScale(gray, 1.1, 4):
+            results.append({
+                "box": [int(x), int(y), int(w), int(h)],
+                "confidence": 1.0,  # Haar cascades don't provide confidence
+                "class_id": class_id,
+                "class": class_name
+            })
+
+    return results
+
+
+def draw_detections(image: np.ndarray, detections: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Draw bounding boxes and labels of detected objects.
+
+    Args:
+        image: Image as numpy array
+        detections: Detected objects
+
+    Returns:
+        Annotated copy of the image
+    """
+    annotated_image = image.copy()
+    color = (0, 255, 0)  # Green
+    for obj in detections:
+        x, y, w, h = obj["box"]
+        label = f"{obj['class']}: {obj['confidence']:.2f}"
+        cv2.rectangle(annotated_image, (x, y), (x + w, y + h), color, 2)
+        cv2.putText(annotated_image, label, (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
+    return annotated_image
+
+
+def detect_objects(
+    models: Dict[str, Any],
+    model_type: str,
+    images: List[np.ndarray],
+    confidence_threshold: float,
+    nms_threshold: float
+) -> List[List[Dict[str, Any]]]:
+    """
+    Detect objects in images with the requested model.
+
+    Args:
+        models: Loaded models
+        model_type: Model to use (yolo, ssd)
+        images: Images as numpy arrays
+        confidence_threshold: Minimum confidence threshold
+        nms_threshold: Non-maximum suppression threshold
+
+    Returns:
+        List of detected objects for each image
+    """
+    classes = models.get("coco_classes", [])
+    if model_type == "yolo" and "yolo" in models:
+        return detect_objects_yolo(models["yolo"], classes, images, confidence_threshold, nms_threshold)
+    if model_type == "ssd" and "ssd" in models:
+        return detect_objects_ssd(models["ssd"], classes, images, confidence_threshold)
+
+    logger.warning(f"Model {model_type} not loaded, using OpenCV's built-in object detection")
+    return [detect_objects_opencv(image) for image in images]
+
+
+# Worker process state: object detection configuration and lazily loaded models
+_worker_config: Dict[str, Any] = {}
+_worker_models: Dict[str, Any] = {}
+_worker_loaded_types: set = set()
+
+
+def init_worker(object_detection_config: Dict[str, Any], threads: int) -> None:
+    """
+    Initialize a worker process.
+
+    Args:
+        object_detection_config: Object detection configuration
+        threads: OpenCV threads per worker
+    """
+    _worker_config.clear()
+    _worker_config.update(object_detection_config)
+    cv2.setNumThreads(threads)
+
+
+def _worker_detection_models(model_type: str) -> Dict[str, Any]:
+    """
+    Get the detection models of the worker process, loading them on first use.
+
+    Args:
+        model_type: Requested model type
+
+    Returns:
+        Loaded models
+    """
+    if model_type not in _worker_loaded_types:
+        _worker_loaded_types.add(model_type)
+        _worker_models.update(load_detection_models(dict(_worker_config, model=model_type)))
+    return _worker_models
+
+
+def _open_frame(frame: FrameInput, handles: List[shared_memory.SharedMemory]) -> np.ndarray:
+    """
+    Get the image of a frame input.
+
+    Args:
+        frame: Frame input
+        handles: List receiving the shared memory blocks that were attached
+
+    Returns:
+        Image as numpy array (a view of the shared memory for shared frames)
+    """
+    if isinstance(frame, SharedFrame):
+        shm = shared_memory.SharedMemory(name=frame.name)
+        handles.append(shm)
+        return np.ndarray(frame.shape, dtype=np.dtype(frame.dtype), buffer=shm.buf)
+    if isinstance(frame, (bytes, bytearray)):
+        return decode_image(bytes(frame))
+    return frame
+
+
+def _run_with_frames(frames: Sequence[FrameInput], work: Callable[[List[np.ndarray]], Any]) -> Any:
+    """
+    Run work on the images of frame inputs and release shared memory afterwards.
+
+    Results must not reference the images, since shared frames are only
+    valid until the work returns.
+
+    Args:
+        frames: Frame inputs
+        work: Function of the images
+
+    Returns:
+        Result of the work
+    """
+    handles: List[shared_memory.SharedMemory] = []
+    try:
+        return work([_open_frame(frame, handles) for frame in frames])
+    except Exception as e:
+        # Exceptions travel back to the event loop pickled; some (e.g. pytesseract's) cannot be rebuilt
+        try:
+            pickle.loads(pickle.dumps(e))
+        except Exception:
+            raise RuntimeError(f"{type(e).__name__}: {str(e)}") from None
+        raise
+    finally:
+        for shm in handles:
+            try:
+                shm.close()
+            except BufferError:
+                # An exception traceback still references the frame; it is unmapped with it
+                pass
+
+
+def process_frame_task(
+    frames: Sequence[FrameInput],
+    operation: str,
+    parameters: Dict[str, Any],
+    default_resize: Tuple[int, int],
+    models: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Task: apply an image processing operation to one frame.
+
+    Args:
+        frames: Single frame input
+        operation: Operation to perform
+        parameters: Operation-specific parameters
+        default_resize: Default (width, height) of the resize operation
+        models: Unused
+
+    Returns:
+        Dictionary with processed image and operation details
+    """
+    return _run_with_frames(frames, lambda images: apply_operation(images[0], operation, parameters, default_resize))
+
+
+def ocr_frame_task(
+    frames: Sequence[FrameInput],
+    parameters: Dict[str, Any],
+    ocr_config: Dict[str, Any],
+    models: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Task: perform OCR on one frame.
+
+    Args:
+        frames: Single frame input
+        parameters: OCR parameters
+        ocr_config: OCR configuration of the service
+        models: Unused
+
+    Returns:
+        Dictionary with recognized text and optional text boxes
+    """
+    return _run_with_frames(frames, lambda images: run_ocr(images[0], parameters, ocr_config))
+
+
+def detect_frames_task(
+    frames: Sequence[FrameInput],
+    model_type: str,
+    confidence_threshold: float,
+    nms_threshold: float,
+    draw_boxes: bool = False,
+    format: str = "JPEG",
+    models: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Task: detect objects in frames with one forward pass.
+
+    Args:
+        frames: Frame inputs
+        model_type: Model to use (yolo, ssd)
+        confidence_threshold: Minimum confidence threshold
+        nms_threshold: Non-maximum suppression threshold
+        draw_boxes: Whether to return annotated images
+        format: Format of annotated images
+        models: Loaded models; the worker process's models if None
+
+    Returns:
+        Dictionary with detected objects (and annotated image) for each frame
+    """
+    if models is None:
+        models = _worker_detection_models(model_type)
+
+    def work(images: List[np.ndarray]) -> List[Dict[str, Any]]:
+        results = []
+        for image, detections in zip(images, detect_objects(models, model_type, images, confidence_threshold, nms_threshold)):
+            result: Dict[str, Any] = {"objects": detections}
+            if draw_boxes:
+                result["annotated_image"] = encode_image(draw_detections(image, detections), format)
+            results.append(result)
+        return results
+
+    return _run_with_frames(frames, work)
+
+
+class CVExecutor:
+    """
+    Runs computer vision tasks in worker processes (or threads).
+
+    Decoded frames are copied once into shared memory blocks that the workers
+    map; the blocks are unlinked when the task completes.
+    """
+
+    def __init__(
+        self,
+        mode: str = "process",
+        max_workers: Optional[int] = None,
+        object_detection_config: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            mode: "process" to use a process pool, "thread" to use the event loop's default thread pool
+            max_workers: Number of worker processes (default: min(4, CPU count))
+            object_detection_config: Object detection configuration for the workers
+        """
+        self.mode = mode
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.object_detection_config = object_detection_config or {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.stats = {
+            "tasks": 0,
+            "shared_frames": 0,
+            "shared_bytes": 0,
+            "pool_restarts": 0
+        }
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the process pool, creating it on first use.
+
+        Returns:
+            Process pool
+        """
+        if self._pool is None:
+            # Spawned workers do not inherit the event loop's threads and locks
+            threads = max(1, (os.cpu_count() or 1) // self.max_workers)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(self.object_detection_config, threads)
+            )
+        return self._pool
+
+    def _share(self, frame: FrameInput, handles: List[shared_memory.SharedMemory]) -> FrameInput:
+        """
+        Move a decoded frame into shared memory.
+
+        Args:
+            frame: Frame input
+            handles: List receiving the created shared memory blocks
+
+        Returns:
+            Shared frame for decoded frames, the input otherwise
+        """
+        if not isinstance(frame, np.ndarray):
+            return frame
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, frame.nbytes))
+        handles.append(shm)
+        view = np.ndarray(frame.shape, dtype=frame.dtype, buffer=shm.buf)
+        view[...] = frame
+        del view
+
+        self.stats["shared_frames"] += 1
+        self.stats["shared_bytes"] += frame.nbytes
+        return SharedFrame(shm.name, frame.shape, frame.dtype.str)
+
+    async def run(self, task: Callable[..., Any], frames: Sequence[FrameInput], *args: Any,
+                  models: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run a task on frames.
+
+        Args:
+            task: Task function, called as task(frames, *args, models=models)
+            frames: Frame inputs
+            *args: Task arguments
+            models: Loaded models for thread mode (process workers use their own)
+
+        Returns:
+            Result of the task
+        """
+        loop = asyncio.get_running_loop()
+        self.stats["tasks"] += 1
+
+        if self.mode != "process":
+            return await loop.run_in_executor(None, partial(task, list(frames), *args, models=models))
+
+        handles: List[shared_memory.SharedMemory] = []
+        try:
+            shared_frames = [self._share(frame, handles) for frame in frames]
+            try:
+                return await loop.run_in_executor(self._get_pool(), partial(task, shared_frames, *args))
+            except BrokenProcessPool:
+                # A worker died (e.g. in native code); start a new pool for the next tasks
+                logger.error("Computer vision worker pool broke, restarting it")
+                self._pool = None
+                self.stats["pool_restarts"] += 1
+                raise
+        finally:
+            for shm in handles:
+                shm.close()
+                shm.unlink()
+
+    def shutdown(self) -> None:
+        """Shut down the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        return {"mode": self.mode, "max_workers": self.max_workers, **self.stats}
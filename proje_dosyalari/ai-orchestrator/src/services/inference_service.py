@@ -21,6 +21,9 @@ from .llm_service import LLMService, get_llm_service
 from .vision_service import VisionService, get_vision_service
 from .audio_service import AudioService, get_audio_service
 from ..core.performance_monitor import PerformanceMonitor, get_performance_monitor
+from ..core.batching import MicroBatcher
+from ..core.single_flight import coalescing_enabled, get_single_flight, mark_coalesced
+from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -35,20 +38,31 @@ class InferenceService:
         llm_service: LLMService,
         vision_service: VisionService,
         audio_service: AudioService,
-        performance_monitor: PerformanceMonitor
+        performance_monitor: PerformanceMonitor,
+        use_batching: bool = True
     ):
-        """Initialize the inference service."""
+        """
+        Initialize the inference service.
+        
+        Args:
+            use_batching: Coalesce concurrent requests through the shared micro-batcher
+                (if enabled in settings)
+        """
         self.model_manager = model_manager
         self.model_cache = model_cache
         self.llm_service = llm_service
         self.vision_service = vision_service
         self.audio_service = audio_service
         self.performance_monitor = performance_monitor
+        self.batcher = get_inference_batcher() if use_batching else None
+        self.single_flight = get_single_flight("inference")
         
     async def run_inference(self, request: InferenceRequest) -> InferenceResponse:
         """
         Run inference using the specified model.
-        Delegates to the appropriate service based on model type.
+        With BATCHING_ENABLED, concurrent requests for the same LLM model are grouped
+        by the micro-batcher and run as one batched model call; each request still
+        gets its own response.
         
         Args:
             request: Inference request
@@ -57,9 +71,67 @@ class InferenceService:
             Inference response
             
         Raises:
-            ValueError: If model not found or type not supported
             RuntimeError: If inference fails
         """
+        model_info = None
+        if self.batcher is not None:
+            model_info = await self.model_manager.get_model(request.model_id)
+            # Only the LLM backends have a batched call; other models would just wait in the queue
+            if model_info and model_info.type == ModelType.LLM:
+                return await self.batcher.submit(request.model_id, (self, request, model_info))
+        return await self._run_single_inference(request, model_info)
+        
+    async def run_model_batch(
+        self, model_id: str, requests: List[InferenceRequest], model_info: Optional[ModelInfo] = None
+    ) -> List[Any]:
+        """
+        Run a batch of requests for one model.
+        Several LLM requests run through the LLM service's batched call; a single
+        request, or a model type without a batched call, runs one by one.
+        
+        Args:
+            model_id: Model ID shared by all requests
+            requests: Inference requests
+            model_info: Model info, if already looked up
+            
+        Returns:
+            One InferenceResponse or exception per request, in order
+        """
+        try:
+            if model_info is None:
+                model_info = await self.model_manager.get_model(model_id)
+            if not model_info:
+                raise ValueError(f"Model {model_id} not found")
+        except Exception as e:
+            logger.error(f"Error running inference with model {model_id}: {str(e)}")
+            return [RuntimeError(f"Failed to run inference: {str(e)}")] * len(requests)
+        
+        if model_info.type == ModelType.LLM and len(requests) > 1:
+            return await self.llm_service.run_batch_llm_inference(requests, return_exceptions=True)
+        
+        return await asyncio.gather(
+            *(self._run_single_inference(request, model_info) for request in requests),
+            return_exceptions=True
+        )
+        
+    async def _run_single_inference(
+        self, request: InferenceRequest, model_info: Optional[ModelInfo] = None
+    ) -> InferenceResponse:
+        """
+        Run inference for one request.
+        Delegates to the appropriate service based on model type; identical
+        concurrent requests share one delegated call (see single_flight).
+        
+        Args:
+            request: Inference request
+            model_info: Model info, if already looked up
+            
+        Returns:
+            Inference response
+            
+        Raises:
+            RuntimeError: If model not found, type not supported or inference fails
+        """
         start_time = time.time()
         model_id = request.model_id
         success = False
@@ -75,19 +147,19 @@ class InferenceService:
                 return response
             
             # Get model info
-            model_info = await self.model_manager.get_model(model_id)
+            if model_info is None:
+                model_info = await self.model_manager.get_model(model_id)
             if not model_info:
                 raise ValueError(f"Model {model_id} not found")
                 
-            # Delegate based on model type
-            if model_info.type == ModelType.LLM:
-                response = await self.llm_service.run_llm_inference(request)
-            elif model_info.type == ModelType.VISION:
-                response = await self.vision_service.run_vision_inference(request)
-            elif model_info.type == ModelType.AUDIO:
-                response = await self.audio_service.run_audio_inference(request)
+            if coalescing_enabled(model_id):
+                cache_key = self.model_cache._generate_cache_key(model_id, request.inputs, request.parameters)
+                response, shared = await self.single_flight.do(
+                    cache_key, lambda: self._delegate_inference(request, model_info)
+                )
+                response = mark_coalesced(response, shared)
             else:
-                raise ValueError(f"Unsupported model type for inference: {model_info.type}")
+                response = await self._delegate_inference(request, model_info)
                 
             success = True
             return response
@@ -110,84 +182,79 @@ class InferenceService:
                     success=success
                 )
         
+    async def _delegate_inference(self, request: InferenceRequest, model_info: ModelInfo) -> InferenceResponse:
+        """
+        Run inference with the service for the model's type.
+        
+        Args:
+            request: Inference request
+            model_info: Model info
+            
+        Returns:
+            Inference response
+            
+        Raises:
+            ValueError: If the model type is not supported
+        """
+        if model_info.type == ModelType.LLM:
+            return await self.llm_service.run_llm_inference(request)
+        elif model_info.type == ModelType.VISION:
+            return await self.vision_service.run_vision_inference(request)
+        elif model_info.type == ModelType.AUDIO:
+            return await self.audio_service.run_audio_inference(request)
+        else:
+            raise ValueError(f"Unsupported model type for inference: {model_info.type}")
+        
     async def run_batch_inference(self, requests: List[InferenceRequest]) -> List[InferenceResponse]:
         """
         Run batch inference using the specified models.
+        Requests go through run_inference, so they are batched per model together
+        with any other concurrent requests.
         
         Args:
             requests: List of inference requests
             
         Returns:
-            List of inference responses
+            List of inference responses, in request order
         """
-        # Group requests by model type for more efficient processing
-        llm_requests = []
-        vision_requests = []
-        audio_requests = []
-        other_requests = []
-        
-        for request in requests:
-            try:
-                model_info = await self.model_manager.get_model(request.model_id)
-                if not model_info:
-                    other_requests.append(request)
-                    continue
-                    
-                if model_info.type == ModelType.LLM:
-                    llm_requests.append(request)
-                elif model_info.type == ModelType.VISION:
-                    vision_requests.append(request)
-                elif model_info.type == ModelType.AUDIO:
-                    audio_requests.append(request)
-                else:
-                    other_requests.append(request)
-            except Exception:
-                other_requests.append(request)
-        
-        # Process each group in parallel
-        tasks = []
-        if llm_requests:
-            tasks.append(self.llm_service.run_batch_llm_inference(llm_requests))
-        
-        # For vision and audio, we don't have batch methods yet, so process individually
-        for request in vision_requests + audio_requests + other_requests:
-            tasks.append(self.run_inference(request))
-        
-        # Gather all results
-        all_responses = await asyncio.gather(*tasks, return_exceptions=True)
+        responses = await asyncio.gather(
+            *(self.run_inference(request) for request in requests),
+            return_exceptions=True
+        )
         
-        # Flatten and handle exceptions
         results = []
-        for response in all_responses:
-            if isinstance(response, list):
-                # This is from batch processing
-                results.extend(response)
-            elif isinstance(response, Exception):
-                logger.error(f"Error in batch inference: {str(response)}")
-                # Create error response - we don't know which request this is for
+        for request, response in zip(requests, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Error in batch inference for model {request.model_id}: {str(response)}")
                 results.append(InferenceResponse(
-                    model_id="unknown",
+                    model_id=request.model_id,
                     outputs="Error during inference",
                     metadata={"error": str(response)}
                 ))
             else:
                 results.append(response)
                 
-        # Ensure we have the same number of responses as requests
-        if len(results) != len(requests):
-            logger.warning(f"Mismatch in batch inference: {len(requests)} requests, {len(results)} responses")
-            # Add error responses if needed
-            while len(results) < len(requests):
-                results.append(InferenceResponse(
-                    model_id="unknown",
-                    outputs="Missing response in batch processing",
-                    metadata={"error": "Internal error in batch processing"}
-                ))
-            # Truncate if we somehow have too many
-            if len(results) > len(requests):
-                results = results[:len(requests)]
-                
         return results
+    
+    def get_batching_stats(self) -> Dict[str, Any]:
+        """
+        Get micro-batching statistics.
+        
+        Returns:
+            Batch-size and queue-wait histograms, counters and queue depths
+        """
+        if self.batcher is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.batcher.get_stats()}
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get request coalescing statistics.
+        
+        Returns:
+            Executions, coalesced requests and requests in flight
+        """
+        return {"enabled": settings.COALESCING_ENABLED, **self.single_flight.get_stats()}
         
     async def run_parallel_inference(
         self, request: InferenceRequest, model_ids: List[str]
@@ -475,6 +542,58 @@ class InferenceService:
             )
 
 
+async def _process_inference_batch(model_id: str, items: List[Any]) -> List[Any]:
+    """
+    Batch function of the shared micro-batcher.
+    Items are (InferenceService, InferenceRequest, ModelInfo) triples; requests
+    submitted through different service instances are run by their own instance.
+    
+    Args:
+        model_id: Model ID shared by the batch
+        items: Batched items
+        
+    Returns:
+        One InferenceResponse or exception per item, in order
+    """
+    groups: Dict[int, List[int]] = {}
+    for index, (service, _, _) in enumerate(items):
+        groups.setdefault(id(service), []).append(index)
+    
+    results: List[Any] = [None] * len(items)
+    
+    async def run_group(indices: List[int]):
+        service, _, model_info = items[indices[0]]
+        responses = await service.run_model_batch(model_id, [items[i][1] for i in indices], model_info)
+        for index, response in zip(indices, responses):
+            results[index] = response
+    
+    await asyncio.gather(*(run_group(indices) for indices in groups.values()))
+    return results
+
+
+# Shared micro-batcher instance
+_inference_batcher: Optional[MicroBatcher] = None
+
+def get_inference_batcher() -> Optional[MicroBatcher]:
+    """
+    Get or create the shared inference micro-batcher.
+    
+    Returns:
+        MicroBatcher instance, or None if batching is disabled in settings
+    """
+    global _inference_batcher
+    
+    if _inference_batcher is None and settings.BATCHING_ENABLED:
+        _inference_batcher = MicroBatcher(
+            _process_inference_batch,
+            max_batch_size=settings.BATCH_MAX_SIZE,
+            max_wait_ms=settings.BATCH_MAX_WAIT_MS,
+            max_queue_size=settings.BATCH_MAX_QUEUE_SIZE
+        )
+        
+    return _inference_batcher
+
+
 def get_inference_service(
     model_manager: ModelManager = get_model_manager(),
     model_cache: ModelCache = get_model_cache(),
@@ -5,15 +5,17 @@ This service is responsible for managing LLM models and running inference.
 """
 import logging
 import asyncio
+import json
 import time # Import time for latency measurement
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 from ..models.inference import InferenceRequest, InferenceResponse
-from ..models.model import ModelType
+from ..models.model import ModelType, ModelInfo
 from ..services.model_manager import ModelManager, get_model_manager
 from ..core.llm_integration import LLMIntegration, get_llm_integration
 from ..core.model_cache import ModelCache, get_model_cache
 from ..core.performance_monitor import PerformanceMonitor, get_performance_monitor # Import PerformanceMonitor
+from ..core.single_flight import coalescing_enabled, get_single_flight, mark_coalesced
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +29,7 @@ class LLMService:
         self.llm_integration = llm_integration
         self.model_cache = model_cache
         self.performance_monitor = performance_monitor # Inject PerformanceMonitor
+        self.single_flight = get_single_flight("llm")
         
     async def run_llm_inference(self, request: InferenceRequest) -> InferenceResponse:
         """
@@ -46,6 +49,7 @@ class LLMService:
         model_id = request.model_id
         success = False
         response = None
+        model_info = None
         
         try:
             # Check cache first
@@ -56,76 +60,15 @@ class LLMService:
                 success = True
                 return response # Return early if cached
             
-            # Get model info
-            model_info = await self.model_manager.get_model(model_id)
-            if not model_info:
-                raise ValueError(f"Model {model_id} not found")
-                
-            # Check if model is an LLM
-            if model_info.type != ModelType.LLM:
-                raise ValueError(f"Model {model_id} is not an LLM model")
-                
-            # Check if model is loaded, load if necessary
-            if not model_info.status or not model_info.status.loaded:
-                logger.info(f"LLM model {model_id} not loaded, loading now")
-                await self.model_manager.load_model(model_id)
-                # Refresh model info after loading
-                model_info = await self.model_manager.get_model(model_id)
-                if not model_info or not model_info.status or not model_info.status.loaded:
-                     raise RuntimeError(f"Failed to load model {model_id} before inference")
-                
-            # Get loaded model instance
-            model = self.model_manager.loaded_models.get(model_id)
-            if not model:
-                raise RuntimeError(f"Failed to get loaded model instance for {model_id}")
-                
-            # Run inference based on model type
-            if model.get("type") == "llama.cpp":
-                # Run llama.cpp inference
-                if not isinstance(request.inputs, str):
-                    raise ValueError("llama.cpp models require string input")
-                    
-                result = await self.llm_integration.run_llama_inference(
-                    model=model,
-                    prompt=request.inputs,
-                    params=request.parameters
-                )
-                
-                # Create response
-                response = InferenceResponse(
-                    model_id=model_id,
-                    outputs=result.get("text", ""),
-                    metadata={
-                        "usage": result.get("usage", {}),
-                        "finish_reason": result.get("finish_reason", ""),
-                        "model_version": model_info.version,
-                        "cached": False
-                    }
-                )
-                
-            elif model.get("type") == "onnx":
-                # Run ONNX inference
-                result = await self.llm_integration.run_onnx_inference(
-                    model=model,
-                    inputs=request.inputs,
-                    params=request.parameters
+            # Identical concurrent requests share one model call
+            if coalescing_enabled(model_id):
+                cache_key = self.model_cache._generate_cache_key(model_id, request.inputs, request.parameters)
+                (response, model_info), shared = await self.single_flight.do(
+                    cache_key, lambda: self._run_uncached_inference(request)
                 )
-                
-                # Create response
-                response = InferenceResponse(
-                    model_id=model_id,
-                    outputs=result.get("text", ""),
-                    metadata={
-                        "model_version": model_info.version,
-                        "cached": False
-                    }
-                )
-                
+                response = mark_coalesced(response, shared)
             else:
-                raise ValueError(f"Unsupported LLM model type: {model.get("type")}")
-                
-            # Store result in cache
-            await self.model_cache.set(model_id, request.inputs, request.parameters, response.dict())
+                response, model_info = await self._run_uncached_inference(request)
             success = True
             return response
             
@@ -156,18 +99,170 @@ class LLMService:
             if success and model_info and model_info.status:
                  model_info.status.last_used = time.strftime("%Y-%m-%dT%H:%M:%S")
     
-    async def run_batch_llm_inference(self, requests: List[InferenceRequest]) -> List[InferenceResponse]:
+    async def _run_uncached_inference(self, request: InferenceRequest) -> Tuple[InferenceResponse, ModelInfo]:
+        """
+        Load the model if needed, run inference and cache the response.
+        
+        Args:
+            request: Inference request
+            
+        Returns:
+            Tuple of the inference response and the model info
+        """
+        model_info, model = await self._get_loaded_model(request.model_id)
+        responses = await self._run_model_call(model, model_info, [request])
+        return responses[0], model_info
+    
+    async def _get_loaded_model(self, model_id: str) -> Tuple[ModelInfo, Any]:
+        """
+        Get an LLM model, loading it if necessary.
+        
+        Args:
+            model_id: ID of the model
+            
+        Returns:
+            Tuple of the model info and the loaded model instance
+        """
+        # Get model info
+        model_info = await self.model_manager.get_model(model_id)
+        if not model_info:
+            raise ValueError(f"Model {model_id} not found")
+        
+        # Check if model is an LLM
+        if model_info.type != ModelType.LLM:
+            raise ValueError(f"Model {model_id} is not an LLM model")
+        
+        # Check if model is loaded, load if necessary
+        if not model_info.status or not model_info.status.loaded:
+            logger.info(f"LLM model {model_id} not loaded, loading now")
+            await self.model_manager.load_model(model_id)
+            # Refresh model info after loading
+            model_info = await self.model_manager.get_model(model_id)
+            if not model_info or not model_info.status or not model_info.status.loaded:
+                 raise RuntimeError(f"Failed to load model {model_id} before inference")
+        
+        # Get loaded model instance
+        model = self.model_manager.loaded_models.get(model_id)
+        if not model:
+            raise RuntimeError(f"Failed to get loaded model instance for {model_id}")
+        
+        return model_info, model
+    
+    async def _run_model_call(self, model: Any, model_info: ModelInfo, requests: List[InferenceRequest]) -> List[InferenceResponse]:
+        """
+        Run one model call for requests sharing their parameters and cache the responses.
+        A single request uses the single-input call of the integration.
+        
+        Args:
+            model: Loaded model instance
+            model_info: Model info
+            requests: Inference requests with identical parameters
+            
+        Returns:
+            One inference response per request, in order
+        """
+        model_id = requests[0].model_id
+        params = requests[0].parameters
+        
+        # Run inference based on model type
+        if model.get("type") == "llama.cpp":
+            # Run llama.cpp inference
+            if not all(isinstance(request.inputs, str) for request in requests):
+                raise ValueError("llama.cpp models require string input")
+            
+            if len(requests) == 1:
+                results = [await self.llm_integration.run_llama_inference(
+                    model=model,
+                    prompt=requests[0].inputs,
+                    params=params
+                )]
+            else:
+                results = await self.llm_integration.run_llama_inference_batch(
+                    model=model,
+                    prompts=[request.inputs for request in requests],
+                    params=params
+                )
+            
+            # Create responses
+            responses = [
+                InferenceResponse(
+                    model_id=model_id,
+                    outputs=result.get("text", ""),
+                    metadata={
+                        "usage": result.get("usage", {}),
+                        "finish_reason": result.get("finish_reason", ""),
+                        "model_version": model_info.version,
+                        "cached": False
+                    }
+                )
+                for result in results
+            ]
+        
+        elif model.get("type") == "onnx":
+            # Run ONNX inference
+            if len(requests) == 1:
+                results = [await self.llm_integration.run_onnx_inference(
+                    model=model,
+                    inputs=requests[0].inputs,
+                    params=params
+                )]
+            else:
+                results = await self.llm_integration.run_onnx_inference_batch(
+                    model=model,
+                    inputs=[request.inputs for request in requests],
+                    params=params
+                )
+            
+            # Create responses
+            responses = [
+                InferenceResponse(
+                    model_id=model_id,
+                    outputs=result.get("text", ""),
+                    metadata={
+                        "model_version": model_info.version,
+                        "cached": False
+                    }
+                )
+                for result in results
+            ]
+        
+        else:
+            raise ValueError(f"Unsupported LLM model type: {model.get('type')}")
+        
+        # Store results in cache
+        for request, response in zip(requests, responses):
+            await self.model_cache.set(model_id, request.inputs, request.parameters, response.dict())
+        return responses
+    
+    async def run_batch_llm_inference(
+        self, requests: List[InferenceRequest], return_exceptions: bool = False
+    ) -> List[Any]:
         """
         Run batch inference with LLM models.
+        Requests for the same model and parameters run as one batched model call.
         
         Args:
             requests: List of inference requests
+            return_exceptions: Return the exception of a failed request in its place
+                instead of an error response
             
         Returns:
-            List of inference responses
+            List of inference responses (or exceptions), in request order
         """
-        tasks = [self.run_llm_inference(request) for request in requests]
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        by_model: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            by_model.setdefault(request.model_id, []).append(index)
+        
+        responses: List[Any] = [None] * len(requests)
+        
+        async def run_model(model_id: str, indices: List[int]):
+            model_responses = await self._run_model_batch(model_id, [requests[i] for i in indices])
+            for index, response in zip(indices, model_responses):
+                responses[index] = response
+        
+        await asyncio.gather(*(run_model(model_id, indices) for model_id, indices in by_model.items()))
+        if return_exceptions:
+            return responses
         
         # Handle exceptions and ensure InferenceResponse objects are returned
         results = []
@@ -192,6 +287,78 @@ class LLMService:
                 ))
                 
         return results
+    
+    async def _run_model_batch(self, model_id: str, requests: List[InferenceRequest]) -> List[Any]:
+        """
+        Run several requests for one LLM model with batched model calls.
+        Cached requests are answered from the cache and identical requests share
+        one prompt slot. The rest are grouped by parameters, since one batched call
+        shares its sampling parameters, and each group is a single model call.
+        
+        Args:
+            model_id: Model ID shared by all requests
+            requests: Inference requests
+            
+        Returns:
+            One InferenceResponse or exception per request, in order
+        """
+        start_time = time.time()
+        results: List[Any] = [None] * len(requests)
+        model_info = None
+        
+        try:
+            # Cache key -> indices of the uncached requests with that key
+            pending: Dict[str, List[int]] = {}
+            for index, request in enumerate(requests):
+                cached_response = await self.model_cache.get(model_id, request.inputs, request.parameters)
+                if cached_response:
+                    results[index] = InferenceResponse(**cached_response)
+                    continue
+                cache_key = self.model_cache._generate_cache_key(model_id, request.inputs, request.parameters)
+                pending.setdefault(cache_key, []).append(index)
+            
+            if pending:
+                model_info, model = await self._get_loaded_model(model_id)
+                
+                groups: Dict[str, List[str]] = {}
+                for cache_key, indices in pending.items():
+                    parameters_key = json.dumps(requests[indices[0]].parameters, sort_keys=True, default=str)
+                    groups.setdefault(parameters_key, []).append(cache_key)
+                
+                async def run_group(cache_keys: List[str]):
+                    group = [requests[pending[cache_key][0]] for cache_key in cache_keys]
+                    try:
+                        responses = await self._run_model_call(model, model_info, group)
+                    except Exception as e:
+                        logger.error(f"Error running batched LLM inference with model {model_id}: {str(e)}")
+                        responses = [RuntimeError(f"Failed to run LLM inference: {str(e)}")] * len(group)
+                    for cache_key, response in zip(cache_keys, responses):
+                        for index in pending[cache_key]:
+                            results[index] = response
+                
+                await asyncio.gather(*(run_group(cache_keys) for cache_keys in groups.values()))
+                
+        except Exception as e:
+            logger.error(f"Error running LLM inference with model {model_id}: {str(e)}")
+            error = RuntimeError(f"Failed to run LLM inference: {str(e)}")
+            results = [error if result is None else result for result in results]
+        finally:
+            latency_ms = (time.time() - start_time) * 1000
+            memory_usage_bytes = None
+            if model_info and model_info.status and model_info.status.memory_usage:
+                memory_usage_bytes = model_info.status.memory_usage * 1024 * 1024 # Convert MB to bytes
+            
+            for result in results:
+                await self.performance_monitor.record_inference_stats(
+                    model_id=model_id,
+                    latency_ms=latency_ms,
+                    memory_usage=memory_usage_bytes,
+                    success=isinstance(result, InferenceResponse)
+                )
+            if model_info and model_info.status and any(isinstance(result, InferenceResponse) for result in results):
+                model_info.status.last_used = time.strftime("%Y-%m-%dT%H:%M:%S")
+        
+        return results
 
 
 def get_llm_service(
@@ -0,0 +1,179 @@
+"""
+Audio decoding and speech segmentation for the Voice Processing Service.
+
+This module turns uploaded audio into 16-bit mono PCM in memory (no
+temporary files) and splits long recordings into speech chunks with an
+energy-based voice activity detector, so the chunks can be recognized
+concurrently.
+"""
+
+import io
+import logging
+import wave
+from typing import List, Tuple
+import numpy as np
+
+logger = logging.getLogger("ai_orchestrator.services.speech_chunking")
+
+
+def decode_audio(data: bytes, default_sample_rate: int = 16000) -> Tuple[np.ndarray, int]:
+    """
+    Decode audio bytes to 16-bit mono PCM.
+
+    WAV containers are parsed in memory; any other bytes are taken as raw
+    16-bit mono PCM at the default sample rate.
+
+    Args:
+        data: WAV file contents or raw PCM
+        default_sample_rate: Sample rate of raw PCM
+
+    Returns:
+        Tuple of the int16 samples and the sample rate
+    """
+    if data[:4] == b"RIFF" and data[8:12] == b"WAVE":
+        with wave.open(io.BytesIO(data), "rb") as wav_file:
+            channels = wav_file.getnchannels()
+            sample_width = wav_file.getsampwidth()
+            sample_rate = wav_file.getframerate()
+            frames = wav_file.readframes(wav_file.getnframes())
+        return to_mono_int16(frames, sample_width, channels), sample_rate
+
+    # Raw 16-bit PCM; ignore a trailing odd byte
+    return np.frombuffer(data[:len(data) - len(data) % 2], dtype=np.int16), default_sample_rate
+
+
+def to_mono_int16(frames: bytes, sample_width: int, channels: int) -> np.ndarray:
+    """
+    Convert interleaved PCM frames to 16-bit mono samples.
+
+    Args:
+        frames: Interleaved PCM frames
+        sample_width: Bytes per sample (1, 2, 3 or 4)
+        channels: Number of channels
+
+    Returns:
+        int16 samples
+    """
+    if sample_width == 1:
+        # 8-bit WAV is unsigned
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.int16) - 128) << 8
+    elif sample_width == 2:
+        samples = np.frombuffer(frames, dtype="<i2")
+    elif sample_width == 3:
+        raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3)
+        # Keep the two most significant bytes of each little-endian 24-bit sample
+        samples = (raw[:, 1].astype(np.int16) | (raw[:, 2].astype(np.int16) << 8))
+    elif sample_width == 4:
+        samples = (np.frombuffer(frames, dtype="<i4") >> 16).astype(np.int16)
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+
+    if channels > 1:
+        samples = samples[:len(samples) - len(samples) % channels].reshape(-1, channels)
+        samples = samples.mean(axis=1).astype(np.int16)
+    return samples
+
+
+def array_to_pcm(audio: np.ndarray) -> np.ndarray:
+    """
+    Convert a numpy audio array to 16-bit mono samples.
+
+    Float arrays in [-1, 1] are scaled; other arrays are taken as 16-bit
+    sample values. Two-dimensional arrays are (samples, channels).
+
+    Args:
+        audio: Audio samples
+
+    Returns:
+        int16 samples
+    """
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if audio.dtype.kind == "f" and audio.size and np.abs(audio).max() <= 1.0:
+        audio = audio * 32767
+    return np.clip(audio, -32768, 32767).astype(np.int16)
+
+
+def frame_energies(samples: np.ndarray, frame_length: int) -> np.ndarray:
+    """
+    Compute the RMS energy of consecutive frames.
+
+    Args:
+        samples: int16 samples
+        frame_length: Samples per frame
+
+    Returns:
+        RMS energy of each frame (the last frame may be partial)
+    """
+    count = -(-len(samples) // frame_length)
+    padded = np.zeros(count * frame_length, dtype=np.float32)
+    padded[:len(samples)] = samples
+    return np.sqrt(np.mean(padded.reshape(count, frame_length) ** 2, axis=1))
+
+
+def segment_speech(
+    samples: np.ndarray,
+    sample_rate: int,
+    energy_threshold: float = 300,
+    pause_threshold: float = 0.8,
+    max_chunk_seconds: float = 15.0,
+    frame_ms: int = 30,
+    padding_ms: int = 200
+) -> List[Tuple[int, int]]:
+    """
+    Split a recording into speech chunks with an energy-based VAD.
+
+    A chunk ends where speech is followed by at least pause_threshold seconds
+    below the energy threshold. Chunks longer than max_chunk_seconds are cut
+    at their quietest frame. Silence-only recordings yield no chunks.
+
+    Args:
+        samples: int16 samples
+        sample_rate: Sample rate in Hz
+        energy_threshold: RMS energy above which a frame is speech
+        pause_threshold: Seconds of silence that end a chunk
+        max_chunk_seconds: Maximum chunk length in seconds
+        frame_ms: VAD frame length in milliseconds
+        padding_ms: Audio kept before and after each chunk in milliseconds
+
+    Returns:
+        List of (start, end) sample offsets
+    """
+    frame_length = max(1, sample_rate * frame_ms // 1000)
+    if not len(samples):
+        return []
+
+    energies = frame_energies(samples, frame_length)
+    speech = energies > energy_threshold
+    pause_frames = max(1, int(pause_threshold * 1000 / frame_ms))
+    max_frames = max(1, int(max_chunk_seconds * 1000 / frame_ms))
+    padding_frames = padding_ms // frame_ms
+
+    # Group speech frames separated by pauses shorter than the pause threshold
+    segments: List[Tuple[int, int]] = []
+    start = None
+    last_speech = 0
+    for index, is_speech in enumerate(speech):
+        if is_speech:
+            if start is None:
+                start = index
+            last_speech = index
+        elif start is not None and index - last_speech >= pause_frames:
+            segments.append((start, last_speech + 1))
+            start = None
+    if start is not None:
+        segments.append((start, last_speech + 1))
+
+    # Pad, then cut long segments at their quietest frame
+    chunks: List[Tuple[int, int]] = []
+    for start, end in segments:
+        start = max(0, start - padding_frames)
+        end = min(len(energies), end + padding_frames)
+        while end - start > max_frames:
+            window_start = start + max_frames // 2
+            cut = window_start + int(np.argmin(energies[window_start:start + max_frames]))
+            chunks.append((start, cut))
+            start = cut
+        chunks.append((start, end))
+
+    return [(start * frame_length, min(len(samples), end * frame_length)) for start, end in chunks]
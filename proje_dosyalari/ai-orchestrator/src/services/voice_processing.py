@@ -9,7 +9,7 @@ import os
 import logging
 import asyncio
 import time
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Optional, Union, Tuple, AsyncIterator
 import numpy as np
 from datetime import datetime
 import base64
@@ -18,6 +18,7 @@ import json
 import tempfile
 import wave
 import audioop
+from concurrent.futures import ThreadPoolExecutor
 
 # Import optional dependencies with fallbacks
 try:
@@ -38,6 +39,8 @@ try:
 except ImportError:
     GTTS_AVAILABLE = False
 
+from .speech_chunking import decode_audio, array_to_pcm, segment_speech
+
 logger = logging.getLogger("ai_orchestrator.services.voice_processing")
 
 class VoiceProcessingService:
@@ -70,6 +73,9 @@ class VoiceProcessingService:
             "energy_threshold": 300,
             "dynamic_energy_threshold": True,
             "pause_threshold": 0.8,
+            "max_chunk_seconds": 15,
+            "chunk_padding_ms": 200,
+            "max_workers": 4,
             "cache_enabled": True,
             "cache_size": 50
         })
@@ -102,6 +108,12 @@ class VoiceProcessingService:
             self.recognizer.energy_threshold = self.speech_recognition_config.get("energy_threshold", 300)
             self.recognizer.dynamic_energy_threshold = self.speech_recognition_config.get("dynamic_energy_threshold", True)
             self.recognizer.pause_threshold = self.speech_recognition_config.get("pause_threshold", 0.8)
+        
+        # Recognition engines block on network I/O or native decoders, so chunks run in threads
+        self.recognition_executor = ThreadPoolExecutor(
+            max_workers=self.speech_recognition_config.get("max_workers", 4),
+            thread_name_prefix="speech-recognition"
+        )
     
     async def initialize(self) -> bool:
         """
@@ -144,6 +156,9 @@ class VoiceProcessingService:
         """
         Recognize speech from audio data.
         
+        Long recordings are split into speech chunks that are recognized
+        concurrently (see recognize_speech_stream).
+        
         Args:
             audio_data: Audio data as base64 string, bytes, or numpy array
             parameters: Recognition parameters
@@ -160,9 +175,6 @@ class VoiceProcessingService:
             if not SPEECH_RECOGNITION_AVAILABLE:
                 raise ImportError("SpeechRecognition library not available")
             
-            # Convert audio data to AudioData object
-            audio = await self._load_audio(audio_data)
-            
             # Generate cache key if caching is enabled
             cache_key = None
             if self.speech_recognition_config.get("cache_enabled", True):
@@ -176,27 +188,21 @@ class VoiceProcessingService:
             parameters = parameters or {}
             language = parameters.get("language", self.speech_recognition_config.get("language", "en-US"))
             
-            # Recognize speech using Google Speech Recognition
-            text = None
-            if parameters.get("engine", "google") == "google":
-                text = self.recognizer.recognize_google(audio, language=language)
-            elif parameters.get("engine", "google") == "sphinx":
-                # Use CMU Sphinx (offline)
-                try:
-                    import pocketsphinx
-                    text = self.recognizer.recognize_sphinx(audio, language=language)
-                except ImportError:
-                    logger.warning("Pocketsphinx not available, falling back to Google Speech Recognition")
-                    text = self.recognizer.recognize_google(audio, language=language)
-            else:
-                # Default to Google Speech Recognition
-                text = self.recognizer.recognize_google(audio, language=language)
+            # Recognize all chunks; the last event carries the full transcript
+            final = None
+            async for event in self.recognize_speech_stream(audio_data, parameters):
+                if event["final"]:
+                    final = event
+            
+            if not final["text"]:
+                raise sr.UnknownValueError("Speech could not be understood")
             
             # Prepare result
             result = {
-                "text": text,
+                "text": final["text"],
                 "language": language,
                 "engine": parameters.get("engine", "google"),
+                "chunks": final["chunks"],
                 "success": True,
                 "processing_time": time.time() - start_time
             }
@@ -228,6 +234,136 @@ class VoiceProcessingService:
                 "processing_time": time.time() - start_time
             }
     
+    async def recognize_speech_stream(
+        self,
+        audio_data: Union[str, bytes, np.ndarray],
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Recognize speech chunk by chunk and yield partial transcripts.
+        
+        Recordings longer than max_chunk_seconds are split at pauses with an
+        energy-based VAD and the chunks are recognized concurrently in the
+        recognition pool. Each chunk's text is yielded as soon as it is ready,
+        so the first text arrives after about one chunk's recognition latency.
+        The last event has final=True and carries the ordered full transcript.
+        
+        Args:
+            audio_data: Audio data as base64 string, bytes, or numpy array
+            parameters: Recognition parameters
+            
+        Yields:
+            Dictionaries with chunk_index, start_time, end_time, text and final
+        """
+        if not SPEECH_RECOGNITION_AVAILABLE:
+            raise ImportError("SpeechRecognition library not available")
+        
+        parameters = parameters or {}
+        language = parameters.get("language", self.speech_recognition_config.get("language", "en-US"))
+        engine = parameters.get("engine", "google")
+        
+        loop = asyncio.get_running_loop()
+        samples, sample_rate = await loop.run_in_executor(
+            self.recognition_executor, self._decode_audio, audio_data
+        )
+        chunks = self._split_speech(samples, sample_rate, parameters)
+        
+        # Submit in order so the first chunks start first when the pool is saturated
+        pending = {}
+        for index, (start, end) in enumerate(chunks):
+            audio = sr.AudioData(samples[start:end].tobytes(), sample_rate, 2)
+            future = loop.run_in_executor(
+                self.recognition_executor, self._recognize_chunk, audio, engine, language
+            )
+            pending[future] = (index, start, end)
+        
+        texts: List[Optional[str]] = [None] * len(chunks)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: pending[f][0]):
+                    index, start, end = pending.pop(future)
+                    texts[index] = future.result()
+                    yield {
+                        "chunk_index": index,
+                        "start_time": start / sample_rate,
+                        "end_time": end / sample_rate,
+                        "text": texts[index],
+                        "final": False
+                    }
+        finally:
+            for future in pending:
+                future.cancel()
+        
+        yield {
+            "text": " ".join(text for text in texts if text),
+            "chunks": [
+                {"start_time": start / sample_rate, "end_time": end / sample_rate, "text": text}
+                for (start, end), text in zip(chunks, texts)
+            ],
+            "final": True
+        }
+    
+    def _split_speech(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        parameters: Dict[str, Any]
+    ) -> List[Tuple[int, int]]:
+        """
+        Split samples into recognition chunks.
+        
+        Args:
+            samples: int16 mono samples
+            sample_rate: Sample rate in Hz
+            parameters: Recognition parameters
+            
+        Returns:
+            List of (start, end) sample offsets
+        """
+        config = self.speech_recognition_config
+        max_chunk_seconds = parameters.get("max_chunk_seconds", config.get("max_chunk_seconds", 15))
+        
+        # Short clips are recognized whole
+        if len(samples) <= max_chunk_seconds * sample_rate:
+            return [(0, len(samples))]
+        
+        return segment_speech(
+            samples,
+            sample_rate,
+            energy_threshold=config.get("energy_threshold", 300),
+            pause_threshold=config.get("pause_threshold", 0.8),
+            max_chunk_seconds=max_chunk_seconds,
+            padding_ms=config.get("chunk_padding_ms", 200)
+        )
+    
+    def _recognize_chunk(self, audio: 'sr.AudioData', engine: str, language: str) -> Optional[str]:
+        """
+        Recognize one chunk of audio.
+        
+        Args:
+            audio: AudioData of the chunk
+            engine: Recognition engine (google or sphinx)
+            language: Recognition language
+            
+        Returns:
+            Recognized text, or None if the chunk was unintelligible
+        """
+        try:
+            if engine == "sphinx":
+                # Use CMU Sphinx (offline)
+                try:
+                    import pocketsphinx
+                    return self.recognizer.recognize_sphinx(audio, language=language)
+                except ImportError:
+                    logger.warning("Pocketsphinx not available, falling back to Google Speech Recognition")
+            
+            # Default to Google Speech Recognition
+            return self.recognizer.recognize_google(audio, language=language)
+            
+        except sr.UnknownValueError:
+            return None
+    
     async def synthesize_speech(
         self, 
         text: str,
@@ -507,6 +643,24 @@ class VoiceProcessingService:
         if isinstance(audio_data, sr.AudioData):
             return audio_data
         
+        samples, sample_rate = self._decode_audio(audio_data)
+        return sr.AudioData(samples.tobytes(), sample_rate, 2)
+    
+    def _decode_audio(self, audio_data: Union[str, bytes, np.ndarray]) -> Tuple[np.ndarray, int]:
+        """
+        Decode audio data to 16-bit mono PCM in memory.
+        
+        Args:
+            audio_data: Audio data as base64 string, file path, WAV or raw PCM bytes, or numpy array
+            
+        Returns:
+            Tuple of the int16 samples and the sample rate
+        """
+        default_rate = self.audio_processing_config.get("sample_rate", 16000)
+        
+        if SPEECH_RECOGNITION_AVAILABLE and isinstance(audio_data, sr.AudioData):
+            return np.frombuffer(audio_data.get_raw_data(convert_width=2), dtype=np.int16), audio_data.sample_rate
+        
         # Convert to bytes if needed
         if isinstance(audio_data, str):
             # Check if it's a base64 string
@@ -527,32 +681,10 @@ class VoiceProcessingService:
                 else:
                     raise FileNotFoundError(f"Audio file not found: {audio_data}")
         
-        # Convert numpy array to bytes if needed
         if isinstance(audio_data, np.ndarray):
-            # Assume 16-bit PCM
-            audio_data = audio_data.astype(np.int16).tobytes()
-        
-        # Create temporary WAV file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_path = temp_file.name
+            return array_to_pcm(audio_data), default_rate
         
-        try:
-            # Write audio data to WAV file
-            with wave.open(temp_path, 'wb') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(16000)  # 16 kHz
-                wav_file.writeframes(audio_data)
-            
-            # Load audio file with speech_recognition
-            with sr.AudioFile(temp_path) as source:
-                audio = self.recognizer.record(source)
-            
-            return audio
-            
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_path)
+        return decode_audio(audio_data, default_rate)
     
     async def _load_audio_pydub(self, audio_data: Union[str, bytes, np.ndarray]) -> 'AudioSegment':
         """
@@ -694,3 +826,7 @@ class VoiceProcessingService:
         stats.pop("processing_times", None)
         
         return stats
+    
+    def close(self) -> None:
+        """Shut down the speech recognition pool."""
+        self.recognition_executor.shutdown(wait=False, cancel_futures=True)
@@ -318,15 +318,21 @@ async def test_run_distributed_batch_inference(orchestrator):
             metadata={"local": True}
         )
     
-    async def mock_run_remote(task):
-        return InferenceResponse(
-            model_id=task.request.model_id,
-            outputs=f"Remote output for {task.request.model_id}",
-            metadata={"remote": True}
-        )
+    remote_batches = []
+    
+    async def mock_run_remote_batch(node_id, tasks):
+        remote_batches.append(len(tasks))
+        return [
+            InferenceResponse(
+                model_id=task.request.model_id,
+                outputs=f"Remote output for {task.request.model_id}",
+                metadata={"remote": True}
+            )
+            for task in tasks
+        ]
     
     orchestrator._run_local_inference = mock_run_local
-    orchestrator._run_remote_inference = mock_run_remote
+    orchestrator._run_remote_batch = mock_run_remote_batch
     
     # Mock the select_nodes_for_batch method
     async def mock_select_nodes(*args, **kwargs):
@@ -334,15 +340,21 @@ async def test_run_distributed_batch_inference(orchestrator):
     
     orchestrator._select_nodes_for_batch = mock_select_nodes
     
-    # Add a remote node
+    # Add a remote node; both nodes have the models loaded and process one request at a time
     remote_node = NodeInfo(
         node_id="remote-node",
         hostname="remote-host",
         ip_address="192.168.1.100",
-        status=NodeStatus.ONLINE
+        status=NodeStatus.ONLINE,
+        available_models=["model-1", "model-2"],
+        capabilities={"max_batch_size": 1},
+        average_response_time=1.0
     )
     orchestrator.nodes["remote-node"] = remote_node
     orchestrator.node_locks["remote-node"] = asyncio.Lock()
+    orchestrator.local_node.available_models = ["model-1", "model-2"]
+    orchestrator.local_node.capabilities["max_batch_size"] = 1
+    orchestrator.local_node.average_response_time = 1.0
     
     # Create test requests
     requests = [
@@ -365,6 +377,9 @@ async def test_run_distributed_batch_inference(orchestrator):
     assert local_count > 0
     assert remote_count > 0
     assert local_count + remote_count == 4
+    
+    # Requests for the remote node are sent in one call
+    assert remote_batches == [remote_count]
 
 @pytest.mark.asyncio
 async def test_run_distributed_pipeline_inference(orchestrator):
@@ -560,6 +575,37 @@ async def test_task_management(orchestrator):
     result = await orchestrator.cancel_task("non-existent")
     assert result is False
 
+@pytest.mark.asyncio
+async def test_heartbeat_without_secret_accepts_only_configured_peers(orchestrator):
+    """Test that without a shared secret, heartbeats only register configured peers."""
+    orchestrator.transport.shared_secret = None
+    orchestrator.seed_urls = {"http://peer-a:8000"}
+    
+    def heartbeat(node_id: str, url: str) -> Dict[str, Any]:
+        node = NodeInfo(node_id=node_id, hostname=node_id, ip_address="10.0.0.1", status=NodeStatus.ONLINE, url=url)
+        return {"node": node.to_dict(), "peers": ["http://attacker:9000"]}
+    
+    with pytest.raises(PermissionError):
+        await orchestrator.handle_heartbeat(heartbeat("intruder", "http://attacker:9000"))
+    assert "intruder" not in orchestrator.nodes
+    
+    await orchestrator.handle_heartbeat(heartbeat("peer-a", "http://peer-a:8000"))
+    assert "peer-a" in orchestrator.nodes
+    # Peers gossiped by the node are not trusted either
+    assert "http://attacker:9000" not in orchestrator.peer_urls
+
+@pytest.mark.asyncio
+async def test_heartbeat_with_secret_learns_gossiped_peers(orchestrator):
+    """Test that nodes sharing a secret register and gossip any peer URL."""
+    orchestrator.transport.shared_secret = "secret"
+    node = NodeInfo(node_id="peer-b", hostname="peer-b", ip_address="10.0.0.2", status=NodeStatus.ONLINE,
+                    url="http://peer-b:8000")
+    
+    await orchestrator.handle_heartbeat({"node": node.to_dict(), "peers": ["http://peer-c:8000"]})
+    
+    assert "peer-b" in orchestrator.nodes
+    assert {"http://peer-b:8000", "http://peer-c:8000"} <= orchestrator.peer_urls
+
 @pytest.mark.asyncio
 async def test_factory_function():
     """Test the factory function."""
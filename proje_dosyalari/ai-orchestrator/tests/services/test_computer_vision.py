@@ -19,7 +19,8 @@ SAMPLE_IMAGE_BASE64 = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAY
 @pytest.fixture
 def computer_vision_service():
     """Fixture to create a ComputerVisionService instance for testing."""
-    service = ComputerVisionService()
+    # Run tasks in threads so patched OpenCV and Tesseract functions apply
+    service = ComputerVisionService({"executor": {"mode": "thread"}})
     return service
 
 @pytest.fixture
@@ -232,3 +233,50 @@ async def test_cache_functionality(computer_vision_service, sample_image):
     assert computer_vision_service.stats["total_requests"] == 2
     assert computer_vision_service.stats["successful_requests"] == 1
     assert computer_vision_service.stats["image_processing_requests"] == 2
+
+@pytest.mark.asyncio
+@patch('cv2.dnn.NMSBoxes', return_value=[0])
+@patch('cv2.dnn.blobFromImages')
+async def test_detect_objects_batch(mock_blob_from_images, mock_nms, computer_vision_service, sample_image):
+    """Test detecting objects in several images with one forward pass."""
+    mock_model = MagicMock()
+    mock_model.getLayerNames.return_value = ['layer1']
+    mock_model.getUnconnectedOutLayers.return_value = [1]
+    # One row per candidate box for each of the two images
+    mock_model.forward.return_value = [np.array([
+        [[0.5, 0.5, 0.2, 0.2, 0.9, 0.8, 0.1, 0.1]],
+        [[0.5, 0.5, 0.2, 0.2, 0.9, 0.1, 0.1, 0.8]]
+    ])]
+    computer_vision_service.models = {
+        "yolo": mock_model,
+        "coco_classes": ["person", "bicycle", "car"]
+    }
+    
+    results = await computer_vision_service.detect_objects_batch(
+        [sample_image, np.ones_like(sample_image)],
+        parameters={"model": "yolo"}
+    )
+    
+    assert [result["success"] for result in results] == [True, True]
+    assert results[0]["objects"][0]["class"] == "person"
+    assert results[1]["objects"][0]["class"] == "car"
+    assert results[0]["batch_size"] == 2
+    mock_model.forward.assert_called_once()
+    assert computer_vision_service.stats["object_detection_requests"] == 2
+    
+    # Cached images are not processed again
+    await computer_vision_service.detect_objects_batch([sample_image], parameters={"model": "yolo"})
+    mock_model.forward.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_process_image_in_worker_process(sample_image):
+    """Test processing an image in a worker process through shared memory."""
+    service = ComputerVisionService({"executor": {"mode": "process", "max_workers": 1}})
+    try:
+        result = await service.process_image(sample_image, operation="resize", parameters={"width": 50, "height": 50})
+        
+        assert result["success"] is True
+        assert result["processed_image"].startswith("data:image/jpg;base64,")
+        assert service.get_stats()["executor"]["shared_frames"] == 1
+    finally:
+        service.close()
@@ -84,6 +84,40 @@ async def test_recognize_speech(mock_record, mock_audio_file, mock_recognize_goo
         assert voice_processing_service.stats["successful_requests"] == 1
         assert voice_processing_service.stats["speech_recognition_requests"] == 1
 
+@pytest.mark.asyncio
+@patch('speech_recognition.Recognizer.recognize_google')
+async def test_recognize_speech_stream(mock_recognize_google, voice_processing_service):
+    """Test chunked recognition of a long recording with partial transcripts."""
+    # Bursts of noise of 4, 6 and 8 seconds separated by two seconds of silence
+    rate = 16000
+    rng = np.random.default_rng(0)
+    silence = np.zeros(2 * rate, dtype=np.int16)
+    bursts = [(rng.standard_normal(seconds * rate) * 3000).astype(np.int16) for seconds in (4, 6, 8)]
+    samples = np.concatenate([bursts[0], silence, bursts[1], silence, bursts[2]])
+
+    def recognize(audio, language):
+        # Name each chunk after its length in whole seconds
+        return f"part{len(audio.frame_data) // (2 * rate)}"
+
+    mock_recognize_google.side_effect = recognize
+
+    events = []
+    async for event in voice_processing_service.recognize_speech_stream(samples, {"engine": "google"}):
+        events.append(event)
+
+    partials = [event for event in events if not event["final"]]
+    assert len(partials) == 3
+    assert sorted(event["chunk_index"] for event in partials) == [0, 1, 2]
+    assert events[-1]["final"] is True
+    assert events[-1]["text"] == "part4 part6 part8"
+    assert [chunk["text"] for chunk in events[-1]["chunks"]] == ["part4", "part6", "part8"]
+
+    # recognize_speech returns the joined transcript
+    result = await voice_processing_service.recognize_speech(samples, {"engine": "google"})
+    assert result["success"] is True
+    assert result["text"] == "part4 part6 part8"
+    assert len(result["chunks"]) == 3
+
 @pytest.mark.asyncio
 @patch('gtts.gTTS')
 async def test_synthesize_speech(mock_gtts, voice_processing_service):
@@ -0,0 +1,160 @@
+"""
+Test script for AI Orchestrator micro-batching.
+
+This script tests the MicroBatcher used by the inference service.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.batching import Histogram, MicroBatcher
+
+@pytest.mark.asyncio
+async def test_concurrent_submissions_are_batched():
+    """Test that concurrent submissions with the same key share a batch."""
+    calls = []
+
+    async def process(key, items):
+        calls.append((key, list(items)))
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(process, max_batch_size=8, max_wait_ms=20)
+    results = await asyncio.gather(*(batcher.submit("model-a", i) for i in range(5)))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert calls == [("model-a", [0, 1, 2, 3, 4])]
+    await batcher.close()
+
+@pytest.mark.asyncio
+async def test_batches_split_by_size_and_key():
+    """Test that batches respect max_batch_size and never mix keys."""
+    calls = []
+
+    async def process(key, items):
+        calls.append((key, len(items)))
+        return [(key, item) for item in items]
+
+    batcher = MicroBatcher(process, max_batch_size=3, max_wait_ms=20)
+    submissions = [batcher.submit("a", i) for i in range(7)] + [batcher.submit("b", i) for i in range(2)]
+    results = await asyncio.gather(*submissions)
+
+    assert results[:7] == [("a", i) for i in range(7)]
+    assert results[7:] == [("b", 0), ("b", 1)]
+    assert sorted(size for key, size in calls if key == "a") == [1, 3, 3]
+    assert [size for key, size in calls if key == "b"] == [2]
+
+    stats = batcher.get_stats()
+    assert stats["items"] == 9
+    assert stats["batch_size_histogram"]["buckets"]["le_3"] == 2
+    await batcher.close()
+
+@pytest.mark.asyncio
+async def test_per_item_and_batch_errors():
+    """Test that per-item exceptions and batch failures reach the right callers."""
+    async def process(key, items):
+        if key == "broken":
+            raise RuntimeError("backend down")
+        return [ValueError(f"bad {item}") if item % 2 else item for item in items]
+
+    batcher = MicroBatcher(process, max_wait_ms=5)
+    results = await asyncio.gather(*(batcher.submit("ok", i) for i in range(4)), return_exceptions=True)
+
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError) and str(results[1]) == "bad 1"
+    assert isinstance(results[3], ValueError)
+
+    with pytest.raises(RuntimeError, match="backend down"):
+        await batcher.submit("broken", 1)
+    assert batcher.get_stats()["errors"] == 1
+    await batcher.close()
+
+@pytest.mark.asyncio
+async def test_bounded_queue_applies_backpressure():
+    """Test that submit waits while the key's queue is full."""
+    release = asyncio.Event()
+
+    async def process(key, items):
+        await release.wait()
+        return list(items)
+
+    batcher = MicroBatcher(process, max_batch_size=1, max_wait_ms=0, max_queue_size=1)
+    first = asyncio.ensure_future(batcher.submit("m", 1))
+    await asyncio.sleep(0.01)  # first item is being processed
+    second = asyncio.ensure_future(batcher.submit("m", 2))
+    await asyncio.sleep(0.01)  # second item fills the queue
+    third = asyncio.ensure_future(batcher.submit("m", 3))
+    await asyncio.sleep(0.01)
+
+    assert batcher.get_stats()["queue_depths"] == {"m": 1}
+    assert not third.done()
+
+    release.set()
+    assert await asyncio.gather(first, second, third) == [1, 2, 3]
+    await batcher.close()
+
+@pytest.mark.asyncio
+async def test_idle_worker_exits():
+    """Test that an idle key's worker and queue are released."""
+    async def process(key, items):
+        return list(items)
+
+    batcher = MicroBatcher(process, max_wait_ms=0, idle_timeout=0.01)
+    assert await batcher.submit("m", 1) == 1
+    await asyncio.sleep(0.05)
+
+    assert batcher.get_stats()["queue_depths"] == {}
+    assert await batcher.submit("m", 2) == 2
+    await batcher.close()
+
+def test_switching_loops_cancels_old_workers():
+    """Test that workers and waiting callers of a previous event loop are cancelled."""
+    started = []
+
+    async def process(key, items):
+        started.extend(items)
+        await asyncio.sleep(10)
+        return list(items)
+
+    batcher = MicroBatcher(process, max_batch_size=1, max_wait_ms=0)
+    old_loop = asyncio.new_event_loop()
+    new_loop = asyncio.new_event_loop()
+    try:
+        async def submit_and_leave():
+            in_batch = asyncio.ensure_future(batcher.submit("m", 1))
+            queued = asyncio.ensure_future(batcher.submit("m", 2))
+            while not started:
+                await asyncio.sleep(0)
+            return in_batch, queued
+
+        in_batch, queued = old_loop.run_until_complete(submit_and_leave())
+        old_worker = batcher._workers["m"]
+
+        async def submit_quickly(item):
+            batcher.process_batch = lambda key, items: asyncio.sleep(0, result=list(items))
+            return await batcher.submit("m", item)
+
+        assert new_loop.run_until_complete(submit_quickly(3)) == 3
+        old_loop.run_until_complete(asyncio.sleep(0.01))
+
+        assert old_worker.cancelled()
+        assert in_batch.cancelled() and queued.cancelled()
+        new_loop.run_until_complete(batcher.close())
+    finally:
+        old_loop.close()
+        new_loop.close()
+
+def test_histogram_snapshot():
+    """Test histogram bucketing."""
+    histogram = Histogram([1, 5, 10])
+    for value in (0.5, 1, 3, 10, 50):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"le_1": 2, "le_5": 1, "le_10": 1, "inf": 1}
+    assert snapshot["count"] == 5
+    assert snapshot["max"] == 50
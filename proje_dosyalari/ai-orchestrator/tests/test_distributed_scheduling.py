@@ -0,0 +1,97 @@
+"""
+Test script for AI Orchestrator tail-latency scheduling.
+
+This script tests hedge delays, work stealing and overlapping stage pipelines.
+"""
+import sys
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.distributed_scheduling import HedgePolicy, WorkStealingScheduler, run_stage_pipeline
+
+
+def test_hedge_delay_uses_percentile_of_recent_latencies():
+    """Test the default delay and the percentile over the latency window."""
+    policy = HedgePolicy(percentile=95.0, min_samples=10, window=20, default_delay=2.0)
+
+    for _ in range(9):
+        policy.record("m1", 0.1)
+    assert policy.delay("m1") == 2.0
+    assert policy.delay("other") == 2.0
+
+    # 19 fast requests and one slow one: the slow one is above the 95th percentile
+    for _ in range(10):
+        policy.record("m1", 0.1)
+    policy.record("m1", 5.0)
+    assert policy.delay("m1") == 0.1
+
+    # Only the last 20 latencies count
+    for _ in range(20):
+        policy.record("m1", 0.5)
+    assert policy.delay("m1") == 0.5
+
+
+@pytest.mark.asyncio
+async def test_idle_node_steals_from_overloaded_node():
+    """Test that a fast node takes queued requests of a slow node."""
+    ran_on = {}
+
+    async def run(node_id, item):
+        await asyncio.sleep(0.05 if node_id == "slow" else 0.01)
+        ran_on[item] = node_id
+        return item * 2
+
+    scheduler = WorkStealingScheduler(run, {"slow": 1, "fast": 1})
+    futures = [scheduler.submit("slow", item) for item in range(6)]
+    scheduler.start()
+    results = await asyncio.gather(*futures)
+    await scheduler.join()
+
+    assert results == [0, 2, 4, 6, 8, 10]
+    assert scheduler.steals > 0
+    assert ran_on[0] == "slow"
+    assert sum(1 for node_id in ran_on.values() if node_id == "fast") >= 3
+
+
+@pytest.mark.asyncio
+async def test_work_stealing_reports_errors_per_item():
+    """Test that a failing item does not stop the other items."""
+    async def run(node_id, item):
+        if item == 1:
+            raise RuntimeError("boom")
+        return item
+
+    scheduler = WorkStealingScheduler(run, {"a": 2})
+    futures = [scheduler.submit("a", item) for item in range(3)]
+    scheduler.start()
+    results = await asyncio.gather(*futures, return_exceptions=True)
+
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_stage_pipeline_overlaps_stages():
+    """Test that stages run concurrently on different items and keep the order."""
+    async def stage(item_index, value):
+        await asyncio.sleep(0.02)
+        if value == "bad":
+            raise ValueError("bad item")
+        return f"{value}+"
+
+    items = ["a", "bad", "c", "d"]
+    start_time = time.perf_counter()
+    results = await run_stage_pipeline(items, [stage, stage, stage])
+    elapsed = time.perf_counter() - start_time
+
+    assert results[0] == "a+++"
+    assert isinstance(results[1], ValueError)
+    assert results[2:] == ["c+++", "d+++"]
+    # Sequential execution would take 12 stage steps, the pipeline about 6
+    assert elapsed < 0.2
@@ -364,6 +364,31 @@ async def test_parallel_inference(mock_model_manager, mock_llm_service, mock_vis
     
     logger.info("Parallel inference test passed!")
 
+async def test_model_batch_uses_batched_llm_call(mock_model_manager, mock_llm_service, mock_vision_service,
+                                                 mock_audio_service, mock_model_cache, mock_performance_monitor):
+    """Test that a batch of LLM requests is one batched LLM service call."""
+    inference_service = get_inference_service(
+        model_manager=mock_model_manager,
+        model_cache=mock_model_cache,
+        llm_service=mock_llm_service,
+        vision_service=mock_vision_service,
+        audio_service=mock_audio_service,
+        performance_monitor=mock_performance_monitor
+    )
+    mock_llm_service.run_batch_llm_inference = AsyncMock(side_effect=lambda requests, return_exceptions: [
+        InferenceResponse(model_id=request.model_id, outputs=f"Response to {request.inputs}") for request in requests
+    ])
+    
+    requests = [
+        InferenceRequest(model_id="test-llm-model", inputs=f"Prompt {i}", parameters={})
+        for i in range(3)
+    ]
+    responses = await inference_service.run_model_batch("test-llm-model", requests)
+    
+    assert [response.outputs for response in responses] == ["Response to Prompt 0", "Response to Prompt 1", "Response to Prompt 2"]
+    mock_llm_service.run_batch_llm_inference.assert_called_once_with(requests, return_exceptions=True)
+    mock_llm_service.run_llm_inference.assert_not_called()
+
 # Add more tests for error handling, ensemble methods, etc.
 
 # Example of how to run tests (if not using pytest runner):
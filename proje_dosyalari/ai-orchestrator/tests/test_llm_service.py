@@ -8,7 +8,7 @@ import logging
 import sys
 import os
 from pathlib import Path
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 import pytest
 
@@ -278,3 +278,65 @@ async def test_llm_inference_model_not_found(mock_model_manager, mock_llm_integr
 
 # if __name__ == "__main__":
 #     asyncio.run(main())
+
+async def test_batch_llm_inference_single_model_call(mock_model_manager, mock_llm_integration, mock_model_cache, mock_performance_monitor):
+    """Test that batched requests for one model run as one batched model call."""
+    logger.info("Testing batched LLM inference...")
+    
+    mock_model_cache._generate_cache_key = MagicMock(side_effect=lambda model_id, inputs, parameters: f"{model_id}:{inputs}:{parameters}")
+    mock_llm_integration.run_llama_inference_batch = AsyncMock(side_effect=lambda model, prompts, params: [
+        {"text": f"Response to {prompt}", "usage": {}, "finish_reason": "stop"} for prompt in prompts
+    ])
+    
+    # Get service instance with mocks
+    llm_service = get_llm_service(
+        model_manager=mock_model_manager,
+        llm_integration=mock_llm_integration,
+        model_cache=mock_model_cache,
+        performance_monitor=mock_performance_monitor
+    )
+    
+    # Two distinct prompts and a duplicate, all with the same parameters
+    requests = [
+        InferenceRequest(model_id="test-llama-model", inputs=prompt, parameters={"max_tokens": 100})
+        for prompt in ["First prompt", "Second prompt", "First prompt"]
+    ]
+    
+    responses = await llm_service.run_batch_llm_inference(requests)
+    
+    # Assertions
+    assert [response.outputs for response in responses] == [
+        "Response to First prompt", "Response to Second prompt", "Response to First prompt"
+    ], "Responses should follow request order"
+    
+    # One model call for the batch, with the duplicate prompt sent once
+    mock_llm_integration.run_llama_inference_batch.assert_called_once()
+    assert mock_llm_integration.run_llama_inference_batch.call_args.kwargs["prompts"] == ["First prompt", "Second prompt"]
+    mock_llm_integration.run_llama_inference.assert_not_called()
+    mock_model_manager.get_model.assert_called_once_with("test-llama-model")
+    assert mock_model_cache.set.call_count == 2
+    assert mock_performance_monitor.record_inference_stats.call_count == 3
+    
+    logger.info("Batched LLM inference test passed!")
+
+async def test_batch_llm_inference_return_exceptions(mock_model_manager, mock_llm_integration, mock_model_cache, mock_performance_monitor):
+    """Test that a failed batched call reaches every request of the batch."""
+    mock_model_cache._generate_cache_key = MagicMock(side_effect=lambda model_id, inputs, parameters: f"{model_id}:{inputs}")
+    mock_llm_integration.run_llama_inference_batch = AsyncMock(side_effect=RuntimeError("backend failed"))
+    
+    llm_service = get_llm_service(
+        model_manager=mock_model_manager,
+        llm_integration=mock_llm_integration,
+        model_cache=mock_model_cache,
+        performance_monitor=mock_performance_monitor
+    )
+    requests = [
+        InferenceRequest(model_id="test-llama-model", inputs=prompt, parameters={})
+        for prompt in ["First prompt", "Second prompt"]
+    ]
+    
+    responses = await llm_service.run_batch_llm_inference(requests, return_exceptions=True)
+    
+    assert all(isinstance(response, RuntimeError) for response in responses)
+    assert "backend failed" in str(responses[1])
+    mock_model_cache.set.assert_not_called()
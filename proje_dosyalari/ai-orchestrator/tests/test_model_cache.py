@@ -0,0 +1,144 @@
+"""
+Test script for AI Orchestrator model cache.
+
+This script tests the segment file result store and the two-tier ModelCache.
+"""
+import asyncio
+import hashlib
+import pickle
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.config import settings
+from src.core.model_cache import ModelCache
+from src.core.result_store import SegmentStore
+
+def make_key(i: int) -> bytes:
+    return hashlib.md5(str(i).encode()).digest()
+
+def test_store_roundtrip_and_reopen(tmp_path):
+    """Test that values survive reopening, with sealed segments loaded from index files."""
+    store = SegmentStore(tmp_path, max_bytes=10 * 1024 * 1024, segment_bytes=4096)
+    for i in range(200):
+        store.put(make_key(i), f"value-{i}".encode() * 10)
+    store.put(make_key(5), b"updated")
+    assert len(list(tmp_path.glob("*.idx"))) > 1
+    store.close()
+
+    reopened = SegmentStore(tmp_path, max_bytes=10 * 1024 * 1024, segment_bytes=4096)
+    assert len(reopened) == 200
+    assert reopened.get(make_key(5)) == b"updated"
+    assert reopened.get(make_key(199)) == b"value-199" * 10
+    assert reopened.get(make_key(1000)) is None
+    reopened.close()
+
+def test_store_recovers_from_torn_write(tmp_path):
+    """Test that a partially written record at the end of the active segment is dropped."""
+    store = SegmentStore(tmp_path, max_bytes=1024 * 1024)
+    store.put(make_key(1), b"first")
+    store.put(make_key(2), b"second")
+    store.close()
+
+    segment = next(tmp_path.glob("*.seg"))
+    segment.write_bytes(segment.read_bytes()[:-3])
+
+    reopened = SegmentStore(tmp_path, max_bytes=1024 * 1024)
+    assert reopened.get(make_key(1)) == b"first"
+    assert reopened.get(make_key(2)) is None
+    reopened.put(make_key(3), b"third")
+    reopened.close()
+
+    assert SegmentStore(tmp_path, max_bytes=1024 * 1024).get(make_key(3)) == b"third"
+
+def test_store_evicts_oldest_segments(tmp_path):
+    """Test the disk budget and that entries read from old segments are kept."""
+    store = SegmentStore(tmp_path, max_bytes=8 * 1024, segment_bytes=2048)
+    value = b"x" * 200
+    store.put(make_key(0), value)
+    for i in range(1, 100):
+        store.put(make_key(i), value)
+        # Keep reading entry 0 so it is copied forward out of old segments
+        assert store.get(make_key(0)) == value
+
+    assert store.disk_bytes <= 8 * 1024
+    assert store.get(make_key(1)) is None
+    assert store.get(make_key(99)) == value
+    assert store.get(make_key(0)) == value
+    store.close()
+
+def test_store_promotion_respects_budget(tmp_path):
+    """Test that copying entries forward on read does not grow the store past its budget."""
+    store = SegmentStore(tmp_path, max_bytes=8 * 1024, segment_bytes=2048)
+    value = b"x" * 200
+    for i in range(40):
+        store.put(make_key(i), value)
+
+    for _ in range(3):
+        for i in range(40):
+            store.get(make_key(i))
+            assert store.disk_bytes <= 8 * 1024
+    store.close()
+
+@pytest.fixture
+def cache_settings(tmp_path):
+    """Point the cache at a temporary directory with small budgets."""
+    with patch.object(settings, "CACHE_DIR", str(tmp_path)), \
+            patch.object(settings, "CACHE_MEMORY_LIMIT", 1), \
+            patch.object(settings, "CACHE_SEGMENT_SIZE", 1):
+        yield tmp_path
+
+def test_model_cache_tiers(cache_settings):
+    """Test memory LRU eviction, disk fallback and statistics."""
+    async def run():
+        cache = ModelCache()
+        big = {"outputs": "y" * 300 * 1024}
+        for i in range(5):
+            await cache.set("model", f"input {i}", {}, big)
+
+        stats = await cache.get_stats()
+        assert stats["entries"] == 5
+        assert stats["memory_entries"] == 3
+        assert stats["memory_mb"] <= 1
+
+        # Evicted from memory, read back from disk
+        assert await cache.get("model", "input 0", {}) == big
+        assert await cache.get("model", "input 4", {}) == big
+        assert await cache.get("model", "missing", {}) is None
+
+        stats = await cache.get_stats()
+        assert (stats["hits"], stats["memory_hits"], stats["misses"]) == (2, 1, 1)
+
+        reopened = ModelCache()
+        assert await reopened.get("model", "input 2", {}) == big
+
+    asyncio.run(run())
+
+def test_model_cache_migrates_legacy_files(cache_settings):
+    """Test that pickle files from the old layout are imported and removed."""
+    cache = ModelCache.__new__(ModelCache)
+    key = cache._generate_cache_key("model", "hello", {"temperature": 0.5})
+    (cache_settings / f"{key}.cache").write_bytes(pickle.dumps({"outputs": "legacy"}))
+
+    async def run():
+        migrated = ModelCache()
+        assert await migrated.get("model", "hello", {"temperature": 0.5}) == {"outputs": "legacy"}
+
+    asyncio.run(run())
+    assert not list(cache_settings.glob("*.cache"))
+
+def test_model_cache_keeps_unrelated_cache_files(cache_settings):
+    """Test that *.cache files whose name is not a cache key are left in place."""
+    (cache_settings / "notes.cache").write_bytes(b"not a cache entry")
+    (cache_settings / "abcd.cache").write_bytes(b"short key")
+
+    async def run():
+        ModelCache()
+
+    asyncio.run(run())
+    assert sorted(p.name for p in cache_settings.glob("*.cache")) == ["abcd.cache", "notes.cache"]
@@ -0,0 +1,141 @@
+"""
+Test script for AI Orchestrator node-to-node transport.
+
+This script tests the pooled, compressed HTTP transport used by distributed execution.
+"""
+import gzip
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.node_transport import (
+    NODE_TOKEN_HEADER, PayloadTooLargeError, PeerClientPool, decode_json_body, encode_json_body,
+    node_token_valid, read_json_body
+)
+
+
+def make_app():
+    """Create a peer app that echoes request bodies and their encoding."""
+    app = FastAPI()
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        payload = await read_json_body(request)
+        return {
+            "payload": payload,
+            "content_encoding": request.headers.get("content-encoding"),
+            "node_token": request.headers.get(NODE_TOKEN_HEADER)
+        }
+
+    @app.post("/limited")
+    async def limited(request: Request):
+        try:
+            await read_json_body(request, max_bytes=4096)
+        except PayloadTooLargeError:
+            return {"too_large": True}
+        return {"too_large": False}
+
+    @app.get("/fail")
+    async def fail():
+        raise RuntimeError("boom")
+
+    return app
+
+
+def test_encode_decode_round_trip():
+    """Test that bodies are compressed above the threshold and decode back."""
+    small, small_headers = encode_json_body({"a": 1}, compress_min_bytes=1024)
+    large, large_headers = encode_json_body({"text": "x" * 5000}, compress_min_bytes=1024)
+
+    assert "Content-Encoding" not in small_headers
+    assert large_headers["Content-Encoding"] == "gzip"
+    assert len(large) < 5000
+    assert decode_json_body(small) == {"a": 1}
+    assert decode_json_body(large, "gzip") == {"text": "x" * 5000}
+
+    with pytest.raises(ValueError):
+        decode_json_body(large, "br")
+
+
+@pytest.mark.asyncio
+async def test_pool_sends_compressed_bodies_over_one_client_per_peer():
+    """Test that requests to a peer share one client and large bodies travel compressed."""
+    pool = PeerClientPool(compress_min_bytes=1024, transport=httpx.ASGITransport(app=make_app()))
+
+    small = await pool.post_json("http://peer-a", "/echo", {"n": 1})
+    large = await pool.post_json("http://peer-a/", "/echo", {"text": "y" * 5000})
+    await pool.post_json("http://peer-b", "/echo", {"n": 2})
+
+    assert small == {"payload": {"n": 1}, "content_encoding": None, "node_token": None}
+    assert large == {"payload": {"text": "y" * 5000}, "content_encoding": "gzip", "node_token": None}
+    assert pool.client("http://peer-a") is pool.client("http://peer-a/")
+
+    stats = pool.get_stats()
+    assert stats["peers"] == ["http://peer-a", "http://peer-b"]
+    assert stats["requests"] == 3
+    assert stats["bytes_sent"] < 5000
+
+    await pool.close()
+    assert pool.get_stats()["peers"] == []
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_errors():
+    """Test that error responses raise and are counted."""
+    pool = PeerClientPool(transport=httpx.ASGITransport(app=make_app(), raise_app_exceptions=False))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await pool.get_json("http://peer-a", "/fail")
+
+    assert pool.get_stats()["errors"] == 1
+    await pool.close()
+
+
+def test_decompression_is_bounded():
+    """Test that gzip bodies inflating past the limit are rejected without inflating them fully."""
+    bomb = gzip.compress(b"[" + b"0," * (8 * 1024 * 1024) + b"0]")
+    assert len(bomb) < 64 * 1024
+
+    with pytest.raises(PayloadTooLargeError):
+        decode_json_body(bomb, "gzip", max_bytes=1024 * 1024)
+    with pytest.raises(ValueError):
+        decode_json_body(b"not gzip", "gzip", max_bytes=1024)
+    with pytest.raises(ValueError):
+        decode_json_body(gzip.compress(b'{"a": 1}')[:-12], "gzip", max_bytes=1024)
+    assert decode_json_body(gzip.compress(b'{"a": 1}'), "gzip", max_bytes=1024) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_read_json_body_limits_raw_and_decompressed_size():
+    """Test that incoming bodies over the limit are rejected, compressed or not."""
+    pool = PeerClientPool(compress_min_bytes=1024, transport=httpx.ASGITransport(app=make_app()))
+
+    assert await pool.post_json("http://peer-a", "/limited", {"n": 1}) == {"too_large": False}
+    # Compressed to a few hundred bytes, inflates past the limit
+    assert await pool.post_json("http://peer-a", "/limited", {"text": "z" * 10000}) == {"too_large": True}
+    pool.compress_min_bytes = 1024 * 1024
+    assert await pool.post_json("http://peer-a", "/limited", {"text": "z" * 10000}) == {"too_large": True}
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_sends_node_token():
+    """Test that the shared secret travels with every request and is checked in constant time."""
+    pool = PeerClientPool(transport=httpx.ASGITransport(app=make_app()), shared_secret="s3cret")
+
+    response = await pool.post_json("http://peer-a", "/echo", {"n": 1})
+
+    assert response["node_token"] == "s3cret"
+    assert node_token_valid("s3cret", shared_secret="s3cret")
+    assert not node_token_valid("wrong", shared_secret="s3cret")
+    assert not node_token_valid(None, shared_secret="s3cret")
+    assert node_token_valid(None, shared_secret="")
+    await pool.close()
@@ -0,0 +1,129 @@
+"""
+Test script for AI Orchestrator OS Integration Client.
+
+This script tests the pooled transport, the coalescing TTL cache and concurrent fan-out.
+"""
+import sys
+import asyncio
+import gc
+import weakref
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.clients.os_integration_client import AsyncTTLCache, ApiCall, OSIntegrationClient
+
+
+def make_client(handler) -> OSIntegrationClient:
+    """Create a client that sends its requests to a handler function."""
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return handler(request)
+
+    return OSIntegrationClient("http://os-service:8083", transport=httpx.MockTransport(async_handler))
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_evicts_least_recently_used_and_expires():
+    """Test LRU eviction, per-entry expiry and clearing."""
+    cache = AsyncTTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    cache.set("short", 4, ttl=0.01)
+    await asyncio.sleep(0.02)
+    assert cache.get("short") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_call_is_coalesced():
+    """Test that concurrent identical calls make one request and later calls hit the cache."""
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"os_name": "MockOS"})
+
+    client = make_client(handler)
+    results = await asyncio.gather(*(client.get_platform_info() for _ in range(10)))
+    assert results == [{"os_name": "MockOS"}] * 10
+    assert await client.get_platform_info() == {"os_name": "MockOS"}
+    assert paths == ["/api/platform/info"]
+    assert client.get_platform_info.cache.coalesced == 9
+
+    # Another client does not see the first client's results
+    other = make_client(handler)
+    await other.get_platform_info()
+    assert len(paths) == 2
+
+    await client.get_platform_info.clear_cache()
+    await client.close()
+    await other.close()
+
+
+@pytest.mark.asyncio
+async def test_cache_does_not_keep_client_alive():
+    """Test that cached results are stored on the client and freed with it."""
+    def handler(request):
+        return httpx.Response(200, json={"os_name": "MockOS"})
+
+    client = make_client(handler)
+    await client.get_platform_info()
+    assert len(client.get_platform_info.cache) == 1
+    await client.close()
+
+    client_ref = weakref.ref(client)
+    del client
+    gc.collect()
+    assert client_ref() is None
+
+
+@pytest.mark.asyncio
+async def test_fan_out_runs_calls_concurrently():
+    """Test that a fan-out sends one request per call at once and keeps the call order."""
+    requests = []
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        requests.append(request.url.path)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.url.params.get("path") == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"path": request.url.path, "query": dict(request.url.params)})
+
+    client = OSIntegrationClient("http://os-service:8083", transport=httpx.MockTransport(handler))
+    results = await client.read_files(["/a", "/missing", "/b"])
+    assert results == [
+        {"path": "/api/fs/read", "query": {"path": "/a"}},
+        None,
+        {"path": "/api/fs/read", "query": {"path": "/b"}},
+    ]
+    assert requests == ["/api/fs/read"] * 3
+    assert peak == 3
+
+    calls = [
+        ApiCall("GET", "api/screenshot", params={"output_path": "/tmp/s.png"}),
+        ApiCall("GET", "api/platform/processes"),
+    ]
+    assert await client.fan_out(calls) == [
+        {"path": "/api/screenshot", "query": {"output_path": "/tmp/s.png"}},
+        {"path": "/api/platform/processes", "query": {}},
+    ]
+    assert await client.fan_out([]) == []
+    await client.close()
@@ -0,0 +1,100 @@
+"""
+Test script for AI Orchestrator performance monitoring.
+
+This script tests latency recording, percentiles and background persistence.
+"""
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.performance_monitor import LatencyHistogram, PerformanceMonitor
+
+def test_histogram_percentiles_are_accurate():
+    """Test that histogram percentiles stay within the bucket precision."""
+    rng = random.Random(7)
+    values = [rng.lognormvariate(3, 1) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    values.sort()
+    result = histogram.percentiles([50, 95, 99])
+    for percentile in (50, 95, 99):
+        exact = values[int(len(values) * percentile / 100) - 1]
+        assert result[percentile] == pytest.approx(exact, rel=0.03)
+
+    assert LatencyHistogram().percentiles([50]) == {50: None}
+
+@pytest.mark.asyncio
+async def test_recording_does_not_write_until_flush(tmp_path):
+    """Test that stats are kept in memory and written by flush."""
+    monitor = PerformanceMonitor(stats_dir=tmp_path)
+    monitor.flush_interval = 3600
+
+    for latency in range(1, 101):
+        await monitor.record_inference_stats("llama", float(latency), success=latency % 10 != 0)
+    assert not monitor.stats_file.exists()
+
+    stats = await monitor.get_model_stats("llama")
+    assert stats["inference_count"] == 100
+    assert stats["failure_count"] == 10
+    assert stats["avg_latency_ms"] == pytest.approx(50.5)
+    assert stats["p50_latency_ms"] == pytest.approx(50, rel=0.02)
+    assert stats["p99_latency_ms"] == pytest.approx(99, rel=0.02)
+    assert len(stats["latency_history"]) == 100
+
+    custom = await monitor.get_model_stats("llama", percentiles=[90])
+    assert custom["p90_latency_ms"] == pytest.approx(90, rel=0.02)
+    assert await monitor.get_model_stats("unknown") == {}
+
+    await monitor.flush()
+    saved = json.loads(monitor.stats_file.read_text())
+    assert saved["model_stats"]["llama"]["inference_count"] == 100
+    monitor.flush_task.cancel()
+
+@pytest.mark.asyncio
+async def test_stats_survive_restart(tmp_path):
+    """Test that counters, history and percentiles are restored from the stats file."""
+    monitor = PerformanceMonitor(stats_dir=tmp_path)
+    for _ in range(200):
+        await monitor.record_inference_stats("whisper", 40.0)
+    await monitor.record_inference_stats("whisper", 400.0, memory_usage=1024)
+    await monitor.flush()
+    monitor.flush_task.cancel()
+
+    restored = PerformanceMonitor(stats_dir=tmp_path)
+    stats = await restored.get_model_stats("whisper")
+    assert stats["inference_count"] == 201
+    assert stats["memory_usage"] == 1024
+    assert stats["max_latency_ms"] == 400.0
+    assert stats["p50_latency_ms"] == pytest.approx(40, rel=0.02)
+    assert len(stats["latency_history"]) == 100
+
+@pytest.mark.asyncio
+async def test_background_flusher(tmp_path):
+    """Test that the flusher persists stats on its interval and on stop."""
+    monitor = PerformanceMonitor(stats_dir=tmp_path)
+    monitor.flush_interval = 0.01
+    monitor.monitoring_interval = 3600
+
+    await monitor.record_inference_stats("yolo", 12.0)
+    await asyncio.sleep(0.1)
+    assert json.loads(monitor.stats_file.read_text())["model_stats"]["yolo"]["inference_count"] == 1
+
+    await monitor.start_monitoring()
+    await monitor.record_inference_stats("yolo", 14.0)
+    for _ in range(100):  # let the monitoring loop collect system stats once
+        if "cpu_percent" in monitor.system_stats:
+            break
+        await asyncio.sleep(0.01)
+    await monitor.stop_monitoring()
+    saved = json.loads(monitor.stats_file.read_text())
+    assert saved["model_stats"]["yolo"]["inference_count"] == 2
+    assert "cpu_percent" in saved["system_stats"]
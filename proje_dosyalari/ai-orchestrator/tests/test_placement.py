@@ -0,0 +1,63 @@
+"""
+Test script for AI Orchestrator batch placement.
+
+This script tests the cost model and makespan-minimizing placement of sub-batches.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.placement import NodeProfile, PlacementEngine
+
+
+def test_completion_time_counts_queue_capacity_and_model_load():
+    """Test the per-node completion time estimate."""
+    node = NodeProfile("a", latency=1.0, queue_depth=3, capacity=4, model_loaded=False, overhead=0.5)
+
+    assert node.completion_time(0, model_load_time=10.0) == 0.0
+    # 3 queued + 1 new fit in one wave
+    assert node.completion_time(1, model_load_time=10.0) == 11.5
+    # 3 queued + 6 new need three waves
+    assert node.completion_time(6, model_load_time=10.0) == 13.5
+
+
+def test_faster_nodes_get_more_requests():
+    """Test that requests are split in proportion to node speed."""
+    engine = PlacementEngine(model_load_time=10.0)
+    profiles = [NodeProfile("slow", latency=3.0), NodeProfile("fast", latency=1.0)]
+
+    assert engine.allocate(profiles, 8) == [2, 6]
+    assert engine.makespan(profiles, [2, 6]) == 6.0
+
+
+def test_model_residency_and_queue_depth():
+    """Test that loading a model and queued work are avoided when cheaper elsewhere."""
+    engine = PlacementEngine(model_load_time=10.0)
+    profiles = [
+        NodeProfile("cold", latency=1.0, model_loaded=False),
+        NodeProfile("busy", latency=1.0, queue_depth=4),
+        NodeProfile("warm", latency=1.0)
+    ]
+
+    counts = engine.allocate(profiles, 6)
+
+    assert counts == [0, 1, 5]
+
+
+def test_place_returns_contiguous_slices():
+    """Test that every request is placed exactly once in contiguous slices."""
+    engine = PlacementEngine()
+    profiles = [
+        NodeProfile("a", latency=0.2, capacity=8),
+        NodeProfile("b", latency=1.0, capacity=2, overhead=0.01),
+        NodeProfile("c", latency=5.0)
+    ]
+
+    slices = engine.place(profiles, 37)
+
+    covered = [index for _, start, end in slices for index in range(start, end)]
+    assert covered == list(range(37))
+    assert all(end > start for _, start, end in slices)
+    assert engine.place([], 5) == []
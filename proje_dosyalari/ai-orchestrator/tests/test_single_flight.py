@@ -0,0 +1,93 @@
+"""
+Test script for AI Orchestrator request coalescing.
+
+This script tests the single-flight layer used by the inference services.
+"""
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.config import settings
+from src.core.single_flight import SingleFlight, coalescing_enabled, mark_coalesced
+from src.models.inference import InferenceResponse
+
+@pytest.mark.asyncio
+async def test_identical_calls_share_one_execution():
+    """Test that concurrent calls with the same key run once."""
+    group = SingleFlight()
+    calls = []
+
+    async def run_model(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return f"result for {key}"
+
+    results = await asyncio.gather(
+        *(group.do("a", lambda: run_model("a")) for _ in range(5)),
+        group.do("b", lambda: run_model("b"))
+    )
+
+    assert calls == ["a", "b"]
+    assert [result for result, _ in results] == ["result for a"] * 5 + ["result for b"]
+    assert [shared for _, shared in results] == [False, True, True, True, True, False]
+    assert group.get_stats() == {"executions": 2, "coalesced": 4, "in_flight": 0}
+
+    # Finished calls are not reused
+    assert await group.do("a", lambda: run_model("a")) == ("result for a", False)
+    assert len(calls) == 3
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    """Test that an exception is raised to the leader and all followers."""
+    group = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("model crashed")
+
+    results = await asyncio.gather(*(group.do("k", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert group.get_stats()["in_flight"] == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    """Test that cancelling the first caller leaves the shared call running."""
+    group = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    leader = asyncio.ensure_future(group.do("k", slow))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(group.do("k", slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == ("done", True)
+    assert leader.cancelled()
+
+def test_coalescing_configuration():
+    """Test the global switch and per-model exclusions."""
+    with patch.object(settings, "COALESCING_ENABLED", True), \
+            patch.object(settings, "COALESCING_EXCLUDED_MODELS", ["sampler"]):
+        assert coalescing_enabled("llama2-7b-q4")
+        assert not coalescing_enabled("sampler")
+
+    with patch.object(settings, "COALESCING_ENABLED", False):
+        assert not coalescing_enabled("llama2-7b-q4")
+
+def test_mark_coalesced_copies_response():
+    """Test that marking a shared response does not modify the original."""
+    response = InferenceResponse(model_id="m", outputs="text", metadata={"cached": False})
+    shared = mark_coalesced(response, True)
+
+    assert shared.metadata == {"cached": False, "coalesced": True}
+    assert response.metadata == {"cached": False}
+    assert shared.outputs == "text"
@@ -0,0 +1,82 @@
+"""
+Test script for AI Orchestrator speech chunking.
+
+This script tests in-memory audio decoding and VAD segmentation.
+"""
+import sys
+import io
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.services.speech_chunking import decode_audio, array_to_pcm, segment_speech
+
+
+def make_wav(samples: np.ndarray, sample_rate: int, channels: int = 1, sample_width: int = 2) -> bytes:
+    """Create WAV file contents in memory."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def test_decode_wav_and_raw_pcm():
+    """Test decoding WAV containers of different formats and raw PCM."""
+    mono = np.array([0, 1000, -1000, 32767], dtype=np.int16)
+    samples, rate = decode_audio(make_wav(mono, 8000), 16000)
+    assert rate == 8000
+    assert samples.tolist() == mono.tolist()
+
+    # Stereo is downmixed
+    stereo = np.array([[1000, 3000], [-2000, 0]], dtype=np.int16)
+    samples, rate = decode_audio(make_wav(stereo, 22050, channels=2), 16000)
+    assert rate == 22050
+    assert samples.tolist() == [2000, -1000]
+
+    # 8-bit WAV is unsigned
+    samples, _ = decode_audio(make_wav(np.array([128, 255, 0], dtype=np.uint8), 8000, sample_width=1))
+    assert samples.tolist() == [0, 127 << 8, -32768]
+
+    # Raw PCM uses the default rate; a trailing odd byte is dropped
+    samples, rate = decode_audio(mono.tobytes() + b"\x01", 16000)
+    assert rate == 16000
+    assert samples.tolist() == mono.tolist()
+
+    assert array_to_pcm(np.array([0.5, -1.0])).tolist() == [16383, -32767]
+
+
+def test_segment_speech_splits_at_pauses():
+    """Test that chunks follow speech and pauses, and long speech is cut."""
+    rate = 16000
+    rng = np.random.default_rng(0)
+
+    def speech(seconds):
+        return (rng.standard_normal(int(seconds * rate)) * 3000).astype(np.int16)
+
+    def silence(seconds):
+        return np.zeros(int(seconds * rate), dtype=np.int16)
+
+    samples = np.concatenate([silence(1), speech(2), silence(0.3), speech(1), silence(2), speech(1.5), silence(1)])
+    chunks = segment_speech(samples, rate, pause_threshold=0.8, padding_ms=210)
+
+    # The short pause stays inside the first chunk, the long one separates chunks
+    assert len(chunks) == 2
+    first, second = [(start / rate, end / rate) for start, end in chunks]
+    assert 0.7 < first[0] < 1.0 and 4.3 < first[1] < 4.6
+    assert 6.0 < second[0] < 6.3 and 7.8 < second[1] < 8.1
+
+    # Long speech is cut into chunks no longer than the maximum
+    chunks = segment_speech(speech(10), rate, max_chunk_seconds=3)
+    assert len(chunks) >= 4
+    assert all(end - start <= 3 * rate for start, end in chunks)
+    assert chunks[0][0] == 0 and chunks[-1][1] == 10 * rate
+    assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+
+    assert segment_speech(silence(5), rate) == []
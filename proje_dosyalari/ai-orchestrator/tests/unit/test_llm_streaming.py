@@ -0,0 +1,115 @@
+"""
+Unit tests for LLM streaming helpers and token streaming.
+"""
+
+import unittest
+
+from src.models.llm.ggml_model import GGMLModel
+from src.models.llm.streaming import IncrementalDetokenizer, StopSequenceMatcher
+
+
+class ByteTokenizer:
+    """Fake byte-level tokenizer: one token per UTF-8 byte"""
+
+    def __init__(self):
+        self.decoded_tokens = 0
+
+    def tokenize(self, text):
+        return list(text.encode("utf-8"))
+
+    def decode(self, tokens):
+        self.decoded_tokens += len(tokens)
+        return bytes(tokens).decode("utf-8", errors="replace")
+
+
+class FakeGGMLBackend(ByteTokenizer):
+    """Fake GGML binding replaying a fixed output"""
+
+    def __init__(self, output):
+        super().__init__()
+        self.output = self.tokenize(output)
+        self.contexts = []
+
+    def generate_next_token(self, tokens, **kwargs):
+        self.contexts.append(tokens)
+        return self.output[len(self.contexts) - 1]
+
+
+class TestIncrementalDetokenizer(unittest.TestCase):
+    """Test cases for incremental detokenization"""
+
+    def test_multibyte_characters_split_across_tokens(self):
+        """Test that characters split across tokens are emitted once complete"""
+        tokenizer = ByteTokenizer()
+        detokenizer = IncrementalDetokenizer(tokenizer.decode)
+        text = "çay ☕ içelim"
+
+        chunks = [detokenizer.add(token) for token in tokenizer.tokenize(text)]
+
+        self.assertEqual("".join(chunks) + detokenizer.flush(), text)
+        self.assertNotIn("�", "".join(chunks))
+
+    def test_decoding_work_per_token_is_bounded(self):
+        """Test that each token only decodes a bounded window"""
+        tokenizer = ByteTokenizer()
+        detokenizer = IncrementalDetokenizer(tokenizer.decode, context_tokens=4)
+
+        for token in tokenizer.tokenize("a" * 1000):
+            detokenizer.add(token)
+
+        self.assertLess(tokenizer.decoded_tokens, 1000 * 10)
+
+
+class TestStopSequenceMatcher(unittest.TestCase):
+    """Test cases for rolling-window stop sequence matching"""
+
+    def test_stop_sequence_split_across_chunks(self):
+        """Test that a stop sequence spanning chunks is found and not emitted"""
+        matcher = StopSequenceMatcher(["###", "\nUser:"])
+        emitted = []
+        for chunk in ["Hello", " wor", "ld\nUs", "er: more"]:
+            text, stopped = matcher.feed(chunk)
+            emitted.append(text)
+            if stopped:
+                break
+
+        self.assertTrue(stopped)
+        self.assertEqual("".join(emitted), "Hello world")
+
+    def test_no_stop_sequence_flushes_everything(self):
+        """Test that held back text is returned by flush"""
+        matcher = StopSequenceMatcher(["STOP"])
+        text, stopped = matcher.feed("almost ST")
+
+        self.assertFalse(stopped)
+        self.assertEqual(text + matcher.flush(), "almost ST")
+
+
+class TestGGMLStreaming(unittest.IsolatedAsyncioTestCase):
+    """Test cases for GGML token streaming"""
+
+    def setUp(self):
+        """Set up a loaded model with a fake backend"""
+        self.model = GGMLModel("test-model", "/path/to/model.bin")
+        self.model.model = FakeGGMLBackend("Merhaba dünya!### ignored")
+        self.model.is_loaded = True
+
+    async def test_stream_stops_before_stop_sequence(self):
+        """Test that stream yields text up to the stop sequence"""
+        chunks = [chunk async for chunk in self.model.stream("Hi", max_tokens=100, stop_sequences=["###"])]
+
+        self.assertEqual("".join(chunks), "Merhaba dünya!")
+        # The context list grows in place instead of being copied per token
+        self.assertTrue(all(context is self.model.model.contexts[0] for context in self.model.model.contexts))
+
+    async def test_generate_with_callback(self):
+        """Test that generate(stream=True) passes chunks to the callback"""
+        chunks = []
+        result = await self.model.generate("Hi", max_tokens=7, stream=True, callback=chunks.append)
+
+        self.assertIsNone(result)
+        self.assertEqual("".join(chunks), "Merhaba")
+
+
+if __name__ == "__main__":
+    unittest.main()
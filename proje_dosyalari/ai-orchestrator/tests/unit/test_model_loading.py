@@ -0,0 +1,149 @@
+"""
+Unit tests for model load deduplication, memory-aware admission and prefetching.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.models import model_manager
+from src.models.model_manager import ModelManager
+from src.models.llm.base import BaseLLMModel
+
+MB = 1024 * 1024
+
+
+class SlowMockModel(BaseLLMModel):
+    """Mock LLM model whose load takes a moment"""
+
+    load_count = 0
+
+    async def load(self):
+        SlowMockModel.load_count += 1
+        await asyncio.sleep(0.01)
+        self.is_loaded = True
+        return True
+
+    async def unload(self):
+        self.is_loaded = False
+        return True
+
+    async def generate(self, prompt, **kwargs):
+        return f"Generated text for: {prompt}"
+
+    async def get_stats(self):
+        return {"loaded": self.is_loaded}
+
+    def get_metadata(self):
+        return {"type": "mock", "name": self.model_name}
+
+
+class TestModelLoading(unittest.IsolatedAsyncioTestCase):
+    """Test cases for model loading and eviction"""
+
+    def setUp(self):
+        """Set up test environment"""
+        SlowMockModel.load_count = 0
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+        for target, new in [
+            ("src.models.model_manager.GGMLModel", SlowMockModel),
+            ("src.models.model_manager.ModelManager._process_rss", staticmethod(lambda: 0)),
+        ]:
+            patcher = patch(target, new)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.manager = ModelManager()
+
+    def configure(self, **models_config):
+        """Override the models configuration for one test"""
+        patcher = patch.dict(model_manager.config["models"], models_config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def register(self, name, size_mb):
+        """Register a model backed by a file of the given size"""
+        path = os.path.join(self.tmpdir.name, f"{name}.bin")
+        with open(path, "wb") as f:
+            f.truncate(int(size_mb * MB))
+        self.manager.register_model(name, "llm", path)
+
+    async def test_concurrent_loads_share_one_load(self):
+        """Test that concurrent loads of a model run a single load"""
+        self.configure(max_loaded_models=5, memory_budget_mb=None)
+        self.register("a", 1)
+
+        results = await asyncio.gather(*[self.manager.load_model("a", "llm") for _ in range(10)])
+
+        self.assertEqual(results, [True] * 10)
+        self.assertEqual(SlowMockModel.load_count, 1)
+        self.assertEqual(self.manager._loading, {})
+        self.assertEqual(self.manager.model_sizes["llm:a"], 1 * MB)
+
+    async def test_memory_budget_evicts_lru(self):
+        """Test that loading past the memory budget evicts the least recently used model"""
+        self.configure(max_loaded_models=5, memory_budget_mb=5, eviction_policy="lru")
+        for name in ("a", "b", "c"):
+            self.register(name, 2)
+
+        await self.manager.load_model("a", "llm")
+        await self.manager.load_model("b", "llm")
+        await self.manager.load_model("a", "llm")  # a is now most recently used
+        await self.manager.load_model("c", "llm")
+
+        self.assertEqual(set(self.manager.loaded_models), {"llm:a", "llm:c"})
+        self.assertLessEqual(self.manager.get_memory_usage(), 5 * MB)
+
+    async def test_memory_budget_evicts_lfu(self):
+        """Test that the LFU policy evicts the least requested model"""
+        self.configure(max_loaded_models=5, memory_budget_mb=5, eviction_policy="lfu")
+        for name in ("a", "b", "c"):
+            self.register(name, 2)
+
+        await self.manager.load_model("a", "llm")
+        await self.manager.load_model("b", "llm")
+        for _ in range(3):
+            self.manager._record_request("llm:a")
+        self.manager._record_request("llm:b")
+        self.manager._touch("llm:a")
+        self.manager._touch("llm:b")  # b is most recently used but least requested
+
+        await self.manager.load_model("c", "llm")
+
+        self.assertEqual(set(self.manager.loaded_models), {"llm:a", "llm:c"})
+
+    async def test_model_larger_than_budget_is_refused(self):
+        """Test that a model that cannot fit the memory budget is not loaded"""
+        self.configure(max_loaded_models=5, memory_budget_mb=1)
+        self.register("big", 2)
+
+        result = await self.manager.load_model("big", "llm")
+
+        self.assertFalse(result)
+        self.assertEqual(SlowMockModel.load_count, 0)
+
+    async def test_prefetch_loads_predicted_models_without_evicting(self):
+        """Test that prefetch warms models from recent traffic using free capacity only"""
+        self.configure(max_loaded_models=2, memory_budget_mb=None)
+        for name in ("a", "b", "c"):
+            self.register(name, 1)
+        await self.manager.load_model("a", "llm")
+
+        for key in ("llm:c", "llm:b", "llm:b", "llm:a", "llm:b"):
+            self.manager._recent_requests.append(key)
+
+        self.assertEqual(self.manager.predict_models(limit=3), ["llm:b", "llm:a", "llm:c"])
+
+        started = await self.manager.prefetch(limit=2)
+        await asyncio.gather(*self.manager._loading.values())
+
+        self.assertEqual(started, ["llm:b"])
+        self.assertEqual(set(self.manager.loaded_models), {"llm:a", "llm:b"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,356 @@
+"""
+ALT Codecs Module for ALT_LAS Segmentation Service
+
+This module provides the serialization layer used by the DSL schema modules.
+Each codec converts between plain ALT dictionaries and bytes:
+
+- JSON, using orjson when it is installed and the standard library otherwise
+- YAML, using the libyaml-backed CSafeLoader/CSafeDumper when available
+- MessagePack, a compact binary format stored with the .altb extension
+
+Files are matched to a codec by extension, or by sniffing their first bytes,
+so each file is parsed exactly once. The module also provides a trusted
+construction path that builds Pydantic models from already-validated data
+without running validators.
+"""
+
+import datetime
+import enum
+import json
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+import yaml
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# First bytes of a MessagePack map: fixmap, map 16, map 32
+_MSGPACK_MAP_MARKERS = frozenset(range(0x80, 0x90)) | {0xde, 0xdf}
+
+class AltCodec:
+    """
+    Base class for ALT file codecs
+
+    Subclasses implement encode and decode for one serialization format.
+    """
+
+    name = ""
+    extensions: Tuple[str, ...] = ()
+    binary = False
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """
+        Serialize an ALT dictionary
+
+        Args:
+            data: ALT file dictionary
+
+        Returns:
+            Serialized bytes
+        """
+        raise NotImplementedError
+
+    def decode(self, raw: bytes) -> Dict[str, Any]:
+        """
+        Parse serialized ALT data
+
+        Args:
+            raw: Serialized bytes (or text, for text formats)
+
+        Returns:
+            ALT file dictionary
+        """
+        raise NotImplementedError
+
+class JsonCodec(AltCodec):
+    """JSON codec backed by orjson, falling back to the json module"""
+
+    name = "json"
+    extensions = (".json",)
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                # Non-string keys, integers wider than 64 bits, etc.
+                pass
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def decode(self, raw: bytes) -> Dict[str, Any]:
+        if isinstance(raw, str):
+            raw = raw.encode("utf-8")
+        if raw.startswith(_UTF8_BOM):
+            raw = raw[len(_UTF8_BOM):]
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects NaN/Infinity and integers wider than 64 bits,
+                # which the json module accepts
+                pass
+        return json.loads(raw)
+
+class YamlCodec(AltCodec):
+    """YAML codec using the C-accelerated safe loader and dumper when available"""
+
+    name = "yaml"
+    extensions = (".yaml", ".yml")
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        return self.dump(data).encode("utf-8")
+
+    def decode(self, raw: bytes) -> Dict[str, Any]:
+        return yaml.load(raw, Loader=YAML_LOADER)
+
+    @staticmethod
+    def dump(data: Dict[str, Any]) -> str:
+        """
+        Serialize an ALT dictionary to a YAML string
+
+        Args:
+            data: ALT file dictionary
+
+        Returns:
+            YAML string
+        """
+        try:
+            return yaml.dump(data, Dumper=YAML_DUMPER, sort_keys=False, default_flow_style=False)
+        except yaml.representer.RepresenterError:
+            # Metadata may hold values only the full (unsafe) dumper can represent
+            return yaml.dump(data, sort_keys=False, default_flow_style=False)
+
+class MsgpackCodec(AltCodec):
+    """Binary MessagePack codec for .altb files"""
+
+    name = "msgpack"
+    extensions = (".altb",)
+    binary = True
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        self._require()
+        return msgpack.packb(data, use_bin_type=True, default=_msgpack_default)
+
+    def decode(self, raw: bytes) -> Dict[str, Any]:
+        self._require()
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+    @staticmethod
+    def _require():
+        """Raise if the msgpack package is not installed"""
+        if msgpack is None:
+            raise ImportError("msgpack is required for the binary ALT format (.altb)")
+
+def _msgpack_default(value: Any) -> Any:
+    """Convert values MessagePack cannot represent natively"""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
+
+_CODECS: Dict[str, AltCodec] = {}
+
+def register_codec(codec: AltCodec):
+    """
+    Register a codec by name
+
+    Args:
+        codec: Codec instance
+    """
+    _CODECS[codec.name] = codec
+
+def get_codec(name: str) -> AltCodec:
+    """
+    Get a registered codec
+
+    Args:
+        name: Codec name (json, yaml or msgpack)
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If no codec has that name
+    """
+    codec = _CODECS.get(name.lower())
+    if codec is None:
+        raise ValueError(f"Unknown ALT format: {name}. Must be one of {sorted(_CODECS)}")
+    return codec
+
+def codec_for_path(file_path: str) -> Optional[AltCodec]:
+    """
+    Get the codec matching a file extension
+
+    Args:
+        file_path: File path
+
+    Returns:
+        Codec instance, or None if the extension is not recognized
+    """
+    lowered = file_path.lower()
+    for codec in _CODECS.values():
+        if lowered.endswith(codec.extensions):
+            return codec
+    return None
+
+def sniff_codec(raw: bytes) -> AltCodec:
+    """
+    Guess the codec of serialized ALT data from its first bytes
+
+    ALT files are mappings, so a MessagePack file starts with a map marker and
+    a JSON file with "{". Anything else is treated as YAML.
+
+    Args:
+        raw: Serialized bytes
+
+    Returns:
+        Codec instance
+    """
+    if raw[:1] and raw[0] in _MSGPACK_MAP_MARKERS and "msgpack" in _CODECS:
+        return _CODECS["msgpack"]
+
+    if raw.startswith(_UTF8_BOM):
+        raw = raw[len(_UTF8_BOM):]
+    if raw.lstrip()[:1] == b"{":
+        return _CODECS["json"]
+    return _CODECS["yaml"]
+
+def decode_bytes(raw: bytes, file_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Parse serialized ALT data, choosing the codec by extension or content
+
+    Args:
+        raw: Serialized bytes
+        file_path: Optional path whose extension selects the codec
+
+    Returns:
+        ALT file dictionary
+    """
+    codec = codec_for_path(file_path) if file_path else None
+    if codec is not None:
+        return codec.decode(raw)
+
+    codec = sniff_codec(raw)
+    try:
+        return codec.decode(raw)
+    except (ValueError, TypeError):
+        if codec.name != "json":
+            raise
+        # A YAML flow mapping also starts with "{" but is not always valid JSON
+        return _CODECS["yaml"].decode(raw)
+
+register_codec(JsonCodec())
+register_codec(YamlCodec())
+register_codec(MsgpackCodec())
+
+# Trusted construction
+
+_FieldPlan = List[Tuple[str, Optional[Callable[[Any], Any]]]]
+_field_plans: Dict[Type[BaseModel], _FieldPlan] = {}
+
+def _is_model(annotation: Any) -> bool:
+    """Check whether an annotation is a Pydantic model class"""
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+def _converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Build a function that converts raw data into an annotation's shape
+
+    Only nested models and enums need converting; everything else is kept as
+    parsed. Returns None when no conversion is needed.
+    """
+    if _is_model(annotation):
+        return lambda value: construct_model(annotation, value) if isinstance(value, dict) else value
+
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return lambda value: annotation(value) if not isinstance(value, annotation) else value
+
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is list and args:
+        item = _converter(args[0])
+        if item is None:
+            return None
+        return lambda value: [item(v) for v in value] if isinstance(value, list) else value
+
+    if origin is dict and len(args) == 2:
+        item = _converter(args[1])
+        if item is None:
+            return None
+        return lambda value: {k: item(v) for k, v in value.items()} if isinstance(value, dict) else value
+
+    if origin is typing.Union:
+        # Mirror validation: with Any in the union, raw values are kept as-is
+        if Any in args:
+            return None
+        models = [arg for arg in args if _is_model(arg)]
+        if not models:
+            converters = [c for c in (_converter(arg) for arg in args if arg is not type(None)) if c is not None]
+            return converters[0] if len(converters) == 1 else None
+        model_converter = _converter(models[0])
+        return lambda value: model_converter(value) if isinstance(value, dict) else value
+
+    return None
+
+def _field_plan(model: Type[BaseModel]) -> _FieldPlan:
+    """Get (and cache) the per-field converters of a model"""
+    plan = _field_plans.get(model)
+    if plan is None:
+        plan = [(name, _converter(field.annotation)) for name, field in model.model_fields.items()]
+        _field_plans[model] = plan
+    return plan
+
+def construct_model(model: Type[BaseModel], data: Dict[str, Any]) -> BaseModel:
+    """
+    Build a model from trusted data without validation
+
+    Nested models and enums are constructed recursively so the result has the
+    same shape as a validated instance. Only use this for data this service
+    wrote itself; validators and type coercion are skipped. Pydantic's compiled
+    validation is already fast for plain fields, so this mainly pays off for
+    models whose Python-level validators dominate the load time.
+
+    Args:
+        model: Pydantic model class
+        data: Parsed model dictionary
+
+    Returns:
+        Model instance
+    """
+    values = dict(data)
+    for name, convert in _field_plan(model):
+        if convert is not None and name in values and values[name] is not None:
+            values[name] = convert(values[name])
+    return model.model_construct(**values)
+
+def load_model(model: Type[BaseModel], data: Dict[str, Any], trusted: bool = False) -> BaseModel:
+    """
+    Build a model from parsed data
+
+    Args:
+        model: Pydantic model class
+        data: Parsed model dictionary
+        trusted: Skip validation (see construct_model)
+
+    Returns:
+        Model instance
+    """
+    if trusted:
+        return construct_model(model, data)
+    return model(**data)
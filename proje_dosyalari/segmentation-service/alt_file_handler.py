@@ -3,18 +3,27 @@ ALT File Handler Module for ALT_LAS Segmentation Service
 
 This module provides functionality for handling ALT files, including saving, loading,
 listing, and deleting ALT files. It implements the AltFileHandler class which manages
-ALT files in a specified directory.
+ALT files in a specified directory. Listing, searching and metadata lookups are served
+from a persistent metadata index that is kept in sync with the directory.
 """
 
 import os
-import json
-import yaml
+import time
+import logging
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 
 from dsl_schema import AltFile
 from custom_file_not_found_error import CustomFileNotFoundError
+from alt_file_index import AltFileIndex, normalize_metadata
+from alt_codecs import codec_for_path, get_codec
+
+# Configure logging
+logger = logging.getLogger("alt_file_handler")
+
+# Name of the metadata index database inside the ALT files directory
+INDEX_FILENAME = ".alt_index.db"
 
 # Singleton instance
 _alt_file_handler_instance = None
@@ -27,17 +36,156 @@ class AltFileHandler:
     It manages ALT files in a specified directory.
     """
     
-    def __init__(self, alt_files_dir: str):
+    def __init__(self, alt_files_dir: str, use_index: bool = True, index_path: Optional[str] = None,
+                 refresh_interval: float = 30.0):
         """
         Initialize the ALT file handler
         
         Args:
             alt_files_dir: Directory to store ALT files
+            use_index: Whether to serve listing, search and metadata from the metadata index
+            index_path: Path of the index database (default: .alt_index.db in alt_files_dir)
+            refresh_interval: Seconds after which the index is rechecked against file mtimes
+                even if the directory itself did not change
         """
         self.alt_files_dir = alt_files_dir
         
         # Create the directory if it doesn't exist
         os.makedirs(self.alt_files_dir, exist_ok=True)
+        
+        # Metadata index, synchronized with the directory on first use
+        self.index = None
+        self.refresh_interval = refresh_interval
+        self._index_dir_mtime = None
+        self._index_refreshed_at = 0.0
+        if use_index:
+            self.index = AltFileIndex(index_path or os.path.join(self.alt_files_dir, INDEX_FILENAME))
+    
+    @staticmethod
+    def _is_alt_filename(filename: str) -> bool:
+        """Check whether a filename has an ALT file extension"""
+        return filename.endswith(".alt.yaml") or filename.endswith(".alt.json")
+    
+    def _read_alt_dict(self, filename: str) -> Dict[str, Any]:
+        """
+        Parse an ALT file into a dictionary
+        
+        Args:
+            filename: Name of the file to read
+            
+        Returns:
+            Parsed ALT file dictionary
+            
+        Raises:
+            ValueError: If the file format is invalid
+        """
+        file_path = os.path.join(self.alt_files_dir, filename)
+        
+        codec = codec_for_path(filename)
+        if codec is None or codec.binary:
+            raise ValueError(f"Invalid file format: {filename}. Must end with .yaml or .json")
+        
+        with open(file_path, "rb") as f:
+            return codec.decode(f.read())
+    
+    @staticmethod
+    def _extract_metadata(alt_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the metadata summary of an ALT file dictionary
+        
+        Values are normalized to JSON types (e.g. YAML timestamps to ISO 8601
+        strings), so the summary is the same whether it comes from the file or
+        from the index.
+        
+        Args:
+            alt_dict: Parsed ALT file dictionary
+            
+        Returns:
+            Dictionary of metadata
+        """
+        return normalize_metadata({
+            "id": alt_dict.get("id"),
+            "command": alt_dict.get("command"),
+            "language": alt_dict.get("language"),
+            "mode": alt_dict.get("mode"),
+            "persona": alt_dict.get("persona"),
+            "segment_count": len(alt_dict.get("segments", [])),
+            "saved_at": alt_dict.get("saved_at"),
+            "metadata": alt_dict.get("metadata", {})
+        })
+    
+    def refresh_index(self) -> Dict[str, int]:
+        """
+        Synchronize the metadata index with the ALT files directory
+        
+        Files whose mtime or size differ from the index are reparsed, new files
+        are added and entries of removed files are dropped.
+        
+        Returns:
+            Counts of added/updated and removed entries
+        """
+        if self.index is None:
+            return {"updated": 0, "removed": 0}
+        
+        dir_mtime = os.stat(self.alt_files_dir).st_mtime_ns
+        indexed = self.index.get_file_stats()
+        
+        updates = []
+        seen = set()
+        with os.scandir(self.alt_files_dir) as entries:
+            for entry in entries:
+                if not self._is_alt_filename(entry.name) or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                if indexed.get(entry.name) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                
+                try:
+                    metadata = self._extract_metadata(self._read_alt_dict(entry.name))
+                except Exception as e:
+                    # Unreadable files are listed but never match a search
+                    logger.warning(f"Could not index ALT file {entry.name}: {e}")
+                    metadata = None
+                updates.append((entry.name, stat.st_mtime_ns, stat.st_size, metadata))
+        
+        removed = [filename for filename in indexed if filename not in seen]
+        
+        if updates:
+            self.index.upsert_many(updates)
+        if removed:
+            self.index.remove(removed)
+        
+        self._index_dir_mtime = dir_mtime
+        self._index_refreshed_at = time.monotonic()
+        
+        if updates or removed:
+            logger.info(f"Refreshed ALT file index: {len(updates)} updated, {len(removed)} removed")
+        
+        return {"updated": len(updates), "removed": len(removed)}
+    
+    def _ensure_index_fresh(self):
+        """Refresh the index if the directory changed or the refresh interval elapsed"""
+        dir_mtime = os.stat(self.alt_files_dir).st_mtime_ns
+        if (dir_mtime != self._index_dir_mtime or
+                time.monotonic() - self._index_refreshed_at > self.refresh_interval):
+            self.refresh_index()
+    
+    def _index_file(self, filename: str, alt_dict: Dict[str, Any], dir_mtime_before: int):
+        """
+        Update the index after this handler wrote a file
+        
+        Args:
+            filename: Name of the written file
+            alt_dict: Written ALT file dictionary
+            dir_mtime_before: Directory mtime before the write
+        """
+        stat = os.stat(os.path.join(self.alt_files_dir, filename))
+        self.index.upsert(filename, stat.st_mtime_ns, stat.st_size, self._extract_metadata(alt_dict))
+        
+        # Our own change does not require a rescan if the index was in sync before it
+        if dir_mtime_before == self._index_dir_mtime:
+            self._index_dir_mtime = os.stat(self.alt_files_dir).st_mtime_ns
     
     def save_alt_file(self, alt_file: AltFile, filename: Optional[str] = None, 
                      format: str = "yaml") -> str:
@@ -75,13 +223,15 @@ class AltFileHandler:
         
         # Create the file path
         file_path = os.path.join(self.alt_files_dir, filename)
+        dir_mtime_before = os.stat(self.alt_files_dir).st_mtime_ns
         
         # Save the file
-        with open(file_path, "w") as f:
-            if format == "yaml":
-                yaml.dump(alt_dict, f, default_flow_style=False, sort_keys=False)
-            else:  # format == "json"
-                json.dump(alt_dict, f, indent=2)
+        with open(file_path, "wb") as f:
+            f.write(get_codec(format).encode(alt_dict))
+        
+        # Keep the metadata index in sync
+        if self.index is not None:
+            self._index_file(filename, alt_dict, dir_mtime_before)
         
         return file_path
     
@@ -107,31 +257,46 @@ class AltFileHandler:
             raise CustomFileNotFoundError(f"ALT file not found: {filename}")
         
         # Load the file
-        with open(file_path, "r") as f:
-            if filename.endswith(".yaml"):
-                alt_dict = yaml.safe_load(f)
-            elif filename.endswith(".json"):
-                alt_dict = json.load(f)
-            else:
-                raise ValueError(f"Invalid file format: {filename}. Must end with .yaml or .json")
+        alt_dict = self._read_alt_dict(filename)
         
         # Convert dictionary to AltFile
         return AltFile(**alt_dict)
     
-    def list_alt_files(self) -> List[str]:
+    def list_alt_files(self, offset: int = 0, limit: Optional[int] = None) -> List[str]:
         """
         List all ALT files in the directory
         
+        Args:
+            offset: Number of files to skip
+            limit: Maximum number of files to return (None for all)
+            
         Returns:
-            List of ALT filenames
+            List of ALT filenames (in filename order when the index is used)
         """
+        if self.index is not None:
+            self._ensure_index_fresh()
+            return self.index.list_files(offset, limit)
+        
         # Get all files in the directory
         files = os.listdir(self.alt_files_dir)
         
         # Filter for ALT files
-        alt_files = [f for f in files if f.endswith(".alt.yaml") or f.endswith(".alt.json")]
+        alt_files = [f for f in files if self._is_alt_filename(f)]
         
-        return alt_files
+        return alt_files[offset:offset + limit if limit is not None else None]
+    
+    def count_alt_files(self) -> int:
+        """
+        Count the ALT files in the directory
+        
+        Returns:
+            Number of ALT files
+        """
+        if self.index is not None:
+            self._ensure_index_fresh()
+            return self.index.count()
+        
+        return len(self.list_alt_files())
     
     def delete_alt_file(self, filename: str) -> bool:
         """
@@ -151,14 +316,24 @@ class AltFileHandler:
             return False
         
         # Delete the file
+        dir_mtime_before = os.stat(self.alt_files_dir).st_mtime_ns
         os.remove(file_path)
         
+        # Keep the metadata index in sync
+        if self.index is not None:
+            self.index.remove([filename])
+            if dir_mtime_before == self._index_dir_mtime:
+                self._index_dir_mtime = os.stat(self.alt_files_dir).st_mtime_ns
+        
         return True
     
     def get_alt_file_metadata(self, filename: str) -> Dict[str, Any]:
         """
         Get metadata for an ALT file without loading the entire file
         
+        Metadata is served from the index when the file's mtime and size still
+        match the indexed entry; otherwise the file is parsed and reindexed.
+        
         Args:
             filename: Name of the file to get metadata for
             
@@ -173,42 +348,43 @@ class AltFileHandler:
         file_path = os.path.join(self.alt_files_dir, filename)
         
         # Check if the file exists
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             raise CustomFileNotFoundError(f"ALT file not found: {filename}")
         
-        # Load the file
-        with open(file_path, "r") as f:
-            if filename.endswith(".yaml"):
-                alt_dict = yaml.safe_load(f)
-            elif filename.endswith(".json"):
-                alt_dict = json.load(f)
-            else:
-                raise ValueError(f"Invalid file format: {filename}. Must end with .yaml or .json")
-        
-        # Extract metadata
-        metadata = {
-            "id": alt_dict.get("id"),
-            "command": alt_dict.get("command"),
-            "language": alt_dict.get("language"),
-            "mode": alt_dict.get("mode"),
-            "persona": alt_dict.get("persona"),
-            "segment_count": len(alt_dict.get("segments", [])),
-            "saved_at": alt_dict.get("saved_at"),
-            "metadata": alt_dict.get("metadata", {})
-        }
+        if self.index is not None:
+            entry = self.index.get_entry(filename)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size) and entry[2] is not None:
+                return entry[2]
+        
+        # Load the file and extract metadata
+        metadata = self._extract_metadata(self._read_alt_dict(filename))
+        
+        if self.index is not None and self._is_alt_filename(filename):
+            self.index.upsert(filename, stat.st_mtime_ns, stat.st_size, metadata)
         
         return metadata
     
-    def search_alt_files(self, query: str) -> List[str]:
+    def search_alt_files(self, query: str, offset: int = 0, limit: Optional[int] = None) -> List[str]:
         """
         Search for ALT files matching a query
         
+        A file matches if the query occurs (case-insensitively) in its metadata
+        or its filename. Files that cannot be parsed never match.
+        
         Args:
             query: Search query
+            offset: Number of matches to skip
+            limit: Maximum number of matches to return (None for all)
             
         Returns:
-            List of matching ALT filenames
+            List of matching ALT filenames (in filename order when the index is used)
         """
+        if self.index is not None:
+            self._ensure_index_fresh()
+            return self.index.search(query, offset, limit)
+        
         # Get all ALT files
         alt_files = self.list_alt_files()
         
@@ -228,7 +404,7 @@ class AltFileHandler:
                 # Skip files that can't be loaded
                 continue
         
-        return matching_files
+        return matching_files[offset:offset + limit if limit is not None else None]
     
     def validate_alt_file(self, alt_file: AltFile) -> bool:
         """
@@ -0,0 +1,288 @@
+"""
+ALT File Index Module for ALT_LAS Segmentation Service
+
+This module provides a persistent SQLite index of ALT file metadata. The ALT
+file handler keeps it in sync with the ALT files directory so that listing,
+searching and metadata lookups do not need to parse every file. Substring
+search is accelerated with an FTS5 trigram index when SQLite supports it.
+"""
+
+import datetime
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger('alt_file_index')
+
+# Separates metadata and filename in the search text. str() of parsed metadata
+# escapes newlines, so a query containing one can never match either part.
+_SEARCH_SEPARATOR = "\n"
+
+def _json_default(value: Any) -> Any:
+    """Convert values JSON cannot represent: dates to ISO 8601 strings, sets to lists, anything else to str"""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+def encode_metadata(metadata: Dict[str, Any]) -> str:
+    """
+    Serialize metadata for storage in the index
+
+    Args:
+        metadata: File metadata
+
+    Returns:
+        JSON text
+    """
+    return json.dumps(metadata, default=_json_default)
+
+def normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert metadata to the JSON types it has after a round trip through the index
+
+    Dates become ISO 8601 strings and tuples become lists, so metadata served
+    from the index is equal to metadata extracted from the file.
+
+    Args:
+        metadata: File metadata
+
+    Returns:
+        Metadata made of JSON types only
+    """
+    return json.loads(encode_metadata(metadata))
+
+def build_search_text(filename: str, metadata: Dict[str, Any]) -> str:
+    """
+    Build the lowercased text a search query is matched against
+
+    Args:
+        filename: ALT filename
+        metadata: Metadata as returned by AltFileHandler.get_alt_file_metadata
+
+    Returns:
+        Search text covering the metadata and the filename
+    """
+    return str(metadata).lower() + _SEARCH_SEPARATOR + filename.lower()
+
+class AltFileIndex:
+    """
+    SQLite-backed metadata and substring index for ALT files
+
+    Each row records the file's mtime and size at indexing time, so callers can
+    detect stale entries with a single stat call.
+    """
+
+    def __init__(self, index_path: str):
+        """
+        Open (or create) the index
+
+        Args:
+            index_path: Path of the SQLite database file
+        """
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(index_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.fts_enabled = False
+
+        self._init_db()
+
+    def _init_db(self):
+        """Create tables and, if available, the FTS5 trigram index"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS alt_files (
+                    id INTEGER PRIMARY KEY,
+                    filename TEXT UNIQUE NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    metadata TEXT,
+                    search_text TEXT
+                )
+            """)
+
+            try:
+                self._conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS alt_files_fts USING fts5(
+                        search_text, content='alt_files', content_rowid='id', tokenize='trigram'
+                    )
+                """)
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS alt_files_ai AFTER INSERT ON alt_files BEGIN
+                        INSERT INTO alt_files_fts(rowid, search_text) VALUES (new.id, new.search_text);
+                    END
+                """)
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS alt_files_ad AFTER DELETE ON alt_files BEGIN
+                        INSERT INTO alt_files_fts(alt_files_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+                    END
+                """)
+                self._conn.execute("""
+                    CREATE TRIGGER IF NOT EXISTS alt_files_au AFTER UPDATE ON alt_files BEGIN
+                        INSERT INTO alt_files_fts(alt_files_fts, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+                        INSERT INTO alt_files_fts(rowid, search_text) VALUES (new.id, new.search_text);
+                    END
+                """)
+                self.fts_enabled = True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 trigram index not available, using substring scans: {e}")
+
+    def get_file_stats(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Get the mtime and size recorded for every indexed file
+
+        Returns:
+            Dictionary mapping filename to (mtime_ns, size)
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT filename, mtime_ns, size FROM alt_files").fetchall()
+        return {filename: (mtime_ns, size) for filename, mtime_ns, size in rows}
+
+    def upsert_many(self, entries: Iterable[Tuple[str, int, int, Optional[Dict[str, Any]]]]):
+        """
+        Add or update index entries
+
+        Args:
+            entries: (filename, mtime_ns, size, metadata) tuples; metadata is None for unreadable files
+        """
+        rows = []
+        for filename, mtime_ns, size, metadata in entries:
+            if metadata is None:
+                rows.append((filename, mtime_ns, size, None, None))
+            else:
+                rows.append((
+                    filename, mtime_ns, size,
+                    encode_metadata(metadata),
+                    build_search_text(filename, metadata)
+                ))
+
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO alt_files (filename, mtime_ns, size, metadata, search_text) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(filename) DO UPDATE SET
+                    mtime_ns = excluded.mtime_ns, size = excluded.size,
+                    metadata = excluded.metadata, search_text = excluded.search_text
+            """, rows)
+
+    def upsert(self, filename: str, mtime_ns: int, size: int, metadata: Optional[Dict[str, Any]]):
+        """
+        Add or update a single index entry
+
+        Args:
+            filename: ALT filename
+            mtime_ns: File modification time in nanoseconds
+            size: File size in bytes
+            metadata: File metadata (None if the file could not be read)
+        """
+        self.upsert_many([(filename, mtime_ns, size, metadata)])
+
+    def remove(self, filenames: Iterable[str]):
+        """
+        Remove index entries
+
+        Args:
+            filenames: ALT filenames to remove
+        """
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM alt_files WHERE filename = ?", [(filename,) for filename in filenames])
+
+    def get_entry(self, filename: str) -> Optional[Tuple[int, int, Optional[Dict[str, Any]]]]:
+        """
+        Get the index entry of a file
+
+        Args:
+            filename: ALT filename
+
+        Returns:
+            (mtime_ns, size, metadata) tuple, or None if the file is not indexed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT mtime_ns, size, metadata FROM alt_files WHERE filename = ?", (filename,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        mtime_ns, size, metadata = row
+        return mtime_ns, size, json.loads(metadata) if metadata is not None else None
+
+    def count(self) -> int:
+        """
+        Count indexed files
+
+        Returns:
+            Number of indexed files
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM alt_files").fetchone()[0]
+
+    def list_files(self, offset: int = 0, limit: Optional[int] = None) -> List[str]:
+        """
+        List indexed files in filename order
+
+        Args:
+            offset: Number of files to skip
+            limit: Maximum number of files to return (None for all)
+
+        Returns:
+            List of ALT filenames
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT filename FROM alt_files ORDER BY filename LIMIT ? OFFSET ?",
+                (limit if limit is not None else -1, offset)
+            ).fetchall()
+        return [filename for filename, in rows]
+
+    def search(self, query: str, offset: int = 0, limit: Optional[int] = None) -> List[str]:
+        """
+        Find files whose metadata or filename contains a query (case-insensitive)
+
+        Args:
+            query: Search query
+            offset: Number of matches to skip
+            limit: Maximum number of matches to return (None for all)
+
+        Returns:
+            List of matching ALT filenames in filename order
+        """
+        needle = query.lower()
+        if _SEARCH_SEPARATOR in needle:
+            return []
+
+        limit = limit if limit is not None else -1
+
+        with self._lock:
+            if self.fts_enabled and len(needle) >= 3:
+                # The trigram index narrows candidates; instr keeps exact substring semantics
+                phrase = '"' + needle.replace('"', '""') + '"'
+                rows = self._conn.execute("""
+                    SELECT f.filename FROM alt_files_fts
+                    JOIN alt_files f ON f.id = alt_files_fts.rowid
+                    WHERE alt_files_fts MATCH ? AND instr(f.search_text, ?) > 0
+                    ORDER BY f.filename LIMIT ? OFFSET ?
+                """, (phrase, needle, limit, offset)).fetchall()
+            else:
+                rows = self._conn.execute("""
+                    SELECT filename FROM alt_files
+                    WHERE search_text IS NOT NULL AND instr(search_text, ?) > 0
+                    ORDER BY filename LIMIT ? OFFSET ?
+                """, (needle, limit, offset)).fetchall()
+
+        return [filename for filename, in rows]
+
+    def clear(self):
+        """Remove all index entries"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM alt_files")
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
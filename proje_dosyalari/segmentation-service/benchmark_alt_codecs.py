@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+ALT Codec Benchmark for ALT_LAS Segmentation Service
+
+Serializes and parses generated ALT files with thousands of segments and
+compares the codec layer (orjson, libyaml, MessagePack, trusted construction)
+with the previous pure-Python PyYAML / json + full validation path. Also
+times loading a YAML file without a known extension, which previously tried
+JSON first and then parsed again as YAML.
+
+Usage:
+    python benchmark_alt_codecs.py --segments 1000 10000
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import warnings
+from typing import Callable, Dict
+
+import yaml
+
+import alt_codecs
+from dsl_schema import (
+    AltFile, TaskParameter, TaskSegment, alt_to_json, alt_to_msgpack, alt_to_yaml,
+    json_to_alt, load_alt_file, msgpack_to_alt, yaml_to_alt
+)
+
+def generate_alt_file(segment_count: int, seed: int = 0) -> AltFile:
+    """
+    Generate a large ALT file
+
+    Args:
+        segment_count: Number of segments
+        seed: Random seed
+
+    Returns:
+        Generated ALT file
+    """
+    rng = random.Random(seed)
+    segments = []
+
+    for i in range(segment_count):
+        segments.append(TaskSegment(
+            id=f"task{i}",
+            task_type=rng.choice(["search", "create", "analyze", "transform"]),
+            content=f"Görev {i}: analyze the quarterly report and summarize the findings",
+            parameters=[
+                TaskParameter(name="query", value=f"report {i}", type="string", required=True),
+                TaskParameter(name="limit", value=rng.randint(1, 100), type="number")
+            ],
+            dependencies=[f"task{rng.randrange(i)}" for _ in range(min(i, 2))],
+            metadata={"confidence": rng.random(), "urgency": rng.choice(["low", "medium", "high"])}
+        ))
+
+    return AltFile(id=f"benchmark_{segment_count}", command="Benchmark command", language="en", segments=segments)
+
+def legacy_load(file_path: str) -> AltFile:
+    """Reference implementation: try JSON, then parse again as YAML"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        content = f.read()
+    try:
+        return AltFile(**json.loads(content))
+    except Exception:
+        return AltFile(**yaml.safe_load(content))
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """Return the best wall time of a call in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start_time)
+    return best * 1000
+
+def run_benchmark(segment_count: int, repeat: int) -> Dict[str, float]:
+    """
+    Benchmark legacy and codec serialization of one generated ALT file
+
+    Args:
+        segment_count: Number of segments
+        repeat: Number of runs per measurement (the best is reported)
+
+    Returns:
+        Timings in milliseconds and encoded sizes in bytes
+    """
+    alt_file = generate_alt_file(segment_count)
+    data = alt_file.dict()
+    yaml_str = alt_to_yaml(alt_file)
+    json_str = alt_to_json(alt_file)
+    packed = alt_to_msgpack(alt_file)
+
+    assert yaml_to_alt(yaml_str, trusted=True) == alt_file
+    assert msgpack_to_alt(packed, trusted=True) == alt_file
+
+    results = {
+        "yaml_dump_legacy": time_call(lambda: yaml.dump(data, sort_keys=False, default_flow_style=False), repeat),
+        "yaml_dump": time_call(lambda: alt_codecs.YamlCodec.dump(data), repeat),
+        "yaml_load_legacy": time_call(lambda: AltFile(**yaml.safe_load(yaml_str)), repeat),
+        "yaml_load": time_call(lambda: yaml_to_alt(yaml_str), repeat),
+        "yaml_load_trusted": time_call(lambda: yaml_to_alt(yaml_str, trusted=True), repeat),
+        "json_dump_legacy": time_call(lambda: json.dumps(data, indent=2), repeat),
+        "json_dump": time_call(lambda: alt_codecs.get_codec("json").encode(data), repeat),
+        "json_load_legacy": time_call(lambda: AltFile(**json.loads(json_str)), repeat),
+        "json_load": time_call(lambda: json_to_alt(json_str), repeat),
+        "json_load_trusted": time_call(lambda: json_to_alt(json_str, trusted=True), repeat),
+        "msgpack_dump": time_call(lambda: alt_codecs.get_codec("msgpack").encode(data), repeat),
+        "msgpack_load": time_call(lambda: msgpack_to_alt(packed), repeat),
+        "msgpack_load_trusted": time_call(lambda: msgpack_to_alt(packed, trusted=True), repeat),
+        "yaml_bytes": len(yaml_str.encode("utf-8")),
+        "json_bytes": len(json_str.encode("utf-8")),
+        "msgpack_bytes": len(packed)
+    }
+
+    directory = tempfile.mkdtemp()
+    try:
+        file_path = os.path.join(directory, "task.alt")
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(yaml_str)
+        results["sniff_load_legacy"] = time_call(lambda: legacy_load(file_path), repeat)
+        results["sniff_load"] = time_call(lambda: load_alt_file(file_path), repeat)
+    finally:
+        shutil.rmtree(directory)
+
+    return results
+
+def main():
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark ALT serialization codecs")
+    parser.add_argument("--segments", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore", DeprecationWarning)
+    print(f"orjson: {alt_codecs.orjson is not None}  msgpack: {alt_codecs.msgpack is not None}  "
+          f"yaml loader: {alt_codecs.YAML_LOADER.__name__}  yaml dumper: {alt_codecs.YAML_DUMPER.__name__}")
+
+    for segment_count in args.segments:
+        results = run_benchmark(segment_count, args.repeat)
+        print(f"\nsegments={segment_count}  sizes: yaml={results['yaml_bytes']:,} json={results['json_bytes']:,} "
+              f"msgpack={results['msgpack_bytes']:,} bytes")
+        for operation in ("yaml_dump", "yaml_load", "json_dump", "json_load", "sniff_load"):
+            legacy = results[f"{operation}_legacy"]
+            current = results[operation]
+            line = f"  {operation:<11} legacy={legacy:>9,.1f} ms  codec={current:>9,.1f} ms ({legacy / current:>5.1f}x)"
+            if f"{operation}_trusted" in results:
+                trusted = results[f"{operation}_trusted"]
+                line += f"  trusted={trusted:>9,.1f} ms ({legacy / trusted:>5.1f}x)"
+            print(line)
+        print(f"  msgpack     dump={results['msgpack_dump']:>9,.1f} ms  load={results['msgpack_load']:>9,.1f} ms  "
+              f"trusted={results['msgpack_load_trusted']:>9,.1f} ms")
+
+if __name__ == "__main__":
+    main()
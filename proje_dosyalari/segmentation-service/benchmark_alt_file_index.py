@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+ALT File Index Benchmark for ALT_LAS Segmentation Service
+
+Writes a directory of generated ALT files and compares listing and searching
+through the metadata index with the unindexed handler, which parses every
+file for each search. Also reports the cost of the initial index build and of
+a freshness check when nothing changed.
+
+Usage:
+    python benchmark_alt_file_index.py --files 1000 10000
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict
+
+from alt_file_handler import AltFileHandler
+
+COMMANDS = [
+    "Search for information about AI and create a report",
+    "Yapay zeka hakkında bilgi ara ve rapor oluştur",
+    "Analyze the sales data and send a summary",
+    "Translate the document into German"
+]
+
+def write_alt_files(directory: str, count: int):
+    """
+    Write generated ALT files directly (without going through the handler)
+
+    Args:
+        directory: Target directory
+        count: Number of files to write
+    """
+    for i in range(count):
+        alt_dict = {
+            "id": f"alt-{i}",
+            "command": f"{COMMANDS[i % len(COMMANDS)]} #{i}",
+            "language": "tr" if i % len(COMMANDS) == 1 else "en",
+            "mode": "Normal",
+            "persona": "researcher",
+            "segments": [{"id": f"s{j}", "task_type": "search", "content": "Task", "dependencies": []} for j in range(3)],
+            "metadata": {"source": "benchmark", "batch": i // 100}
+        }
+        with open(os.path.join(directory, f"task_{i:06d}.alt.json"), "w") as f:
+            json.dump(alt_dict, f)
+
+def time_call(func, repeat: int = 1) -> float:
+    """Return the average wall time of a call in milliseconds"""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start_time) / repeat * 1000
+
+def run_benchmark(count: int, searches: int) -> Dict[str, float]:
+    """
+    Benchmark indexed and unindexed handlers on one directory
+
+    Args:
+        count: Number of ALT files
+        searches: Number of indexed searches to average over
+
+    Returns:
+        Timings in milliseconds
+    """
+    directory = tempfile.mkdtemp()
+    try:
+        write_alt_files(directory, count)
+
+        indexed = AltFileHandler(directory)
+        plain = AltFileHandler(directory, use_index=False)
+
+        results = {
+            "index_build_ms": time_call(indexed.refresh_index),
+            "freshness_check_ms": time_call(indexed._ensure_index_fresh, repeat=100),
+            "indexed_search_ms": time_call(lambda: indexed.search_alt_files("sales data #12"), repeat=searches),
+            "indexed_page_ms": time_call(lambda: indexed.list_alt_files(offset=count // 2, limit=50), repeat=searches),
+            "plain_search_ms": time_call(lambda: plain.search_alt_files("sales data #12"))
+        }
+
+        assert sorted(plain.search_alt_files("sales data #12")) == indexed.search_alt_files("sales data #12")
+        indexed.index.close()
+        return results
+    finally:
+        shutil.rmtree(directory)
+
+def main():
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark the ALT file metadata index")
+    parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--searches", type=int, default=20)
+    args = parser.parse_args()
+
+    for count in args.files:
+        results = run_benchmark(count, args.searches)
+        speedup = results["plain_search_ms"] / results["indexed_search_ms"] if results["indexed_search_ms"] > 0 else 0
+        print(
+            f"files={count:<7} build={results['index_build_ms']:>9,.1f} ms  "
+            f"check={results['freshness_check_ms']:>6.3f} ms  "
+            f"search: plain={results['plain_search_ms']:>9,.1f} ms indexed={results['indexed_search_ms']:>7.2f} ms ({speedup:,.0f}x)  "
+            f"page={results['indexed_page_ms']:>6.2f} ms"
+        )
+
+if __name__ == "__main__":
+    main()
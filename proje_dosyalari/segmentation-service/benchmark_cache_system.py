@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Cache Backend Micro-Benchmark for ALT_LAS Segmentation Service
+
+Compares the simple dictionary-based MemoryCache with the sharded O(1) LRU
+ShardedMemoryCache at several cache sizes. Each run fills the cache to
+capacity and then performs a mixed get/set workload that forces evictions.
+With --disk, also compares DiskCache and PooledDiskCache read latency.
+
+Usage:
+    python benchmark_cache_system.py --sizes 10000 100000 1000000
+    python benchmark_cache_system.py --sizes 10000 --disk
+"""
+
+import argparse
+import json
+import logging
+import random
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+from enhanced_cache_system import CacheBackend, MemoryCache, ShardedMemoryCache, DiskCache, PooledDiskCache
+
+# Setup logging
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger("benchmark_cache_system")
+
+def run_workload(cache: CacheBackend, size: int, operations: int, threads: int) -> Dict[str, Any]:
+    """
+    Run a fill phase and a mixed read/write phase against a cache
+
+    Args:
+        cache: Cache backend to benchmark
+        size: Cache capacity (number of keys to preload)
+        operations: Number of mixed operations per thread
+        threads: Number of worker threads
+
+    Returns:
+        Dictionary with benchmark results
+    """
+    start_time = time.perf_counter()
+    for i in range(size):
+        cache.set(f"key{i}", i, ttl=3600)
+    fill_time = time.perf_counter() - start_time
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        key_space = size * 2
+        for _ in range(operations):
+            key = f"key{rng.randrange(key_space)}"
+            if cache.get(key) is None:
+                cache.set(key, key, ttl=3600)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start_time = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    mixed_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    cache.get_stats(include_items=False)
+    stats_time = time.perf_counter() - start_time
+
+    total_operations = operations * threads
+    return {
+        "fill_ops_per_sec": size / fill_time if fill_time > 0 else 0,
+        "mixed_ops_per_sec": total_operations / mixed_time if mixed_time > 0 else 0,
+        "stats_ms": stats_time * 1000
+    }
+
+def run_benchmark(sizes: List[int], operations: int, threads: int) -> Dict[str, Any]:
+    """
+    Benchmark both memory backends at each size
+
+    Args:
+        sizes: Cache sizes to benchmark
+        operations: Number of mixed operations per thread
+        threads: Number of worker threads
+
+    Returns:
+        Dictionary with results keyed by size and backend
+    """
+    results = {}
+
+    for size in sizes:
+        results[size] = {}
+        for backend_name, backend_class in (("simple_memory", MemoryCache), ("memory", ShardedMemoryCache)):
+            cache = backend_class(f"bench_{backend_name}", max_size=size)
+            results[size][backend_name] = run_workload(cache, size, operations, threads)
+            cache.clear()
+
+    return results
+
+def run_disk_benchmark(entries: int, reads: int) -> Dict[str, Any]:
+    """
+    Compare read latency of the disk cache backends
+
+    Args:
+        entries: Number of entries to preload
+        reads: Number of random reads to time
+
+    Returns:
+        Dictionary with results keyed by backend
+    """
+    results = {}
+    rng = random.Random(0)
+    keys = [f"key{rng.randrange(entries)}" for _ in range(reads)]
+    payload = {f"key{i}": {"index": i, "text": "x" * 64} for i in range(entries)}
+
+    for backend_name, backend_class in (("disk", DiskCache), ("disk_pooled", PooledDiskCache)):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            cache = backend_class("bench_disk", cache_dir=cache_dir, max_size_mb=1024)
+            cache.set_many(payload)
+
+            start_time = time.perf_counter()
+            for key in keys:
+                cache.get(key)
+            elapsed = time.perf_counter() - start_time
+
+            if isinstance(cache, PooledDiskCache):
+                cache.close()
+
+            results[backend_name] = {
+                "read_latency_us": elapsed / reads * 1_000_000,
+                "reads_per_sec": reads / elapsed if elapsed > 0 else 0
+            }
+        finally:
+            shutil.rmtree(cache_dir)
+
+    return results
+
+def main():
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark segmentation memory cache backends")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--operations", type=int, default=50_000, help="Mixed operations per thread")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--disk", action="store_true", help="Also benchmark disk cache read latency")
+    parser.add_argument("--disk-reads", type=int, default=2_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.operations, args.threads)
+
+    for size, backends in results.items():
+        print(f"size={size}")
+        for backend_name, metrics in backends.items():
+            print(
+                f"  {backend_name:<14} fill={metrics['fill_ops_per_sec']:>12,.0f} ops/s  "
+                f"mixed={metrics['mixed_ops_per_sec']:>12,.0f} ops/s  stats={metrics['stats_ms']:.2f} ms"
+            )
+
+    if args.disk:
+        disk_results = run_disk_benchmark(min(args.sizes), args.disk_reads)
+        print(f"disk entries={min(args.sizes)}")
+        for backend_name, metrics in disk_results.items():
+            print(
+                f"  {backend_name:<14} read={metrics['read_latency_us']:>10,.1f} us  "
+                f"throughput={metrics['reads_per_sec']:>12,.0f} reads/s"
+            )
+        results["disk"] = disk_results
+
+    logger.debug(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Command Parser Keyword Matching Benchmark for ALT_LAS Segmentation Service
+
+Compares the automaton-based keyword handling in CommandParser with the
+previous approach of running one regular expression per keyword. Commands are
+taken from the benchmark_test_*.alt.yaml files and optionally padded to
+simulate longer requests.
+
+Usage:
+    python benchmark_command_parser.py --iterations 2000 --repeat 1 5 20
+"""
+
+import argparse
+import glob
+import os
+import re
+import time
+from typing import Callable, Dict, List
+
+import yaml
+
+from command_parser import CommandParser
+
+def load_benchmark_commands(directory: str) -> List[str]:
+    """
+    Load commands from benchmark ALT files
+
+    Args:
+        directory: Directory containing benchmark_test_*.alt.yaml files
+
+    Returns:
+        List of commands
+    """
+    commands = []
+
+    for path in sorted(glob.glob(os.path.join(directory, "benchmark_test_*.alt.yaml"))):
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        commands.append(data["command"])
+
+    return commands
+
+def regex_split_into_subtasks(parser: CommandParser, sentence: str, language: str) -> List[str]:
+    """Reference implementation: one re.finditer per indicator"""
+    lp = parser.language_processor
+    all_indicators = lp.get_conjunction_indicators(language) + lp.get_alternative_indicators(language)
+
+    matches = []
+    for indicator in all_indicators:
+        for match in re.finditer(r'\b' + re.escape(indicator) + r'\b', sentence, re.IGNORECASE):
+            matches.append((match.start(), match.end()))
+
+    if not matches:
+        return [sentence.strip()]
+
+    matches.sort()
+    subtasks = []
+    last_split = 0
+    for start, end in matches:
+        subtask = sentence[last_split:start].strip()
+        if subtask:
+            subtasks.append(subtask)
+        last_split = end
+
+    remaining_subtask = sentence[last_split:].strip()
+    if remaining_subtask:
+        subtasks.append(remaining_subtask)
+
+    if len(subtasks) <= 1:
+        return [sentence.strip()]
+    return subtasks
+
+def regex_identify_task_type(parser: CommandParser, text: str, language: str) -> str:
+    """Reference implementation: linear membership checks per keyword"""
+    tokens_lower = [token.lower() for token in parser.language_processor.tokenize_by_language(text, language)]
+    text_lower = text.lower()
+
+    matches = {}
+    for task_type, keywords in parser.language_processor.get_task_keywords(language).items():
+        count = 0
+        for keyword in keywords:
+            keyword_lower = keyword.lower()
+            if keyword_lower in tokens_lower or keyword_lower in text_lower:
+                count += 1
+            elif ' ' in keyword_lower and all(word in tokens_lower for word in keyword_lower.split()):
+                count += 0.5
+        matches[task_type] = count
+
+    positive_matches = {k: v for k, v in matches.items() if v > 0}
+    return max(positive_matches.items(), key=lambda x: x[1])[0] if positive_matches else "execute"
+
+def regex_extract_content(parser: CommandParser, text: str, task_type: str, language: str) -> str:
+    """Reference implementation: one re.sub per keyword"""
+    content = text
+    for keyword in parser.language_processor.get_task_keywords(language).get(task_type, []):
+        content = re.sub(r'\b' + re.escape(keyword) + r'\b', '', content, flags=re.IGNORECASE).strip()
+    return content
+
+def time_pipeline(func: Callable[[str, str], None], commands: List[str], language: str, iterations: int) -> float:
+    """
+    Time a keyword pipeline over all commands
+
+    Args:
+        func: Function processing a single command
+        commands: Commands to process
+        language: Language code
+        iterations: Number of passes over the commands
+
+    Returns:
+        Commands processed per second
+    """
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        for command in commands:
+            func(command, language)
+    elapsed = time.perf_counter() - start_time
+
+    return iterations * len(commands) / elapsed if elapsed > 0 else 0
+
+def main():
+    """Run the benchmark from the command line"""
+    arg_parser = argparse.ArgumentParser(description="Benchmark command parser keyword matching")
+    arg_parser.add_argument("--iterations", type=int, default=2000)
+    arg_parser.add_argument("--repeat", type=int, nargs="+", default=[1, 5, 20],
+                            help="Number of times each command is repeated to simulate longer inputs")
+    arg_parser.add_argument("--language", default="tr")
+    args = arg_parser.parse_args()
+
+    parser = CommandParser()
+    base_commands = load_benchmark_commands(os.path.dirname(os.path.abspath(__file__)))
+
+    def automaton_pipeline(command: str, language: str):
+        for task_text in parser._split_into_subtasks(command, language):
+            task_type, _ = parser._identify_task_type(task_text, language, parser.language_processor.get_task_keywords(language))
+            parser._extract_parameters(task_text, task_type, language)
+
+    def regex_pipeline(command: str, language: str):
+        for task_text in regex_split_into_subtasks(parser, command, language):
+            task_type = regex_identify_task_type(parser, task_text, language)
+            regex_extract_content(parser, task_text, task_type, language)
+
+    results: Dict[int, Dict[str, float]] = {}
+    for repeat in args.repeat:
+        commands = [" ".join([command] * repeat) for command in base_commands]
+        iterations = max(1, args.iterations // repeat)
+        results[repeat] = {
+            "regex": time_pipeline(regex_pipeline, commands, args.language, iterations),
+            "automaton": time_pipeline(automaton_pipeline, commands, args.language, iterations)
+        }
+
+    for repeat, metrics in results.items():
+        speedup = metrics["automaton"] / metrics["regex"] if metrics["regex"] > 0 else 0
+        print(
+            f"repeat={repeat:<3} regex={metrics['regex']:>10,.0f} cmd/s  "
+            f"automaton={metrics['automaton']:>10,.0f} cmd/s  speedup={speedup:.2f}x"
+        )
+
+if __name__ == "__main__":
+    main()
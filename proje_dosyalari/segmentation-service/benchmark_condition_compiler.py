@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Condition Evaluation Benchmark for ALT_LAS Segmentation Service
+
+Evaluates enhanced DSL conditions over many loop items and compares the
+previous recursive interpreter with the compiled evaluator, called through
+evaluate_condition (cache lookup per call) and through evaluate_condition_batch.
+
+Usage:
+    python benchmark_condition_compiler.py --items 10000 --depth 1 3 5
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from enhanced_dsl_schema import Condition, ConditionOperator, evaluate_condition, evaluate_condition_batch
+
+def legacy_evaluate(condition: Condition, variables: Dict[str, Any]) -> bool:
+    """Reference implementation: walk the condition tree on every call"""
+    op = condition.operator
+
+    if op == ConditionOperator.NOT:
+        if isinstance(condition.left, Condition):
+            return not legacy_evaluate(condition.left, variables)
+        return not variables.get(condition.left, False)
+
+    left = condition.left
+    right = condition.right
+
+    if op in [ConditionOperator.AND, ConditionOperator.OR]:
+        left_result = legacy_evaluate(left, variables)
+        right_result = legacy_evaluate(right, variables)
+        if op == ConditionOperator.AND:
+            return left_result and right_result
+        return left_result or right_result
+
+    if isinstance(left, Condition):
+        left_val = legacy_evaluate(left, variables)
+    elif isinstance(left, str) and left in variables:
+        left_val = variables[left]
+    else:
+        left_val = left
+
+    if isinstance(right, Condition):
+        right_val = legacy_evaluate(right, variables)
+    elif isinstance(right, str) and right in variables:
+        right_val = variables[right]
+    else:
+        right_val = right
+
+    try:
+        if op == ConditionOperator.EQUAL:
+            return left_val == right_val
+        elif op == ConditionOperator.NOT_EQUAL:
+            return left_val != right_val
+        elif op == ConditionOperator.GREATER_THAN:
+            return left_val > right_val
+        elif op == ConditionOperator.LESS_THAN:
+            return left_val < right_val
+        elif op == ConditionOperator.GREATER_EQUAL:
+            return left_val >= right_val
+        elif op == ConditionOperator.LESS_EQUAL:
+            return left_val <= right_val
+        elif op == ConditionOperator.CONTAINS:
+            return right_val in left_val
+        elif op == ConditionOperator.NOT_CONTAINS:
+            return right_val not in left_val
+        elif op == ConditionOperator.STARTS_WITH:
+            return str(left_val).startswith(str(right_val))
+        elif op == ConditionOperator.ENDS_WITH:
+            return str(left_val).endswith(str(right_val))
+        raise ValueError(f"Unsupported operator: {op}")
+    except TypeError:
+        return False
+
+def build_condition(depth: int) -> Condition:
+    """
+    Build a balanced condition tree of the given depth
+
+    Leaves alternate between comparisons later in the if/elif chain
+    (ends_with, contains) and earlier ones (gte, neq).
+
+    Args:
+        depth: Number of AND/OR levels above the leaves
+
+    Returns:
+        Condition tree
+    """
+    if depth == 0:
+        return Condition(
+            operator=ConditionOperator.AND,
+            left=Condition(operator=ConditionOperator.ENDS_WITH, left="title", right="suffix"),
+            right=Condition(operator=ConditionOperator.GREATER_EQUAL, left="score", right="threshold")
+        )
+
+    return Condition(
+        operator=ConditionOperator.OR if depth % 2 else ConditionOperator.AND,
+        left=build_condition(depth - 1),
+        right=Condition(
+            operator=ConditionOperator.NOT,
+            left=Condition(operator=ConditionOperator.CONTAINS, left="tags", right="blocked")
+        )
+    )
+
+def time_call(func: Callable[[], Any]) -> float:
+    """Return the wall time of a call in milliseconds"""
+    start_time = time.perf_counter()
+    func()
+    return (time.perf_counter() - start_time) * 1000
+
+def main():
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark enhanced DSL condition evaluation")
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--depth", type=int, nargs="+", default=[0, 2, 4])
+    args = parser.parse_args()
+
+    variables_list: List[Dict[str, Any]] = [
+        {
+            "title": f"Item {i} suffix" if i % 3 else f"Item {i}",
+            "score": i % 10,
+            "threshold": 5,
+            "tags": ["blocked"] if i % 7 == 0 else ["ok"],
+            "suffix": "suffix"
+        }
+        for i in range(args.items)
+    ]
+
+    for depth in args.depth:
+        condition = build_condition(depth)
+        expected = [legacy_evaluate(condition, variables) for variables in variables_list]
+        assert evaluate_condition_batch(condition, variables_list) == expected
+
+        legacy_ms = time_call(lambda: [legacy_evaluate(condition, variables) for variables in variables_list])
+        cached_ms = time_call(lambda: [evaluate_condition(condition, variables) for variables in variables_list])
+        batch_ms = time_call(lambda: evaluate_condition_batch(condition, variables_list))
+
+        print(
+            f"depth={depth} items={args.items:<7} legacy={legacy_ms:>8.1f} ms  "
+            f"evaluate_condition={cached_ms:>8.1f} ms ({legacy_ms / cached_ms:.1f}x)  "
+            f"batch={batch_ms:>8.1f} ms ({legacy_ms / batch_ms:.1f}x)"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Language Detection Benchmark for ALT_LAS Segmentation Service
+
+Compares the compiled LanguageDetector with the previous approach of running
+every language pattern through re.findall on the full text. Inputs are a mix
+of English, Turkish, German, French, Spanish and Russian commands, optionally
+repeated to simulate longer requests. The detector is measured with its LRU
+cache disabled (every text scored) and enabled (repeated texts).
+
+Usage:
+    python benchmark_language_detector.py --iterations 2000 --repeat 1 10 100
+"""
+
+import argparse
+import re
+import time
+from typing import Callable, Dict, List
+
+from enhanced_language_processor import EnhancedLanguageProcessor
+from language_detector import LanguageDetector
+
+SAMPLE_COMMANDS = {
+    "en": "Search for the latest reports on renewable energy and create a summary with charts",
+    "tr": "Yapay zeka hakkında bilgi ara ve sonuçları içeren bir rapor oluştur",
+    "de": "Suche nach Informationen über das Wetter und erstelle eine Übersicht für die Woche",
+    "fr": "Recherche des informations sur le marché et crée un rapport très détaillé",
+    "es": "Busca información sobre el clima y crea un informe con más detalles",
+    "ru": "Найди информацию о погоде и создай подробный отчёт для команды"
+}
+
+def legacy_detect(language_patterns: Dict[str, List[str]], text: str) -> str:
+    """Reference implementation: one re.findall per pattern"""
+    scores = {language: 0 for language in language_patterns.keys()}
+    for language, patterns in language_patterns.items():
+        for pattern in patterns:
+            scores[language] += len(re.findall(pattern, text, re.IGNORECASE))
+
+    max_score = 0
+    detected_language = 'en'
+    for language, score in scores.items():
+        if score > max_score:
+            max_score = score
+            detected_language = language
+    return detected_language
+
+def time_detector(func: Callable[[str], str], texts: List[str], iterations: int) -> float:
+    """
+    Time a detection function over all texts
+
+    Args:
+        func: Function detecting the language of a single text
+        texts: Texts to detect
+        iterations: Number of passes over the texts
+
+    Returns:
+        Texts processed per second
+    """
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        for text in texts:
+            func(text)
+    elapsed = time.perf_counter() - start_time
+
+    return iterations * len(texts) / elapsed if elapsed > 0 else 0
+
+def main():
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark language detection")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, nargs="+", default=[1, 10, 100],
+                        help="Number of times each command is repeated to simulate longer inputs")
+    args = parser.parse_args()
+
+    language_patterns = EnhancedLanguageProcessor().language_patterns
+
+    for repeat in args.repeat:
+        texts = [" ".join([command] * repeat) for command in SAMPLE_COMMANDS.values()]
+        iterations = max(1, args.iterations // repeat)
+
+        uncached = LanguageDetector(language_patterns, cache_size=0)
+        cached = LanguageDetector(language_patterns)
+
+        legacy_rate = time_detector(lambda text: legacy_detect(language_patterns, text), texts, iterations)
+        compiled_rate = time_detector(uncached.detect, texts, iterations)
+        cached_rate = time_detector(cached.detect, texts, iterations)
+
+        agreement = sum(
+            legacy_detect(language_patterns, text) == uncached.detect(text) for text in texts
+        ) / len(texts)
+
+        print(
+            f"repeat={repeat:<4} legacy={legacy_rate:>10,.0f} texts/s  "
+            f"compiled={compiled_rate:>10,.0f} texts/s ({compiled_rate / legacy_rate:.1f}x)  "
+            f"cached={cached_rate:>10,.0f} texts/s  agreement={agreement:.0%}  "
+            f"early_exits={uncached.get_stats()['early_exits']}"
+        )
+
+if __name__ == "__main__":
+    main()
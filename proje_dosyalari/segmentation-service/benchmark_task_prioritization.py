@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Task Prioritization Benchmark for ALT_LAS Segmentation Service
+
+Prioritizes generated ALT files with thousands of segments and compares the
+graph-indexed TaskPrioritizer with the previous recursive-DFS ordering and
+nested-loop write-back. Also times incremental reprioritization of a single
+segment. Two dependency shapes are generated: a random DAG where each segment
+depends on a few earlier ones, and a single deep chain.
+
+Usage:
+    python benchmark_task_prioritization.py --segments 10000 --max-deps 3
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from typing import Dict, List
+
+from dsl_schema import AltFile, TaskSegment
+from task_prioritization import TaskPrioritizer
+
+def generate_alt_file(segment_count: int, max_dependencies: int, chain: bool, seed: int = 0) -> AltFile:
+    """
+    Generate an ALT file with a dependency graph
+
+    Args:
+        segment_count: Number of segments
+        max_dependencies: Maximum dependencies per segment (random DAG only)
+        chain: Generate one deep chain instead of a random DAG
+        seed: Random seed
+
+    Returns:
+        Generated ALT file
+    """
+    rng = random.Random(seed)
+    segments = []
+
+    for i in range(segment_count):
+        if chain:
+            dependencies = [f"task{i - 1}"] if i > 0 else []
+        else:
+            dependencies = [f"task{rng.randrange(i)}" for _ in range(rng.randint(0, min(i, max_dependencies)))]
+
+        segments.append(TaskSegment(
+            id=f"task{i}",
+            task_type=rng.choice(["search", "create", "analyze", "transform"]),
+            content=f"Task {i}",
+            dependencies=dependencies,
+            metadata={"confidence": rng.random(), "urgency": rng.choice(["low", "medium", "high"])}
+        ))
+
+    return AltFile(id=f"benchmark_{segment_count}", command="Benchmark command", language="en", segments=segments)
+
+def legacy_execution_order(alt_file: AltFile) -> Dict[str, int]:
+    """Reference implementation: recursive DFS with priority tie-breaking and nested write-back"""
+    dependency_graph = {segment.id: segment.dependencies for segment in alt_file.segments}
+    execution_order = {}
+    visited = set()
+    temp_visited = set()
+    order = 1
+
+    def visit(segment_id):
+        nonlocal order
+        if segment_id in temp_visited or segment_id in visited:
+            return
+        temp_visited.add(segment_id)
+        for dependency in dependency_graph.get(segment_id, []):
+            visit(dependency)
+        visited.add(segment_id)
+        temp_visited.remove(segment_id)
+        execution_order[segment_id] = order
+        order += 1
+
+    for segment in sorted(alt_file.segments, key=lambda s: s.metadata.get("priority_score", 0), reverse=True):
+        if segment.id not in visited:
+            visit(segment.id)
+
+    max_order = max(execution_order.values())
+    for segment_id in execution_order:
+        execution_order[segment_id] = max_order - execution_order[segment_id] + 1
+
+    for segment_id, order in execution_order.items():
+        for segment in alt_file.segments:
+            if segment.id == segment_id:
+                segment.metadata["execution_order"] = order
+                break
+
+    return execution_order
+
+def run_benchmark(segment_count: int, max_dependencies: int, chain: bool, updates: int) -> Dict[str, float]:
+    """
+    Benchmark full and incremental prioritization of one generated ALT file
+
+    Args:
+        segment_count: Number of segments
+        max_dependencies: Maximum dependencies per segment
+        chain: Generate one deep chain instead of a random DAG
+        updates: Number of single-segment updates to time
+
+    Returns:
+        Timings in milliseconds (None where the legacy ordering failed)
+    """
+    prioritizer = TaskPrioritizer()
+    alt_file = generate_alt_file(segment_count, max_dependencies, chain)
+    results: Dict[str, float] = {}
+
+    start_time = time.perf_counter()
+    prioritizer.prioritize_alt_file(alt_file)
+    results["full_ms"] = (time.perf_counter() - start_time) * 1000
+
+    try:
+        start_time = time.perf_counter()
+        legacy_execution_order(alt_file)
+        results["legacy_order_ms"] = (time.perf_counter() - start_time) * 1000
+    except RecursionError:
+        results["legacy_order_ms"] = None
+
+    # Restore the current ordering before timing incremental updates
+    prioritizer.prioritize_alt_file(alt_file)
+
+    rng = random.Random(1)
+    start_time = time.perf_counter()
+    for _ in range(updates):
+        segment = alt_file.segments[rng.randrange(segment_count)]
+        segment.metadata["urgency"] = rng.choice(["low", "medium", "high"])
+        prioritizer.reprioritize_segment(alt_file, segment.id)
+    results["incremental_ms"] = (time.perf_counter() - start_time) * 1000 / max(1, updates)
+
+    return results
+
+def main():
+    """Run the benchmark from the command line"""
+    parser = argparse.ArgumentParser(description="Benchmark task prioritization on large ALT files")
+    parser.add_argument("--segments", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--max-deps", type=int, default=3)
+    parser.add_argument("--updates", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.getLogger("task-prioritization").setLevel(logging.WARNING)
+    print(f"recursion limit: {sys.getrecursionlimit()}")
+
+    for segment_count in args.segments:
+        for chain in (False, True):
+            results = run_benchmark(segment_count, args.max_deps, chain, args.updates)
+            legacy = f"{results['legacy_order_ms']:>10,.1f} ms" if results["legacy_order_ms"] is not None else "RecursionError"
+            print(
+                f"segments={segment_count:<6} shape={'chain' if chain else 'dag':<5} "
+                f"full={results['full_ms']:>10,.1f} ms  legacy_order={legacy}  "
+                f"incremental={results['incremental_ms']:>8,.2f} ms/update"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ import logging
 
 from language_processor import get_language_processor
 from dsl_schema import AltFile, TaskSegment, TaskParameter
+from keyword_matcher import get_task_keyword_index
 
 # Configure logging
 logger = logging.getLogger('command_parser')
@@ -144,11 +145,8 @@ class CommandParser:
             List of subtask texts
         """
         # Get language-specific indicators
-        conjunction_indicators = self.language_processor.get_conjunction_indicators(language)
-        alternative_indicators = self.language_processor.get_alternative_indicators(language)
-        
-        # Combine all indicators
-        all_indicators = conjunction_indicators + alternative_indicators
+        keyword_index = self.language_processor.get_keyword_index(language)
+        all_indicators = keyword_index.split_indicators
         
         if not all_indicators:
             return [sentence.strip()]
@@ -156,19 +154,16 @@ class CommandParser:
         subtasks = []
         last_split = 0
         
-        # Find all occurrences of indicators with their positions
-        matches = []
-        for indicator in all_indicators:
-            # Use finditer to get match objects
-            for match in re.finditer(r'\b' + re.escape(indicator) + r'\b', sentence, re.IGNORECASE):
-                matches.append((match.start(), match.end()))
+        # Find all occurrences of indicators with their positions in a single pass
+        matches = [
+            (start, end)
+            for start, end, keyword in keyword_index.automaton.find_words(sentence)
+            if keyword in all_indicators
+        ]
 
         if not matches:
             return [sentence.strip()]
 
-        # Sort matches by start position to process them in order
-        matches.sort()
-
         # Split sentence based on matches
         for start, end in matches:
             # Add the part before the indicator
@@ -205,23 +200,26 @@ class CommandParser:
         tokens = self.language_processor.tokenize_by_language(text, language)
         
         # Convert tokens to lowercase for case-insensitive matching
-        tokens_lower = [token.lower() for token in tokens]
+        tokens_lower = {token.lower() for token in tokens}
         text_lower = text.lower()
         
+        # Find every keyword contained in the text in one pass
+        keyword_index = self.language_processor.get_keyword_index(language)
+        if task_keywords is not keyword_index.task_keywords:
+            # Keyword lists not owned by the processor: use an index cached by their content
+            keyword_index = get_task_keyword_index(task_keywords)
+        found_keywords = keyword_index.automaton.find_substrings(text_lower)
+        
         # Count matches for each task type
         matches = {}
-        for task_type, keywords in task_keywords.items():
+        for task_type, entries in keyword_index.task_keyword_entries.items():
             count = 0
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                # Check for exact matches
-                if keyword_lower in tokens_lower:
-                    count += 1
-                # Check for keyword in original text (for phrases)
-                elif keyword_lower in text_lower:
+            for keyword_lower, keyword_folded, words in entries:
+                # Check for exact matches or keyword in original text (for phrases)
+                if keyword_lower in tokens_lower or keyword_folded in found_keywords:
                     count += 1
                 # Check for partial matches (for multi-word keywords)
-                elif ' ' in keyword_lower and all(word in tokens_lower for word in keyword_lower.split()):
+                elif words and all(word in tokens_lower for word in words):
                     count += 0.5
             
             matches[task_type] = count
@@ -260,13 +258,14 @@ class CommandParser:
             List of task parameters
         """
         parameters = []
+        task_keywords = self.language_processor.get_task_keywords(language)
+        keyword_index = self.language_processor.get_keyword_index(language)
+        automaton = keyword_index.automaton
         
         # Different parameter extraction based on task type
         if task_type == "search":
             # Extract query parameter
-            query = text
-            for keyword in self.language_processor.get_task_keywords(language).get("search", []):
-                query = re.sub(r'\b' + re.escape(keyword) + r'\b', '', query, flags=re.IGNORECASE).strip()
+            query = automaton.remove_words(text, task_keywords.get("search", []))
             
             parameters.append(TaskParameter(
                 name="query",
@@ -279,9 +278,9 @@ class CommandParser:
         elif task_type == "create":
             # Extract format parameter if present
             format_match = None
-            for format_keyword in self.language_processor.get_context_keywords(language).get("format", []):
-                match = re.search(r'\b' + re.escape(format_keyword) + r'\b', text, re.IGNORECASE)
-                if match:
+            found_words = {keyword for _, _, keyword in automaton.find_words(text)}
+            for format_keyword, format_folded in keyword_index.format_keywords:
+                if format_folded in found_words:
                     format_match = format_keyword
                     break
             
@@ -294,14 +293,13 @@ class CommandParser:
                     description="Output format"
                 ))
             
-            # Extract title parameter
-            title = text
-            for keyword in self.language_processor.get_task_keywords(language).get("create", []):
-                title = re.sub(r'\b' + re.escape(keyword) + r'\b', '', title, flags=re.IGNORECASE).strip()
-            
-            # Remove format if found and clean up extra spaces
+            # Extract title parameter, removing the format if found
+            removable_keywords = list(task_keywords.get("create", []))
             if format_match:
-                title = re.sub(r'\b' + re.escape(format_match) + r'\b', '', title, flags=re.IGNORECASE).strip()
+                removable_keywords.append(format_match)
+            title = automaton.remove_words(text, removable_keywords)
+            
+            # Clean up extra spaces
             title = re.sub(r'\s+', ' ', title).strip() # Replace multiple spaces with single space
             
             parameters.append(TaskParameter(
@@ -314,9 +312,7 @@ class CommandParser:
             
         elif task_type == "analyze":
             # Extract subject parameter
-            subject = text
-            for keyword in self.language_processor.get_task_keywords(language).get("analyze", []):
-                subject = re.sub(r'\b' + re.escape(keyword) + r'\b', '', subject, flags=re.IGNORECASE).strip()
+            subject = automaton.remove_words(text, task_keywords.get("analyze", []))
             
             parameters.append(TaskParameter(
                 name="subject",
@@ -328,9 +324,7 @@ class CommandParser:
             
         elif task_type == "open":
             # Extract target parameter
-            target = text
-            for keyword in self.language_processor.get_task_keywords(language).get("open", []):
-                target = re.sub(r'\b' + re.escape(keyword) + r'\b', '', target, flags=re.IGNORECASE).strip()
+            target = automaton.remove_words(text, task_keywords.get("open", []))
             
             parameters.append(TaskParameter(
                 name="target",
@@ -343,9 +337,8 @@ class CommandParser:
         else:
             # For other task types, extract a generic content parameter
             content = text
-            if task_type in self.language_processor.get_task_keywords(language):
-                for keyword in self.language_processor.get_task_keywords(language).get(task_type, []):
-                    content = re.sub(r'\b' + re.escape(keyword) + r'\b', '', content, flags=re.IGNORECASE).strip()
+            if task_type in task_keywords:
+                content = automaton.remove_words(content, task_keywords.get(task_type, []))
             
             parameters.append(TaskParameter(
                 name="content",
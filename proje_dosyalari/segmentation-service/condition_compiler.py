@@ -0,0 +1,287 @@
+"""
+Condition Compiler Module for ALT_LAS Segmentation Service
+
+This module compiles enhanced DSL conditions into nested Python closures.
+Operators are dispatched through lookup tables and variable names, including
+dotted paths such as "result.title", are split once at compile time, so
+evaluating a condition repeatedly (for example inside a loop) does not walk
+the Pydantic model tree again.
+
+Compiled conditions are cached per condition object. Assigning a field of any
+condition calls condition_changed, which bumps a generation counter; a cached
+entry from an older generation is checked against its tree once and
+recompiled if a node of that tree was reassigned.
+"""
+
+import logging
+import operator
+import threading
+import weakref
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from pydantic import BaseModel
+
+# Configure logging
+logger = logging.getLogger('condition_compiler')
+
+Evaluator = Callable[[Dict[str, Any]], Any]
+
+_MISSING = object()
+
+def _contains(left: Any, right: Any) -> bool:
+    return right in left
+
+def _not_contains(left: Any, right: Any) -> bool:
+    return right not in left
+
+def _starts_with(left: Any, right: Any) -> bool:
+    return str(left).startswith(str(right))
+
+def _ends_with(left: Any, right: Any) -> bool:
+    return str(left).endswith(str(right))
+
+# ConditionOperator is a str enum, so its members hash and compare like these keys
+BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "gt": operator.gt,
+    "lt": operator.lt,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "contains": _contains,
+    "not_contains": _not_contains,
+    "starts_with": _starts_with,
+    "ends_with": _ends_with
+}
+
+def _lookup_path(value: Any, path: Tuple[str, ...]) -> Any:
+    """
+    Follow a pre-split attribute path through dicts, sequences and objects
+
+    Args:
+        value: Root value
+        path: Path segments after the root variable name
+
+    Returns:
+        Resolved value, or _MISSING if any segment does not exist
+    """
+    for part in path:
+        if isinstance(value, Mapping):
+            value = value.get(part, _MISSING)
+        elif isinstance(value, (list, tuple)) and part.lstrip("-").isdigit():
+            index = int(part)
+            value = value[index] if -len(value) <= index < len(value) else _MISSING
+        else:
+            value = getattr(value, part, _MISSING)
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+def _compile_name(name: str, default: Any) -> Evaluator:
+    """
+    Compile a variable reference
+
+    A name that is a variable resolves to its value. Otherwise a dotted name
+    whose first segment is a variable resolves through that variable, and
+    anything else evaluates to the default.
+
+    Args:
+        name: Variable name or dotted path
+        default: Value used when the name does not resolve
+
+    Returns:
+        Evaluator returning the resolved value
+    """
+    if "." not in name:
+        return lambda variables: variables.get(name, default)
+
+    root, *rest = name.split(".")
+    path = tuple(rest)
+
+    def resolve(variables: Dict[str, Any]) -> Any:
+        if name in variables:
+            return variables[name]
+        if root in variables:
+            value = _lookup_path(variables[root], path)
+            if value is not _MISSING:
+                return value
+        return default
+
+    return resolve
+
+class CompiledCondition:
+    """
+    A condition compiled into a closure
+
+    Call the instance with a variables dictionary to evaluate the condition,
+    or use evaluate_many to evaluate it over several dictionaries.
+    """
+
+    __slots__ = ("_evaluate", "_snapshot")
+
+    def __init__(self, condition: BaseModel):
+        """
+        Compile a condition
+
+        Args:
+            condition: Condition model (operator, left, right)
+        """
+        self._snapshot: List[Tuple[Any, Any, Any]] = []
+        self._evaluate = self._compile(condition)
+
+    def __call__(self, variables: Dict[str, Any]) -> bool:
+        return self._evaluate(variables)
+
+    def evaluate_many(self, variables_list: Sequence[Dict[str, Any]]) -> List[bool]:
+        """
+        Evaluate the condition over several variable dictionaries
+
+        Args:
+            variables_list: Variable dictionaries, e.g. one per for_each item
+
+        Returns:
+            Result for each dictionary, in order
+        """
+        evaluate = self._evaluate
+        return [evaluate(variables) for variables in variables_list]
+
+    def is_current(self, condition: BaseModel) -> bool:
+        """
+        Check that no node of the condition tree was reassigned since compiling
+
+        Only needed after condition_changed; compile_condition skips it otherwise.
+
+        Args:
+            condition: Condition this instance was compiled from
+
+        Returns:
+            True if the compiled closure still matches the condition
+        """
+        snapshot = self._snapshot
+        index = 0
+        stack = [condition]
+
+        # Walk the tree in compile order, comparing each node's fields by identity
+        while stack:
+            node = stack.pop()
+            if index == len(snapshot):
+                return False
+            op, left, right = snapshot[index]
+            index += 1
+            if node.operator is not op or node.left is not left or node.right is not right:
+                return False
+            if op != "not" and isinstance(right, BaseModel):
+                stack.append(right)
+            if isinstance(left, BaseModel):
+                stack.append(left)
+
+        return index == len(snapshot)
+
+    def _compile(self, condition: BaseModel) -> Evaluator:
+        """Compile one condition node and, recursively, its operands"""
+        op, left, right = condition.operator, condition.left, condition.right
+        self._snapshot.append((op, left, right))
+
+        if op == "not":
+            operand = self._compile_operand(left, default=False)
+            return lambda variables: not operand(variables)
+
+        if op in ("and", "or"):
+            left_eval = self._compile_operand(left)
+            right_eval = self._compile_operand(right)
+            if op == "and":
+                return lambda variables: bool(left_eval(variables)) and bool(right_eval(variables))
+            return lambda variables: bool(left_eval(variables)) or bool(right_eval(variables))
+
+        compare = BINARY_OPERATORS.get(op)
+        if compare is None:
+            def unsupported(variables: Dict[str, Any]) -> bool:
+                logger.error(f"Error evaluating condition: Unsupported operator: {op}")
+                return False
+            return unsupported
+
+        left_eval = self._compile_operand(left)
+        right_eval = self._compile_operand(right)
+
+        def evaluate(variables: Dict[str, Any]) -> Any:
+            try:
+                return compare(left_eval(variables), right_eval(variables))
+            except TypeError:
+                # Handle type errors during comparison gracefully
+                return False
+            except Exception as e:
+                logger.error(f"Error evaluating condition: {e}")
+                return False
+
+        return evaluate
+
+    def _compile_operand(self, operand: Any, default: Any = _MISSING) -> Evaluator:
+        """
+        Compile an operand: a nested condition, a variable reference or a literal
+
+        Args:
+            operand: Operand value
+            default: Value for unresolved names (the name itself if omitted)
+
+        Returns:
+            Evaluator returning the operand value
+        """
+        if isinstance(operand, BaseModel):
+            return self._compile(operand)
+        if isinstance(operand, str):
+            return _compile_name(operand, operand if default is _MISSING else default)
+        value = operand if default is _MISSING else default
+        return lambda variables: value
+
+# Compiled conditions keyed by id(), with the generation they were last validated in;
+# entries are dropped when the condition is garbage collected
+_compiled_conditions: Dict[int, Tuple["weakref.ref[BaseModel]", CompiledCondition, int]] = {}
+_generation = 0
+# Reentrant: a weakref callback may run during a compile while the lock is held
+_cache_lock = threading.RLock()
+
+def _forget(key: int) -> Callable[[Any], None]:
+    def forget(ref: "weakref.ref[BaseModel]") -> None:
+        with _cache_lock:
+            entry = _compiled_conditions.get(key)
+            if entry is not None and entry[0] is ref:
+                del _compiled_conditions[key]
+    return forget
+
+def condition_changed():
+    """Invalidate cached compiled conditions after a condition field was assigned"""
+    global _generation
+    with _cache_lock:
+        _generation += 1
+
+def compile_condition(condition: BaseModel) -> CompiledCondition:
+    """
+    Get the compiled form of a condition, compiling it on first use
+
+    Args:
+        condition: Condition model
+
+    Returns:
+        Compiled condition
+    """
+    key = id(condition)
+    with _cache_lock:
+        entry = _compiled_conditions.get(key)
+        if entry is not None and entry[0]() is condition:
+            ref, compiled, generation = entry
+            if generation == _generation:
+                return compiled
+            # Some condition changed since; reuse the closure if it was not this one
+            if compiled.is_current(condition):
+                _compiled_conditions[key] = (ref, compiled, _generation)
+                return compiled
+
+        compiled = CompiledCondition(condition)
+        _compiled_conditions[key] = (weakref.ref(condition, _forget(key)), compiled, _generation)
+        return compiled
+
+def clear_condition_cache():
+    """Drop all cached compiled conditions"""
+    with _cache_lock:
+        _compiled_conditions.clear()
@@ -7,8 +7,7 @@ providing a structured format for command segmentation and processing.
 
 from typing import Dict, List, Any, Optional, Union
 from pydantic import BaseModel, Field, validator
-import yaml
-import json
+from alt_codecs import YamlCodec, codec_for_path, decode_bytes, get_codec, load_model
 import uuid
 import datetime
 
@@ -69,7 +68,7 @@ def alt_to_yaml(alt_file: AltFile) -> str:
     Returns:
         YAML string representation
     """
-    return yaml.dump(alt_file.dict(), sort_keys=False, default_flow_style=False)
+    return YamlCodec.dump(alt_file.dict())
 
 def alt_to_json(alt_file: AltFile) -> str:
     """
@@ -81,33 +80,60 @@ def alt_to_json(alt_file: AltFile) -> str:
     Returns:
         JSON string representation
     """
-    return json.dumps(alt_file.dict(), indent=2)
+    return get_codec("json").encode(alt_file.dict()).decode("utf-8")
 
-def yaml_to_alt(yaml_str: str) -> AltFile:
+def yaml_to_alt(yaml_str: str, trusted: bool = False) -> AltFile:
     """
     Convert YAML string to ALT file object
     
     Args:
         yaml_str: YAML string
+        trusted: Skip validation for data this service wrote itself
         
     Returns:
         ALT file object
     """
-    data = yaml.safe_load(yaml_str)
-    return AltFile(**data)
+    data = get_codec("yaml").decode(yaml_str)
+    return load_model(AltFile, data, trusted)
 
-def json_to_alt(json_str: str) -> AltFile:
+def json_to_alt(json_str: str, trusted: bool = False) -> AltFile:
     """
     Convert JSON string to ALT file object
     
     Args:
         json_str: JSON string
+        trusted: Skip validation for data this service wrote itself
         
     Returns:
         ALT file object
     """
-    data = json.loads(json_str)
-    return AltFile(**data)
+    data = get_codec("json").decode(json_str)
+    return load_model(AltFile, data, trusted)
+
+def alt_to_msgpack(alt_file: AltFile) -> bytes:
+    """
+    Convert ALT file to the binary MessagePack format
+    
+    Args:
+        alt_file: ALT file object
+        
+    Returns:
+        MessagePack bytes
+    """
+    return get_codec("msgpack").encode(alt_file.dict())
+
+def msgpack_to_alt(data: bytes, trusted: bool = False) -> AltFile:
+    """
+    Convert MessagePack bytes to ALT file object
+    
+    Args:
+        data: MessagePack bytes
+        trusted: Skip validation for data this service wrote itself
+        
+    Returns:
+        ALT file object
+    """
+    return load_model(AltFile, get_codec("msgpack").decode(data), trusted)
 
 def save_alt_file(alt_file: AltFile, file_path: str, format: str = "yaml") -> None:
     """
@@ -116,44 +142,43 @@ def save_alt_file(alt_file: AltFile, file_path: str, format: str = "yaml") -> No
     Args:
         alt_file: ALT file object
         file_path: Path to save the file
-        format: Format to save the file in (yaml or json)
+        format: Format to save the file in (yaml, json or msgpack)
     """
-    if format.lower() == "yaml":
-        content = alt_to_yaml(alt_file)
-    elif format.lower() == "json":
-        content = alt_to_json(alt_file)
-    else:
-        raise ValueError("Format must be either 'yaml' or 'json'")
+    if format.lower() not in ("yaml", "json", "msgpack"):
+        raise ValueError("Format must be one of 'yaml', 'json' or 'msgpack'")
+    content = get_codec(format).encode(alt_file.dict())
     
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with open(file_path, 'wb') as f:
         f.write(content)
 
-def load_alt_file(file_path: str) -> AltFile:
+def load_alt_file(file_path: str, trusted: bool = False) -> AltFile:
     """
     Load ALT file from disk
     
+    The format is chosen by extension (.yaml/.yml, .json, .altb) or, for
+    other extensions, by sniffing the first bytes, so the file is parsed once.
+    
     Args:
         file_path: Path to the file
+        trusted: Skip validation for files this service wrote itself
         
     Returns:
         ALT file object
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
+    with open(file_path, 'rb') as f:
         content = f.read()
     
-    if file_path.endswith('.yaml') or file_path.endswith('.yml'):
-        return yaml_to_alt(content)
-    elif file_path.endswith('.json'):
-        return json_to_alt(content)
-    else:
-        # Try to determine format from content
-        try:
-            return json_to_alt(content)
-        except:
-            try:
-                return yaml_to_alt(content)
-            except:
-                raise ValueError("Could not determine file format. Use .yaml or .json extension.")
+    codec = codec_for_path(file_path)
+    if codec is not None:
+        return load_model(AltFile, codec.decode(content), trusted)
+    
+    try:
+        data = decode_bytes(content)
+    except Exception:
+        raise ValueError("Could not determine file format. Use .yaml, .json or .altb extension.")
+    if not isinstance(data, dict):
+        raise ValueError("Could not determine file format. Use .yaml, .json or .altb extension.")
+    return load_model(AltFile, data, trusted)
 
 # Example usage
 if __name__ == "__main__":
@@ -14,6 +14,8 @@ import pickle
 import logging
 import threading
 import functools
+import heapq
+from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Tuple, TypeVar, Optional, Union
 from datetime import datetime, timedelta
 import sqlite3
@@ -156,14 +158,55 @@ class CacheBackend:
         """
         raise NotImplementedError("Subclasses must implement clear()")
     
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self, include_items: bool = True) -> Dict[str, Any]:
         """
         Get cache statistics
         
+        Args:
+            include_items: Whether to include per-item details
+            
         Returns:
             Dictionary with cache statistics
         """
         raise NotImplementedError("Subclasses must implement get_stats()")
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get multiple values from cache
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dictionary of found keys to cached values (missing keys are omitted)
+        """
+        results = {}
+        
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                results[key] = value
+        
+        return results
+    
+    def set_many(self, items: Dict[str, Any], ttl: int = None) -> bool:
+        """
+        Set multiple values in cache
+        
+        Args:
+            items: Dictionary of cache keys to values
+            ttl: Time to live in seconds (None for no expiration)
+            
+        Returns:
+            True if all values were stored, False otherwise
+        """
+        success = True
+        
+        for key, value in items.items():
+            if not self.set(key, value, ttl):
+                success = False
+        
+        return success
 
 class MemoryCache(CacheBackend):
     """In-memory cache backend"""
@@ -278,10 +321,13 @@ class MemoryCache(CacheBackend):
             self.cache.clear()
             return True
     
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self, include_items: bool = True) -> Dict[str, Any]:
         """
         Get cache statistics
         
+        Args:
+            include_items: Whether to include per-item details
+            
         Returns:
             Dictionary with cache statistics
         """
@@ -289,16 +335,20 @@ class MemoryCache(CacheBackend):
             total_requests = self.hits + self.misses
             hit_rate = self.hits / total_requests if total_requests > 0 else 0
             
-            return {
+            stats = {
                 "name": self.name,
                 "type": "memory",
                 "size": len(self.cache),
                 "max_size": self.max_size,
                 "hits": self.hits,
                 "misses": self.misses,
-                "hit_rate": hit_rate,
-                "items": [item.to_dict() for item in self.cache.values()]
+                "hit_rate": hit_rate
             }
+            
+            if include_items:
+                stats["items"] = [item.to_dict() for item in self.cache.values()]
+            
+            return stats
     
     def _cleanup_if_needed(self):
         """Clean up expired items if needed"""
@@ -340,6 +390,309 @@ class MemoryCache(CacheBackend):
         
         logger.debug(f"Evicted {num_to_remove} items from cache '{self.name}'")
 
+class _LRUShard:
+    """Single lock-protected shard of a ShardedMemoryCache"""
+    
+    __slots__ = ("items", "expiry_heap", "lock", "hits", "misses", "evictions", "expirations")
+    
+    def __init__(self):
+        """Initialize shard"""
+        self.items: "OrderedDict[str, CacheItem]" = OrderedDict()
+        self.expiry_heap: List[Tuple[float, str]] = []
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def expire(self, now: float) -> int:
+        """
+        Remove expired items using the expiry heap (caller must hold the lock)
+        
+        Args:
+            now: Current time
+            
+        Returns:
+            Number of expired items removed
+        """
+        heap = self.expiry_heap
+        removed = 0
+        
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            item = self.items.get(key)
+            
+            # Skip stale heap entries left behind by overwrites and deletes
+            if item is None or item.ttl is None or item.created_at + item.ttl != expires_at:
+                continue
+            
+            del self.items[key]
+            removed += 1
+        
+        # Compact the heap when stale entries dominate it
+        if len(heap) > 2 * len(self.items) + 64:
+            self.expiry_heap = [
+                (item.created_at + item.ttl, key)
+                for key, item in self.items.items()
+                if item.ttl is not None
+            ]
+            heapq.heapify(self.expiry_heap)
+        
+        self.expirations += removed
+        return removed
+
+class ShardedMemoryCache(CacheBackend):
+    """
+    In-memory cache backend with O(1) LRU eviction
+    
+    Features:
+    - O(1) get/set/evict using per-shard ordered dictionaries
+    - TTL expiry driven by a per-shard min-heap instead of full scans
+    - Lock sharding by key hash to reduce contention between threads
+    
+    max_size is enforced for the whole cache through a shared item count.
+    LRU order is maintained per shard: when the cache is full, the writing
+    key's shard gives up its least recently used item (or the next non-empty
+    shard if it has none), so eviction approximates global LRU.
+    """
+    
+    def __init__(self, name: str, max_size: int = 1000, cleanup_interval: int = 60, num_shards: int = 16):
+        """
+        Initialize sharded memory cache
+        
+        Args:
+            name: Cache name
+            max_size: Maximum number of items in cache
+            cleanup_interval: Interval in seconds for expiry sweeps on reads
+            num_shards: Number of lock shards
+        """
+        super().__init__(name)
+        self.max_size = max_size
+        self.cleanup_interval = cleanup_interval
+        self.num_shards = max(1, min(num_shards, max_size))
+        self.shards = [_LRUShard() for _ in range(self.num_shards)]
+        self.last_cleanup = time.time()
+        
+        # Item count across all shards; only ever taken while holding at most one shard lock
+        self._size = 0
+        self._size_lock = threading.Lock()
+        
+        logger.info(f"Sharded memory cache '{name}' initialized with max size: {max_size}, shards: {self.num_shards}, cleanup interval: {cleanup_interval}s")
+    
+    def _get_shard(self, key: str) -> _LRUShard:
+        """
+        Get the shard responsible for a key
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Shard for the key
+        """
+        return self.shards[hash(key) % self.num_shards]
+    
+    def _add_size(self, delta: int) -> int:
+        """
+        Adjust the item count
+        
+        Args:
+            delta: Number of items added (negative for removed)
+            
+        Returns:
+            New item count
+        """
+        with self._size_lock:
+            self._size += delta
+            return self._size
+    
+    def _evict_over_capacity(self, shard_index: int):
+        """
+        Evict least recently used items until the cache is within max_size
+        
+        Args:
+            shard_index: Index of the shard to evict from first
+        """
+        for offset in range(self.num_shards):
+            shard = self.shards[(shard_index + offset) % self.num_shards]
+            # Never evict the item just written, which is the newest in its own shard
+            keep = 1 if offset == 0 else 0
+            with shard.lock:
+                while len(shard.items) > keep and self._size > self.max_size:
+                    shard.items.popitem(last=False)
+                    shard.evictions += 1
+                    self._add_size(-1)
+            if self._size <= self.max_size:
+                return
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found
+        """
+        self._cleanup_if_needed()
+        
+        shard = self._get_shard(key)
+        with shard.lock:
+            item = shard.items.get(key)
+            
+            if item is None:
+                shard.misses += 1
+                return None
+            
+            if item.ttl is not None and time.time() > item.created_at + item.ttl:
+                del shard.items[key]
+                self._add_size(-1)
+                shard.expirations += 1
+                shard.misses += 1
+                return None
+            
+            shard.items.move_to_end(key)
+            item.access()
+            shard.hits += 1
+            
+            return item.value
+    
+    def set(self, key: str, value: Any, ttl: int = None) -> bool:
+        """
+        Set value in cache
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds (None for no expiration)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        item = CacheItem(key, value, ttl)
+        
+        shard_index = hash(key) % self.num_shards
+        shard = self.shards[shard_index]
+        with shard.lock:
+            added = 0
+            if shard.expiry_heap:
+                added -= shard.expire(item.created_at)
+            
+            if key in shard.items:
+                shard.items.move_to_end(key)
+            else:
+                added += 1
+            
+            shard.items[key] = item
+            
+            if ttl is not None:
+                heapq.heappush(shard.expiry_heap, (item.created_at + ttl, key))
+            
+            size = self._add_size(added)
+        
+        if size > self.max_size:
+            self._evict_over_capacity(shard_index)
+        
+        return True
+    
+    def delete(self, key: str) -> bool:
+        """
+        Delete value from cache
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        shard = self._get_shard(key)
+        with shard.lock:
+            if shard.items.pop(key, None) is None:
+                return False
+            self._add_size(-1)
+            return True
+    
+    def clear(self) -> bool:
+        """
+        Clear all values from cache
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        for shard in self.shards:
+            with shard.lock:
+                self._add_size(-len(shard.items))
+                shard.items.clear()
+                shard.expiry_heap.clear()
+        
+        return True
+    
+    def get_stats(self, include_items: bool = True) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Args:
+            include_items: Whether to include per-item details
+            
+        Returns:
+            Dictionary with cache statistics
+        """
+        size = hits = misses = evictions = expirations = 0
+        items = []
+        
+        for shard in self.shards:
+            with shard.lock:
+                size += len(shard.items)
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+                expirations += shard.expirations
+                
+                if include_items:
+                    items.extend(item.to_dict() for item in shard.items.values())
+        
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0
+        
+        stats = {
+            "name": self.name,
+            "type": "memory",
+            "size": size,
+            "max_size": self.max_size,
+            "shards": self.num_shards,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hit_rate,
+            "evictions": evictions,
+            "expirations": expirations
+        }
+        
+        if include_items:
+            stats["items"] = items
+        
+        return stats
+    
+    def _cleanup_if_needed(self):
+        """Clean up expired items if needed"""
+        current_time = time.time()
+        if current_time - self.last_cleanup > self.cleanup_interval:
+            self.last_cleanup = current_time
+            self._cleanup()
+    
+    def _cleanup(self):
+        """Clean up expired items"""
+        now = time.time()
+        expired_count = 0
+        
+        for shard in self.shards:
+            with shard.lock:
+                removed = shard.expire(now)
+                self._add_size(-removed)
+                expired_count += removed
+        
+        if expired_count:
+            logger.debug(f"Cleaned up {expired_count} expired items from cache '{self.name}'")
+
 class DiskCache(CacheBackend):
     """Disk-based cache backend using SQLite"""
     
@@ -544,10 +897,13 @@ class DiskCache(CacheBackend):
         
         return True
     
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self, include_items: bool = True) -> Dict[str, Any]:
         """
         Get cache statistics
         
+        Args:
+            include_items: Whether to include the most recently accessed items
+            
         Returns:
             Dictionary with cache statistics
         """
@@ -561,15 +917,51 @@ class DiskCache(CacheBackend):
         # Get cache size
         cache_size_mb = self._get_cache_size_mb()
         
-        # Get item stats
+        conn.close()
+        
+        total_requests = self.hits + self.misses
+        hit_rate = self.hits / total_requests if total_requests > 0 else 0
+        
+        stats = {
+            "name": self.name,
+            "type": "disk",
+            "size": item_count,
+            "size_mb": cache_size_mb,
+            "max_size_mb": self.max_size_mb,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": hit_rate
+        }
+        
+        if include_items:
+            stats["items"] = self._get_recent_items()
+        
+        return stats
+    
+    def _get_recent_items(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Get details of the most recently accessed items
+        
+        Args:
+            limit: Maximum number of items to return
+            
+        Returns:
+            List of item dictionaries
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
         cursor.execute(
             '''
             SELECT key, created_at, last_accessed, access_count, ttl
             FROM cache_items
             ORDER BY last_accessed DESC
-            LIMIT 100
-            '''
+            LIMIT ?
+            ''',
+            (limit,)
         )
+        
+        now = time.time()
         items = []
         for row in cursor.fetchall():
             key, created_at, last_accessed, access_count, ttl = row
@@ -579,27 +971,14 @@ class DiskCache(CacheBackend):
                 "last_accessed": last_accessed,
                 "access_count": access_count,
                 "ttl": ttl,
-                "age": time.time() - created_at,
-                "idle_time": time.time() - last_accessed,
-                "expired": ttl is not None and time.time() > (created_at + ttl)
+                "age": now - created_at,
+                "idle_time": now - last_accessed,
+                "expired": ttl is not None and now > (created_at + ttl)
             })
         
         conn.close()
         
-        total_requests = self.hits + self.misses
-        hit_rate = self.hits / total_requests if total_requests > 0 else 0
-        
-        return {
-            "name": self.name,
-            "type": "disk",
-            "size": item_count,
-            "size_mb": cache_size_mb,
-            "max_size_mb": self.max_size_mb,
-            "hits": self.hits,
-            "misses": self.misses,
-            "hit_rate": hit_rate,
-            "items": items
-        }
+        return items
     
     def _get_cache_size_mb(self) -> float:
         """
@@ -665,6 +1044,425 @@ class DiskCache(CacheBackend):
         
         logger.debug(f"Evicted {num_to_remove} items from disk cache '{self.name}'")
 
+class PooledDiskCache(DiskCache):
+    """
+    Disk-based cache backend using SQLite with pooled connections
+    
+    Features:
+    - One persistent connection per thread, opened in WAL journal mode
+    - Access statistics buffered in memory and flushed in batches
+    - Incrementally tracked payload size instead of per-write file size checks
+    - Bulk get_many/set_many executed in a single statement/transaction
+    
+    The size limit applies to the stored payload bytes rather than the
+    database file size.
+    """
+    
+    # SQLite's default limit on host parameters is 999 on older builds
+    _MAX_SQL_PARAMS = 500
+    
+    def __init__(self, name: str, cache_dir: str = None, max_size_mb: int = 100, cleanup_interval: int = 300,
+                 flush_interval: float = 5.0, flush_batch_size: int = 1000):
+        """
+        Initialize pooled disk cache
+        
+        Args:
+            name: Cache name
+            cache_dir: Directory to store cache files
+            max_size_mb: Maximum cache payload size in MB
+            cleanup_interval: Interval in seconds for cleanup
+            flush_interval: Maximum seconds to buffer access statistics
+            flush_batch_size: Number of buffered accesses that triggers a flush
+        """
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.last_flush = time.time()
+        self.size_bytes = 0
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._access_buffer: Dict[str, List[float]] = {}
+        self._lock = threading.RLock()
+        
+        super().__init__(name, cache_dir=cache_dir, max_size_mb=max_size_mb, cleanup_interval=cleanup_interval)
+    
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection, opening it on first use
+        
+        Returns:
+            SQLite connection
+        """
+        conn = getattr(self._local, "conn", None)
+        
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            
+            with self._lock:
+                self._connections.append(conn)
+        
+        return conn
+    
+    def _init_db(self):
+        """Initialize SQLite database and load the current payload size"""
+        super()._init_db()
+        
+        conn = self._get_connection()
+        row = conn.execute('SELECT COALESCE(SUM(LENGTH(value)), 0) FROM cache_items').fetchone()
+        self.size_bytes = row[0]
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if not found
+        """
+        return self.get_many([key]).get(key)
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get multiple values from cache
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Dictionary of found keys to cached values (missing keys are omitted)
+        """
+        self._cleanup_if_needed()
+        
+        conn = self._get_connection()
+        now = time.time()
+        rows = []
+        
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), self._MAX_SQL_PARAMS):
+            chunk = unique_keys[start:start + self._MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows.extend(conn.execute(
+                f'SELECT key, value, created_at, ttl FROM cache_items WHERE key IN ({placeholders})',
+                chunk
+            ).fetchall())
+        
+        results = {}
+        invalid_keys = []
+        
+        for key, value_blob, created_at, ttl in rows:
+            # Check if expired
+            if ttl is not None and now > (created_at + ttl):
+                invalid_keys.append(key)
+                continue
+            
+            # Deserialize value
+            try:
+                results[key] = pickle.loads(value_blob)
+            except Exception as e:
+                logger.error(f"Error deserializing cached value for key '{key}': {str(e)}")
+                invalid_keys.append(key)
+        
+        if invalid_keys:
+            self._delete_keys(conn, invalid_keys)
+        
+        self.hits += len(results)
+        self.misses += len(unique_keys) - len(results)
+        
+        if results:
+            self._record_access(list(results.keys()), now)
+        
+        return results
+    
+    def set(self, key: str, value: Any, ttl: int = None) -> bool:
+        """
+        Set value in cache
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds (None for no expiration)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.set_many({key: value}, ttl)
+    
+    def set_many(self, items: Dict[str, Any], ttl: int = None) -> bool:
+        """
+        Set multiple values in cache in a single transaction
+        
+        Args:
+            items: Dictionary of cache keys to values
+            ttl: Time to live in seconds (None for no expiration)
+            
+        Returns:
+            True if all values were stored, False otherwise
+        """
+        self._cleanup_if_needed()
+        
+        # Serialize values
+        now = time.time()
+        rows = []
+        success = True
+        
+        for key, value in items.items():
+            try:
+                rows.append((key, pickle.dumps(value), now, now, 0, ttl))
+            except Exception as e:
+                logger.error(f"Error serializing value for key '{key}': {str(e)}")
+                success = False
+        
+        if not rows:
+            return success
+        
+        conn = self._get_connection()
+        
+        with self._lock:
+            # Check if cache is full
+            if self._get_cache_size_mb() >= self.max_size_mb:
+                self._evict_items()
+            
+            replaced_bytes = self._get_stored_bytes(conn, [row[0] for row in rows])
+            
+            with conn:
+                conn.executemany(
+                    '''
+                    INSERT OR REPLACE INTO cache_items
+                    (key, value, created_at, last_accessed, access_count, ttl)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ''',
+                    rows
+                )
+            
+            self.size_bytes += sum(len(row[1]) for row in rows) - replaced_bytes
+            
+            for row in rows:
+                self._access_buffer.pop(row[0], None)
+        
+        return success
+    
+    def delete(self, key: str) -> bool:
+        """
+        Delete value from cache
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._delete_keys(self._get_connection(), [key]) > 0
+    
+    def clear(self) -> bool:
+        """
+        Clear all values from cache
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        conn = self._get_connection()
+        
+        with self._lock:
+            with conn:
+                conn.execute('DELETE FROM cache_items')
+            
+            self.size_bytes = 0
+            self._access_buffer.clear()
+        
+        return True
+    
+    def get_stats(self, include_items: bool = True) -> Dict[str, Any]:
+        """
+        Get cache statistics
+        
+        Args:
+            include_items: Whether to include the most recently accessed items
+            
+        Returns:
+            Dictionary with cache statistics
+        """
+        self.flush()
+        
+        conn = self._get_connection()
+        item_count = conn.execute('SELECT COUNT(*) FROM cache_items').fetchone()[0]
+        
+        total_requests = self.hits + self.misses
+        hit_rate = self.hits / total_requests if total_requests > 0 else 0
+        
+        stats = {
+            "name": self.name,
+            "type": "disk_pooled",
+            "size": item_count,
+            "size_mb": self._get_cache_size_mb(),
+            "max_size_mb": self.max_size_mb,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": hit_rate,
+            "pending_access_updates": len(self._access_buffer)
+        }
+        
+        if include_items:
+            stats["items"] = self._get_recent_items()
+        
+        return stats
+    
+    def flush(self):
+        """Write buffered access statistics to the database"""
+        with self._lock:
+            if not self._access_buffer:
+                self.last_flush = time.time()
+                return
+            
+            updates = [(last_accessed, int(count), key) for key, (last_accessed, count) in self._access_buffer.items()]
+            self._access_buffer.clear()
+            
+            conn = self._get_connection()
+            with conn:
+                conn.executemany(
+                    'UPDATE cache_items SET last_accessed = ?, access_count = access_count + ? WHERE key = ?',
+                    updates
+                )
+            
+            self.last_flush = time.time()
+        
+        logger.debug(f"Flushed {len(updates)} access updates to disk cache '{self.name}'")
+    
+    def close(self):
+        """Flush pending statistics and close all pooled connections"""
+        self.flush()
+        
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.ProgrammingError:
+                    # Connection belongs to another thread that already exited
+                    pass
+            
+            self._connections.clear()
+            self._local = threading.local()
+    
+    def _record_access(self, keys: List[str], now: float):
+        """
+        Buffer access statistics for later batch update
+        
+        Args:
+            keys: Accessed keys
+            now: Access time
+        """
+        with self._lock:
+            for key in keys:
+                entry = self._access_buffer.get(key)
+                if entry is None:
+                    self._access_buffer[key] = [now, 1]
+                else:
+                    entry[0] = now
+                    entry[1] += 1
+            
+            should_flush = (
+                len(self._access_buffer) >= self.flush_batch_size
+                or now - self.last_flush >= self.flush_interval
+            )
+        
+        if should_flush:
+            self.flush()
+    
+    def _get_stored_bytes(self, conn: sqlite3.Connection, keys: List[str]) -> int:
+        """
+        Get the stored payload size of existing keys
+        
+        Args:
+            conn: SQLite connection
+            keys: Cache keys
+            
+        Returns:
+            Total payload bytes of the keys that exist
+        """
+        total = 0
+        
+        for start in range(0, len(keys), self._MAX_SQL_PARAMS):
+            chunk = keys[start:start + self._MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            row = conn.execute(
+                f'SELECT COALESCE(SUM(LENGTH(value)), 0) FROM cache_items WHERE key IN ({placeholders})',
+                chunk
+            ).fetchone()
+            total += row[0]
+        
+        return total
+    
+    def _delete_keys(self, conn: sqlite3.Connection, keys: List[str]) -> int:
+        """
+        Delete keys and update the tracked size
+        
+        Args:
+            conn: SQLite connection
+            keys: Cache keys
+            
+        Returns:
+            Number of deleted rows
+        """
+        with self._lock:
+            freed_bytes = self._get_stored_bytes(conn, keys)
+            
+            with conn:
+                cursor = conn.executemany('DELETE FROM cache_items WHERE key = ?', [(key,) for key in keys])
+                deleted = cursor.rowcount
+            
+            self.size_bytes -= freed_bytes
+            
+            for key in keys:
+                self._access_buffer.pop(key, None)
+        
+        return deleted
+    
+    def _get_cache_size_mb(self) -> float:
+        """
+        Get tracked cache payload size in MB
+        
+        Returns:
+            Cache size in MB
+        """
+        return self.size_bytes / (1024 * 1024)
+    
+    def _cleanup(self):
+        """Clean up expired items"""
+        conn = self._get_connection()
+        rows = conn.execute(
+            'SELECT key FROM cache_items WHERE ttl IS NOT NULL AND created_at + ttl < ?',
+            (time.time(),)
+        ).fetchall()
+        
+        if rows:
+            expired_count = self._delete_keys(conn, [row[0] for row in rows])
+            logger.debug(f"Cleaned up {expired_count} expired items from disk cache '{self.name}'")
+    
+    def _evict_items(self):
+        """Evict least recently accessed items when full"""
+        # Pending access updates affect LRU order
+        self.flush()
+        
+        conn = self._get_connection()
+        total_items = conn.execute('SELECT COUNT(*) FROM cache_items').fetchone()[0]
+        
+        if total_items == 0:
+            return
+        
+        # Remove 10% of items or at least one
+        num_to_remove = max(1, int(total_items * 0.1))
+        rows = conn.execute(
+            'SELECT key FROM cache_items ORDER BY last_accessed ASC LIMIT ?',
+            (num_to_remove,)
+        ).fetchall()
+        
+        self._delete_keys(conn, [row[0] for row in rows])
+        
+        logger.debug(f"Evicted {num_to_remove} items from disk cache '{self.name}'")
+
 class CacheManager:
     """
     Cache manager for managing multiple caches
@@ -687,7 +1485,7 @@ class CacheManager:
         
         Args:
             name: Cache name
-            backend: Cache backend type ('memory' or 'disk')
+            backend: Cache backend type ('memory', 'simple_memory', 'disk' or 'disk_pooled')
             **kwargs: Additional arguments for cache backend
             
         Returns:
@@ -700,9 +1498,13 @@ class CacheManager:
         
         # Create new cache
         if backend == "memory":
+            cache = ShardedMemoryCache(name, **kwargs)
+        elif backend == "simple_memory":
             cache = MemoryCache(name, **kwargs)
         elif backend == "disk":
             cache = DiskCache(name, **kwargs)
+        elif backend == "disk_pooled":
+            cache = PooledDiskCache(name, **kwargs)
         else:
             raise ValueError(f"Unknown cache backend: {backend}")
         
@@ -796,17 +1598,20 @@ class CacheManager:
         
         return success
     
-    def get_cache_stats(self) -> Dict[str, Any]:
+    def get_cache_stats(self, include_items: bool = True) -> Dict[str, Any]:
         """
         Get statistics for all caches
         
+        Args:
+            include_items: Whether to include per-item details
+            
         Returns:
             Dictionary with cache statistics
         """
         stats = {}
         
         for cache_key, cache in self.caches.items():
-            stats[cache_key] = cache.get_stats()
+            stats[cache_key] = cache.get_stats(include_items=include_items)
         
         return stats
     
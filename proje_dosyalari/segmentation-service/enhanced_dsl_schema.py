@@ -12,8 +12,8 @@ These advanced features enable more complex command processing and task automati
 
 from typing import Dict, List, Any, Optional, Union, Callable
 from pydantic import BaseModel, Field, field_validator, model_validator, ValidationInfo
-import yaml
-import json
+from alt_codecs import YamlCodec, codec_for_path, decode_bytes, get_codec, load_model
+from condition_compiler import compile_condition, condition_changed
 import uuid
 import datetime
 import re
@@ -95,6 +95,11 @@ class Condition(BaseModel):
     left: Union[str, "Condition"] = Field(..., description="Left operand (variable name or nested condition)")
     right: Optional[Union[str, Any, "Condition"]] = Field(None, description="Right operand (variable name, value, or nested condition)")
 
+    def __setattr__(self, name: str, value: Any):
+        """Assign a field and invalidate compiled conditions that may contain this one"""
+        super().__setattr__(name, value)
+        condition_changed()
+
     @model_validator(mode="after")
     def validate_condition(self):
         """Validate condition based on operator"""
@@ -268,7 +273,7 @@ def alt_to_yaml(alt_file: AltFile) -> str:
     Returns:
         YAML string representation
     """
-    return yaml.dump(alt_file.model_dump(), sort_keys=False, default_flow_style=False)
+    return YamlCodec.dump(alt_file.model_dump(mode="json"))
 
 def alt_to_json(alt_file: AltFile) -> str:
     """
@@ -280,33 +285,60 @@ def alt_to_json(alt_file: AltFile) -> str:
     Returns:
         JSON string representation
     """
-    return json.dumps(alt_file.model_dump(), indent=2)
+    return get_codec("json").encode(alt_file.model_dump(mode="json")).decode("utf-8")
 
-def yaml_to_alt(yaml_str: str) -> AltFile:
+def yaml_to_alt(yaml_str: str, trusted: bool = False) -> AltFile:
     """
     Convert YAML string to ALT file object
 
     Args:
         yaml_str: YAML string
+        trusted: Skip validation for data this service wrote itself
 
     Returns:
         ALT file object
     """
-    data = yaml.safe_load(yaml_str)
-    return AltFile(**data)
+    data = get_codec("yaml").decode(yaml_str)
+    return load_model(AltFile, data, trusted)
 
-def json_to_alt(json_str: str) -> AltFile:
+def json_to_alt(json_str: str, trusted: bool = False) -> AltFile:
     """
     Convert JSON string to ALT file object
 
     Args:
         json_str: JSON string
+        trusted: Skip validation for data this service wrote itself
+
+    Returns:
+        ALT file object
+    """
+    data = get_codec("json").decode(json_str)
+    return load_model(AltFile, data, trusted)
+
+def alt_to_msgpack(alt_file: AltFile) -> bytes:
+    """
+    Convert ALT file to the binary MessagePack format
+
+    Args:
+        alt_file: ALT file object
+
+    Returns:
+        MessagePack bytes
+    """
+    return get_codec("msgpack").encode(alt_file.model_dump(mode="json"))
+
+def msgpack_to_alt(data: bytes, trusted: bool = False) -> AltFile:
+    """
+    Convert MessagePack bytes to ALT file object
+
+    Args:
+        data: MessagePack bytes
+        trusted: Skip validation for data this service wrote itself
 
     Returns:
         ALT file object
     """
-    data = json.loads(json_str)
-    return AltFile(**data)
+    return load_model(AltFile, get_codec("msgpack").decode(data), trusted)
 
 def save_alt_file(alt_file: AltFile, file_path: str, format: str = "yaml") -> None:
     """
@@ -315,49 +347,53 @@ def save_alt_file(alt_file: AltFile, file_path: str, format: str = "yaml") -> No
     Args:
         alt_file: ALT file object
         file_path: Path to save the file
-        format: Format to save the file in (yaml or json)
+        format: Format to save the file in (yaml, json or msgpack)
     """
-    if format.lower() == "yaml":
-        content = alt_to_yaml(alt_file)
-    elif format.lower() == "json":
-        content = alt_to_json(alt_file)
-    else:
-        raise ValueError("Format must be either 'yaml' or 'json'")
-
-    with open(file_path, "w", encoding="utf-8") as f:
+    if format.lower() not in ("yaml", "json", "msgpack"):
+        raise ValueError("Format must be one of 'yaml', 'json' or 'msgpack'")
+    content = get_codec(format).encode(alt_file.model_dump(mode="json"))
+
+    with open(file_path, "wb") as f:
         f.write(content)
 
-def load_alt_file(file_path: str) -> AltFile:
+def load_alt_file(file_path: str, trusted: bool = False) -> AltFile:
     """
     Load ALT file from disk
 
+    The format is chosen by extension (.yaml/.yml, .json, .altb) or, for
+    other extensions, by sniffing the first bytes, so the file is parsed once.
+
     Args:
         file_path: Path to the file
+        trusted: Skip validation for files this service wrote itself
 
     Returns:
         ALT file object
     """
-    with open(file_path, "r", encoding="utf-8") as f:
+    with open(file_path, "rb") as f:
         content = f.read()
 
-    if file_path.endswith(".yaml") or file_path.endswith(".yml"):
-        return yaml_to_alt(content)
-    elif file_path.endswith(".json"):
-        return json_to_alt(content)
-    else:
-        # Try to determine format from content
-        try:
-            return json_to_alt(content)
-        except:
-            try:
-                return yaml_to_alt(content)
-            except:
-                raise ValueError("Could not determine file format. Use .yaml or .json extension.")
+    codec = codec_for_path(file_path)
+    if codec is not None:
+        return load_model(AltFile, codec.decode(content), trusted)
+
+    try:
+        data = decode_bytes(content)
+    except Exception:
+        raise ValueError("Could not determine file format. Use .yaml, .json or .altb extension.")
+    if not isinstance(data, dict):
+        raise ValueError("Could not determine file format. Use .yaml, .json or .altb extension.")
+    return load_model(AltFile, data, trusted)
 
 def evaluate_condition(condition: Condition, variables: Dict[str, Any]) -> bool:
     """
     Evaluate a condition with given variables
 
+    The condition is compiled on first use (see condition_compiler) and the
+    compiled form is reused until the condition is modified. String operands
+    that name a variable, or a dotted path into one such as "result.title",
+    are replaced by its value; other operands are used as literals.
+
     Args:
         condition: Condition to evaluate
         variables: Dictionary of variables
@@ -365,78 +401,22 @@ def evaluate_condition(condition: Condition, variables: Dict[str, Any]) -> bool:
     Returns:
         Boolean result of condition evaluation
     """
-    op = condition.operator
-
-    # Handle unary operators
-    if op == ConditionOperator.NOT:
-        if isinstance(condition.left, Condition):
-            return not evaluate_condition(condition.left, variables)
-        else:
-            left_val = variables.get(condition.left, False)
-            return not left_val
-
-    # Handle binary operators
-    left = condition.left
-    right = condition.right
-
-    # Handle nested conditions
-    if op in [ConditionOperator.AND, ConditionOperator.OR]:
-        left_result = evaluate_condition(left, variables)
-        right_result = evaluate_condition(right, variables)
-
-        if op == ConditionOperator.AND:
-            return left_result and right_result
-        else:  # OR
-            return left_result or right_result
-
-    # Get values for comparison
-    left_val = None
-    if isinstance(left, Condition):
-        left_val = evaluate_condition(left, variables)
-    elif isinstance(left, str) and left in variables:
-        left_val = variables[left]
-    else:
-        left_val = left # Assume literal value if not a variable or condition
-
-    right_val = None
-    if isinstance(right, Condition):
-        right_val = evaluate_condition(right, variables)
-    elif isinstance(right, str) and right in variables:
-        right_val = variables[right]
-    else:
-        right_val = right # Assume literal value if not a variable or condition
-
-    # Perform comparison
-    try:
-        if op == ConditionOperator.EQUAL:
-            return left_val == right_val
-        elif op == ConditionOperator.NOT_EQUAL:
-            return left_val != right_val
-        elif op == ConditionOperator.GREATER_THAN:
-            return left_val > right_val
-        elif op == ConditionOperator.LESS_THAN:
-            return left_val < right_val
-        elif op == ConditionOperator.GREATER_EQUAL:
-            return left_val >= right_val
-        elif op == ConditionOperator.LESS_EQUAL:
-            return left_val <= right_val
-        elif op == ConditionOperator.CONTAINS:
-            return right_val in left_val
-        elif op == ConditionOperator.NOT_CONTAINS:
-            return right_val not in left_val
-        elif op == ConditionOperator.STARTS_WITH:
-            return str(left_val).startswith(str(right_val))
-        elif op == ConditionOperator.ENDS_WITH:
-            return str(left_val).endswith(str(right_val))
-        else:
-            raise ValueError(f"Unsupported operator: {op}")
-    except TypeError:
-        # Handle type errors during comparison gracefully
-        return False
-    except Exception as e:
-        # Log other potential errors during evaluation
-        print(f"Error evaluating condition: {e}")
-        return False
+    return compile_condition(condition)(variables)
+
+def evaluate_condition_batch(condition: Condition, variables_list: List[Dict[str, Any]]) -> List[bool]:
+    """
+    Evaluate one condition over several variable dictionaries
+
+    Useful for for_each loops, where the same condition is checked once per item.
+
+    Args:
+        condition: Condition to evaluate
+        variables_list: Dictionaries of variables, e.g. one per loop item
+
+    Returns:
+        Boolean result for each dictionary, in order
+    """
+    return compile_condition(condition).evaluate_many(variables_list)
 
 # Example usage:
 if __name__ == "__main__":
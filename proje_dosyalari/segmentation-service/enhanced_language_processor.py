@@ -14,11 +14,16 @@ import string
 import logging
 import os
 import time
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple, Union, Set
 import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords, wordnet
 
+from language_detector import LanguageDetector
+
 # Check if we should disable spaCy
 DISABLE_SPACY = os.environ.get("DISABLE_SPACY", "false").lower() in ("true", "1", "yes")
 
@@ -175,15 +180,187 @@ else:
             return word_tokenize(text)
 
 
+class DocCache:
+    """
+    Bounded LRU cache for processed spaCy documents.
+
+    Entries are keyed by a fixed-size hash of the text and language, so long
+    commands do not end up as dictionary keys. The cache enforces both an item
+    limit and a memory budget in bytes, estimated from each document's token count.
+    """
+
+    # Rough per-token footprint of a spaCy Doc (token struct, attributes, tensor row)
+    BYTES_PER_TOKEN = 512
+    # Fixed per-document overhead (Doc object, vocab references, user data)
+    DOC_OVERHEAD_BYTES = 1024
+
+    def __init__(self, max_items: int = 100, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the document cache.
+
+        Args:
+            max_items: Maximum number of documents to keep.
+            max_bytes: Maximum estimated size of all cached documents in bytes.
+        """
+        self._items: "OrderedDict[bytes, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self.rejected = 0
+
+    @staticmethod
+    def make_key(text: str, language: Optional[str]) -> bytes:
+        """
+        Build a fixed-size cache key for a text and language.
+
+        Args:
+            text: Input text.
+            language: Language code (None if it is to be detected).
+
+        Returns:
+            16-byte digest identifying the text and language.
+        """
+        data = f"{language}\x00{text}".encode("utf-8", "surrogatepass")
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    @classmethod
+    def estimate_size(cls, doc: Any) -> int:
+        """
+        Estimate the memory footprint of a processed document.
+
+        Args:
+            doc: spaCy Doc (or any object supporting len()).
+
+        Returns:
+            Estimated size in bytes.
+        """
+        try:
+            num_tokens = len(doc)
+        except TypeError:
+            num_tokens = 0
+        return cls.DOC_OVERHEAD_BYTES + num_tokens * cls.BYTES_PER_TOKEN
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """
+        Get a document and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key.
+
+        Returns:
+            Cached document, or None if not cached.
+        """
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: bytes, doc: Any) -> bool:
+        """
+        Store a document, evicting least recently used ones to stay within limits.
+
+        Args:
+            key: Cache key from make_key.
+            doc: Processed document.
+
+        Returns:
+            True if the document was cached, False if it exceeds the byte budget on its own.
+        """
+        size = self.estimate_size(doc)
+
+        with self._lock:
+            old_entry = self._items.pop(key, None)
+            if old_entry is not None:
+                self.current_bytes -= old_entry[1]
+
+            if size > self.max_bytes or self.max_items <= 0:
+                self.rejected += 1
+                return False
+
+            self._items[key] = (doc, size)
+            self.current_bytes += size
+            self._evict()
+            return True
+
+    def _evict(self):
+        """Evict least recently used documents until both limits are met (lock must be held)"""
+        while self._items and (len(self._items) > self.max_items or self.current_bytes > self.max_bytes):
+            _, (_, size) = self._items.popitem(last=False)
+            self.current_bytes -= size
+            self.evictions += 1
+            self.evicted_bytes += size
+
+    def resize(self, max_items: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Change the cache limits, evicting documents if the cache is now too large.
+
+        Args:
+            max_items: New item limit (unchanged if None).
+            max_bytes: New byte budget (unchanged if None).
+        """
+        with self._lock:
+            if max_items is not None:
+                self.max_items = max_items
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Remove all cached documents"""
+        with self._lock:
+            self._items.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._items
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, limits and hit/miss/eviction counters.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._items),
+                "max_size": self.max_items,
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total > 0 else 0,
+                "evictions": self.evictions,
+                "evicted_bytes": self.evicted_bytes,
+                "rejected": self.rejected
+            }
+
 class EnhancedLanguageProcessor:
     """Class for enhanced language detection and multilanguage processing using spaCy."""
 
-    def __init__(self, max_cache_size=100):
+    def __init__(self, max_cache_size=100, max_cache_bytes=64 * 1024 * 1024):
         """
         Initialize the language processor.
 
         Args:
             max_cache_size: Maximum number of documents to cache
+            max_cache_bytes: Maximum estimated size of cached documents in bytes
         """
         # Model loading functions
         self.model_loaders = {
@@ -201,13 +378,14 @@ class EnhancedLanguageProcessor:
         # Load keyword lists for fallback methods
         self._load_keyword_lists()
 
+        # Compiled language detector (falls back to English if unsure)
+        self.language_detector = LanguageDetector(self.language_patterns, default_language='en')
+
         # Define supported languages
         self.supported_languages = ["en", "tr", "de", "fr", "es", "ru"]
 
         # Cache for processed documents to avoid reprocessing
-        self.doc_cache = {}
-        self.cache_keys = []  # For LRU tracking
-        self.max_cache_size = max_cache_size
+        self.doc_cache = DocCache(max_cache_size, max_cache_bytes)
 
         # Variable pattern - matches {variable_name} or <variable_name>
         self.variable_pattern = re.compile(r'[{<]([a-zA-Z0-9_]+)[}>]')
@@ -473,25 +651,8 @@ class EnhancedLanguageProcessor:
         elif "Это тестовое предложение на русском языке." in text:
             return 'ru'
 
-        # Calculate scores for each language
-        scores = {lang: 0 for lang in self.language_patterns.keys()}
-
-        for lang, patterns in self.language_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                scores[lang] += len(matches)
-
-        # Get language with highest score
-        max_score = 0
-        detected_lang = 'en'  # Default to English
-
-        for lang, score in scores.items():
-            if score > max_score:
-                max_score = score
-                detected_lang = lang
-
-        logger.info(f"Detected language: {detected_lang} (score: {max_score})")
-        return detected_lang
+        # Score all languages in one pass with the compiled detector
+        return self.language_detector.detect(text)
 
     def get_nlp_model(self, language: str):
         """
@@ -532,13 +693,10 @@ class EnhancedLanguageProcessor:
             A spaCy Doc object, or None if the model is not available.
         """
         # Check cache first
-        cache_key = f"{text}_{language}"
-        if cache_key in self.doc_cache:
-            # Move this key to the end of the LRU list (most recently used)
-            if cache_key in self.cache_keys:
-                self.cache_keys.remove(cache_key)
-            self.cache_keys.append(cache_key)
-            return self.doc_cache[cache_key]
+        cache_key = DocCache.make_key(text, language)
+        cached_doc = self._get_cached_doc(cache_key)
+        if cached_doc is not None:
+            return cached_doc
 
         # Detect language if not provided
         if language is None:
@@ -548,27 +706,119 @@ class EnhancedLanguageProcessor:
         nlp = self.get_nlp_model(language)
         if nlp:
             doc = nlp(text)
+            self._cache_doc(cache_key, doc)
+            return doc
 
-            # Manage cache size (LRU eviction)
-            if len(self.cache_keys) >= self.max_cache_size:
-                # Remove least recently used item
-                oldest_key = self.cache_keys.pop(0)
-                if oldest_key in self.doc_cache:
-                    del self.doc_cache[oldest_key]
-                    logger.debug(f"Evicted document from cache: {oldest_key[:30]}...")
+        logger.warning(f"spaCy model for language '{language}' not available.")
+        return None
 
-            # Cache the result
-            self.doc_cache[cache_key] = doc
-            self.cache_keys.append(cache_key)
+    def process_texts(self, texts: List[str], languages: Optional[List[Optional[str]]] = None,
+                      batch_size: int = 32, n_process: int = 1) -> List[Optional[Doc]]:
+        """
+        Process multiple texts, batching them per language through nlp.pipe.
+        Texts without a language are detected individually. Cached documents
+        are reused and results are returned in the order of the input texts.
 
-            # Track memory usage periodically
-            if len(self.cache_keys) % 10 == 0:
-                self._track_memory_usage()
+        Args:
+            texts: Input texts.
+            languages: Language code per text (None entries are detected). If None, all are detected.
+            batch_size: Number of texts per spaCy batch.
+            n_process: Number of worker processes used by nlp.pipe.
 
-            return doc
+        Returns:
+            List of spaCy Doc objects (None where no model is available), in input order.
+        """
+        if languages is None:
+            languages = [None] * len(texts)
+        elif len(languages) != len(texts):
+            raise ValueError("languages must have the same length as texts")
+
+        results: List[Optional[Doc]] = [None] * len(texts)
+
+        # Group cache misses by language, remembering their positions
+        pending: Dict[str, List[Tuple[int, str, bytes]]] = {}
+        for index, (text, language) in enumerate(zip(texts, languages)):
+            cache_key = DocCache.make_key(text, language)
+            cached_doc = self._get_cached_doc(cache_key)
+            if cached_doc is not None:
+                results[index] = cached_doc
+                continue
+
+            detected_language = language if language is not None else self.detect_language(text)
+            pending.setdefault(detected_language, []).append((index, text, cache_key))
+
+        for language, items in pending.items():
+            nlp = self.get_nlp_model(language)
+            if not nlp:
+                logger.warning(f"spaCy model for language '{language}' not available.")
+                continue
+
+            # Identical texts in one batch are only processed once
+            unique_texts = list(dict.fromkeys(text for _, text, _ in items))
+            docs_by_text = dict(zip(unique_texts, nlp.pipe(unique_texts, batch_size=batch_size, n_process=n_process)))
+
+            for index, text, cache_key in items:
+                doc = docs_by_text[text]
+                results[index] = doc
+                self._cache_doc(cache_key, doc)
+
+            logger.debug(f"Processed {len(unique_texts)} texts for language '{language}' with nlp.pipe")
+
+        return results
+
+    @property
+    def max_cache_size(self) -> int:
+        """Maximum number of documents kept in the document cache"""
+        return self.doc_cache.max_items
+
+    @max_cache_size.setter
+    def max_cache_size(self, value: int):
+        self.doc_cache.resize(max_items=value)
+
+    @property
+    def max_cache_bytes(self) -> int:
+        """Memory budget of the document cache in bytes"""
+        return self.doc_cache.max_bytes
+
+    @max_cache_bytes.setter
+    def max_cache_bytes(self, value: int):
+        self.doc_cache.resize(max_bytes=value)
+
+    def _get_cached_doc(self, cache_key: bytes) -> Optional[Doc]:
+        """
+        Get a processed document from the cache and mark it as recently used.
 
-        logger.warning(f"spaCy model for language '{language}' not available.")
-        return None
+        Args:
+            cache_key: Cache key from DocCache.make_key.
+
+        Returns:
+            Cached Doc, or None if not cached.
+        """
+        return self.doc_cache.get(cache_key)
+
+    def _cache_doc(self, cache_key: bytes, doc: Doc):
+        """
+        Store a processed document in the cache, evicting least recently used ones if full.
+
+        Args:
+            cache_key: Cache key from DocCache.make_key.
+            doc: Processed document.
+        """
+        if not self.doc_cache.put(cache_key, doc):
+            logger.debug(f"Document too large for cache budget ({DocCache.estimate_size(doc)} bytes)")
+
+        # Track memory usage periodically
+        if len(self.doc_cache) % 10 == 0:
+            self._track_memory_usage()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get document cache statistics.
+
+        Returns:
+            Dictionary with cache size, byte usage and hit/miss/eviction counters.
+        """
+        return self.doc_cache.get_stats()
 
     def get_sentences(self, text_or_doc: Union[str, Doc], language: str = None) -> List[Span]:
         """
@@ -876,7 +1126,6 @@ class EnhancedLanguageProcessor:
         """Clear document cache to free memory"""
         cache_size = len(self.doc_cache)
         self.doc_cache.clear()
-        self.cache_keys.clear()
         logger.info(f"Cleared document cache ({cache_size} items)")
 
     def unload_unused_models(self):
@@ -0,0 +1,334 @@
+"""
+Keyword Matcher Module for ALT_LAS Segmentation Service
+
+This module provides an Aho-Corasick automaton that finds every occurrence of
+a language's task keywords and split indicators in a single pass over the text.
+The command parser uses it instead of running one regular expression per
+keyword on every request.
+"""
+
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Configure logging
+logger = logging.getLogger('keyword_matcher')
+
+def _lower_char(char: str) -> str:
+    """
+    Lowercase a single character without changing the string length
+
+    Args:
+        char: Character to lowercase
+
+    Returns:
+        Lowercased character (first code point if lowercasing expands it)
+    """
+    lowered = char.lower()
+    return lowered if len(lowered) == 1 else lowered[0]
+
+def fold_case(text: str) -> str:
+    """
+    Lowercase text while preserving character offsets
+
+    Args:
+        text: Input text
+
+    Returns:
+        Lowercased text with the same length as the input
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(_lower_char(char) for char in text)
+
+def _is_word_char(char: str) -> bool:
+    """Check whether a character counts as a word character for regex \\b"""
+    return char.isalnum() or char == '_'
+
+def _is_boundary(text: str, position: int) -> bool:
+    """
+    Check whether a regex word boundary (\\b) exists at a position
+
+    Args:
+        text: Text to check
+        position: Offset between two characters
+
+    Returns:
+        True if exactly one side of the position is a word character
+    """
+    before = position > 0 and _is_word_char(text[position - 1])
+    after = position < len(text) and _is_word_char(text[position])
+    return before != after
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over a fixed set of case-insensitive keywords
+
+    The automaton is built once and can then report every keyword occurrence
+    in a text in O(len(text) + matches), independent of the number of keywords.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the automaton
+
+        Args:
+            keywords: Keywords to match (matched case-insensitively)
+        """
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        seen = set()
+        for keyword in keywords:
+            normalized = fold_case(keyword)
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                self._add_keyword(normalized)
+
+        self._build_failure_links()
+
+    def _add_keyword(self, keyword: str):
+        """
+        Add a keyword to the trie
+
+        Args:
+            keyword: Lowercased keyword
+        """
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = next_state
+            state = next_state
+
+        self._output[state].append(len(self.keywords))
+        self.keywords.append(keyword)
+
+    def _build_failure_links(self):
+        """Compute failure links, merged outputs and the full transition table"""
+        queue = deque(self._goto[0].values())
+        order = []
+
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+        # Fold failure links into a deterministic transition table so scanning
+        # needs a single dictionary lookup per character. Characters missing
+        # from a state's table lead back to the root.
+        self._delta: List[Dict[str, int]] = [dict(self._goto[0])] + [None] * (len(self._goto) - 1)
+        for state in order:
+            transitions = dict(self._delta[self._fail[state]])
+            transitions.update(self._goto[state])
+            self._delta[state] = transitions
+
+        self._outputs_by_state: List[Tuple[Tuple[int, str], ...]] = [
+            tuple((len(self.keywords[index]), self.keywords[index]) for index in outputs)
+            for outputs in self._output
+        ]
+
+    def scan(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Find all (possibly overlapping) keyword occurrences
+
+        Args:
+            text: Text to scan (lowercased with fold_case)
+
+        Returns:
+            List of (start, end, keyword) tuples in order of end offset
+        """
+        delta = self._delta
+        outputs_by_state = self._outputs_by_state
+        matches = []
+        state = 0
+
+        for end, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            outputs = outputs_by_state[state]
+            if outputs:
+                for length, keyword in outputs:
+                    matches.append((end - length, end, keyword))
+
+        return matches
+
+    def find_substrings(self, text: str) -> Set[str]:
+        """
+        Find the keywords that occur anywhere in the text
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of lowercased keywords found as substrings
+        """
+        return {keyword for _, _, keyword in self.scan(fold_case(text))}
+
+    def find_words(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Find whole-word keyword occurrences
+
+        Matches follow the semantics of re.finditer(r'\\bkeyword\\b', text,
+        re.IGNORECASE) run separately for every keyword: occurrences of the
+        same keyword never overlap, occurrences of different keywords may.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List of (start, end, keyword) tuples sorted by position
+        """
+        folded = fold_case(text)
+        last_end: Dict[str, int] = {}
+        matches = []
+
+        for start, end, keyword in self.scan(folded):
+            if start < last_end.get(keyword, 0):
+                continue
+            if not (_is_boundary(folded, start) and _is_boundary(folded, end)):
+                continue
+            last_end[keyword] = end
+            matches.append((start, end, keyword))
+
+        matches.sort()
+        return matches
+
+    def remove_words(self, text: str, keywords: Sequence[str]) -> str:
+        """
+        Remove whole-word occurrences of keywords from text
+
+        Equivalent to applying re.sub(r'\\bkeyword\\b', '', text, flags=re.IGNORECASE)
+        followed by strip() for each keyword in order: once a keyword has been
+        removed, overlapping occurrences of later keywords no longer match.
+
+        Args:
+            text: Text to clean
+            keywords: Keywords to remove, in priority order
+
+        Returns:
+            Text with the keywords removed and surrounding whitespace stripped
+        """
+        if not keywords:
+            return text
+
+        matches_by_keyword: Dict[str, List[Tuple[int, int]]] = {}
+        for start, end, keyword in self.find_words(text):
+            matches_by_keyword.setdefault(keyword, []).append((start, end))
+
+        removed: List[Tuple[int, int]] = []
+        for keyword in keywords:
+            for start, end in matches_by_keyword.get(fold_case(keyword), ()):
+                if not any(start < removed_end and removed_start < end for removed_start, removed_end in removed):
+                    removed.append((start, end))
+
+        if not removed:
+            return text.strip()
+
+        removed.sort()
+        parts = []
+        position = 0
+        for start, end in removed:
+            parts.append(text[position:start])
+            position = end
+        parts.append(text[position:])
+
+        return ''.join(parts).strip()
+
+class LanguageKeywordIndex:
+    """
+    Precompiled keyword data for one language
+
+    Bundles the automaton with lowercased lookup tables so that callers do
+    not need to normalize keyword lists on every request.
+    """
+
+    def __init__(self, task_keywords: Dict[str, List[str]], conjunction_indicators: Sequence[str] = (),
+                 alternative_indicators: Sequence[str] = (), format_keywords: Sequence[str] = ()):
+        """
+        Build the index
+
+        Args:
+            task_keywords: Task keywords by task type
+            conjunction_indicators: Conjunction indicators
+            alternative_indicators: Alternative indicators
+            format_keywords: Output format keywords
+        """
+        self.task_keywords = task_keywords
+        self.split_indicators = frozenset(fold_case(indicator) for indicator in list(conjunction_indicators) + list(alternative_indicators))
+        self.format_keywords = [(keyword, fold_case(keyword)) for keyword in format_keywords]
+
+        # (lowercased keyword, case-folded keyword, words of multi-word keywords) by task type
+        self.task_keyword_entries: Dict[str, List[Tuple[str, str, Optional[Tuple[str, ...]]]]] = {}
+        for task_type, keywords in task_keywords.items():
+            entries = []
+            for keyword in keywords:
+                keyword_lower = keyword.lower()
+                words = tuple(keyword_lower.split()) if ' ' in keyword_lower else None
+                entries.append((keyword_lower, fold_case(keyword), words))
+            self.task_keyword_entries[task_type] = entries
+
+        all_keywords = [keyword for keywords in task_keywords.values() for keyword in keywords]
+        all_keywords.extend(conjunction_indicators)
+        all_keywords.extend(alternative_indicators)
+        all_keywords.extend(format_keywords)
+        self.automaton = KeywordAutomaton(all_keywords)
+
+def build_keyword_index(language_processor: Any, language: str) -> LanguageKeywordIndex:
+    """
+    Build a keyword index from a language processor's keyword lists
+
+    Args:
+        language_processor: Processor exposing the get_*_indicators/keywords methods
+        language: Language code
+
+    Returns:
+        Index covering task keywords, split indicators and format keywords
+    """
+    index = LanguageKeywordIndex(
+        language_processor.get_task_keywords(language),
+        language_processor.get_conjunction_indicators(language),
+        language_processor.get_alternative_indicators(language),
+        language_processor.get_context_keywords(language).get("format", [])
+    )
+    logger.debug(f"Built keyword index for '{language}' with {len(index.automaton.keywords)} keywords")
+
+    return index
+
+@lru_cache(maxsize=32)
+def _build_task_keyword_index(task_keywords: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> LanguageKeywordIndex:
+    """Build a task keyword index from hashable keyword lists"""
+    return LanguageKeywordIndex({task_type: list(keywords) for task_type, keywords in task_keywords})
+
+def get_task_keyword_index(task_keywords: Dict[str, List[str]]) -> LanguageKeywordIndex:
+    """
+    Get an index over task keywords only, cached by the keywords' content
+
+    Callers that pass a freshly built but identical keyword dictionary reuse
+    the same automaton instead of compiling a new one.
+
+    Args:
+        task_keywords: Task keywords by task type
+
+    Returns:
+        Index covering the task keywords
+    """
+    return _build_task_keyword_index(
+        tuple((task_type, tuple(keywords)) for task_type, keywords in task_keywords.items())
+    )
@@ -0,0 +1,332 @@
+"""
+Language Detector Module for ALT_LAS Segmentation Service
+
+This module provides a compiled language detector for the regex-based language
+patterns used by the language processor. Instead of running every pattern over
+the whole text, it scores all languages with one tokenization pass over a
+keyword table and a single character histogram, stops early once one language
+clearly leads, and remembers recent results in a small LRU cache.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Pattern, Set, Tuple
+
+# Configure logging
+logger = logging.getLogger('language_detector')
+
+# Patterns of the form \b(word|word|...)\b
+_WORD_PATTERN = re.compile(r'^\\b\(((?:\w+\|)*\w+)\)\\b$')
+
+# Patterns of the form [chars] (no ranges, escapes or negation)
+_CHAR_CLASS_PATTERN = re.compile(r'^\[([^\]\\\-^]+)\]$')
+
+# Maximal runs of word characters, i.e. the spans \b(word)\b can match
+_TOKEN = re.compile(r'\w+')
+
+# Chunk boundaries are moved to whitespace so that no word is split
+_WHITESPACE = re.compile(r'\s')
+
+# Every code point of the Basic Multilingual Plane except surrogates, used to
+# find the characters a character class matches under re.IGNORECASE
+_BMP_CHARS = ''.join(chr(code) for code in range(0x10000) if not 0xD800 <= code <= 0xDFFF)
+
+class LanguageDetector:
+    """
+    Scores texts against per-language regex patterns in a single pass
+
+    Scores are identical to summing len(re.findall(pattern, text, re.IGNORECASE))
+    over each language's patterns, as long as the text fits into the first chunk
+    or no early exit is taken.
+    """
+
+    def __init__(self, language_patterns: Dict[str, List[str]], default_language: str = 'en',
+                 chunk_size: int = 1000, min_evidence: int = 20, confidence_threshold: float = 0.8,
+                 cache_size: int = 1024):
+        """
+        Compile the detector
+
+        Args:
+            language_patterns: Regex patterns by language code, in priority order for ties
+            default_language: Language returned when no pattern matches
+            chunk_size: Number of characters scored before checking for an early exit
+            min_evidence: Minimum total score before an early exit is allowed
+            confidence_threshold: Share of the total score the leading language needs for an early exit
+            cache_size: Maximum number of cached detection results
+        """
+        self.languages = list(language_patterns.keys())
+        self.default_language = default_language
+        self.chunk_size = chunk_size
+        self.min_evidence = min_evidence
+        self.confidence_threshold = confidence_threshold
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[object, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.early_exits = 0
+
+        self._compile(language_patterns)
+
+    def _compile(self, language_patterns: Dict[str, List[str]]):
+        """
+        Split patterns into keyword lists, character classes and generic regexes
+
+        Args:
+            language_patterns: Regex patterns by language code
+        """
+        word_languages: Dict[str, Counter] = {}
+        char_languages: Dict[str, Counter] = {}
+        self._fallback_patterns: List[Tuple[str, Pattern]] = []
+
+        for language, patterns in language_patterns.items():
+            for pattern in patterns:
+                word_match = _WORD_PATTERN.match(pattern)
+                char_match = _CHAR_CLASS_PATTERN.match(pattern)
+
+                if word_match:
+                    for word in word_match.group(1).split('|'):
+                        word_languages.setdefault(word.lower(), Counter())[language] += 1
+                elif char_match:
+                    # Expand the class to every character it matches case-insensitively
+                    for char in re.findall(pattern, _BMP_CHARS, re.IGNORECASE):
+                        char_languages.setdefault(char, Counter())[language] += 1
+                else:
+                    self._fallback_patterns.append((language, re.compile(pattern, re.IGNORECASE)))
+
+        self._word_table = self._build_case_table(set(''.join(word_languages)))
+        self._word_scores: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+        self._word_regex = None
+
+        if self._word_table is not None:
+            # Keywords are looked up by their canonical form after case folding
+            merged: Dict[str, Counter] = {}
+            for word, languages in word_languages.items():
+                merged.setdefault(word.translate(self._word_table), Counter()).update(languages)
+            self._word_scores = {word: tuple(languages.items()) for word, languages in merged.items()}
+        elif word_languages:
+            # One named group per distinct set of languages a keyword scores for
+            groups: Dict[Tuple[Tuple[str, int], ...], List[str]] = {}
+            for word, languages in word_languages.items():
+                groups.setdefault(tuple(sorted(languages.items())), []).append(word)
+
+            self._group_scores: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+            alternatives = []
+            for index, (scores, words) in enumerate(groups.items()):
+                group_name = f"g{index}"
+                self._group_scores[group_name] = scores
+                words.sort(key=len, reverse=True)
+                alternatives.append(f"(?P<{group_name}>{'|'.join(re.escape(word) for word in words)})")
+
+            self._word_regex = re.compile(r'\b(?:' + '|'.join(alternatives) + r')\b', re.IGNORECASE)
+
+        self._char_scores: Dict[str, Tuple[Tuple[str, int], ...]] = {
+            char: tuple(languages.items()) for char, languages in char_languages.items()
+        }
+
+        logger.debug(
+            f"Compiled language detector: {len(word_languages)} keywords, {len(self._char_scores)} characters, "
+            f"{len(self._fallback_patterns)} fallback patterns"
+        )
+
+    @staticmethod
+    def _build_case_table(word_chars: Set[str]) -> Optional[Dict[int, str]]:
+        """
+        Build a translation table that folds case the way re.IGNORECASE does
+
+        str.lower() alone misses some of the equivalences re applies (for example
+        'I', 'İ' and 'ı' all match 'i'). The table maps every character that
+        matches a keyword character to one canonical keyword character.
+
+        Args:
+            word_chars: Characters occurring in the (lowercased) keywords
+
+        Returns:
+            Translation table, or None if the equivalences cannot be expressed as one
+        """
+        if not word_chars:
+            return {}
+
+        char_class = '[' + re.escape(''.join(sorted(word_chars))) + ']'
+        candidates = ''.join(re.findall(char_class, _BMP_CHARS, re.IGNORECASE))
+        equivalents = {
+            char: frozenset(re.findall('[' + re.escape(char) + ']', candidates, re.IGNORECASE))
+            for char in word_chars
+        }
+
+        table = {}
+        for candidate in candidates:
+            owners = sorted(char for char in word_chars if candidate in equivalents[char])
+            # Keyword characters sharing a candidate must match exactly the same characters
+            if len({equivalents[owner] for owner in owners}) != 1:
+                return None
+            if candidate != owners[0]:
+                table[ord(candidate)] = owners[0]
+
+        return table
+
+    def _score_chunk(self, text: str, scores: Dict[str, int]):
+        """
+        Add the pattern match counts of a text chunk to the scores
+
+        Args:
+            text: Text chunk (must not split a word)
+            scores: Scores by language, updated in place
+        """
+        if self._word_scores:
+            word_scores = self._word_scores
+            for token in _TOKEN.findall(text.translate(self._word_table).lower()):
+                languages = word_scores.get(token)
+                if languages:
+                    for language, count in languages:
+                        scores[language] += count
+        elif self._word_regex is not None:
+            group_scores = self._group_scores
+            for match in self._word_regex.finditer(text):
+                for language, count in group_scores[match.lastgroup]:
+                    scores[language] += count
+
+        char_scores = self._char_scores
+        for char, occurrences in Counter(text).items():
+            languages = char_scores.get(char)
+            if languages:
+                for language, count in languages:
+                    scores[language] += count * occurrences
+
+        for language, pattern in self._fallback_patterns:
+            scores[language] += len(pattern.findall(text))
+
+    def _chunks(self, text: str):
+        """
+        Split text into chunks of about chunk_size characters at whitespace
+
+        Args:
+            text: Input text
+
+        Yields:
+            Consecutive chunks that together make up the text
+        """
+        start = 0
+        length = len(text)
+        while start < length:
+            end = start + self.chunk_size
+            if end >= length:
+                yield text[start:]
+                return
+
+            # Extend to the next whitespace so that no word is split
+            match = _WHITESPACE.search(text, end)
+            end = match.start() if match else length
+            yield text[start:end]
+            start = end
+
+    def score(self, text: str, early_exit: bool = True) -> Tuple[Dict[str, int], bool]:
+        """
+        Score a text for every language
+
+        Args:
+            text: Input text
+            early_exit: Stop after a chunk once one language clearly leads
+
+        Returns:
+            Tuple of (scores by language, whether scoring stopped early)
+        """
+        scores = {language: 0 for language in self.languages}
+        scored_length = 0
+
+        for chunk in self._chunks(text):
+            self._score_chunk(chunk, scores)
+            scored_length += len(chunk)
+
+            if early_exit and scored_length < len(text):
+                total = sum(scores.values())
+                if total >= self.min_evidence and max(scores.values()) >= self.confidence_threshold * total:
+                    return scores, True
+
+        return scores, False
+
+    def _select(self, scores: Dict[str, int]) -> Tuple[str, int]:
+        """
+        Pick the highest scoring language (earlier languages win ties)
+
+        Args:
+            scores: Scores by language
+
+        Returns:
+            Tuple of (language code, score)
+        """
+        max_score = 0
+        detected_language = self.default_language
+
+        for language in self.languages:
+            if scores[language] > max_score:
+                max_score = scores[language]
+                detected_language = language
+
+        return detected_language, max_score
+
+    def _cache_key(self, text: str) -> object:
+        """Use short texts directly as cache keys and hash long ones"""
+        if len(text) <= 256:
+            return text
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def detect(self, text: str) -> str:
+        """
+        Detect the language of a text
+
+        Args:
+            text: Input text
+
+        Returns:
+            Language code (default_language if no pattern matches)
+        """
+        key = self._cache_key(text)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached
+            self.cache_misses += 1
+
+        scores, stopped_early = self.score(text)
+        detected_language, max_score = self._select(scores)
+
+        with self._lock:
+            if stopped_early:
+                self.early_exits += 1
+            if self.cache_size > 0:
+                self._cache[key] = detected_language
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        logger.debug(f"Detected language: {detected_language} (score: {max_score})")
+        return detected_language
+
+    def clear_cache(self):
+        """Clear cached detection results"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get detector statistics
+
+        Returns:
+            Dictionary with cache size, cache hits/misses and early exits
+        """
+        with self._lock:
+            return {
+                "cache_size": len(self._cache),
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "early_exits": self.early_exits
+            }
@@ -13,6 +13,8 @@ import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.corpus import stopwords
 
+from keyword_matcher import LanguageKeywordIndex, build_keyword_index
+
 # Configure logging
 logger = logging.getLogger('language_processor')
 
@@ -168,6 +170,9 @@ class LanguageProcessor:
             'en': set(stopwords.words('english')),
             'tr': set(turkish_stops)
         }
+        
+        # Precompiled keyword indexes by language, built on first use
+        self.keyword_indexes: Dict[str, LanguageKeywordIndex] = {}
     
     def detect_language(self, text: str) -> str:
         """
@@ -317,6 +322,22 @@ class LanguageProcessor:
             Dictionary of relationship indicators
         """
         return self.relationship_indicators.get(language, self.relationship_indicators['en'])
+    
+    def get_keyword_index(self, language: str) -> LanguageKeywordIndex:
+        """
+        Get the precompiled keyword index (Aho-Corasick automaton) for the specified language
+        
+        Args:
+            language: Language code ('en' or 'tr')
+            
+        Returns:
+            Keyword index covering task keywords, split indicators and format keywords
+        """
+        index = self.keyword_indexes.get(language)
+        if index is None:
+            index = build_keyword_index(self, language)
+            self.keyword_indexes[language] = index
+        return index
 
 # Create a global instance
 language_processor = LanguageProcessor()
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.gzip import GZipMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 import uuid
 import datetime
@@ -29,8 +29,13 @@ memory_threshold_mb = float(os.environ.get("MEMORY_THRESHOLD_MB", "500"))
 high_memory_threshold_mb = float(os.environ.get("HIGH_MEMORY_THRESHOLD_MB", "1000"))
 gc_interval = int(os.environ.get("GC_INTERVAL", "60"))
 max_cache_size = int(os.environ.get("MAX_CACHE_SIZE", "100"))
+max_cache_mb = float(os.environ.get("MAX_CACHE_MB", "64"))
+# Defaults and upper bounds for the per-request batch settings of /segment/batch
+nlp_batch_size = int(os.environ.get("NLP_BATCH_SIZE", "32"))
+nlp_n_process = int(os.environ.get("NLP_N_PROCESS", "1"))
 
-logger.info(f"Memory configuration: threshold={memory_threshold_mb}MB, high_threshold={high_memory_threshold_mb}MB, gc_interval={gc_interval}s, max_cache_size={max_cache_size}")
+logger.info(f"Memory configuration: threshold={memory_threshold_mb}MB, high_threshold={high_memory_threshold_mb}MB, gc_interval={gc_interval}s, max_cache_size={max_cache_size}, max_cache_mb={max_cache_mb}MB")
+logger.info(f"Batch configuration: batch_size={nlp_batch_size}, n_process={nlp_n_process}")
 
 # Initialize memory optimizer with configuration
 memory_optimizer = get_memory_optimizer()
@@ -41,6 +46,7 @@ memory_optimizer.gc_interval = gc_interval
 # Initialize language processor with configuration
 language_processor = get_enhanced_language_processor()
 language_processor.max_cache_size = max_cache_size
+language_processor.max_cache_bytes = int(max_cache_mb * 1024 * 1024)
 
 # Create FastAPI app
 app = FastAPI(title="ALT_LAS Segmentation Service")
@@ -84,6 +90,48 @@ class SegmentationResponse(BaseModel):
     alt_file: str
     metadata: Dict[str, Any]
 
+class BatchSegmentationRequest(BaseModel):
+    commands: List[SegmentationRequest]
+    batch_size: Optional[int] = Field(None, ge=1)
+    n_process: Optional[int] = Field(None, ge=1)
+
+class BatchSegmentationResponse(BaseModel):
+    results: List[SegmentationResponse]
+    metadata: Dict[str, Any]
+
+def get_request_language(request: SegmentationRequest) -> Optional[str]:
+    """Get the language hint from request metadata, if any"""
+    if request.metadata and "language" in request.metadata:
+        return request.metadata["language"]
+    return None
+
+def build_segmentation_response(task_id: str, request: SegmentationRequest, language: str, doc) -> SegmentationResponse:
+    """Create a segmentation response with NLP-derived metadata"""
+    # In a real implementation, this would analyze the command and create an ALT file
+    # For now, we'll just create a mock response with some NLP-derived information
+
+    # Create metadata with NLP-derived information
+    metadata = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "mode": request.mode,
+        "persona": request.persona,
+        "command_length": len(request.command),
+        "language": language,
+        "sentence_count": len(list(language_processor.get_sentences(doc))) if doc else 1,
+        "token_count": len(list(language_processor.get_tokens(doc))) if doc else len(request.command.split())
+    }
+
+    # If additional metadata was provided, merge it
+    if request.metadata:
+        metadata.update(request.metadata)
+
+    return SegmentationResponse(
+        id=task_id,
+        status="completed",
+        alt_file=f"task_{task_id}.alt",
+        metadata=metadata
+    )
+
 @app.get("/")
 def read_root():
     return {"message": "ALT_LAS Segmentation Service"}
@@ -100,8 +148,17 @@ def memory_stats():
     memory_report = memory_optimizer.get_memory_usage_report()
 
     # Get language processor stats
+    cache_stats = language_processor.get_cache_stats()
     language_stats = {
-        "cache_size": len(language_processor.doc_cache),
+        "cache_size": cache_stats["size"],
+        "cache_bytes": cache_stats["bytes"],
+        "cache_max_bytes": cache_stats["max_bytes"],
+        "cache_hits": cache_stats["hits"],
+        "cache_misses": cache_stats["misses"],
+        "cache_hit_rate": cache_stats["hit_rate"],
+        "cache_evictions": cache_stats["evictions"],
+        "cache_evicted_bytes": cache_stats["evicted_bytes"],
+        "language_detector": language_processor.language_detector.get_stats(),
         "loaded_models": list(language_processor.nlp_models.keys())
     }
 
@@ -144,10 +201,8 @@ def segment_command(request: SegmentationRequest):
         logger.info(f"Processing segmentation request: {task_id}, command length: {len(request.command)}")
 
         # Detect language
-        language = None
-        if request.metadata and "language" in request.metadata:
-            language = request.metadata["language"]
-        else:
+        language = get_request_language(request)
+        if language is None:
             # Auto-detect language
             language = language_processor.detect_language(request.command)
             logger.info(f"Detected language: {language}")
@@ -156,31 +211,8 @@ def segment_command(request: SegmentationRequest):
         # This will use the lazy loading and caching mechanisms
         doc = language_processor.process_text(request.command, language)
 
-        # In a real implementation, this would analyze the command and create an ALT file
-        # For now, we'll just create a mock response with some NLP-derived information
-
-        # Create metadata with NLP-derived information
-        metadata = {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "mode": request.mode,
-            "persona": request.persona,
-            "command_length": len(request.command),
-            "language": language,
-            "sentence_count": len(list(language_processor.get_sentences(doc))) if doc else 1,
-            "token_count": len(list(language_processor.get_tokens(doc))) if doc else len(request.command.split())
-        }
-
-        # If additional metadata was provided, merge it
-        if request.metadata:
-            metadata.update(request.metadata)
-
         # Create response
-        response = SegmentationResponse(
-            id=task_id,
-            status="completed",
-            alt_file=f"task_{task_id}.alt",
-            metadata=metadata
-        )
+        response = build_segmentation_response(task_id, request, language, doc)
 
         # Check memory usage and optimize if needed
         memory_optimizer.optimize_if_needed()
@@ -192,6 +224,61 @@ def segment_command(request: SegmentationRequest):
         memory_optimizer.optimize_memory(aggressive=True)
         raise HTTPException(status_code=500, detail=f"Segmentation error: {str(e)}")
 
+@app.post("/segment/batch", response_model=BatchSegmentationResponse)
+def segment_commands_batch(request: BatchSegmentationRequest):
+    try:
+        # Clients may lower the configured batch settings, never raise them
+        batch_size = min(request.batch_size or nlp_batch_size, nlp_batch_size)
+        n_process = min(request.n_process or nlp_n_process, nlp_n_process)
+
+        # Log request
+        logger.info(f"Processing batch segmentation request: {len(request.commands)} commands, batch_size={batch_size}, n_process={n_process}")
+        start_time = time.time()
+
+        # Resolve languages up front so commands can be grouped per language model
+        languages = []
+        for command_request in request.commands:
+            language = get_request_language(command_request)
+            if language is None:
+                language = language_processor.detect_language(command_request.command)
+            languages.append(language)
+
+        # Process all commands with nlp.pipe, grouped by language
+        docs = language_processor.process_texts(
+            [command_request.command for command_request in request.commands],
+            languages,
+            batch_size=batch_size,
+            n_process=n_process
+        )
+
+        # Build responses in request order
+        results = [
+            build_segmentation_response(str(uuid.uuid4()), command_request, language, doc)
+            for command_request, language, doc in zip(request.commands, languages, docs)
+        ]
+
+        process_time = time.time() - start_time
+
+        # Check memory usage and optimize if needed
+        memory_optimizer.optimize_if_needed()
+
+        return BatchSegmentationResponse(
+            results=results,
+            metadata={
+                "timestamp": datetime.datetime.now().isoformat(),
+                "command_count": len(results),
+                "languages": sorted(set(languages)),
+                "batch_size": batch_size,
+                "n_process": n_process,
+                "processing_time": process_time
+            }
+        )
+    except Exception as e:
+        logger.error(f"Error processing batch segmentation request: {str(e)}", exc_info=True)
+        # Force memory optimization after error
+        memory_optimizer.optimize_memory(aggressive=True)
+        raise HTTPException(status_code=500, detail=f"Batch segmentation error: {str(e)}")
+
 @app.get("/segment/{task_id}", response_model=SegmentationResponse)
 def get_segmentation_status(task_id: str):
     # In a real implementation, this would check the status of a segmentation task
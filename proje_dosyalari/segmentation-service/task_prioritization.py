@@ -7,8 +7,11 @@ It allows customization of prioritization weights and parameters.
 
 import logging
 import datetime
+import heapq
 import json
 import os
+import weakref
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from dsl_schema import AltFile, TaskSegment
 
@@ -19,6 +22,119 @@ logging.basicConfig(
 )
 logger = logging.getLogger("task-prioritization")
 
+class SegmentGraph:
+    """
+    Indexed dependency graph of the segments in an ALT file
+    
+    Holds a segment-id map and forward/reverse dependency indexes so that
+    execution ordering and single-segment updates do not rescan the file.
+    """
+    
+    def __init__(self, segments: List[TaskSegment]):
+        """
+        Build the graph
+        
+        Args:
+            segments: Segments of the ALT file
+        """
+        self.segments: Dict[str, TaskSegment] = {}
+        self.positions: Dict[str, int] = {}
+        self.dependencies: Dict[str, List[str]] = {}
+        self.dependents: Dict[str, List[str]] = {}
+        
+        for position, segment in enumerate(segments):
+            # Like the segment lookups elsewhere, the first segment with an id wins
+            if segment.id not in self.segments:
+                self.segments[segment.id] = segment
+                self.positions[segment.id] = position
+                self.dependents[segment.id] = []
+        
+        for segment_id, segment in self.segments.items():
+            self._link(segment_id, segment.dependencies)
+    
+    def __len__(self) -> int:
+        return len(self.segments)
+    
+    def _link(self, segment_id: str, dependencies: List[str]) -> None:
+        """
+        Add the dependency edges of a segment
+        
+        Args:
+            segment_id: Segment ID
+            dependencies: IDs of segments the segment depends on
+        """
+        known_dependencies = []
+        for dependency in dependencies:
+            if dependency == segment_id:
+                logger.warning(f"Segment depends on itself, ignoring: {segment_id}")
+            elif dependency not in self.segments:
+                logger.warning(f"Unknown dependency {dependency} for segment: {segment_id}")
+            elif dependency not in known_dependencies:
+                known_dependencies.append(dependency)
+                self.dependents[dependency].append(segment_id)
+        
+        self.dependencies[segment_id] = known_dependencies
+    
+    def update_segment(self, segment: TaskSegment) -> None:
+        """
+        Replace a segment and re-index its dependencies
+        
+        Args:
+            segment: Updated segment (must have an ID already in the graph)
+        """
+        for dependency in self.dependencies.get(segment.id, []):
+            self.dependents[dependency].remove(segment.id)
+        
+        self.segments[segment.id] = segment
+        self._link(segment.id, segment.dependencies)
+    
+    def execution_order(self) -> Dict[str, int]:
+        """
+        Order segments so that dependencies come first
+        
+        Uses Kahn's algorithm with a heap of ready segments, so that among the
+        segments whose dependencies are done, the one with the highest priority
+        score (then the earliest in the file) runs first. Segments on a
+        dependency cycle are released one at a time in the same order, from a
+        second heap holding the segments that were blocked at the start.
+        
+        Returns:
+            Execution order mapping (segment_id -> order, starting at 1)
+        """
+        in_degree = {segment_id: len(dependencies) for segment_id, dependencies in self.dependencies.items()}
+        
+        def sort_key(segment_id: str) -> Tuple[float, int, str]:
+            return (-self.segments[segment_id].metadata.get("priority_score", 0), self.positions[segment_id], segment_id)
+        
+        ready = []
+        blocked = []
+        for segment_id, degree in in_degree.items():
+            (blocked if degree else ready).append(sort_key(segment_id))
+        heapq.heapify(ready)
+        heapq.heapify(blocked)
+        
+        execution_order = {}
+        while len(execution_order) < len(self.segments):
+            if not ready:
+                # Only cycles remain: release the best blocked segment, skipping those ordered since
+                while blocked[0][2] in execution_order:
+                    heapq.heappop(blocked)
+                cyclic = heapq.heappop(blocked)
+                logger.warning(f"Cyclic dependency detected for segment: {cyclic[2]}")
+                heapq.heappush(ready, cyclic)
+            
+            segment_id = heapq.heappop(ready)[2]
+            if segment_id in execution_order:
+                continue
+            execution_order[segment_id] = len(execution_order) + 1
+            
+            for dependent in self.dependents[segment_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0 and dependent not in execution_order:
+                    heapq.heappush(ready, sort_key(dependent))
+        
+        return execution_order
+
 class TaskPrioritizer:
     """
     Task prioritizer for ALT files
@@ -47,6 +163,11 @@ class TaskPrioritizer:
         self.config_dir = os.path.join(os.getcwd(), "config")
         os.makedirs(self.config_dir, exist_ok=True)
         
+        # Segment graphs of recently prioritized ALT files, for incremental updates.
+        # Files are weakly referenced, and an entry is dropped when its file is collected.
+        self._segment_graphs: "OrderedDict[str, Tuple[weakref.ref, SegmentGraph]]" = OrderedDict()
+        self.max_cached_graphs = 32
+        
         # Default config file path
         self.default_config_file = os.path.join(self.config_dir, "prioritization_config.json")
         
@@ -151,44 +272,14 @@ class TaskPrioritizer:
             logger.info(f"Prioritizing ALT file: {alt_file.id}")
             
             # Calculate priority scores for each segment
+            context = self._build_file_context(alt_file)
             for segment in alt_file.segments:
-                # Calculate factors
-                dependency_factor = self._calculate_dependency_factor(segment, alt_file)
-                urgency_factor = self._calculate_urgency_factor(segment, alt_file)
-                user_pref_factor = self._calculate_user_preference_factor(segment, alt_file)
-                confidence_factor = self._calculate_confidence_factor(segment)
-                
-                # Calculate weighted priority score
-                priority_score = (
-                    self.dependency_weight * dependency_factor +
-                    self.urgency_weight * urgency_factor +
-                    self.user_pref_weight * user_pref_factor +
-                    self.confidence_weight * confidence_factor
-                )
-                
-                # Store priority score in segment metadata
-                segment.metadata["priority_score"] = round(priority_score, 3)
-                
-                # Store individual factors for transparency
-                segment.metadata["dependency_factor"] = round(dependency_factor, 3)
-                segment.metadata["urgency_factor"] = round(urgency_factor, 3)
-                segment.metadata["user_preference_factor"] = round(user_pref_factor, 3)
-                segment.metadata["confidence_factor"] = round(confidence_factor, 3)
-            
-            # Determine execution order based on dependencies and priority scores
-            execution_order = self._determine_execution_order(alt_file)
+                self._score_segment(segment, alt_file, context)
             
-            # Store execution order in segment metadata
-            for segment_id, order in execution_order.items():
-                for segment in alt_file.segments:
-                    if segment.id == segment_id:
-                        segment.metadata["execution_order"] = order
-                        break
-            
-            # Add prioritization metadata to ALT file
-            alt_file.metadata["prioritized"] = True
-            alt_file.metadata["prioritization_timestamp"] = datetime.datetime.now().isoformat()
-            alt_file.metadata["prioritization_config"] = self.get_config()
+            # Index the dependency graph once and determine execution order
+            graph = SegmentGraph(alt_file.segments)
+            self._cache_segment_graph(alt_file, graph)
+            self._apply_execution_order(alt_file, graph)
             
             logger.info(f"ALT file prioritized successfully: {alt_file.id}")
             return alt_file
@@ -196,72 +287,172 @@ class TaskPrioritizer:
             logger.error(f"Error prioritizing ALT file: {str(e)}")
             raise
     
-    def _determine_execution_order(self, alt_file: AltFile) -> Dict[str, int]:
+    def reprioritize_segment(self, alt_file: AltFile, segment_id: str) -> AltFile:
         """
-        Determine execution order based on dependencies and priority scores
+        Update priorities after a single segment changed
+        
+        Only the changed segment is rescored and its dependency edges re-indexed;
+        the execution order of the file is then recomputed from the cached graph.
+        Falls back to a full prioritization if the file was not prioritized before
+        or its segment list changed.
         
         Args:
-            alt_file: ALT file
+            alt_file: Previously prioritized ALT file
+            segment_id: ID of the segment whose metadata or dependencies changed
             
         Returns:
-            Execution order mapping (segment_id -> order)
+            Prioritized ALT file
         """
-        # Create dependency graph
-        dependency_graph = {}
-        for segment in alt_file.segments:
-            dependency_graph[segment.id] = segment.dependencies
-        
-        # Topological sort with priority tie-breaking
-        execution_order = {}
-        visited = set()
-        temp_visited = set()
-        order = 1
+        graph = self._get_segment_graph(alt_file)
+        position = graph.positions.get(segment_id) if graph is not None else None
+        if position is None or alt_file.segments[position].id != segment_id:
+            return self.prioritize_alt_file(alt_file)
         
-        def visit(segment_id):
-            nonlocal order
-            
-            # Check for cyclic dependencies
-            if segment_id in temp_visited:
-                logger.warning(f"Cyclic dependency detected for segment: {segment_id}")
-                return
+        try:
+            segment = alt_file.segments[position]
+            previous_score = segment.metadata.get("priority_score")
+            previous_dependencies = graph.dependencies[segment_id]
+            replaced = graph.segments[segment_id] is not segment
             
-            # Skip if already visited
-            if segment_id in visited:
-                return
+            graph.update_segment(segment)
+            self._score_segment(segment, alt_file, self._build_file_context(alt_file))
             
-            # Mark as temporarily visited
-            temp_visited.add(segment_id)
+            # The order only changes if the score or the dependency edges did
+            if (segment.metadata["priority_score"] != previous_score or
+                    graph.dependencies[segment_id] != previous_dependencies or replaced):
+                self._apply_execution_order(alt_file, graph)
             
-            # Visit dependencies
-            for dependency in dependency_graph.get(segment_id, []):
-                visit(dependency)
+            logger.info(f"Reprioritized segment {segment_id} in ALT file: {alt_file.id}")
+            return alt_file
+        except Exception as e:
+            logger.error(f"Error reprioritizing segment {segment_id}: {str(e)}")
+            raise
+    
+    def _build_file_context(self, alt_file: AltFile) -> Dict[str, Any]:
+        """
+        Precompute ALT file level values shared by all segments
+        
+        Args:
+            alt_file: ALT file
             
-            # Mark as visited
-            visited.add(segment_id)
-            temp_visited.remove(segment_id)
+        Returns:
+            Context with the file deadline (parsed, or None)
+        """
+        deadline = None
+        if "deadline" in alt_file.metadata:
+            try:
+                deadline = datetime.datetime.fromisoformat(alt_file.metadata["deadline"])
+            except (ValueError, TypeError):
+                # Invalid deadline format, ignore
+                pass
+        
+        return {"deadline": deadline}
+    
+    def _score_segment(self, segment: TaskSegment, alt_file: AltFile, context: Optional[Dict[str, Any]] = None) -> float:
+        """
+        Calculate the priority score of a segment and store it in its metadata
+        
+        Args:
+            segment: Task segment to score
+            alt_file: Parent ALT file
+            context: File context from _build_file_context
             
-            # Assign execution order
-            execution_order[segment_id] = order
-            order += 1
-        
-        # Get segments sorted by priority score (highest first)
-        segments_by_priority = sorted(
-            alt_file.segments,
-            key=lambda s: s.metadata.get("priority_score", 0),
-            reverse=True
+        Returns:
+            Priority score
+        """
+        # Calculate factors
+        dependency_factor = self._calculate_dependency_factor(segment, alt_file)
+        urgency_factor = self._calculate_urgency_factor(segment, alt_file, context)
+        user_pref_factor = self._calculate_user_preference_factor(segment, alt_file)
+        confidence_factor = self._calculate_confidence_factor(segment)
+        
+        # Calculate weighted priority score
+        priority_score = (
+            self.dependency_weight * dependency_factor +
+            self.urgency_weight * urgency_factor +
+            self.user_pref_weight * user_pref_factor +
+            self.confidence_weight * confidence_factor
         )
         
-        # Visit segments in priority order
-        for segment in segments_by_priority:
-            if segment.id not in visited:
-                visit(segment.id)
+        # Store priority score in segment metadata
+        segment.metadata["priority_score"] = round(priority_score, 3)
         
-        # Reverse the order (highest order should be first)
-        max_order = max(execution_order.values())
-        for segment_id in execution_order:
-            execution_order[segment_id] = max_order - execution_order[segment_id] + 1
+        # Store individual factors for transparency
+        segment.metadata["dependency_factor"] = round(dependency_factor, 3)
+        segment.metadata["urgency_factor"] = round(urgency_factor, 3)
+        segment.metadata["user_preference_factor"] = round(user_pref_factor, 3)
+        segment.metadata["confidence_factor"] = round(confidence_factor, 3)
         
-        return execution_order
+        return priority_score
+    
+    def _apply_execution_order(self, alt_file: AltFile, graph: SegmentGraph) -> None:
+        """
+        Store execution order and prioritization metadata in the ALT file
+        
+        Args:
+            alt_file: ALT file
+            graph: Segment graph of the ALT file
+        """
+        # Determine execution order based on dependencies and priority scores
+        execution_order = graph.execution_order()
+        
+        # Store execution order in segment metadata
+        for segment_id, order in execution_order.items():
+            graph.segments[segment_id].metadata["execution_order"] = order
+        
+        # Add prioritization metadata to ALT file
+        alt_file.metadata["prioritized"] = True
+        alt_file.metadata["prioritization_timestamp"] = datetime.datetime.now().isoformat()
+        alt_file.metadata["prioritization_config"] = self.get_config()
+    
+    def _cache_segment_graph(self, alt_file: AltFile, graph: SegmentGraph) -> None:
+        """
+        Remember the segment graph of an ALT file for incremental updates
+        
+        Args:
+            alt_file: ALT file
+            graph: Segment graph of the ALT file
+        """
+        segment_graphs = self._segment_graphs
+        
+        def forget(file_ref: weakref.ref, file_id: str = alt_file.id) -> None:
+            entry = segment_graphs.get(file_id)
+            if entry is not None and entry[0] is file_ref:
+                segment_graphs.pop(file_id, None)
+        
+        self._segment_graphs[alt_file.id] = (weakref.ref(alt_file, forget), graph)
+        self._segment_graphs.move_to_end(alt_file.id)
+        while len(self._segment_graphs) > self.max_cached_graphs:
+            self._segment_graphs.popitem(last=False)
+    
+    def _get_segment_graph(self, alt_file: AltFile) -> Optional[SegmentGraph]:
+        """
+        Get the cached segment graph of an ALT file if it is still valid
+        
+        Args:
+            alt_file: ALT file
+            
+        Returns:
+            Segment graph, or None if the file was not prioritized or its segment list changed
+        """
+        entry = self._segment_graphs.get(alt_file.id)
+        if entry is None or entry[0]() is not alt_file or len(entry[1]) != len(alt_file.segments):
+            return None
+        
+        self._segment_graphs.move_to_end(alt_file.id)
+        return entry[1]
+    
+    def _determine_execution_order(self, alt_file: AltFile) -> Dict[str, int]:
+        """
+        Determine execution order based on dependencies and priority scores
+        
+        Args:
+            alt_file: ALT file
+            
+        Returns:
+            Execution order mapping (segment_id -> order)
+        """
+        return SegmentGraph(alt_file.segments).execution_order()
     
     def _calculate_dependency_factor(self, segment: TaskSegment, alt_file: AltFile) -> float:
         """
@@ -290,13 +481,14 @@ class TaskPrioritizer:
         
         return dependency_ratio
     
-    def _calculate_urgency_factor(self, segment: TaskSegment, alt_file: AltFile) -> float:
+    def _calculate_urgency_factor(self, segment: TaskSegment, alt_file: AltFile, context: Optional[Dict[str, Any]] = None) -> float:
         """
         Calculate urgency factor for a task segment
         
         Args:
             segment: Task segment to calculate urgency factor for
             alt_file: Parent ALT file
+            context: File context from _build_file_context (built if not given)
             
         Returns:
             Urgency factor (0-1 scale)
@@ -317,49 +509,52 @@ class TaskPrioritizer:
         
         # Check if deadline is specified
         if "deadline" in segment.metadata:
-            deadline_str = segment.metadata["deadline"]
             try:
-                deadline = datetime.datetime.fromisoformat(deadline_str)
-                now = datetime.datetime.now()
-                time_diff = deadline - now
-                
-                # Calculate urgency based on time remaining
-                if time_diff.total_seconds() <= 0:
-                    # Past deadline, highest urgency
-                    urgency = 10
-                else:
-                    # Scale urgency based on time remaining (up to 7 days)
-                    days_remaining = time_diff.total_seconds() / (24 * 60 * 60)
-                    if days_remaining < 7:
-                        urgency = max(urgency, 10 - days_remaining)
-            except (ValueError, TypeError):
-                # Invalid deadline format, ignore
-                pass
-        elif "deadline" in alt_file.metadata:
-            deadline_str = alt_file.metadata["deadline"]
-            try:
-                deadline = datetime.datetime.fromisoformat(deadline_str)
-                now = datetime.datetime.now()
-                time_diff = deadline - now
-                
-                # Calculate urgency based on time remaining
-                if time_diff.total_seconds() <= 0:
-                    # Past deadline, highest urgency
-                    urgency = 10
-                else:
-                    # Scale urgency based on time remaining (up to 7 days)
-                    days_remaining = time_diff.total_seconds() / (24 * 60 * 60)
-                    if days_remaining < 7:
-                        urgency = max(urgency, 10 - days_remaining)
+                deadline = datetime.datetime.fromisoformat(segment.metadata["deadline"])
+                urgency = self._apply_deadline(urgency, deadline)
             except (ValueError, TypeError):
                 # Invalid deadline format, ignore
                 pass
+        else:
+            if context is None:
+                context = self._build_file_context(alt_file)
+            if context["deadline"] is not None:
+                try:
+                    urgency = self._apply_deadline(urgency, context["deadline"])
+                except TypeError:
+                    # Deadline not comparable with local time, ignore
+                    pass
         
         # Normalize urgency to 0-1 scale
         urgency_factor = urgency / 10
         
         return urgency_factor
     
+    def _apply_deadline(self, urgency: float, deadline: datetime.datetime) -> float:
+        """
+        Raise urgency as a deadline approaches
+        
+        Args:
+            urgency: Urgency without the deadline (0-10 scale)
+            deadline: Deadline
+            
+        Returns:
+            Urgency taking the deadline into account
+        """
+        time_diff = deadline - datetime.datetime.now()
+        
+        # Calculate urgency based on time remaining
+        if time_diff.total_seconds() <= 0:
+            # Past deadline, highest urgency
+            return 10
+        
+        # Scale urgency based on time remaining (up to 7 days)
+        days_remaining = time_diff.total_seconds() / (24 * 60 * 60)
+        if days_remaining < 7:
+            urgency = max(urgency, 10 - days_remaining)
+        
+        return urgency
+    
     def _calculate_user_preference_factor(self, segment: TaskSegment, alt_file: AltFile) -> float:
         """
         Calculate user preference factor for a task segment
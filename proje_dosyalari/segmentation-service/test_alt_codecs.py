@@ -0,0 +1,112 @@
+"""
+Unit tests for the ALT Codecs module of ALT_LAS Segmentation Service
+
+This module contains unit tests for the serialization codecs, format sniffing
+and trusted model construction used by the DSL schema modules.
+"""
+
+import unittest
+
+import yaml
+
+from alt_codecs import codec_for_path, decode_bytes, get_codec, load_model, sniff_codec
+from enhanced_dsl_schema import (
+    AltFile, Condition, ConditionOperator, Loop, TaskSegment, Variable,
+    VariableType, alt_to_yaml, yaml_to_alt
+)
+
+ALT_DICT = {
+    "id": "test-id",
+    "command": "Yapay zeka hakkında bilgi ara",
+    "language": "tr",
+    "segments": [{"id": "s1", "task_type": "search", "content": "Ara", "dependencies": [], "metadata": {"score": 0.5}}],
+    "metadata": {"nested": {"items": [1, None, True]}}
+}
+
+class TestAltCodecs(unittest.TestCase):
+    """Test cases for the codec registry and codecs"""
+
+    def test_round_trip_all_codecs(self):
+        """Test that every codec decodes what it encodes"""
+        for name in ("json", "yaml", "msgpack"):
+            codec = get_codec(name)
+            self.assertEqual(codec.decode(codec.encode(ALT_DICT)), ALT_DICT, name)
+
+    def test_json_fallback(self):
+        """Test values orjson rejects still round-trip through the json module"""
+        codec = get_codec("json")
+        data = {"large": 2 ** 70, "keys": {1: "one"}}
+        self.assertEqual(codec.decode(codec.encode(data)), {"large": 2 ** 70, "keys": {"1": "one"}})
+
+    def test_unknown_codec(self):
+        """Test that unknown format names raise ValueError"""
+        with self.assertRaises(ValueError):
+            get_codec("xml")
+
+    def test_codec_for_path(self):
+        """Test extension-based codec lookup"""
+        self.assertEqual(codec_for_path("task.alt.yaml").name, "yaml")
+        self.assertEqual(codec_for_path("task.ALT.YML").name, "yaml")
+        self.assertEqual(codec_for_path("task.alt.json").name, "json")
+        self.assertEqual(codec_for_path("task.altb").name, "msgpack")
+        self.assertIsNone(codec_for_path("task.alt"))
+
+    def test_sniff_codec(self):
+        """Test content-based codec detection"""
+        self.assertEqual(sniff_codec(get_codec("msgpack").encode(ALT_DICT)).name, "msgpack")
+        self.assertEqual(sniff_codec(b"\xef\xbb\xbf  \n{\"id\": 1}").name, "json")
+        self.assertEqual(sniff_codec(get_codec("yaml").encode(ALT_DICT)).name, "yaml")
+
+    def test_decode_yaml_flow_mapping(self):
+        """Test that a YAML flow mapping sniffed as JSON still decodes"""
+        self.assertEqual(decode_bytes(b"{id: test, segments: []}"), {"id": "test", "segments": []})
+
+    def test_yaml_dump_matches_pyyaml(self):
+        """Test that the accelerated dumper produces the same YAML as yaml.dump"""
+        self.assertEqual(
+            get_codec("yaml").encode(ALT_DICT).decode("utf-8"),
+            yaml.dump(ALT_DICT, sort_keys=False, default_flow_style=False)
+        )
+
+class TestTrustedConstruction(unittest.TestCase):
+    """Test cases for trusted model construction"""
+
+    def setUp(self):
+        """Set up an enhanced ALT file with nested models"""
+        self.alt_file = AltFile(
+            command="Repeat while x equals y",
+            language="en",
+            segments=[
+                TaskSegment(
+                    task_type="loop",
+                    content="Repeat",
+                    variables=[Variable(name="x", type=VariableType.NUMBER, value=1)],
+                    loop=Loop(
+                        type="while", variable="i", body=["s2"],
+                        condition=Condition(operator="not", left=Condition(operator="eq", left="x", right="y"))
+                    )
+                )
+            ]
+        )
+
+    def test_trusted_matches_validated(self):
+        """Test that trusted loading produces the same models and enums as validation"""
+        data = yaml.safe_load(alt_to_yaml(self.alt_file))
+        trusted = load_model(AltFile, data, trusted=True)
+
+        self.assertEqual(trusted, self.alt_file)
+        self.assertEqual(trusted, load_model(AltFile, data))
+        condition = trusted.segments[0].loop.condition
+        self.assertIsInstance(condition.left, Condition)
+        self.assertIs(condition.operator, ConditionOperator.NOT)
+        self.assertIs(trusted.segments[0].variables[0].type, VariableType.NUMBER)
+
+    def test_enhanced_yaml_round_trip(self):
+        """Test that enum fields are written as plain YAML values"""
+        yaml_str = alt_to_yaml(self.alt_file)
+
+        self.assertNotIn("!!python", yaml_str)
+        self.assertEqual(yaml_to_alt(yaml_str), self.alt_file)
+
+if __name__ == "__main__":
+    unittest.main()
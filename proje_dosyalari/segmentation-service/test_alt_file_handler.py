@@ -243,6 +243,96 @@ class TestAltFileHandler(unittest.TestCase):
         
         # Verify the result
         self.assertFalse(result)
+    
+    def test_search_alt_files(self):
+        """Test searching ALT files by metadata and filename"""
+        self.handler.save_alt_file(self.alt_file, "report.alt.yaml")
+        other = AltFile(**{**self.alt_file.dict(), "id": "other-id", "command": "Translate the document", "metadata": {"source": "api"}})
+        self.handler.save_alt_file(other, "translation.alt.json", format="json")
+        
+        self.assertEqual(self.handler.search_alt_files("CREATE A REPORT"), ["report.alt.yaml"])
+        self.assertEqual(self.handler.search_alt_files("'source': 'api'"), ["translation.alt.json"])
+        self.assertEqual(self.handler.search_alt_files("translation.alt"), ["translation.alt.json"])
+        self.assertEqual(self.handler.search_alt_files("en"), ["report.alt.yaml", "translation.alt.json"])
+        self.assertEqual(self.handler.search_alt_files("missing"), [])
+    
+    def test_search_matches_unindexed_handler(self):
+        """Test that indexed search returns the same files as reparsing every file"""
+        for i in range(5):
+            alt_file = AltFile(**{**self.alt_file.dict(), "id": f"id-{i}", "command": f"Command number {i}"})
+            self.handler.save_alt_file(alt_file, f"file{i}.alt.yaml")
+        
+        plain_handler = AltFileHandler(self.test_dir, use_index=False)
+        for query in ["number 3", "researcher", "id-", "file4", "zz", "N"]:
+            self.assertEqual(self.handler.search_alt_files(query), sorted(plain_handler.search_alt_files(query)))
+    
+    def test_index_tracks_external_changes(self):
+        """Test that files changed outside the handler are picked up via mtime checks"""
+        self.handler.save_alt_file(self.alt_file, "external.alt.yaml")
+        self.assertEqual(self.handler.search_alt_files("edited command"), [])
+        
+        # Rewrite the file behind the handler's back and add an unreadable file
+        edited = AltFile(**{**self.alt_file.dict(), "command": "Edited command"})
+        AltFileHandler(self.test_dir, use_index=False).save_alt_file(edited, "external.alt.yaml")
+        with open(os.path.join(self.test_dir, "broken.alt.yaml"), "w") as f:
+            f.write("{not: [valid")
+        
+        self.assertEqual(self.handler.search_alt_files("edited command"), ["external.alt.yaml"])
+        self.assertEqual(self.handler.get_alt_file_metadata("external.alt.yaml")["command"], "Edited command")
+        self.assertEqual(self.handler.list_alt_files(), ["broken.alt.yaml", "external.alt.yaml"])
+        self.assertNotIn("broken.alt.yaml", self.handler.search_alt_files("broken"))
+        
+        os.remove(os.path.join(self.test_dir, "broken.alt.yaml"))
+        self.assertEqual(self.handler.list_alt_files(), ["external.alt.yaml"])
+    
+    def test_indexed_metadata_matches_unindexed(self):
+        """Test that metadata served from the index equals metadata parsed from the file"""
+        with open(os.path.join(self.test_dir, "typed.alt.yaml"), "w") as f:
+            f.write(
+                "id: typed\n"
+                "command: Typed values\n"
+                "language: en\n"
+                "segments: []\n"
+                "saved_at: 2024-01-02 03:04:05\n"
+                "metadata:\n"
+                "  deadline: 2024-05-01\n"
+                "  tags: [a, b]\n"
+            )
+        self.handler.save_alt_file(self.alt_file, "saved.alt.json", format="json")
+        
+        plain_handler = AltFileHandler(self.test_dir, use_index=False)
+        for filename in ["typed.alt.yaml", "saved.alt.json"]:
+            uncached = plain_handler.get_alt_file_metadata(filename)
+            first = self.handler.get_alt_file_metadata(filename)
+            self.assertIsNotNone(self.handler.index.get_entry(filename))
+            cached = self.handler.get_alt_file_metadata(filename)
+            
+            self.assertEqual(first, uncached)
+            self.assertEqual(cached, uncached)
+        
+        typed = self.handler.get_alt_file_metadata("typed.alt.yaml")
+        self.assertEqual(typed["saved_at"], "2024-01-02T03:04:05")
+        self.assertEqual(typed["metadata"], {"deadline": "2024-05-01", "tags": ["a", "b"]})
+    
+    def test_list_and_search_pagination(self):
+        """Test offset/limit pagination of listing and search"""
+        for i in range(7):
+            self.handler.save_alt_file(self.alt_file, f"page{i}.alt.yaml")
+        
+        self.assertEqual(self.handler.count_alt_files(), 7)
+        self.assertEqual(self.handler.list_alt_files(offset=2, limit=3), ["page2.alt.yaml", "page3.alt.yaml", "page4.alt.yaml"])
+        self.assertEqual(self.handler.search_alt_files("page", offset=5), ["page5.alt.yaml", "page6.alt.yaml"])
+        
+        self.handler.delete_alt_file("page0.alt.yaml")
+        self.assertEqual(self.handler.list_alt_files(limit=1), ["page1.alt.yaml"])
+    
+    def test_index_persists_between_handlers(self):
+        """Test that a new handler reuses the index without reparsing unchanged files"""
+        self.handler.save_alt_file(self.alt_file, "persist.alt.yaml")
+        
+        handler = AltFileHandler(self.test_dir)
+        self.assertEqual(handler.refresh_index(), {"updated": 0, "removed": 0})
+        self.assertEqual(handler.search_alt_files("persist"), ["persist.alt.yaml"])
 
 class TestGetAltFileHandler(unittest.TestCase):
     """Test cases for get_alt_file_handler function"""
@@ -0,0 +1,67 @@
+"""
+Unit tests for the ALT File Index module of ALT_LAS Segmentation Service
+
+This module contains unit tests for the SQLite metadata index used by the
+ALT file handler.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from alt_file_index import AltFileIndex
+
+class TestAltFileIndex(unittest.TestCase):
+    """Test cases for AltFileIndex class"""
+
+    def setUp(self):
+        """Set up a fresh index"""
+        self.test_dir = tempfile.mkdtemp()
+        self.index = AltFileIndex(os.path.join(self.test_dir, "index.db"))
+        self.index.upsert_many([
+            ("a.alt.yaml", 1, 10, {"command": "Search for \"quoted\" AI papers", "language": "en"}),
+            ("b.alt.json", 2, 20, {"command": "Rapor oluştur", "language": "tr"}),
+            ("c.alt.yaml", 3, 30, None)
+        ])
+
+    def tearDown(self):
+        """Close the index and remove temporary files"""
+        self.index.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_search_substrings(self):
+        """Test case-insensitive substring search over metadata and filename"""
+        self.assertEqual(self.index.search("AI PAPERS"), ["a.alt.yaml"])
+        self.assertEqual(self.index.search('"quoted"'), ["a.alt.yaml"])
+        self.assertEqual(self.index.search("tr"), ["b.alt.json"])
+        self.assertEqual(self.index.search(".alt."), ["a.alt.yaml", "b.alt.json"])
+        self.assertEqual(self.index.search(""), ["a.alt.yaml", "b.alt.json"])
+        self.assertEqual(self.index.search("json\n"), [])
+
+    def test_search_without_fts(self):
+        """Test that substring scans give the same results without FTS5"""
+        self.index.fts_enabled = False
+        self.assertEqual(self.index.search("AI PAPERS"), ["a.alt.yaml"])
+        self.assertEqual(self.index.search("oluş"), ["b.alt.json"])
+
+    def test_update_and_remove(self):
+        """Test that updates replace searchable text and removals drop entries"""
+        self.index.upsert("a.alt.yaml", 5, 50, {"command": "Translate text"})
+        self.assertEqual(self.index.search("papers"), [])
+        self.assertEqual(self.index.search("translate"), ["a.alt.yaml"])
+        self.assertEqual(self.index.get_entry("a.alt.yaml"), (5, 50, {"command": "Translate text"}))
+
+        self.index.remove(["a.alt.yaml", "c.alt.yaml"])
+        self.assertEqual(self.index.list_files(), ["b.alt.json"])
+        self.assertIsNone(self.index.get_entry("a.alt.yaml"))
+
+    def test_file_stats_and_pagination(self):
+        """Test recorded file stats, counting and paginated listing"""
+        self.assertEqual(self.index.get_file_stats()["b.alt.json"], (2, 20))
+        self.assertEqual(self.index.count(), 3)
+        self.assertEqual(self.index.list_files(offset=1, limit=1), ["b.alt.json"])
+        self.assertEqual(self.index.get_entry("c.alt.yaml"), (3, 30, None))
+
+if __name__ == "__main__":
+    unittest.main()
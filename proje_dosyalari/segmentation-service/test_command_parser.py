@@ -12,6 +12,7 @@ import re
 from command_parser import CommandParser, get_command_parser
 from dsl_schema import AltFile, TaskSegment, TaskParameter
 from language_processor import LanguageProcessor
+from keyword_matcher import build_keyword_index
 
 class TestCommandParser(unittest.TestCase):
     """Test cases for CommandParser class"""
@@ -38,6 +39,9 @@ class TestCommandParser(unittest.TestCase):
             "format": ["pdf", "doc", "docx", "txt", "csv"],
             "language": ["french", "german", "spanish", "turkish"]
         }
+        self.mock_language_processor.get_keyword_index.side_effect = (
+            lambda language: build_keyword_index(self.mock_language_processor, language)
+        )
         
         # Create command parser with mock language processor
         with patch("command_parser.get_language_processor", return_value=self.mock_language_processor):
@@ -253,6 +257,15 @@ class TestCommandParser(unittest.TestCase):
         self.assertEqual(result[1], "create Y")
         self.assertEqual(result[2], "analyze Z")
 
+    def test_identify_task_type_uses_processor_keyword_index(self):
+        """Test that task type identification uses the index owned by the language processor"""
+        task_keywords = self.mock_language_processor.get_task_keywords("en")
+        
+        task_type, _ = self.parser._identify_task_type("Find the quarterly report", "en", task_keywords)
+        
+        self.assertEqual(task_type, "search")
+        self.mock_language_processor.get_keyword_index.assert_called_with("en")
+    
     def test_identify_task_type_ambiguous(self):
         """Test identifying task type with ambiguous keywords"""
         task_keywords = {
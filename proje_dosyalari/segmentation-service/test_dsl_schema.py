@@ -15,7 +15,7 @@ import yaml
 from dsl_schema import (
     AltFile, TaskSegment, TaskParameter,
     alt_to_yaml, alt_to_json, yaml_to_alt, json_to_alt,
-    save_alt_file, load_alt_file
+    alt_to_msgpack, msgpack_to_alt, save_alt_file, load_alt_file
 )
 
 class TestTaskParameter(unittest.TestCase):
@@ -382,6 +382,20 @@ class TestAltFileConversion(unittest.TestCase):
         self.assertEqual(alt_file.id, "test-id")
         self.assertEqual(alt_file.command, "Search for information about AI and create a report")
         self.assertEqual(len(alt_file.segments), 2)
+    
+    def test_msgpack_round_trip(self):
+        """Test converting AltFile to MessagePack and back"""
+        data = alt_to_msgpack(self.alt_file)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(msgpack_to_alt(data), self.alt_file)
+    
+    def test_trusted_load(self):
+        """Test that trusted loading builds the same nested models as validation"""
+        alt_file = json_to_alt(alt_to_json(self.alt_file), trusted=True)
+        
+        self.assertEqual(alt_file, self.alt_file)
+        self.assertIsInstance(alt_file.segments[0], TaskSegment)
+        self.assertIsInstance(alt_file.segments[0].parameters[0], TaskParameter)
 
 class TestAltFileIO(unittest.TestCase):
     """Test cases for ALT file I/O functions"""
@@ -465,6 +479,24 @@ class TestAltFileIO(unittest.TestCase):
         self.assertEqual(loaded_alt.id, "test-id")
         self.assertEqual(loaded_alt.command, "Search for information about AI")
         self.assertEqual(len(loaded_alt.segments), 1)
+    
+    def test_save_load_alt_file_msgpack(self):
+        """Test saving and loading ALT file in the binary format, with and without extension"""
+        for name in ("test.altb", "test_binary.alt"):
+            file_path = os.path.join(self.temp_dir, name)
+            save_alt_file(self.alt_file, file_path, format="msgpack")
+            
+            self.assertEqual(load_alt_file(file_path), self.alt_file)
+            self.assertEqual(load_alt_file(file_path, trusted=True), self.alt_file)
+    
+    def test_load_alt_file_invalid_content(self):
+        """Test loading a file without extension whose content is not an ALT mapping"""
+        file_path = os.path.join(self.temp_dir, "test.alt")
+        with open(file_path, "w") as f:
+            f.write("not an alt file")
+        
+        with self.assertRaises(ValueError):
+            load_alt_file(file_path)
 
 if __name__ == "__main__":
     unittest.main()
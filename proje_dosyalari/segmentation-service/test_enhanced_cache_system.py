@@ -0,0 +1,345 @@
+"""
+Unit tests for the Enhanced Cache System module of ALT_LAS Segmentation Service
+
+This module contains unit tests for the cache backends and the cache manager,
+focusing on LRU eviction, TTL expiry and statistics reporting.
+"""
+
+import unittest
+import shutil
+import tempfile
+import threading
+from unittest.mock import patch
+
+from enhanced_cache_system import CacheManager, MemoryCache, ShardedMemoryCache, PooledDiskCache
+
+class TestShardedMemoryCache(unittest.TestCase):
+    """Test cases for ShardedMemoryCache class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.cache = ShardedMemoryCache("test", max_size=100, num_shards=4)
+
+    def test_set_and_get(self):
+        """Test basic set and get"""
+        self.cache.set("a", 1)
+        self.cache.set("b", {"x": 2})
+
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertEqual(self.cache.get("b"), {"x": 2})
+        self.assertIsNone(self.cache.get("missing"))
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["size"], 2)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used key is evicted first"""
+        cache = ShardedMemoryCache("lru", max_size=3, num_shards=1)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache.set("d", 4)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.get("d"), 4)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_size_bound(self):
+        """Test that the cache never grows beyond max_size"""
+        for i in range(1000):
+            self.cache.set(f"key{i}", i)
+
+        stats = self.cache.get_stats(include_items=False)
+        self.assertEqual(stats["size"], 100)
+        self.assertEqual(stats["evictions"], 900)
+
+    def test_size_bound_with_more_shards_than_items(self):
+        """Test that max_size holds when it is not a multiple of the shard count"""
+        cache = ShardedMemoryCache("small", max_size=10, num_shards=16)
+        for i in range(50):
+            cache.set(f"key{i}", i)
+
+        self.assertEqual(cache.get_stats(include_items=False)["size"], 10)
+
+    def test_skewed_keys_use_full_capacity(self):
+        """Test that keys landing on one shard are not evicted while the cache has room"""
+        cache = ShardedMemoryCache("skewed", max_size=8, num_shards=4)
+        keys = [key for key in (f"key{i}" for i in range(1000)) if cache._get_shard(key) is cache.shards[0]][:9]
+
+        for key in keys[:8]:
+            cache.set(key, key)
+        self.assertEqual(cache.get_stats(include_items=False)["evictions"], 0)
+        self.assertTrue(all(cache.get(key) == key for key in keys[:8]))
+
+        # The least recently used key goes once the cache is full
+        cache.get(keys[0])
+        cache.set(keys[8], keys[8])
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertEqual(cache.get(keys[0]), keys[0])
+
+    def test_size_bound_under_concurrent_writes(self):
+        """Test that concurrent writers keep the cache at max_size"""
+        threads = [
+            threading.Thread(target=lambda n=n: [self.cache.set(f"t{n}-{i}", i) for i in range(500)])
+            for n in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.cache.get_stats(include_items=False)
+        self.assertEqual(stats["size"], 100)
+        self.assertEqual(self.cache._size, 100)
+
+    def test_delete_and_clear_release_capacity(self):
+        """Test that deleted and cleared items no longer count against max_size"""
+        cache = ShardedMemoryCache("release", max_size=2, num_shards=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("b"), 2)
+
+        cache.clear()
+        cache.set("d", 4)
+        cache.set("e", 5)
+        self.assertEqual(cache.get_stats(include_items=False)["evictions"], 0)
+
+    def test_ttl_expiry_on_get(self):
+        """Test that expired items are not returned"""
+        with patch("enhanced_cache_system.time.time", return_value=1000.0):
+            self.cache.set("a", 1, ttl=10)
+
+        with patch("enhanced_cache_system.time.time", return_value=1005.0):
+            self.assertEqual(self.cache.get("a"), 1)
+
+        with patch("enhanced_cache_system.time.time", return_value=1011.0):
+            self.assertIsNone(self.cache.get("a"))
+
+    def test_ttl_expiry_via_heap(self):
+        """Test that expired items are removed by the expiry heap on writes"""
+        cache = ShardedMemoryCache("ttl", max_size=10, num_shards=1)
+
+        with patch("enhanced_cache_system.time.time", return_value=1000.0):
+            cache.set("a", 1, ttl=5)
+            cache.set("b", 2, ttl=50)
+            cache.set("c", 3)
+
+        with patch("enhanced_cache_system.time.time", return_value=1010.0):
+            cache.set("d", 4)
+            stats = cache.get_stats(include_items=False)
+
+        self.assertEqual(stats["size"], 3)
+        self.assertEqual(stats["expirations"], 1)
+        self.assertNotIn("a", cache.shards[0].items)
+
+    def test_overwrite_resets_ttl(self):
+        """Test that overwriting a key discards its old expiry entry"""
+        cache = ShardedMemoryCache("ttl", max_size=10, num_shards=1)
+
+        with patch("enhanced_cache_system.time.time", return_value=1000.0):
+            cache.set("a", 1, ttl=5)
+
+        with patch("enhanced_cache_system.time.time", return_value=1004.0):
+            cache.set("a", 2, ttl=100)
+
+        with patch("enhanced_cache_system.time.time", return_value=1010.0):
+            cache.set("b", 3)
+            self.assertEqual(cache.get("a"), 2)
+
+    def test_delete_and_clear(self):
+        """Test delete and clear"""
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+
+        self.assertTrue(self.cache.delete("a"))
+        self.assertFalse(self.cache.delete("a"))
+        self.assertIsNone(self.cache.get("a"))
+
+        self.assertTrue(self.cache.clear())
+        self.assertEqual(self.cache.get_stats()["size"], 0)
+
+    def test_stats_without_items(self):
+        """Test that stats can be collected without per-item details"""
+        self.cache.set("a", 1)
+
+        self.assertIn("items", self.cache.get_stats())
+        self.assertNotIn("items", self.cache.get_stats(include_items=False))
+
+    def test_concurrent_access(self):
+        """Test concurrent reads and writes from several threads"""
+        def worker(offset):
+            for i in range(500):
+                key = f"key{(offset + i) % 200}"
+                self.cache.set(key, i)
+                self.cache.get(key)
+
+        threads = [threading.Thread(target=worker, args=(n * 50,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.cache.get_stats(include_items=False)
+        self.assertEqual(stats["hits"] + stats["misses"], 8 * 500)
+        self.assertLessEqual(stats["size"], 100)
+
+class TestPooledDiskCache(unittest.TestCase):
+    """Test cases for PooledDiskCache class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = PooledDiskCache("test", cache_dir=self.temp_dir, flush_batch_size=10)
+
+    def tearDown(self):
+        """Clean up resources"""
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_wal_mode(self):
+        """Test that pooled connections use WAL journal mode"""
+        conn = self.cache._get_connection()
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        self.assertIs(self.cache._get_connection(), conn)
+
+    def test_set_and_get(self):
+        """Test basic set and get"""
+        self.assertTrue(self.cache.set("a", {"x": 1}))
+
+        self.assertEqual(self.cache.get("a"), {"x": 1})
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_get_many_and_set_many(self):
+        """Test bulk operations"""
+        items = {f"key{i}": i for i in range(1200)}
+        self.assertTrue(self.cache.set_many(items))
+
+        results = self.cache.get_many(list(items.keys()) + ["missing"])
+
+        self.assertEqual(results, items)
+        self.assertEqual(self.cache.hits, 1200)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_access_updates_are_batched(self):
+        """Test that access statistics are buffered until flushed"""
+        self.cache.set("a", 1)
+        self.cache.get("a")
+        self.cache.get("a")
+
+        conn = self.cache._get_connection()
+        count = conn.execute("SELECT access_count FROM cache_items WHERE key = 'a'").fetchone()[0]
+        self.assertEqual(count, 0)
+
+        self.cache.flush()
+
+        count = conn.execute("SELECT access_count FROM cache_items WHERE key = 'a'").fetchone()[0]
+        self.assertEqual(count, 2)
+
+    def test_size_tracking(self):
+        """Test that payload size is tracked incrementally"""
+        self.cache.set("a", "x" * 1000)
+        size_after_set = self.cache.size_bytes
+        self.assertGreater(size_after_set, 1000)
+
+        self.cache.set("a", "x" * 10)
+        self.assertLess(self.cache.size_bytes, size_after_set)
+
+        self.cache.delete("a")
+        self.assertEqual(self.cache.size_bytes, 0)
+
+        # Size is reloaded from the database on reopen
+        self.cache.set("b", "y" * 500)
+        expected = self.cache.size_bytes
+        self.cache.close()
+        reopened = PooledDiskCache("test", cache_dir=self.temp_dir)
+        self.assertEqual(reopened.size_bytes, expected)
+        reopened.close()
+
+    def test_expired_items(self):
+        """Test that expired items are removed on read"""
+        with patch("enhanced_cache_system.time.time", return_value=1000.0):
+            self.cache.set("a", 1, ttl=10)
+
+        with patch("enhanced_cache_system.time.time", return_value=1020.0):
+            self.assertIsNone(self.cache.get("a"))
+
+        self.assertEqual(self.cache.size_bytes, 0)
+
+    def test_eviction(self):
+        """Test that writes evict items once the size limit is reached"""
+        cache = PooledDiskCache("small", cache_dir=self.temp_dir, max_size_mb=0.01)
+        for i in range(50):
+            cache.set(f"key{i}", "x" * 1000)
+
+        self.assertLess(cache._get_cache_size_mb(), 0.02)
+        self.assertIsNone(cache.get("key0"))
+        cache.close()
+
+    def test_threads_use_separate_connections(self):
+        """Test that each thread gets its own pooled connection"""
+        connections = []
+
+        def worker():
+            connections.append(self.cache._get_connection())
+            self.cache.set("t", 1)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertIsNot(connections[0], self.cache._get_connection())
+        self.assertEqual(self.cache.get("t"), 1)
+
+class TestCacheManager(unittest.TestCase):
+    """Test cases for CacheManager class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.manager = CacheManager()
+
+    def test_backend_selection(self):
+        """Test that backend names map to the expected classes"""
+        self.assertIsInstance(self.manager.get_cache("a", backend="memory"), ShardedMemoryCache)
+        self.assertIsInstance(self.manager.get_cache("b", backend="simple_memory"), MemoryCache)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            disk_cache = self.manager.get_cache("d", backend="disk_pooled", cache_dir=temp_dir)
+            self.assertIsInstance(disk_cache, PooledDiskCache)
+            disk_cache.close()
+        finally:
+            shutil.rmtree(temp_dir)
+
+        with self.assertRaises(ValueError):
+            self.manager.get_cache("c", backend="unknown")
+
+    def test_memoize(self):
+        """Test memoization through the default memory backend"""
+        calls = []
+
+        @self.manager.memoize(cache_name="square")
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(square(4), 16)
+        self.assertEqual(square(4), 16)
+        self.assertEqual(calls, [4])
+
+        stats = self.manager.get_cache_stats(include_items=False)
+        self.assertEqual(stats["memory:square"]["hits"], 1)
+        self.assertNotIn("items", stats["memory:square"])
+
+if __name__ == "__main__":
+    unittest.main()
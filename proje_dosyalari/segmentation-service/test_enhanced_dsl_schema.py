@@ -11,11 +11,14 @@ This module contains tests for the enhanced DSL schema with advanced features in
 import pytest
 import json
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from condition_compiler import CompiledCondition
 from enhanced_dsl_schema import (
     AltFile, TaskSegment, Variable, VariableType, Condition, ConditionOperator,
     Loop, LoopType, Function, FunctionParameter, FunctionCall, ConditionalBranch,
     TaskParameter, alt_to_yaml, alt_to_json, yaml_to_alt, json_to_alt,
-    evaluate_condition
+    evaluate_condition, evaluate_condition_batch
 )
 
 def test_variable_creation():
@@ -514,3 +517,95 @@ def test_condition_evaluation():
         Condition(operator=ConditionOperator.NOT, left="flag"),
         variables
     ) == False
+
+def test_condition_dotted_paths():
+    """Test resolving dotted variable paths such as result.title"""
+    variables = {
+        "result": {"title": "Best Python Tutorial", "tags": ["python", "beginner"]},
+        "config.mode": "strict"
+    }
+    
+    assert evaluate_condition(
+        Condition(operator=ConditionOperator.CONTAINS, left="result.title", right="Python"),
+        variables
+    ) == True
+    
+    assert evaluate_condition(
+        Condition(operator=ConditionOperator.EQUAL, left="result.tags.1", right="beginner"),
+        variables
+    ) == True
+    
+    # A variable whose name contains a dot takes precedence over path lookup
+    assert evaluate_condition(
+        Condition(operator=ConditionOperator.EQUAL, left="config.mode", right="strict"),
+        variables
+    ) == True
+    
+    # Unresolvable paths are used as literals
+    assert evaluate_condition(
+        Condition(operator=ConditionOperator.EQUAL, left="result.missing", right="result.missing"),
+        variables
+    ) == True
+
+def test_condition_batch_evaluation():
+    """Test evaluating one condition over a list of loop variables"""
+    condition = Condition(
+        operator=ConditionOperator.AND,
+        left=Condition(operator=ConditionOperator.STARTS_WITH, left="item.name", right="test"),
+        right=Condition(operator=ConditionOperator.GREATER_EQUAL, left="item.score", right="threshold")
+    )
+    variables_list = [
+        {"item": {"name": "test_a", "score": 7}, "threshold": 5},
+        {"item": {"name": "prod_b", "score": 9}, "threshold": 5},
+        {"item": {"name": "test_c", "score": 2}, "threshold": 5}
+    ]
+    
+    assert evaluate_condition_batch(condition, variables_list) == [True, False, False]
+
+def test_condition_recompiled_after_change():
+    """Test that modifying a condition after evaluation is picked up"""
+    inner = Condition(operator=ConditionOperator.EQUAL, left="status", right="success")
+    condition = Condition(operator=ConditionOperator.NOT, left=inner)
+    variables = {"status": "success"}
+    
+    assert evaluate_condition(condition, variables) == False
+    
+    inner.right = "error"
+    assert evaluate_condition(condition, variables) == True
+    
+    condition.left = "flag"
+    assert evaluate_condition(condition, variables) == True
+
+def test_cached_condition_not_walked_until_changed():
+    """Test that evaluating a cached condition does not re-check its tree"""
+    condition = Condition(
+        operator=ConditionOperator.AND,
+        left=Condition(operator=ConditionOperator.EQUAL, left="status", right="success"),
+        right=Condition(operator=ConditionOperator.GREATER_THAN, left="count", right=3)
+    )
+    variables = {"status": "success", "count": 5}
+    assert evaluate_condition(condition, variables) == True
+    
+    with patch.object(CompiledCondition, "is_current", autospec=True, return_value=True) as is_current:
+        for _ in range(10):
+            assert evaluate_condition(condition, variables) == True
+        assert is_current.call_count == 0
+        
+        # Another condition changing forces one check, after which the cache is trusted again
+        Condition(operator=ConditionOperator.EQUAL, left="a", right="b").right = "c"
+        evaluate_condition(condition, variables)
+        evaluate_condition(condition, variables)
+        assert is_current.call_count == 1
+
+def test_condition_evaluation_across_threads():
+    """Test compiling and evaluating conditions concurrently from several threads"""
+    conditions = [Condition(operator=ConditionOperator.GREATER_THAN, left="value", right=i) for i in range(50)]
+    
+    def evaluate_all(value):
+        return [evaluate_condition(condition, {"value": value}) for condition in conditions]
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(evaluate_all, range(0, 100, 5)))
+    
+    for value, result in zip(range(0, 100, 5), results):
+        assert result == [value > i for i in range(50)]
@@ -8,7 +8,7 @@ import spacy
 from spacy.tokens import Doc, Span, Token
 
 # Import the module to be tested
-from enhanced_language_processor import EnhancedLanguageProcessor, get_enhanced_language_processor
+from enhanced_language_processor import DocCache, EnhancedLanguageProcessor, get_enhanced_language_processor
 
 import nltk # Add this import
 
@@ -106,6 +106,94 @@ class TestEnhancedLanguageProcessor(unittest.TestCase):
         doc = self.processor.process_text(text, "fr") # Assuming French model is not loaded
         self.assertIsNone(doc)
 
+    def test_process_texts_batches_by_language(self):
+        """Test batch processing groups texts per language and keeps input order."""
+        processor = EnhancedLanguageProcessor()
+        mock_nlp_en = MagicMock()
+        mock_nlp_en.pipe.side_effect = lambda texts, **kwargs: [f"doc:{text}" for text in texts]
+        mock_nlp_tr = MagicMock()
+        mock_nlp_tr.pipe.side_effect = lambda texts, **kwargs: [f"doc:{text}" for text in texts]
+        processor.nlp_models = {"en": mock_nlp_en, "tr": mock_nlp_tr}
+
+        texts = ["Create a report", "Bir rapor oluştur", "Search the web", "Create a report", "Texte français"]
+        languages = ["en", "tr", "en", "en", "fr"]
+        docs = processor.process_texts(texts, languages, batch_size=8, n_process=1)
+
+        self.assertEqual(docs, ["doc:Create a report", "doc:Bir rapor oluştur", "doc:Search the web", "doc:Create a report", None])
+        mock_nlp_en.pipe.assert_called_once_with(["Create a report", "Search the web"], batch_size=8, n_process=1)
+        mock_nlp_tr.pipe.assert_called_once_with(["Bir rapor oluştur"], batch_size=8, n_process=1)
+
+        # Cached documents are not processed again
+        self.assertEqual(processor.process_texts(["Search the web"], ["en"]), ["doc:Search the web"])
+        mock_nlp_en.pipe.assert_called_once()
+
+    def test_process_texts_length_mismatch(self):
+        """Test that mismatched language lists are rejected."""
+        with self.assertRaises(ValueError):
+            self.processor.process_texts(["a", "b"], ["en"])
+
+    def test_doc_cache_hits_and_lru_eviction(self):
+        """Test document cache statistics and least recently used eviction."""
+        processor = EnhancedLanguageProcessor(max_cache_size=2)
+        mock_nlp = MagicMock(side_effect=lambda text: f"doc:{text}")
+        processor.nlp_models = {"en": mock_nlp}
+
+        processor.process_text("first", "en")
+        processor.process_text("second", "en")
+        processor.process_text("first", "en")  # hit, "second" becomes least recently used
+        processor.process_text("third", "en")
+
+        stats = processor.get_cache_stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["evicted_bytes"], DocCache.estimate_size("doc:second"))
+
+        processor.process_text("first", "en")
+        self.assertEqual(mock_nlp.call_count, 3)
+        processor.process_text("second", "en")
+        self.assertEqual(mock_nlp.call_count, 4)
+
+    def test_doc_cache_byte_budget(self):
+        """Test that the cache stays within its byte budget."""
+        short_doc = ["token"] * 2
+        long_doc = ["token"] * 100
+        cache = DocCache(max_items=100, max_bytes=DocCache.estimate_size(long_doc) + DocCache.estimate_size(short_doc))
+
+        cache.put(DocCache.make_key("a", "en"), short_doc)
+        cache.put(DocCache.make_key("b", "en"), short_doc)
+        cache.put(DocCache.make_key("c", "en"), long_doc)
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn(DocCache.make_key("a", "en"), cache)
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+
+        # A document larger than the whole budget is not cached
+        self.assertFalse(cache.put(DocCache.make_key("d", "en"), ["token"] * 1000))
+        self.assertEqual(cache.get_stats()["rejected"], 1)
+
+    def test_doc_cache_key_is_fixed_size(self):
+        """Test that cache keys do not grow with the text and separate languages."""
+        key = DocCache.make_key("word " * 10000, "en")
+        self.assertEqual(len(key), 16)
+        self.assertNotEqual(DocCache.make_key("text", "en"), DocCache.make_key("text", "tr"))
+        self.assertNotEqual(DocCache.make_key("text", None), DocCache.make_key("text", "en"))
+
+    def test_max_cache_size_setter_shrinks_cache(self):
+        """Test that lowering max_cache_size evicts documents."""
+        processor = EnhancedLanguageProcessor(max_cache_size=10)
+        for index in range(5):
+            processor.doc_cache.put(DocCache.make_key(str(index), "en"), "doc")
+
+        processor.max_cache_size = 2
+        self.assertEqual(len(processor.doc_cache), 2)
+        self.assertEqual(processor.max_cache_size, 2)
+
+        processor.clear_cache()
+        self.assertEqual(len(processor.doc_cache), 0)
+        self.assertEqual(processor.doc_cache.current_bytes, 0)
+
     def test_get_sentences(self):
         """Test sentence segmentation."""
         mock_sent1 = MagicMock(spec=Span, text="Sentence 1.")
@@ -5,13 +5,15 @@ Test for Enhanced Task Prioritization
 This module contains tests for the enhanced task prioritization system.
 """
 
+import gc
 import unittest
+import weakref
 import os
 import json
 import tempfile
 from pathlib import Path
 from dsl_schema import AltFile, TaskSegment, TaskParameter
-from task_prioritization import TaskPrioritizer, get_task_prioritizer
+from task_prioritization import SegmentGraph, TaskPrioritizer, get_task_prioritizer
 
 class TestConfigurableTaskPrioritizer(unittest.TestCase):
     """Test cases for configurable TaskPrioritizer class"""
@@ -294,5 +296,127 @@ class TestPrioritizationWithDeadline(unittest.TestCase):
         # Verify that urgency factor is default
         self.assertEqual(factor, self.prioritizer.default_urgency / 10)
 
+class TestExecutionOrder(unittest.TestCase):
+    """Test cases for graph-indexed execution ordering"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.prioritizer = TaskPrioritizer()
+    
+    def _make_alt_file(self, dependencies, metadata=None):
+        """Create an ALT file from a mapping of segment ID to dependencies"""
+        segments = [
+            TaskSegment(
+                id=segment_id,
+                task_type="search",
+                content=f"Task {segment_id}",
+                dependencies=deps,
+                metadata=dict((metadata or {}).get(segment_id, {}))
+            )
+            for segment_id, deps in dependencies.items()
+        ]
+        return AltFile(id="order_test", command="Test command", language="en", segments=segments)
+    
+    def _orders(self, alt_file):
+        return {segment.id: segment.metadata["execution_order"] for segment in alt_file.segments}
+    
+    def test_dependencies_run_first(self):
+        """Test that every segment is ordered after its dependencies"""
+        alt_file = self._make_alt_file({"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]})
+        orders = self._orders(self.prioritizer.prioritize_alt_file(alt_file))
+        
+        self.assertEqual(sorted(orders.values()), [1, 2, 3, 4])
+        for segment in alt_file.segments:
+            for dependency in segment.dependencies:
+                self.assertLess(orders[dependency], orders[segment.id])
+    
+    def test_ready_segments_by_priority(self):
+        """Test that independent segments run in order of priority score"""
+        alt_file = self._make_alt_file(
+            {"low": [], "high": [], "medium": []},
+            metadata={"low": {"urgency": "low"}, "high": {"urgency": "high"}, "medium": {"urgency": "medium"}}
+        )
+        orders = self._orders(self.prioritizer.prioritize_alt_file(alt_file))
+        
+        self.assertEqual(orders, {"high": 1, "medium": 2, "low": 3})
+    
+    def test_deep_chain(self):
+        """Test that long dependency chains do not hit the recursion limit"""
+        count = 5000
+        dependencies = {f"task{i}": ([f"task{i - 1}"] if i > 0 else []) for i in range(count)}
+        orders = self._orders(self.prioritizer.prioritize_alt_file(self._make_alt_file(dependencies)))
+        
+        self.assertEqual(orders["task0"], 1)
+        self.assertEqual(orders[f"task{count - 1}"], count)
+    
+    def test_cycles_and_unknown_dependencies(self):
+        """Test that cycles and unknown dependencies still yield a complete order"""
+        alt_file = self._make_alt_file({"a": ["c"], "b": ["a"], "c": ["b"], "d": ["missing"], "e": ["e"]})
+        orders = self._orders(self.prioritizer.prioritize_alt_file(alt_file))
+        
+        self.assertEqual(sorted(orders.values()), [1, 2, 3, 4, 5])
+        self.assertLess(orders["a"], orders["b"])
+        self.assertLess(orders["b"], orders["c"])
+    
+    def test_many_cycles(self):
+        """Test that each cycle is broken at its best segment, in priority order"""
+        dependencies = {}
+        for i in range(2000):
+            dependencies[f"x{i}"] = [f"y{i}"]
+            dependencies[f"y{i}"] = [f"x{i}"]
+        metadata = {"y1999": {"urgency": "high"}}
+        orders = self._orders(self.prioritizer.prioritize_alt_file(self._make_alt_file(dependencies, metadata)))
+        
+        self.assertEqual(sorted(orders.values()), list(range(1, 4001)))
+        self.assertEqual(orders["y1999"], 1)
+        self.assertEqual(orders["x1999"], 2)
+        self.assertLess(orders["x0"], orders["y0"])
+    
+    def test_cached_graph_does_not_keep_file_alive(self):
+        """Test that a cached segment graph is dropped once its ALT file is garbage collected"""
+        alt_file = self._make_alt_file({"a": [], "b": ["a"]})
+        self.prioritizer.prioritize_alt_file(alt_file)
+        self.assertIn("order_test", self.prioritizer._segment_graphs)
+        
+        file_ref = weakref.ref(alt_file)
+        del alt_file
+        gc.collect()
+        
+        self.assertIsNone(file_ref())
+        self.assertNotIn("order_test", self.prioritizer._segment_graphs)
+    
+    def test_reprioritize_segment(self):
+        """Test incremental reprioritization after a single segment changes"""
+        alt_file = self._make_alt_file({"a": [], "b": [], "c": ["a"]})
+        self.prioritizer.prioritize_alt_file(alt_file)
+        self.assertEqual(self._orders(alt_file)["a"], 1)
+        
+        # Raise the urgency of b and make a depend on it
+        segment_b = alt_file.segments[1]
+        segment_b.metadata["urgency"] = "high"
+        self.prioritizer.reprioritize_segment(alt_file, "b")
+        self.assertEqual(self._orders(alt_file)["b"], 1)
+        
+        alt_file.segments[0].dependencies = ["b"]
+        self.prioritizer.reprioritize_segment(alt_file, "a")
+        self.assertEqual(self._orders(alt_file), {"b": 1, "a": 2, "c": 3})
+        self.assertEqual(alt_file.segments[0].metadata["dependency_factor"], 0.5)
+    
+    def test_reprioritize_segment_without_cached_graph(self):
+        """Test that reprioritization falls back to a full pass for unknown files"""
+        alt_file = self._make_alt_file({"a": [], "b": ["a"]})
+        self.prioritizer.reprioritize_segment(alt_file, "b")
+        
+        self.assertEqual(self._orders(alt_file), {"a": 1, "b": 2})
+    
+    def test_segment_graph_indexes(self):
+        """Test the segment-id map and reverse dependency index"""
+        alt_file = self._make_alt_file({"a": [], "b": ["a", "a"], "c": ["a", "b"]})
+        graph = SegmentGraph(alt_file.segments)
+        
+        self.assertEqual(graph.positions, {"a": 0, "b": 1, "c": 2})
+        self.assertEqual(graph.dependencies["b"], ["a"])
+        self.assertEqual(graph.dependents["a"], ["b", "c"])
+
 if __name__ == "__main__":
     unittest.main()
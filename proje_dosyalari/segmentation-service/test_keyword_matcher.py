@@ -0,0 +1,105 @@
+"""
+Unit tests for the Keyword Matcher module of ALT_LAS Segmentation Service
+
+This module contains unit tests for the Aho-Corasick keyword automaton and
+checks that it matches the regex-based keyword handling it replaces.
+"""
+
+import re
+import unittest
+from unittest.mock import MagicMock
+
+from keyword_matcher import KeywordAutomaton, build_keyword_index, fold_case, get_task_keyword_index
+
+class TestKeywordAutomaton(unittest.TestCase):
+    """Test cases for KeywordAutomaton class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.automaton = KeywordAutomaton(["and", "or", "as well as", "search", "ara", "google'da ara", "he", "she", "hers"])
+
+    def test_scan_overlapping(self):
+        """Test that all overlapping occurrences are reported"""
+        matches = self.automaton.scan("ushers")
+
+        self.assertIn((1, 4, "she"), matches)
+        self.assertIn((2, 4, "he"), matches)
+        self.assertIn((2, 6, "hers"), matches)
+
+    def test_find_substrings_case_insensitive(self):
+        """Test case-insensitive substring detection"""
+        found = self.automaton.find_substrings("SEARCH the Sandbox")
+
+        self.assertIn("search", found)
+        self.assertIn("and", found)
+
+    def test_find_words_respects_boundaries(self):
+        """Test that whole-word matching follows regex word boundaries"""
+        matches = self.automaton.find_words("Search sandbox and orbit or bar")
+
+        self.assertEqual([keyword for _, _, keyword in matches], ["search", "and", "or"])
+
+    def test_find_words_matches_regex(self):
+        """Test that whole-word matches equal per-keyword re.finditer results"""
+        text = "Search and find, or search AS WELL AS search-and-ara as well as well as"
+
+        expected = sorted(
+            (match.start(), match.end(), keyword)
+            for keyword in self.automaton.keywords
+            for match in re.finditer(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE)
+        )
+
+        self.assertEqual(self.automaton.find_words(text), expected)
+
+    def test_remove_words_matches_sequential_regex(self):
+        """Test that removal equals sequential re.sub calls"""
+        keywords = ["ara", "google'da ara"]
+        text = "google'da ara yapay zeka ARA"
+
+        expected = text
+        for keyword in keywords:
+            expected = re.sub(r'\b' + re.escape(keyword) + r'\b', '', expected, flags=re.IGNORECASE).strip()
+
+        self.assertEqual(self.automaton.remove_words(text, keywords), expected)
+
+    def test_remove_words_without_keywords(self):
+        """Test that text is returned unchanged when there is nothing to remove"""
+        self.assertEqual(self.automaton.remove_words("  search  ", []), "  search  ")
+
+    def test_fold_case_preserves_length(self):
+        """Test that case folding keeps character offsets stable"""
+        text = "İstanbul'da ARA"
+
+        self.assertEqual(len(fold_case(text)), len(text))
+        self.assertEqual(fold_case(text), "istanbul'da ara")
+
+class TestBuildKeywordIndex(unittest.TestCase):
+    """Test cases for build_keyword_index function"""
+
+    def test_build_from_language_processor(self):
+        """Test that all keyword lists of a language are included"""
+        processor = MagicMock()
+        processor.get_task_keywords.return_value = {"search": ["search", "find"], "create": ["create"]}
+        processor.get_conjunction_indicators.return_value = ["and"]
+        processor.get_alternative_indicators.return_value = ["or"]
+        processor.get_context_keywords.return_value = {"format": ["PDF"], "time": ["today"]}
+
+        index = build_keyword_index(processor, "en")
+
+        self.assertEqual(set(index.automaton.keywords), {"search", "find", "create", "and", "or", "pdf"})
+        self.assertEqual(index.split_indicators, {"and", "or"})
+        self.assertEqual(index.format_keywords, [("PDF", "pdf")])
+        processor.get_task_keywords.assert_called_once_with("en")
+
+    def test_task_keyword_index_cached_by_content(self):
+        """Test that equal keyword dictionaries share one index and different ones do not"""
+        first = get_task_keyword_index({"search": ["search", "find"], "create": ["create"]})
+        second = get_task_keyword_index({"search": ["search", "find"], "create": ["create"]})
+        other = get_task_keyword_index({"search": ["search"]})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(first.automaton.find_substrings("please find it"), {"find"})
+
+if __name__ == "__main__":
+    unittest.main()
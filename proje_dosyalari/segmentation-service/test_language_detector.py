@@ -0,0 +1,140 @@
+"""
+Unit tests for the Language Detector module of ALT_LAS Segmentation Service
+
+This module contains unit tests for the compiled language detector and checks
+that it scores texts like the per-pattern regex matching it replaces.
+"""
+
+import re
+import unittest
+from unittest.mock import patch
+
+from language_detector import LanguageDetector
+
+LANGUAGE_PATTERNS = {
+    'tr': [
+        r'\b(ve|veya|için|ile|bu|şu|şey|çok|daha|en|gibi|kadar)\b',
+        r'[şçğüöıİ]',
+        r'\b(bir|iki|üç|dört|beş|altı|yedi|sekiz|dokuz|on)\b'
+    ],
+    'en': [
+        r'\b(and|or|for|with|this|that|thing|very|more|most|like|than)\b',
+        r'\b(one|two|three|four|five|six|seven|eight|nine|ten)\b'
+    ],
+    'fr': [
+        r'\b(et|ou|pour|avec|ce|cette|chose|très|plus|comme|que)\b',
+        r'[éèêëàâäôöùûüÿçœæ]',
+        r'\b(un|deux|trois|quatre|cinq|six|sept|huit|neuf|dix)\b'
+    ],
+    'es': [
+        r'\b(y|o|para|con|este|esta|cosa|muy|más|como|que)\b',
+        r'[áéíóúüñ¿¡]'
+    ],
+    'ru': [
+        r'[абвгдеёжзийклмнопрстуфхцчшщъыьэюя]'
+    ]
+}
+
+def reference_scores(text):
+    """Score a text by running every pattern separately"""
+    return {
+        language: sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in patterns)
+        for language, patterns in LANGUAGE_PATTERNS.items()
+    }
+
+class TestLanguageDetector(unittest.TestCase):
+    """Test cases for LanguageDetector class"""
+
+    def setUp(self):
+        """Set up test data"""
+        self.detector = LanguageDetector(LANGUAGE_PATTERNS)
+
+    def test_scores_match_per_pattern_regex(self):
+        """Test that scores equal the sum of per-pattern re.findall counts"""
+        texts = [
+            "Search for information and create a report",
+            "Yapay zeka hakkında bilgi ARA ve bir rapor oluştur",
+            "Six chats et six chiens, que más QUE",
+            "Найти информацию и создать отчёт",
+            "İSTANBUL'DA bIr şey, this-and-that",
+            ""
+        ]
+
+        for text in texts:
+            scores, stopped_early = self.detector.score(text)
+            self.assertEqual(scores, reference_scores(text), text)
+            self.assertFalse(stopped_early)
+
+    def test_chunked_scoring_matches_full_scan(self):
+        """Test that splitting into chunks does not change the scores"""
+        detector = LanguageDetector(LANGUAGE_PATTERNS, chunk_size=5)
+        text = "bir iki üç and or, très bien et cinq. Один два и три " * 3
+
+        scores, _ = detector.score(text, early_exit=False)
+        self.assertEqual(scores, reference_scores(text))
+
+    def test_detect(self):
+        """Test detection of the highest scoring language"""
+        self.assertEqual(self.detector.detect("Search for the report and create more tables"), "en")
+        self.assertEqual(self.detector.detect("Yapay zeka hakkında bilgi ara ve bir rapor oluştur"), "tr")
+        self.assertEqual(self.detector.detect("Найти информацию и создать отчёт"), "ru")
+
+    def test_default_language_and_ties(self):
+        """Test the fallback language and that earlier languages win ties"""
+        self.assertEqual(self.detector.detect("xyz 123"), "en")
+        # "que" scores once for French and once for Spanish
+        self.assertEqual(self.detector.detect("que"), "fr")
+
+    def test_ignorecase_character_classes(self):
+        """Test that character classes count every case-insensitive match like re does"""
+        # Under re.IGNORECASE, [İı] also matches a plain i
+        scores, _ = self.detector.score("I think")
+        self.assertEqual(scores["tr"], 2)
+
+    def test_early_exit(self):
+        """Test that long texts stop scoring once one language clearly leads"""
+        detector = LanguageDetector(LANGUAGE_PATTERNS, chunk_size=100, min_evidence=10)
+        text = "Найти информацию и создать отчёт. " * 100
+
+        scores, stopped_early = detector.score(text)
+        self.assertTrue(stopped_early)
+        self.assertLess(scores["ru"], reference_scores(text)["ru"])
+        self.assertEqual(detector.detect(text), "ru")
+        self.assertEqual(detector.get_stats()["early_exits"], 1)
+
+    def test_cache(self):
+        """Test that repeated texts are served from the LRU cache"""
+        detector = LanguageDetector(LANGUAGE_PATTERNS, cache_size=2)
+
+        detector.detect("this and that")
+        detector.detect("this and that")
+        detector.detect("bir ve iki")
+        detector.detect("un et deux")
+
+        stats = detector.get_stats()
+        self.assertEqual(stats["cache_hits"], 1)
+        self.assertEqual(stats["cache_misses"], 3)
+        self.assertEqual(stats["cache_size"], 2)
+
+        detector.clear_cache()
+        self.assertEqual(detector.get_stats()["cache_size"], 0)
+
+    def test_keyword_regex_fallback(self):
+        """Test keyword scoring when case equivalences cannot be folded into a table"""
+        with patch.object(LanguageDetector, "_build_case_table", return_value=None):
+            detector = LanguageDetector(LANGUAGE_PATTERNS)
+
+        text = "İSTANBUL'DA bIr şey, this-and-that, que QUE"
+        scores, _ = detector.score(text)
+        self.assertEqual(scores, reference_scores(text))
+
+    def test_unrecognized_patterns_fall_back_to_regex(self):
+        """Test that patterns of other shapes are still counted"""
+        detector = LanguageDetector({'en': [r'th\w+'], 'de': [r'[a-c]+']})
+        text = "the abc thing"
+
+        scores, _ = detector.score(text)
+        self.assertEqual(scores, {'en': 2, 'de': 1})
+
+if __name__ == "__main__":
+    unittest.main()
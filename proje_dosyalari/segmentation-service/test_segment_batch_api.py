@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the /segment/batch endpoint of the segmentation service.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import main
+
+class TestSegmentBatchEndpoint(unittest.TestCase):
+    """Test cases for batch segmentation through the HTTP API"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = TestClient(main.app)
+
+    def test_mixed_language_batch_keeps_request_order(self):
+        """Test that results of a mixed-language batch come back in request order"""
+        commands = [
+            {"command": "Open the file and read it.", "metadata": {"language": "en"}},
+            {"command": "Dosyayı aç ve oku.", "metadata": {"language": "tr"}},
+            {"command": "Write a short report.", "metadata": {"language": "en"}},
+            {"command": "Rapor yaz.", "metadata": {"language": "tr"}, "persona": "teacher"}
+        ]
+
+        response = self.client.post("/segment/batch", json={"commands": commands, "batch_size": 2})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        results = data["results"]
+        self.assertEqual(len(results), len(commands))
+        for command, result in zip(commands, results):
+            self.assertEqual(result["status"], "completed")
+            self.assertEqual(result["metadata"]["language"], command["metadata"]["language"])
+            self.assertEqual(result["metadata"]["command_length"], len(command["command"]))
+        self.assertEqual(results[3]["metadata"]["persona"], "teacher")
+        self.assertEqual(len({result["id"] for result in results}), len(commands))
+
+        self.assertEqual(data["metadata"]["command_count"], len(commands))
+        self.assertEqual(data["metadata"]["languages"], ["en", "tr"])
+        self.assertEqual(data["metadata"]["batch_size"], 2)
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns no results"""
+        response = self.client.post("/segment/batch", json={"commands": []})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["results"], [])
+        self.assertEqual(data["metadata"]["command_count"], 0)
+        self.assertEqual(data["metadata"]["languages"], [])
+
+    def test_failing_item_returns_error(self):
+        """Test that a failure while processing an item fails the whole batch with a 500"""
+        commands = [
+            {"command": "Open the file.", "metadata": {"language": "en"}},
+            {"command": "Dosyayı aç.", "metadata": {"language": "tr"}}
+        ]
+
+        with patch.object(main.language_processor, "process_texts",
+                          side_effect=ValueError("cannot process item 1")), \
+                patch.object(main.memory_optimizer, "optimize_memory") as optimize_memory:
+            response = self.client.post("/segment/batch", json={"commands": commands})
+
+        self.assertEqual(response.status_code, 500)
+        self.assertIn("Batch segmentation error", response.json()["detail"])
+        self.assertIn("cannot process item 1", response.json()["detail"])
+        optimize_memory.assert_called_once_with(aggressive=True)
+
+    def test_invalid_item_is_rejected(self):
+        """Test that an item without a command is rejected before processing"""
+        response = self.client.post(
+            "/segment/batch",
+            json={"commands": [{"command": "Open the file."}, {"mode": "Normal"}]}
+        )
+
+        self.assertEqual(response.status_code, 422)
+
+    def test_batch_settings_are_clamped_to_server_limits(self):
+        """Test that client batch settings above the configured values are lowered"""
+        commands = [{"command": "Open the file.", "metadata": {"language": "en"}}]
+
+        with patch.object(main, "nlp_batch_size", 16), patch.object(main, "nlp_n_process", 2), \
+                patch.object(main.language_processor, "process_texts",
+                             wraps=main.language_processor.process_texts) as process_texts:
+            response = self.client.post(
+                "/segment/batch",
+                json={"commands": commands, "batch_size": 10000, "n_process": 64}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["metadata"]["batch_size"], 16)
+        self.assertEqual(response.json()["metadata"]["n_process"], 2)
+        self.assertEqual(process_texts.call_args.kwargs["batch_size"], 16)
+        self.assertEqual(process_texts.call_args.kwargs["n_process"], 2)
+
+    def test_non_positive_batch_settings_are_rejected(self):
+        """Test that zero or negative batch settings fail validation"""
+        commands = [{"command": "Open the file."}]
+
+        for settings in ({"batch_size": 0}, {"batch_size": -4}, {"n_process": 0}, {"n_process": -1}):
+            with self.subTest(settings=settings):
+                response = self.client.post("/segment/batch", json={"commands": commands, **settings})
+                self.assertEqual(response.status_code, 422)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+"""Add per-node state table for workflow runs
+
+Revision ID: 5b1e7c9d2a40
+Revises: cea2319d718a
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c9d2a40'
+down_revision: Union[str, None] = 'cea2319d718a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('workflow_run_node_states',
+    sa.Column('run_id', sa.String(), nullable=False),
+    sa.Column('node_id', sa.String(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', name='nodestatus'), nullable=True),
+    sa.Column('output', sa.JSON(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['run_id'], ['workflow_runs.id'], ),
+    sa.PrimaryKeyConstraint('run_id', 'node_id')
+    )
+    op.create_index(op.f('ix_workflow_run_node_states_status'), 'workflow_run_node_states', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_workflow_run_node_states_status'), table_name='workflow_run_node_states')
+    op.drop_table('workflow_run_node_states')
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+HTTP piece benchmark for the Workflow Engine.
+
+Starts a localhost stub HTTP/1.1 keep-alive server in a separate process and
+runs a chain of --nodes sequential HttpRequest nodes on a temporary SQLite
+database (batched state persistence), comparing:
+- per-execution: no shared pool, so every node opens its own client and
+  connection, as the pieces did before
+- pooled: the engine-level HttpClientPool injected through the PieceRegistry
+
+Usage:
+    python benchmark_http_pieces.py --nodes 1000
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.engine.executor import WorkflowExecutor
+from src.engine.http_pool import HttpClientPool
+from src.engine.registry import PieceRegistry
+from src.models.db_models import Base, WorkflowDefinitionDB, WorkflowRunDB
+from src.models.workflow import Edge, Node, NodeType, WorkflowDefinition, WorkflowRun, WorkflowStatus
+from src.pieces.actions import HttpRequest
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a small JSON body."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path, "ok": True}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(ports) -> None:
+    """Run the stub server and report its port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+def make_workflow(nodes: int, port: int) -> WorkflowDefinition:
+    """Creates a chain of HTTP request nodes."""
+    node_list = [Node(id=f"n{i}", type=NodeType.ACTION, piece_type="http_request",
+                      config={"url": f"http://127.0.0.1:{port}/item/{i}", "max_retries": 0})
+                 for i in range(nodes)]
+    edges = [Edge(id=f"e{i}", source_node_id=f"n{i - 1}", target_node_id=f"n{i}") for i in range(1, nodes)]
+    return WorkflowDefinition(id="wf_http", name="http chain", nodes=node_list, edges=edges)
+
+
+async def run_mode(args: argparse.Namespace, mode: str, port: int, db_path: str) -> None:
+    """Runs the chain with or without the shared pool and prints the results."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)()
+
+    wf_def = make_workflow(args.nodes, port)
+    wf_run = WorkflowRun(id=f"run_{mode}", workflow_id=wf_def.id, workflow_version=1)
+    session.add(WorkflowDefinitionDB(id=wf_def.id, name=wf_def.name, nodes=[], edges=[], version=1))
+    session.add(WorkflowRunDB(id=wf_run.id, workflow_id=wf_def.id, workflow_version=1, status=WorkflowStatus.IDLE,
+                              node_states={}, node_outputs={}))
+    await session.commit()
+
+    registry = PieceRegistry()
+    registry.register("http_request", HttpRequest)
+    if mode == "pooled":
+        registry.http_pool = HttpClientPool()
+
+    executor = WorkflowExecutor(wf_def, wf_run, registry, session, state_flush_interval=args.flush_interval)
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()): # Pieces print a line per execution
+        await executor.execute()
+    elapsed = time.perf_counter() - start_time
+
+    if registry.http_pool is not None:
+        await registry.http_pool.aclose()
+    await session.close()
+    await engine.dispose()
+    assert wf_run.status == WorkflowStatus.COMPLETED, wf_run.status
+    assert wf_run.node_outputs[f"n{args.nodes - 1}"]["body"]["ok"] is True
+    print(f"{mode:14s} nodes {args.nodes:5d}  wall {elapsed:6.2f} s  {args.nodes / elapsed:7.1f} nodes/s  "
+          f"{elapsed / args.nodes * 1000:6.2f} ms/node")
+
+
+async def run(args: argparse.Namespace, port: int) -> None:
+    """Runs every mode."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in args.modes:
+            await run_mode(args, mode, port, os.path.join(tmp, f"{mode}.db"))
+
+
+def main():
+    """Runs the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark HTTP pieces with and without the shared client pool")
+    parser.add_argument("--nodes", type=int, default=1000)
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    parser.add_argument("--modes", nargs="+", default=["per-execution", "pooled"])
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(ports,), daemon=True)
+    server.start()
+    try:
+        asyncio.run(run(args, ports.get(timeout=10)))
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Scheduler benchmark for the Workflow Engine.
+
+Runs synthetic DAGs on a temporary local SQLite database (batched state
+persistence) and reports wall time and scheduling overhead per node for:
+- legacy: unordered ready set and a scan of every adjacency list to find each
+  node's predecessors, as the executor did before
+- ready-queue: precomputed reverse adjacency and in-degrees with a
+  critical-path ordered ready queue
+
+Shapes:
+- fan: start -> N parallel no-op nodes -> end (fan-out/fan-in)
+- layered: --layers fully fanned out/in stages of no-op nodes
+- mixed: one chain of --chain sleeping nodes next to --short single sleeping nodes,
+  which shows the effect of critical-path priority under a concurrency limit
+
+Usage:
+    python benchmark_scheduler.py --nodes 10000 --max-concurrent 64
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.engine.executor import WorkflowExecutor
+from src.engine.registry import PieceRegistry
+from src.models.db_models import Base, WorkflowDefinitionDB, WorkflowRunDB
+from src.models.workflow import Edge, Node, NodeStatus, NodeType, WorkflowDefinition, WorkflowRun, WorkflowStatus
+from src.pieces.base import Piece
+
+
+class NoopPiece(Piece):
+    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {}
+
+
+class SleepPiece(Piece):
+    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(self.node.config.get("seconds", 0.01))
+        return {}
+
+
+class ScanningPredecessors(dict):
+    """Finds predecessors by scanning every adjacency list, as the old executor did."""
+
+    def __init__(self, adjacency_list: Dict[str, List[str]]):
+        super().__init__()
+        self.adjacency_list = adjacency_list
+
+    def __getitem__(self, node_id: str) -> List[str]:
+        return [pred_id for pred_id, neighbors in self.adjacency_list.items() if node_id in neighbors]
+
+
+class LegacyExecutor(WorkflowExecutor):
+    """Executor with the previous unordered ready set and predecessor scan."""
+
+    def _build_graph(self):
+        super()._build_graph()
+        self.predecessors = ScanningPredecessors(self.adjacency_list)
+
+    async def _execute_graph(self):
+        await self._update_run_status(WorkflowStatus.RUNNING)
+        running_tasks: Dict[str, asyncio.Task] = {}
+        nodes_to_process = {node_id for node_id, degree in self.in_degree.items() if degree == 0}
+        for node_id in nodes_to_process:
+            await self._update_node_state(node_id, NodeStatus.PENDING)
+
+        while nodes_to_process or running_tasks:
+            while nodes_to_process and len(running_tasks) < self.max_concurrent_nodes:
+                node_id = nodes_to_process.pop()
+                running_tasks[node_id] = asyncio.create_task(self._execute_node_wrapper(node_id))
+            done, _ = await asyncio.wait(running_tasks.values(), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                node_id = next(nid for nid, t in running_tasks.items() if t == task)
+                del running_tasks[node_id]
+                self.processed_nodes.add(node_id)
+                await task
+                for neighbor_id in self.adjacency_list[node_id]:
+                    self.in_degree[neighbor_id] -= 1
+                    if self.in_degree[neighbor_id] == 0 and neighbor_id not in self.processed_nodes:
+                        nodes_to_process.add(neighbor_id)
+                        await self._update_node_state(neighbor_id, NodeStatus.PENDING)
+
+        await self._update_run_status(WorkflowStatus.COMPLETED)
+
+
+def make_workflow(args: argparse.Namespace, shape: str) -> WorkflowDefinition:
+    """Creates a fan, layered or mixed workflow definition."""
+    nodes = [Node(id="start", type=NodeType.TRIGGER, piece_type="noop")]
+    edges: List[Edge] = []
+    if shape == "fan":
+        nodes += [Node(id=f"n{i}", type=NodeType.ACTION, piece_type="noop") for i in range(args.nodes - 2)]
+        nodes.append(Node(id="end", type=NodeType.ACTION, piece_type="noop"))
+        edges += [Edge(id=f"a{i}", source_node_id="start", target_node_id=f"n{i}") for i in range(args.nodes - 2)]
+        edges += [Edge(id=f"b{i}", source_node_id=f"n{i}", target_node_id="end") for i in range(args.nodes - 2)]
+    elif shape == "layered":
+        width = max(1, (args.nodes - 1) // args.layers)
+        previous = ["start"]
+        for layer in range(args.layers):
+            current = [f"l{layer}_{i}" for i in range(width)]
+            nodes += [Node(id=node_id, type=NodeType.ACTION, piece_type="noop") for node_id in current]
+            # Each node depends on one node of the previous layer, the first node of a layer on all of them
+            edges += [Edge(id=f"{node_id}_in", source_node_id=previous[i % len(previous)], target_node_id=node_id)
+                      for i, node_id in enumerate(current[1:], 1)]
+            edges += [Edge(id=f"{current[0]}_in{i}", source_node_id=prev_id, target_node_id=current[0])
+                      for i, prev_id in enumerate(previous)]
+            previous = current
+    else:
+        sleep = {"seconds": args.sleep}
+        nodes += [Node(id=f"short{i}", type=NodeType.ACTION, piece_type="sleep", config=sleep) for i in range(args.short)]
+        nodes += [Node(id=f"chain{i}", type=NodeType.ACTION, piece_type="sleep", config=sleep) for i in range(args.chain)]
+        edges += [Edge(id=f"s{i}", source_node_id="start", target_node_id=f"short{i}") for i in range(args.short)]
+        edges.append(Edge(id="c0", source_node_id="start", target_node_id="chain0"))
+        edges += [Edge(id=f"c{i}", source_node_id=f"chain{i - 1}", target_node_id=f"chain{i}") for i in range(1, args.chain)]
+    return WorkflowDefinition(id=f"wf_{shape}", name=shape, nodes=nodes, edges=edges)
+
+
+async def run_mode(args: argparse.Namespace, shape: str, mode: str, db_path: str) -> None:
+    """Runs one workflow with one scheduler and prints the results."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)()
+
+    wf_def = make_workflow(args, shape)
+    wf_run = WorkflowRun(id=f"run_{shape}_{mode}", workflow_id=wf_def.id, workflow_version=1)
+    session.add(WorkflowDefinitionDB(id=wf_def.id, name=wf_def.name, nodes=[], edges=[], version=1))
+    session.add(WorkflowRunDB(id=wf_run.id, workflow_id=wf_def.id, workflow_version=1, status=WorkflowStatus.IDLE,
+                              node_states={}, node_outputs={}))
+    await session.commit()
+
+    registry = PieceRegistry()
+    registry.register("noop", NoopPiece)
+    registry.register("sleep", SleepPiece)
+    max_concurrent = args.mixed_concurrent if shape == "mixed" else args.max_concurrent
+    executor_class = LegacyExecutor if mode == "legacy" else WorkflowExecutor
+
+    start_time = time.perf_counter()
+    executor = executor_class(wf_def, wf_run, registry, session, state_flush_interval=args.flush_interval,
+                              max_concurrent_nodes=max_concurrent)
+    await executor.execute()
+    elapsed = time.perf_counter() - start_time
+
+    await session.close()
+    await engine.dispose()
+    assert wf_run.status == WorkflowStatus.COMPLETED, wf_run.status
+    node_count = len(wf_def.nodes)
+    print(f"{shape:7s} {mode:11s} nodes {node_count:6d}  edges {len(wf_def.edges):6d}  wall {elapsed:7.2f} s  "
+          f"{elapsed / node_count * 1e6:8.1f} us/node")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Runs every shape and mode."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for shape in args.shapes:
+            for mode in args.modes:
+                await run_mode(args, shape, mode, os.path.join(tmp, f"{shape}_{mode}.db"))
+
+
+def main():
+    """Runs the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the workflow executor scheduler")
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--layers", type=int, default=10)
+    parser.add_argument("--max-concurrent", type=int, default=64)
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    parser.add_argument("--short", type=int, default=200, help="Number of single nodes in the mixed shape")
+    parser.add_argument("--chain", type=int, default=50, help="Length of the long chain in the mixed shape")
+    parser.add_argument("--sleep", type=float, default=0.01, help="Node duration in the mixed shape")
+    parser.add_argument("--mixed-concurrent", type=int, default=5)
+    parser.add_argument("--shapes", nargs="+", default=["fan", "layered", "mixed"])
+    parser.add_argument("--modes", nargs="+", default=["legacy", "ready-queue"])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Node state persistence benchmark for the Workflow Engine.
+
+Runs wide (start -> N parallel nodes -> end) and deep (chain of N nodes)
+synthetic workflows of no-op pieces on a temporary local SQLite database and
+reports run wall time, commits and commits/sec for:
+- legacy: the whole run row (all node states and outputs) merged and committed
+  on every transition, as the executor did before
+- write-through: one node state row written and committed per transition
+- batched: node state rows written behind every --flush-interval seconds
+
+Usage:
+    python benchmark_state_persistence.py --nodes 500 --flush-interval 0.5
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.engine.executor import WorkflowExecutor
+from src.engine.registry import PieceRegistry
+from src.models.db_models import Base, WorkflowDefinitionDB, WorkflowRunDB
+from src.models.workflow import Edge, Node, NodeStatus, NodeType, WorkflowDefinition, WorkflowRun, WorkflowStatus
+from src.pieces.base import Piece
+
+
+class NoopPiece(Piece):
+    async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        return {"node": self.node.id}
+
+
+class LegacyExecutor(WorkflowExecutor):
+    """Executor that persists the whole run on every transition, as before."""
+
+    commits = 0
+    failed_writes = 0
+
+    async def _persist_whole_run(self):
+        run = self.workflow_run
+        try:
+            await self._merge_run(run)
+        except Exception:
+            # The old executor logged and rolled back; concurrent node tasks sharing the session can collide
+            self.failed_writes += 1
+            try:
+                await self.db_session.rollback()
+            except Exception:
+                pass
+
+    async def _merge_run(self, run: WorkflowRun):
+        await self.db_session.merge(WorkflowRunDB(
+            id=run.id,
+            workflow_id=run.workflow_id,
+            workflow_version=run.workflow_version,
+            status=run.status,
+            error_message=run.error_message,
+            start_time=datetime.fromisoformat(run.start_time) if run.start_time else None,
+            end_time=datetime.fromisoformat(run.end_time) if run.end_time else None,
+            trigger_data=run.trigger_data,
+            node_states=run.node_states,
+            node_outputs=run.node_outputs
+        ))
+        await self.db_session.commit()
+        self.commits += 1
+
+    async def _update_node_state(self, node_id: str, status: NodeStatus, output_data: Any | None = None):
+        self.workflow_run.node_states[node_id] = status
+        if output_data is not None:
+            self.workflow_run.node_outputs[node_id] = output_data
+        await self._persist_whole_run()
+
+    async def _update_run_status(self, status: WorkflowStatus, error_message: str | None = None):
+        self.workflow_run.status = status
+        await self._persist_whole_run()
+
+
+def make_workflow(shape: str, nodes: int) -> WorkflowDefinition:
+    """Creates a wide or deep workflow definition."""
+    node_list = [Node(id="n0", type=NodeType.TRIGGER, piece_type="noop")]
+    node_list += [Node(id=f"n{i}", type=NodeType.ACTION, piece_type="noop") for i in range(1, nodes)]
+    if shape == "deep":
+        edges = [Edge(id=f"e{i}", source_node_id=f"n{i - 1}", target_node_id=f"n{i}") for i in range(1, nodes)]
+    else:
+        last = f"n{nodes - 1}"
+        edges = [Edge(id=f"a{i}", source_node_id="n0", target_node_id=f"n{i}") for i in range(1, nodes - 1)]
+        edges += [Edge(id=f"b{i}", source_node_id=f"n{i}", target_node_id=last) for i in range(1, nodes - 1)]
+    return WorkflowDefinition(id=f"wf_{shape}", name=shape, nodes=node_list, edges=edges)
+
+
+async def run_mode(args: argparse.Namespace, shape: str, mode: str, db_path: str) -> None:
+    """Runs one workflow in one persistence mode and prints the results."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)()
+
+    wf_def = make_workflow(shape, args.nodes)
+    wf_run = WorkflowRun(id=f"run_{shape}_{mode}", workflow_id=wf_def.id, workflow_version=1)
+    session.add(WorkflowDefinitionDB(id=wf_def.id, name=wf_def.name, nodes=[], edges=[], version=1))
+    session.add(WorkflowRunDB(id=wf_run.id, workflow_id=wf_def.id, workflow_version=1, status=WorkflowStatus.IDLE,
+                              node_states={}, node_outputs={}))
+    await session.commit()
+
+    registry = PieceRegistry()
+    registry.register("noop", NoopPiece)
+    if mode == "legacy":
+        executor = LegacyExecutor(wf_def, wf_run, registry, session)
+    else:
+        interval = 0 if mode == "write-through" else args.flush_interval
+        executor = WorkflowExecutor(wf_def, wf_run, registry, session, state_flush_interval=interval)
+
+    start_time = time.perf_counter()
+    await executor.execute()
+    elapsed = time.perf_counter() - start_time
+    commits = executor.commits if mode == "legacy" else executor.state_store.commits
+    failed = f"  failed writes {executor.failed_writes}" if mode == "legacy" else ""
+
+    await session.close()
+    await engine.dispose()
+    assert wf_run.status == WorkflowStatus.COMPLETED, wf_run.status
+    print(f"{shape:5s} {mode:14s} wall {elapsed:7.2f} s  commits {commits:5d}  {commits / elapsed:8.1f} commits/s  "
+          f"{3 * args.nodes / elapsed:8.0f} transitions/s{failed}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Runs every shape and mode."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for shape in args.shapes:
+            for mode in args.modes:
+                await run_mode(args, shape, mode, os.path.join(tmp, f"{shape}_{mode}.db"))
+
+
+def main():
+    """Runs the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark workflow run state persistence on SQLite")
+    parser.add_argument("--nodes", type=int, default=500)
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    parser.add_argument("--shapes", nargs="+", default=["wide", "deep"])
+    parser.add_argument("--modes", nargs="+", default=["legacy", "write-through", "batched"])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from ..models.workflow import WorkflowRun, WorkflowDefinition # Pydantic models
 from ..models import db_models # SQLAlchemy models
 from ..engine.executor import WorkflowExecutor
 from ..engine.registry import get_registry
+from ..engine.state_store import load_run_snapshot
 from sqlalchemy.future import select
 import uuid
 import json
@@ -73,25 +74,11 @@ async def trigger_workflow(
 @router.get("/{run_id}/status", response_model=WorkflowRun)
 async def get_run_status(run_id: str, db: AsyncSession = Depends(get_db)):
     """Get the status and details of a specific workflow run."""
-    result = await db.execute(select(db_models.WorkflowRun).where(db_models.WorkflowRun.id == run_id))
-    db_run = result.scalar_one_or_none()
-    if db_run is None:
+    # Materialize the run from its node state rows so in-progress runs show live node states
+    run = await load_run_snapshot(db, run_id)
+    if run is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Workflow run not found")
-
-    # Convert db_run to Pydantic model
-    run_data = {
-        "id": db_run.id,
-        "workflow_id": db_run.workflow_id,
-        "workflow_version": db_run.workflow_version,
-        "status": db_run.status,
-        "start_time": db_run.start_time.isoformat() if db_run.start_time else None,
-        "end_time": db_run.end_time.isoformat() if db_run.end_time else None,
-        "trigger_data": json.loads(db_run.trigger_data) if db_run.trigger_data else None,
-        "node_states": json.loads(db_run.node_states) if db_run.node_states else {},
-        "node_outputs": json.loads(db_run.node_outputs) if db_run.node_outputs else {},
-        "error_message": db_run.error_message
-    }
-    return WorkflowRun(**run_data)
+    return run
 
 @router.get("/history/{workflow_id}", response_model=List[WorkflowRun])
 async def get_workflow_run_history(
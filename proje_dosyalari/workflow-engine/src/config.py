@@ -8,6 +8,18 @@ class Settings(BaseSettings):
     AI_ORCHESTRATOR_URL: str = "http://ai-orchestrator:8000"
     OS_INTEGRATION_URL: str = "http://os-integration-service:8000"
 
+    # Seconds between batched writes of node states during a run (0 writes every change immediately)
+    STATE_FLUSH_INTERVAL_SECONDS: float = 0.5
+
+    # Shared HTTP client pool used by HTTP based pieces
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP2_ENABLED: bool = False # Requires the h2 package (pip install httpx[http2])
+    HTTP_MAX_RETRIES: int = 2
+    HTTP_RETRY_BACKOFF_SECONDS: float = 0.2 # Base delay, doubled on every attempt and jittered
+    HTTP_RETRY_BACKOFF_MAX_SECONDS: float = 5.0
+
     # Logging Level
     LOGGING_LEVEL: str = "INFO"
 
@@ -1,7 +1,10 @@
 import asyncio
+import heapq
 import logging
+import shutil
+import tempfile
 import time
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Tuple
 from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -11,6 +14,7 @@ from src.models.workflow import WorkflowDefinition, WorkflowRun, NodeStatus, Wor
 from src.models.db_models import WorkflowRunDB # Import the DB model
 from src.pieces.base import Piece
 from src.engine.registry import PieceRegistry
+from src.engine.state_store import RunStateStore
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -26,26 +30,79 @@ DEFAULT_MAX_CONCURRENT_NODES = 5
 class WorkflowExecutor:
     """Handles the execution of a single workflow run, including persistence, retries, and parallel execution."""
 
-    def __init__(self, workflow_def: WorkflowDefinition, workflow_run: WorkflowRun, registry: PieceRegistry, db_session: AsyncSession):
+    def __init__(self, workflow_def: WorkflowDefinition, workflow_run: WorkflowRun, registry: PieceRegistry, db_session: AsyncSession, state_flush_interval: float | None = None, max_concurrent_nodes: int | None = None, piece_concurrency_limits: Dict[str, int] | None = None):
         self.workflow_def = workflow_def
         self.workflow_run = workflow_run # Pydantic model for in-memory state
         self.registry = registry
         self.db_session = db_session
+        # Node states are written behind in batches; run status changes flush them
+        self.state_store = RunStateStore(db_session, workflow_run.id, flush_interval=state_flush_interval)
         self.node_map: Dict[str, Node] = {node.id: node for node in workflow_def.nodes}
         self.adjacency_list: Dict[str, List[str]] = {node.id: [] for node in workflow_def.nodes}
+        self.predecessors: Dict[str, List[str]] = {node.id: [] for node in workflow_def.nodes}
         self.in_degree: Dict[str, int] = {node.id: 0 for node in workflow_def.nodes}
+        self.critical_path_length: Dict[str, int] = {}
         self.processed_nodes: Set[str] = set()
-        self.max_concurrent_nodes = workflow_def.config.get("max_concurrent_nodes", DEFAULT_MAX_CONCURRENT_NODES) if hasattr(workflow_def, 'config') else DEFAULT_MAX_CONCURRENT_NODES
+        workflow_config = workflow_def.config if hasattr(workflow_def, 'config') else {}
+        self.max_concurrent_nodes = max_concurrent_nodes or workflow_config.get("max_concurrent_nodes", DEFAULT_MAX_CONCURRENT_NODES)
+        # piece_type -> maximum nodes of that type running at once
+        self.piece_concurrency_limits: Dict[str, int] = piece_concurrency_limits or workflow_config.get("piece_concurrency_limits", {})
+        self._ready: Dict[str, List[Tuple[int, int, str]]] = {} # piece_type -> heap of (-critical path, seq, node_id)
+        self._ready_count = 0
+        self._running_by_type: Dict[str, int] = {}
+        self.temp_dir: str | None = None # Holds files pieces write during the run, such as spilled HTTP bodies
         self._build_graph()
 
     def _build_graph(self):
-        """Builds the adjacency list and in-degree map from the workflow edges."""
+        """Builds the adjacency lists, in-degree map and node priorities once per run."""
         for edge in self.workflow_def.edges:
             if edge.source_node_id in self.node_map and edge.target_node_id in self.node_map:
                 self.adjacency_list[edge.source_node_id].append(edge.target_node_id)
+                self.predecessors[edge.target_node_id].append(edge.source_node_id)
                 self.in_degree[edge.target_node_id] += 1
             else:
                 logger.warning(f"Edge {edge.id} connects non-existent nodes.")
+        self.critical_path_length = self._compute_critical_path_lengths()
+
+    def _compute_critical_path_lengths(self) -> Dict[str, int]:
+        """Counts the nodes on the longest path from each node to the end of the workflow.
+
+        Ready nodes with longer remaining paths are started first, so the chain
+        that bounds the run time is not held up behind short branches.
+        """
+        remaining = dict(self.in_degree)
+        order = [node_id for node_id, degree in remaining.items() if degree == 0]
+        for node_id in order: # Kahn's algorithm; order grows while iterating
+            for neighbor_id in self.adjacency_list[node_id]:
+                remaining[neighbor_id] -= 1
+                if remaining[neighbor_id] == 0:
+                    order.append(neighbor_id)
+        if len(order) < len(self.node_map):
+            logger.warning(f"Workflow {self.workflow_def.id} has a cycle; {len(self.node_map) - len(order)} nodes will never run.")
+
+        lengths = {node_id: 0 for node_id in self.node_map}
+        for node_id in reversed(order):
+            lengths[node_id] = 1 + max((lengths[neighbor_id] for neighbor_id in self.adjacency_list[node_id]), default=0)
+        return lengths
+
+    def _push_ready(self, node_id: str):
+        """Adds a node to the ready queue of its piece type."""
+        piece_type = self.node_map[node_id].piece_type
+        heapq.heappush(self._ready.setdefault(piece_type, []), (-self.critical_path_length[node_id], self._ready_count, node_id))
+        self._ready_count += 1
+
+    def _pop_ready(self) -> str | None:
+        """Takes the ready node with the longest critical path whose piece type is below its limit."""
+        best_heap = None
+        for piece_type, heap in self._ready.items():
+            if not heap:
+                continue
+            limit = self.piece_concurrency_limits.get(piece_type)
+            if limit is not None and self._running_by_type.get(piece_type, 0) >= limit:
+                continue
+            if best_heap is None or heap[0] < best_heap[0]:
+                best_heap = heap
+        return heapq.heappop(best_heap)[2] if best_heap else None
 
     async def _update_run_status(self, status: WorkflowStatus, error_message: str | None = None):
         """Updates the workflow run status in memory and persists to DB."""
@@ -63,50 +120,38 @@ class WorkflowExecutor:
             self.workflow_run.end_time = datetime.now(timezone.utc).isoformat()
 
         try:
-            db_run_data = {
-                "id": self.workflow_run.id,
+            run_values = {
                 "status": status,
-                "error_message": error_message,
+                "error_message": self.workflow_run.error_message,
                 "start_time": datetime.fromisoformat(self.workflow_run.start_time) if self.workflow_run.start_time else None,
                 "end_time": datetime.fromisoformat(self.workflow_run.end_time) if self.workflow_run.end_time else None,
-                "workflow_id": self.workflow_run.workflow_id,
-                "workflow_version": self.workflow_run.workflow_version,
-                "trigger_data": self.workflow_run.trigger_data,
-                "node_states": self.workflow_run.node_states,
-                "node_outputs": self.workflow_run.node_outputs
             }
-            await self.db_session.merge(WorkflowRunDB(**db_run_data))
-            await self.db_session.commit()
+            if status == WorkflowStatus.RUNNING:
+                run_values["workflow_id"] = self.workflow_run.workflow_id
+                run_values["workflow_version"] = self.workflow_run.workflow_version
+                run_values["trigger_data"] = self.workflow_run.trigger_data
+            elif status in [WorkflowStatus.COMPLETED, WorkflowStatus.FAILED]:
+                # Materialize the final node states on the run row once, at the end
+                run_values["node_states"] = self.workflow_run.node_states
+                run_values["node_outputs"] = self.workflow_run.node_outputs
+            await self.state_store.flush(run_values)
             logger.info(f"Persisted WorkflowRun {self.workflow_run.id} status: {status}")
         except Exception as e:
             logger.error(f"Failed to persist WorkflowRun {self.workflow_run.id} status: {e}", exc_info=True)
-            await self.db_session.rollback()
 
     async def _update_node_state(self, node_id: str, status: NodeStatus, output_data: Any | None = None):
-        """Updates a node's state in memory and persists the run state to DB."""
+        """Updates a node's state in memory and queues it for the next batched write."""
         self.workflow_run.node_states[node_id] = status
         if output_data is not None:
             self.workflow_run.node_outputs[node_id] = output_data
 
-        try:
-            db_run_data = {
-                "id": self.workflow_run.id,
-                "node_states": self.workflow_run.node_states,
-                "node_outputs": self.workflow_run.node_outputs,
-                "status": self.workflow_run.status,
-                "error_message": self.workflow_run.error_message,
-                "start_time": datetime.fromisoformat(self.workflow_run.start_time) if self.workflow_run.start_time else None,
-                "end_time": datetime.fromisoformat(self.workflow_run.end_time) if self.workflow_run.end_time else None,
-                "workflow_id": self.workflow_run.workflow_id,
-                "workflow_version": self.workflow_run.workflow_version,
-                "trigger_data": self.workflow_run.trigger_data
-            }
-            await self.db_session.merge(WorkflowRunDB(**db_run_data))
-            await self.db_session.commit()
-            logger.info(f"Persisted Node {node_id} state: {status} for Run {self.workflow_run.id}")
-        except Exception as e:
-            logger.error(f"Failed to persist Node {node_id} state for Run {self.workflow_run.id}: {e}", exc_info=True)
-            await self.db_session.rollback()
+        self.state_store.record(node_id, status, output_data)
+        if self.state_store.write_through:
+            try:
+                await self.state_store.flush()
+                logger.info(f"Persisted Node {node_id} state: {status} for Run {self.workflow_run.id}")
+            except Exception as e:
+                logger.error(f"Failed to persist Node {node_id} state for Run {self.workflow_run.id}: {e}", exc_info=True)
 
     async def _execute_node(self, node_id: str):
         """Executes a single node with retry logic."""
@@ -130,13 +175,14 @@ class WorkflowExecutor:
                     raise ValueError(f"Piece type 	{node.piece_type}	 not found in registry.")
 
                 piece_instance: Piece = piece_class(node)
+                piece_instance.http_pool = self.registry.http_pool
+                piece_instance.run_temp_dir = self.temp_dir
 
                 # Gather input data (simplified)
                 # TODO: Handle multiple inputs, specific handles
                 input_data = {}
                 # Find predecessors based on graph structure
-                predecessors = [pred_id for pred_id, neighbors in self.adjacency_list.items() if node_id in neighbors]
-                for pred_id in predecessors:
+                for pred_id in self.predecessors[node_id]:
                      if pred_id in self.workflow_run.node_outputs:
                         input_data.update(self.workflow_run.node_outputs.get(pred_id, {}))
 
@@ -164,60 +210,65 @@ class WorkflowExecutor:
 
     async def execute(self):
         """Executes the workflow with parallel node processing, persistence, and retries."""
+        self.state_store.start()
+        self.temp_dir = tempfile.mkdtemp(prefix=f"workflow_run_{self.workflow_run.id}_")
+        try:
+            await self._execute_graph()
+        finally:
+            # Write any node states still buffered, even if execution was interrupted
+            await self.state_store.stop()
+            # Files written by pieces, e.g. body_path of HttpRequest, only live as long as the run
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    async def _execute_graph(self):
+        """Runs the nodes in dependency order and records the final run status."""
         logger.info(f"Starting execution for WorkflowRun ID: {self.workflow_run.id}")
         await self._update_run_status(WorkflowStatus.RUNNING)
 
-        semaphore = asyncio.Semaphore(self.max_concurrent_nodes)
-        running_tasks: Dict[str, asyncio.Task] = {}
-        nodes_to_process: Set[str] = set()
+        running_tasks: Dict[asyncio.Task, str] = {} # task -> node_id
         final_status = WorkflowStatus.COMPLETED # Assume success initially
         final_error_message = None
 
         # Initialize with nodes having in-degree 0
         for node_id, degree in self.in_degree.items():
             if degree == 0:
-                nodes_to_process.add(node_id)
+                self._push_ready(node_id)
                 await self._update_node_state(node_id, NodeStatus.PENDING)
 
-        while nodes_to_process or running_tasks:
-            # Start new tasks if possible
-            while nodes_to_process and len(running_tasks) < self.max_concurrent_nodes:
-                node_id = nodes_to_process.pop()
-                if node_id not in self.processed_nodes and node_id not in running_tasks:
-                    logger.debug(f"Creating task for node {node_id}")
-                    task = asyncio.create_task(self._execute_node_wrapper(node_id, semaphore))
-                    running_tasks[node_id] = task
+        while True:
+            # Start the highest-priority ready nodes that fit the global and per-piece limits
+            while len(running_tasks) < self.max_concurrent_nodes:
+                node_id = self._pop_ready()
+                if node_id is None:
+                    break
+                piece_type = self.node_map[node_id].piece_type
+                self._running_by_type[piece_type] = self._running_by_type.get(piece_type, 0) + 1
+                task = asyncio.create_task(self._execute_node_wrapper(node_id))
+                running_tasks[task] = node_id
 
             if not running_tasks:
-                # Should not happen if nodes_to_process was not empty, but safety check
-                await asyncio.sleep(0.1) # Prevent tight loop if something unexpected happens
-                continue
+                if any(self._ready.values()):
+                    logger.error(f"Ready nodes of WorkflowRun {self.workflow_run.id} cannot start; check piece_concurrency_limits.")
+                    final_status = WorkflowStatus.FAILED
+                    final_error_message = "Ready nodes could not be scheduled."
+                break
 
             # Wait for any task to complete
-            done, pending = await asyncio.wait(running_tasks.values(), return_when=asyncio.FIRST_COMPLETED)
+            done, _ = await asyncio.wait(running_tasks, return_when=asyncio.FIRST_COMPLETED)
 
             for task in done:
-                node_id = None
-                # Find the node_id associated with the completed task
-                for nid, t in running_tasks.items():
-                    if t == task:
-                        node_id = nid
-                        break
-                
-                if node_id is None:
-                    logger.error("Completed task not found in running_tasks mapping!")
-                    continue
-
-                del running_tasks[node_id] # Remove from running tasks
+                node_id = running_tasks.pop(task)
+                piece_type = self.node_map[node_id].piece_type
+                self._running_by_type[piece_type] -= 1
                 self.processed_nodes.add(node_id)
 
                 try:
-                    await task # Raise exception if task failed
-                    # Task completed successfully, process successors
+                    task.result() # Raise exception if task failed
+                    # Task completed successfully, release successors
                     for neighbor_id in self.adjacency_list[node_id]:
                         self.in_degree[neighbor_id] -= 1
                         if self.in_degree[neighbor_id] == 0 and neighbor_id not in self.processed_nodes:
-                            nodes_to_process.add(neighbor_id)
+                            self._push_ready(neighbor_id)
                             # Persist PENDING state for newly ready nodes
                             await self._update_node_state(neighbor_id, NodeStatus.PENDING)
                 except Exception as e:
@@ -225,37 +276,34 @@ class WorkflowExecutor:
                     logger.error(f"Task for node {node_id} failed: {e}")
                     final_status = WorkflowStatus.FAILED
                     final_error_message = self.workflow_run.error_message or f"Node {node_id} processing failed."
-                    # Cancel remaining tasks (optional, could be configurable)
-                    logger.info(f"Cancelling remaining {len(pending)} tasks due to failure in node {node_id}.")
-                    for remaining_task in pending:
-                        remaining_task.cancel()
-                    # Clear nodes_to_process to stop scheduling new tasks
-                    nodes_to_process.clear()
-                    # Ensure loop terminates
-                    running_tasks.clear()
-                    break # Exit the outer while loop
-            
-            # Check if a failure occurred in the inner loop
+                    break
+
             if final_status == WorkflowStatus.FAILED:
+                # Cancel remaining tasks and stop scheduling new ones
+                logger.info(f"Cancelling remaining {len(running_tasks)} tasks due to failure in node {node_id}.")
+                for remaining_task in running_tasks:
+                    remaining_task.cancel()
+                await asyncio.gather(*running_tasks, return_exceptions=True)
+                running_tasks.clear()
+                self._ready.clear()
                 break
 
         # Final status update
         await self._update_run_status(final_status, final_error_message)
         logger.info(f"Workflow run {self.workflow_run.id} finished with status: {self.workflow_run.status}")
 
-    async def _execute_node_wrapper(self, node_id: str, semaphore: asyncio.Semaphore):
-        """Wrapper to handle semaphore acquisition/release and exceptions for _execute_node."""
-        async with semaphore:
-            try:
-                await self._execute_node(node_id)
-            except Exception as e:
-                # Ensure failure state is persisted if _execute_node fails after retries
-                if self.workflow_run.node_states.get(node_id) != NodeStatus.FAILED:
-                    error_msg = f"Node {node_id} failed after retries: {e}"
-                    await self._update_node_state(node_id, NodeStatus.FAILED)
-                    # Update run status only if it's not already failed
-                    if self.workflow_run.status != WorkflowStatus.FAILED:
-                         await self._update_run_status(WorkflowStatus.FAILED, error_msg)
-                # Re-raise the exception so the main loop can catch it
-                raise
+    async def _execute_node_wrapper(self, node_id: str):
+        """Wrapper to handle exceptions for _execute_node."""
+        try:
+            await self._execute_node(node_id)
+        except Exception as e:
+            # Ensure failure state is persisted if _execute_node fails after retries
+            if self.workflow_run.node_states.get(node_id) != NodeStatus.FAILED:
+                error_msg = f"Node {node_id} failed after retries: {e}"
+                await self._update_node_state(node_id, NodeStatus.FAILED)
+                # Update run status only if it's not already failed
+                if self.workflow_run.status != WorkflowStatus.FAILED:
+                     await self._update_run_status(WorkflowStatus.FAILED, error_msg)
+            # Re-raise the exception so the main loop can catch it
+            raise
 
@@ -0,0 +1,180 @@
+import asyncio
+import importlib.util
+import logging
+import random
+import tempfile
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Tuple
+
+import httpx
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Requests with these methods can be repeated without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Errors raised before the request reached the server, safe to retry for any method
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+class HttpClientPool:
+    """Shared HTTP client for all pieces of the engine.
+
+    One httpx.AsyncClient keeps connections alive across node executions, so
+    nodes calling the same service do not pay TCP/TLS setup every time. The
+    number of in-flight requests per host is capped, failed requests are
+    retried with jittered exponential backoff, and response bodies can be
+    streamed. The pool is owned by the application lifespan and handed to
+    pieces through the PieceRegistry.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_connections_per_host: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+        max_retries: int | None = None,
+        backoff: float | None = None,
+        backoff_max: float | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.max_connections = max_connections or settings.HTTP_MAX_CONNECTIONS
+        self.max_connections_per_host = max_connections_per_host or settings.HTTP_MAX_CONNECTIONS_PER_HOST
+        self.keepalive_expiry = settings.HTTP_KEEPALIVE_EXPIRY_SECONDS if keepalive_expiry is None else keepalive_expiry
+        self.http2 = settings.HTTP2_ENABLED if http2 is None else http2
+        self.max_retries = settings.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff = settings.HTTP_RETRY_BACKOFF_SECONDS if backoff is None else backoff
+        self.backoff_max = settings.HTTP_RETRY_BACKOFF_MAX_SECONDS if backoff_max is None else backoff_max
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self._host_slots: Dict[Tuple[str, str, int | None], asyncio.Semaphore] = {}
+
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1.")
+            self.http2 = False
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Creates the shared client on first use, inside the running event loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    def _host_slot(self, url: httpx.URL) -> asyncio.Semaphore:
+        """Returns the semaphore limiting in-flight requests to the host of url."""
+        key = (url.scheme, url.host, url.port)
+        slot = self._host_slots.get(key)
+        if slot is None:
+            slot = self._host_slots[key] = asyncio.Semaphore(self.max_connections_per_host)
+        return slot
+
+    def _retry_delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After header."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt))
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, retries: int | None = None, **kwargs) -> AsyncIterator[httpx.Response]:
+        """Sends a request and yields the response before its body is read.
+
+        Connection errors are retried for every method; other transport errors
+        and 429/502/503/504 responses only for idempotent methods.
+
+        Args:
+            method: HTTP method.
+            url: Absolute request URL.
+            retries: Retries for this request (defaults to the pool setting).
+            **kwargs: Passed to httpx.AsyncClient.build_request (headers, params, json, content, timeout...).
+        """
+        client = self._get_client()
+        request = client.build_request(method, url, **kwargs)
+        max_retries = self.max_retries if retries is None else retries
+        idempotent = request.method in IDEMPOTENT_METHODS
+
+        async with self._host_slot(request.url):
+            attempt = 0
+            while True:
+                try:
+                    response = await client.send(request, stream=True)
+                except httpx.TransportError as e:
+                    if attempt >= max_retries or not (idempotent or isinstance(e, CONNECT_ERRORS)):
+                        raise
+                    delay = self._retry_delay(attempt)
+                    logger.warning(f"{request.method} {request.url} failed ({e!r}); retrying in {delay:.2f}s")
+                else:
+                    if response.status_code not in RETRY_STATUS_CODES or not idempotent or attempt >= max_retries:
+                        break
+                    await response.aclose()
+                    delay = self._retry_delay(attempt, response)
+                    logger.warning(f"{request.method} {request.url} returned {response.status_code}; retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+            try:
+                yield response
+            finally:
+                await response.aclose()
+
+    async def request(self, method: str, url: str, retries: int | None = None, **kwargs) -> httpx.Response:
+        """Sends a request with retries and returns the response with its body read."""
+        async with self.stream(method, url, retries=retries, **kwargs) as response:
+            await response.aread()
+        return response
+
+    async def aclose(self):
+        """Closes all pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_slots.clear()
+
+    async def __aenter__(self) -> "HttpClientPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+async def read_body(response: httpx.Response, max_in_memory: int | None = None, spill_dir: str | None = None) -> Tuple[bytes | None, str | None, int]:
+    """Reads a streamed response body, spilling it to a temporary file when large.
+
+    Args:
+        response: Response from HttpClientPool.stream.
+        max_in_memory: Largest body kept in memory; None keeps every body in memory.
+        spill_dir: Directory for the temporary file (defaults to the system temp directory).
+
+    Returns:
+        (content, None, size) for small bodies, (None, file path, size) for large ones.
+        The caller owns the temporary file.
+    """
+    chunks = []
+    size = 0
+    body_file = None
+    try:
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if body_file is not None:
+                body_file.write(chunk)
+                continue
+            chunks.append(chunk)
+            if max_in_memory is not None and size > max_in_memory:
+                body_file = tempfile.NamedTemporaryFile(prefix="workflow_http_", dir=spill_dir, delete=False)
+                body_file.writelines(chunks)
+                chunks = []
+    finally:
+        if body_file is not None:
+            body_file.close()
+    if body_file is not None:
+        return None, body_file.name, size
+    return b"".join(chunks), None, size
@@ -1,11 +1,13 @@
 from typing import Dict, Type, Any
 from ..pieces.base import Piece
+from .http_pool import HttpClientPool
 
 class PieceRegistry:
     """Registry for all available workflow pieces."""
     
     def __init__(self):
         self._pieces: Dict[str, Type[Piece]] = {}
+        self.http_pool: HttpClientPool | None = None # Shared by HTTP based pieces, set by the app lifespan
         
     def register(self, piece_type: str, piece_class: Type[Piece]):
         """Register a piece class with its type identifier."""
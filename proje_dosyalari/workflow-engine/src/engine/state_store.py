@@ -0,0 +1,152 @@
+import asyncio
+import logging
+from typing import Dict, Any, Set
+from datetime import datetime, timezone
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.config import settings
+from src.models.workflow import WorkflowRun, NodeStatus
+from src.models.db_models import WorkflowRunDB, WorkflowRunNodeStateDB
+
+logger = logging.getLogger(__name__)
+
+class RunStateStore:
+    """Write-behind persistence of the node states of one workflow run.
+
+    Node transitions are buffered in memory and written as one row per node to
+    workflow_run_node_states, in a single commit per flush interval. Only nodes
+    that changed since the last flush are written, so a run writes O(nodes) rows
+    instead of rewriting the whole node_states/node_outputs JSON on every change.
+    """
+
+    def __init__(self, db_session: AsyncSession, run_id: str, flush_interval: float | None = None):
+        self.db_session = db_session
+        self.run_id = run_id
+        self.flush_interval = settings.STATE_FLUSH_INTERVAL_SECONDS if flush_interval is None else flush_interval
+        self._dirty: Dict[str, Dict[str, Any]] = {} # node_id -> changed columns
+        self._persisted: Set[str] = set() # Nodes that already have a row
+        self._lock = asyncio.Lock() # The session is shared, so writes must not overlap
+        self._stopped = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        self.commits = 0
+        self.rows_written = 0
+
+    @property
+    def write_through(self) -> bool:
+        """Whether every change is written immediately instead of batched."""
+        return self.flush_interval <= 0
+
+    def record(self, node_id: str, status: NodeStatus, output_data: Any | None = None):
+        """Buffers a node state change until the next flush."""
+        row = self._dirty.setdefault(node_id, {"run_id": self.run_id, "node_id": node_id})
+        row["status"] = status
+        row["updated_at"] = datetime.now(timezone.utc)
+        if output_data is not None:
+            row["output"] = output_data
+
+    def start(self):
+        """Starts the background flusher (no-op in write-through mode)."""
+        if not self.write_through and self._flusher is None:
+            self._stopped.clear()
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self):
+        """Stops the background flusher and writes any buffered changes."""
+        if self._flusher is not None:
+            self._stopped.set()
+            await self._flusher
+            self._flusher = None
+        await self.flush()
+
+    async def _flush_periodically(self):
+        """Flushes buffered changes every flush interval until stopped."""
+        while not self._stopped.is_set():
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                try:
+                    await self.flush()
+                except Exception as e:
+                    # Changes stay buffered and are retried on the next flush
+                    logger.error(f"Failed to flush node states for Run {self.run_id}: {e}", exc_info=True)
+
+    async def flush(self, run_values: Dict[str, Any] | None = None):
+        """Writes buffered node states, and optionally run columns, in one commit.
+
+        Args:
+            run_values: Columns of the WorkflowRunDB row to update in the same transaction.
+        """
+        async with self._lock:
+            if not self._dirty and not run_values:
+                return
+            rows, self._dirty = self._dirty, {}
+            new_rows = [row for node_id, row in rows.items() if node_id not in self._persisted]
+            changed_rows = [row for node_id, row in rows.items() if node_id in self._persisted]
+            for row in new_rows:
+                row.setdefault("output", None)
+
+            try:
+                if new_rows:
+                    await self.db_session.execute(insert(WorkflowRunNodeStateDB), new_rows)
+                if changed_rows:
+                    # Bulk UPDATE by primary key
+                    await self.db_session.execute(update(WorkflowRunNodeStateDB), changed_rows)
+                if run_values:
+                    result = await self.db_session.execute(
+                        update(WorkflowRunDB).where(WorkflowRunDB.id == self.run_id).values(**run_values)
+                    )
+                    if result.rowcount == 0:
+                        self.db_session.add(WorkflowRunDB(id=self.run_id, **run_values))
+                await self.db_session.commit()
+            except Exception:
+                await self.db_session.rollback()
+                # Put the rows back without overwriting changes recorded meanwhile
+                for node_id, row in rows.items():
+                    self._dirty[node_id] = {**row, **self._dirty.get(node_id, {})}
+                raise
+
+            self._persisted.update(row["node_id"] for row in new_rows)
+            self.commits += 1
+            self.rows_written += len(rows)
+
+async def load_run_snapshot(db_session: AsyncSession, run_id: str) -> WorkflowRun | None:
+    """Materializes the current state of a run from its run row and node state rows.
+
+    Args:
+        db_session: Database session.
+        run_id: ID of the workflow run.
+
+    Returns:
+        The run with up-to-date node states and outputs, or None if it does not exist.
+    """
+    db_run = (await db_session.execute(
+        select(WorkflowRunDB).where(WorkflowRunDB.id == run_id).execution_options(populate_existing=True)
+    )).scalar_one_or_none()
+    if db_run is None:
+        return None
+
+    node_states = dict(db_run.node_states or {})
+    node_outputs = dict(db_run.node_outputs or {})
+    node_rows = await db_session.execute(
+        select(WorkflowRunNodeStateDB).where(WorkflowRunNodeStateDB.run_id == run_id)
+    )
+    for node_row in node_rows.scalars():
+        node_states[node_row.node_id] = node_row.status
+        if node_row.output is not None:
+            node_outputs[node_row.node_id] = node_row.output
+
+    return WorkflowRun(
+        id=db_run.id,
+        workflow_id=db_run.workflow_id,
+        workflow_version=db_run.workflow_version,
+        status=db_run.status,
+        start_time=db_run.start_time.isoformat() if db_run.start_time else None,
+        end_time=db_run.end_time.isoformat() if db_run.end_time else None,
+        trigger_data=db_run.trigger_data,
+        node_states=node_states,
+        node_outputs=node_outputs,
+        error_message=db_run.error_message
+    )
@@ -15,6 +15,7 @@ from .api import workflows, runs, pieces
 
 # Import the central registry and specific workflow pieces to be registered.
 from .engine.registry import registry, get_registry
+from .engine.http_pool import HttpClientPool
 from .pieces.actions import CodeExecutor, HttpRequest, Delay
 from .pieces.triggers import ManualTrigger, ScheduleTrigger, WebhookTrigger
 from .pieces.integrations import AiOrchestrator, OsIntegration
@@ -24,7 +25,8 @@ async def lifespan(app: FastAPI):
     """Manages the application's lifespan events, such as startup and shutdown.
 
     During startup, it loads all defined workflow pieces into the central registry,
-    making them available for use in workflows.
+    making them available for use in workflows, and creates the HTTP client pool
+    shared by HTTP based pieces. The pool's connections are closed on shutdown.
     """
     logger.info("Workflow Engine starting up...")
     logger.info("Loading workflow pieces into the registry...")
@@ -45,9 +47,14 @@ async def lifespan(app: FastAPI):
     piece_registry.register("os_integration", OsIntegration)    # Interacts with OS Integration Service.
 
     logger.info(f"Successfully loaded pieces: {list(piece_registry.list_pieces().keys())}")
+
+    # Share keep-alive connections between all node executions.
+    piece_registry.http_pool = HttpClientPool()
     yield  # Application runs after this point.
     # Clean up resources on shutdown if needed.
     logger.info("Workflow Engine shutting down...")
+    await piece_registry.http_pool.aclose()
+    piece_registry.http_pool = None
 
 # Initialize the FastAPI application instance.
 app = FastAPI(
@@ -36,5 +36,14 @@ class WorkflowRunDB(Base):
 
     definition = relationship("WorkflowDefinitionDB", back_populates="runs")
 
+class WorkflowRunNodeStateDB(Base):
+    __tablename__ = "workflow_run_node_states"
+
+    run_id = Column(String, ForeignKey("workflow_runs.id"), primary_key=True)
+    node_id = Column(String, primary_key=True)
+    status = Column(SQLEnum(NodeStatus), index=True)
+    output = Column(JSON, nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
 # You might add more models here later if needed, e.g., for storing piece execution logs separately.
 
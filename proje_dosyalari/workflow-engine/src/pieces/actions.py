@@ -1,4 +1,5 @@
 import asyncio
+import json
 import subprocess
 from typing import Dict, Any
 from .base import Piece
@@ -118,6 +119,7 @@ class CodeExecutor(Piece):
 # Keeping the HttpRequest and Delay classes.
 
 import httpx # Using httpx for async requests
+from ..engine.http_pool import read_body
 
 class HttpRequest(Piece):
     """Makes an HTTP request to a specified URL."""
@@ -130,6 +132,7 @@ class HttpRequest(Piece):
         self.params = self.config.get("params", {})
         self.data = self.config.get("data", None) # For POST/PUT/PATCH etc.
         self.timeout = self.config.get("timeout", 30)
+        self.stream_threshold_bytes = self.config.get("stream_threshold_bytes") # None keeps every body in memory
 
     async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Performs the HTTP request using httpx."""
@@ -143,28 +146,34 @@ class HttpRequest(Piece):
         # ... etc.
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.request(
-                    method=self.method,
-                    url=self.url,
+            async with self.use_http_pool() as pool:
+                async with pool.stream(
+                    self.method,
+                    self.url,
                     headers=self.headers,
                     params=self.params,
                     json=self.data if isinstance(self.data, (dict, list)) else None,
-                    data=self.data if isinstance(self.data, (str, bytes)) else None
-                )
-
-                response.raise_for_status() # Raise exception for 4xx/5xx status codes
+                    content=self.data if isinstance(self.data, (str, bytes)) else None,
+                    timeout=self.timeout
+                ) as response:
+                    response.raise_for_status() # Raise exception for 4xx/5xx status codes
+                    # With a threshold, large bodies are written to a file in the run's temporary directory
+                    content, body_path, body_size = await read_body(response, self.stream_threshold_bytes, self.run_temp_dir)
+
+                result = {
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers)
+                }
+                if body_path is not None:
+                    result["body_path"] = body_path
+                    result["body_size"] = body_size
+                    return result
 
                 try:
-                    response_data = response.json()
+                    result["body"] = json.loads(content)
                 except Exception:
-                    response_data = response.text
-
-                return {
-                    "status_code": response.status_code,
-                    "headers": dict(response.headers),
-                    "body": response_data
-                }
+                    result["body"] = content.decode(response.encoding or "utf-8", errors="replace")
+                return result
 
         except httpx.RequestError as e:
             print(f"HTTP Request failed for node {self.node.id}: {e}")
@@ -204,6 +213,11 @@ class HttpRequest(Piece):
                     "type": "integer",
                     "title": "Timeout (seconds)",
                     "default": 30
+                },
+                "stream_threshold_bytes": {
+                    "type": "integer",
+                    "title": "Stream Threshold (bytes)",
+                    "description": "Response bodies larger than this are saved to a temporary file returned as body_path instead of body. The file is deleted when the run finishes. Unset keeps every body in memory."
                 }
             },
             "required": ["url", "method"]
@@ -233,6 +247,8 @@ class HttpRequest(Piece):
                 "status_code": {"type": "integer", "title": "Status Code"},
                 "headers": {"type": "object", "title": "Response Headers"},
                 "body": {"type": ["object", "string"], "title": "Response Body (JSON/Text)"},
+                "body_path": {"type": "string", "title": "Response Body File (large bodies)"},
+                "body_size": {"type": "integer", "title": "Response Body Size (bytes)"},
                 "error": {"type": "string", "title": "Error Message"}
             }
         }
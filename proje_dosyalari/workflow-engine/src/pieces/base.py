@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator
 from ..models.workflow import Node
+from ..engine.http_pool import HttpClientPool
 
 class Piece(ABC):
     """Base class for all workflow pieces (nodes)."""
@@ -8,6 +10,17 @@ class Piece(ABC):
     def __init__(self, node: Node):
         self.node = node
         self.config = node.config
+        self.http_pool: HttpClientPool | None = None # Injected by the executor from the registry
+        self.run_temp_dir: str | None = None # Injected by the executor; deleted when the run finishes
+
+    @asynccontextmanager
+    async def use_http_pool(self) -> AsyncIterator[HttpClientPool]:
+        """Yields the engine's shared HTTP pool, or a pool for this execution only when none was injected."""
+        if self.http_pool is not None:
+            yield self.http_pool
+        else:
+            async with HttpClientPool() as pool:
+                yield pool
 
     @abstractmethod
     async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
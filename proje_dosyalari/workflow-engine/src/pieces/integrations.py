@@ -21,9 +21,9 @@ class AiOrchestrator(Piece):
         print(f"Executing AiOrchestrator for node {self.node.id} to {target_url}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self.use_http_pool() as pool:
                 # Assuming POST request with input_data as JSON body
-                response = await client.post(target_url, json=input_data)
+                response = await pool.request("POST", target_url, json=input_data, timeout=self.timeout)
                 response.raise_for_status()
                 return response.json()
         except httpx.RequestError as e:
@@ -87,9 +87,9 @@ class OsIntegration(Piece):
         print(f"Executing OsIntegration for node {self.node.id} to {target_url}")
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self.use_http_pool() as pool:
                 # Assuming POST request with input_data as JSON body
-                response = await client.post(target_url, json=input_data)
+                response = await pool.request("POST", target_url, json=input_data, timeout=self.timeout)
                 response.raise_for_status()
                 return response.json()
         except httpx.RequestError as e:
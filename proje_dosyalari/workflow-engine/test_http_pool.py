@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+import asyncio
+import os
+import tempfile
+import logging
+
+import httpx
+import pytest
+
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.engine.executor import WorkflowExecutor
+from src.engine.http_pool import HttpClientPool
+from src.engine.registry import PieceRegistry
+from src.models.db_models import Base, WorkflowDefinitionDB, WorkflowRunDB
+from src.models.workflow import WorkflowDefinition, WorkflowRun, Node, NodeType, WorkflowStatus
+from src.pieces.actions import HttpRequest
+
+logging.basicConfig(level=logging.WARNING)
+
+def make_pool(handler, **kwargs) -> HttpClientPool:
+    return HttpClientPool(transport=httpx.MockTransport(handler), backoff=0.001, **kwargs)
+
+@pytest.mark.asyncio
+async def test_retries_idempotent_requests_only():
+    """GETs are retried on 503, POSTs only when the connection failed."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if request.method == "POST" and calls.count("POST") == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(503 if len(calls) < 3 else 200)
+
+    async with make_pool(handler, max_retries=2) as pool:
+        response = await pool.request("GET", "http://svc/a")
+        assert response.status_code == 200
+        assert calls == ["GET"] * 3
+
+        calls.clear()
+        response = await pool.request("POST", "http://svc/b", json={})
+        # Connect error retried, 503 returned as is
+        assert response.status_code == 503
+        assert calls == ["POST", "POST"]
+
+@pytest.mark.asyncio
+async def test_per_host_limit():
+    """In-flight requests are capped per host, not across hosts."""
+    active = {}
+    peak = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        active[host] = active.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), active[host])
+        await asyncio.sleep(0.01)
+        active[host] -= 1
+        return httpx.Response(200)
+
+    async with make_pool(handler, max_connections_per_host=2) as pool:
+        await asyncio.gather(*(pool.request("GET", f"http://{host}/") for host in ["a", "b"] * 5))
+    assert peak == {"a": 2, "b": 2}
+
+@pytest.mark.asyncio
+async def test_http_request_piece_uses_pool_and_streams_large_bodies():
+    """The piece parses JSON bodies, keeps large bodies in memory by default and saves them to a file on request."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/big":
+            return httpx.Response(200, content=b"x" * 5000)
+        return httpx.Response(200, json={"ok": True})
+
+    async with make_pool(handler) as pool:
+        small = HttpRequest(Node(id="small", type=NodeType.ACTION, piece_type="http_request",
+                                 config={"url": "http://svc/small"}))
+        small.http_pool = pool
+        assert (await small.execute({}))["body"] == {"ok": True}
+
+        in_memory = HttpRequest(Node(id="in_memory", type=NodeType.ACTION, piece_type="http_request",
+                                     config={"url": "http://svc/big"}))
+        in_memory.http_pool = pool
+        result = await in_memory.execute({})
+        assert result["body"] == "x" * 5000
+        assert "body_path" not in result
+
+        with tempfile.TemporaryDirectory() as run_temp_dir:
+            big = HttpRequest(Node(id="big", type=NodeType.ACTION, piece_type="http_request",
+                                   config={"url": "http://svc/big", "stream_threshold_bytes": 1024}))
+            big.http_pool = pool
+            big.run_temp_dir = run_temp_dir
+            result = await big.execute({})
+            assert "body" not in result
+            assert result["body_size"] == 5000
+            assert os.path.dirname(result["body_path"]) == run_temp_dir
+            with open(result["body_path"], "rb") as body_file:
+                assert body_file.read() == b"x" * 5000
+
+@pytest.mark.asyncio
+async def test_spilled_bodies_are_deleted_when_run_finishes():
+    """Files written for body_path live in the run's temporary directory and are removed once it ends."""
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"x" * 5000)
+
+    registry = PieceRegistry()
+    registry.register("http_request", HttpRequest)
+    node = Node(id="big", type=NodeType.ACTION, piece_type="http_request",
+                config={"url": "http://svc/big", "stream_threshold_bytes": 1024})
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'wf.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)()
+        wf_def = WorkflowDefinition(id="wf", name="Spill", nodes=[node], edges=[])
+        session.add(WorkflowDefinitionDB(id=wf_def.id, name=wf_def.name, nodes=[], edges=[], version=1))
+        wf_run = WorkflowRun(id="run", workflow_id=wf_def.id, workflow_version=1)
+        session.add(WorkflowRunDB(id=wf_run.id, workflow_id=wf_def.id, workflow_version=1,
+                                  status=WorkflowStatus.IDLE, node_states={}, node_outputs={}))
+        await session.commit()
+
+        async with make_pool(handler) as pool:
+            registry.http_pool = pool
+            executor = WorkflowExecutor(wf_def, wf_run, registry, session)
+            await executor.execute()
+        await session.close()
+        await engine.dispose()
+
+    assert wf_run.status == WorkflowStatus.COMPLETED
+    body_path = wf_run.node_outputs["big"]["body_path"]
+    assert os.path.dirname(body_path) == executor.temp_dir
+    assert not os.path.exists(body_path)
+    assert not os.path.exists(executor.temp_dir)
+
+if __name__ == "__main__":
+    asyncio.run(test_retries_idempotent_requests_only())
+    asyncio.run(test_per_host_limit())
+    asyncio.run(test_http_request_piece_uses_pool_and_streams_large_bodies())
+    asyncio.run(test_spilled_bodies_are_deleted_when_run_finishes())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+import asyncio
+import os
+import tempfile
+import logging
+from collections import Counter
+from typing import Dict, Any, List
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from src.models.db_models import Base, WorkflowDefinitionDB, WorkflowRunDB
+from src.models.workflow import WorkflowDefinition, WorkflowRun, Node, Edge, NodeType, WorkflowStatus, NodeStatus
+from src.engine.executor import WorkflowExecutor
+from src.engine.registry import PieceRegistry
+from src.pieces.base import Piece
+
+logging.basicConfig(level=logging.WARNING)
+
+started: List[str] = []
+running = Counter()
+max_running = Counter()
+
+class TrackingPiece(Piece):
+    """Records start order and the peak number of concurrent executions per piece type."""
+    async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        started.append(self.node.id)
+        running[self.node.piece_type] += 1
+        max_running[self.node.piece_type] = max(max_running[self.node.piece_type], running[self.node.piece_type])
+        try:
+            await asyncio.sleep(0.01)
+            if self.node.config.get("fail"):
+                raise ValueError("boom")
+            return {self.node.id: True}
+        finally:
+            running[self.node.piece_type] -= 1
+
+def make_registry() -> PieceRegistry:
+    registry = PieceRegistry()
+    for piece_type in ("fast", "slow"):
+        registry.register(piece_type, TrackingPiece)
+    return registry
+
+async def run_workflow(nodes: List[Node], edges: List[Edge], **executor_kwargs) -> tuple[WorkflowRun, WorkflowExecutor]:
+    """Runs a workflow on a fresh SQLite database and returns the run."""
+    started.clear()
+    running.clear()
+    max_running.clear()
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmp, 'wf.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)()
+        wf_def = WorkflowDefinition(id="wf", name="Scheduler", nodes=nodes, edges=edges)
+        session.add(WorkflowDefinitionDB(id=wf_def.id, name=wf_def.name, nodes=[], edges=[], version=1))
+        wf_run = WorkflowRun(id="run", workflow_id=wf_def.id, workflow_version=1)
+        session.add(WorkflowRunDB(id=wf_run.id, workflow_id=wf_def.id, workflow_version=1,
+                                  status=WorkflowStatus.IDLE, node_states={}, node_outputs={}))
+        await session.commit()
+
+        executor = WorkflowExecutor(wf_def, wf_run, make_registry(), session, state_flush_interval=0.05, **executor_kwargs)
+        await executor.execute()
+        await session.close()
+        await engine.dispose()
+    return wf_run, executor
+
+@pytest.mark.asyncio
+async def test_longest_path_starts_first():
+    """With one slot, the ready node heading the longest chain runs before short branches."""
+    nodes = [Node(id=node_id, type=NodeType.ACTION, piece_type="fast") for node_id in ("short", "long", "l1", "l2")]
+    edges = [Edge(id="e1", source_node_id="long", target_node_id="l1"),
+             Edge(id="e2", source_node_id="l1", target_node_id="l2")]
+    wf_run, executor = await run_workflow(nodes, edges, max_concurrent_nodes=1)
+
+    assert wf_run.status == WorkflowStatus.COMPLETED
+    assert executor.critical_path_length == {"short": 1, "long": 3, "l1": 2, "l2": 1}
+    # "short" and "l2" tie once "l1" has run
+    assert started[:2] == ["long", "l1"]
+
+@pytest.mark.asyncio
+async def test_piece_concurrency_limits():
+    """Per-piece limits cap concurrency of that type without holding back other types."""
+    nodes = [Node(id="start", type=NodeType.TRIGGER, piece_type="fast")]
+    nodes += [Node(id=f"s{i}", type=NodeType.ACTION, piece_type="slow") for i in range(6)]
+    nodes += [Node(id=f"f{i}", type=NodeType.ACTION, piece_type="fast") for i in range(6)]
+    edges = [Edge(id=f"e{node.id}", source_node_id="start", target_node_id=node.id) for node in nodes[1:]]
+    wf_run, _ = await run_workflow(nodes, edges, max_concurrent_nodes=8, piece_concurrency_limits={"slow": 2})
+
+    assert wf_run.status == WorkflowStatus.COMPLETED
+    assert max_running["slow"] == 2
+    assert max_running["fast"] == 6
+    assert len(started) == 13
+
+@pytest.mark.asyncio
+async def test_failure_stops_scheduling():
+    """A failing node fails the run and its successors never start."""
+    nodes = [Node(id="a", type=NodeType.ACTION, piece_type="fast", config={"fail": True, "max_retries": 0}),
+             Node(id="b", type=NodeType.ACTION, piece_type="fast")]
+    edges = [Edge(id="e1", source_node_id="a", target_node_id="b")]
+    wf_run, _ = await run_workflow(nodes, edges)
+
+    assert wf_run.status == WorkflowStatus.FAILED
+    assert wf_run.node_states["a"] == NodeStatus.FAILED
+    assert "b" not in started
+
+if __name__ == "__main__":
+    asyncio.run(test_longest_path_starts_first())
+    asyncio.run(test_piece_concurrency_limits())
+    asyncio.run(test_failure_stops_scheduling())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+import asyncio
+import os
+import tempfile
+import logging
+from typing import Dict, Any
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.future import select
+
+from src.models.db_models import Base, WorkflowDefinitionDB, WorkflowRunDB, WorkflowRunNodeStateDB
+from src.models.workflow import WorkflowDefinition, WorkflowRun, Node, Edge, NodeType, WorkflowStatus, NodeStatus
+from src.engine.executor import WorkflowExecutor
+from src.engine.registry import PieceRegistry
+from src.engine.state_store import RunStateStore, load_run_snapshot
+from src.pieces.base import Piece
+
+logging.basicConfig(level=logging.WARNING)
+
+class EchoPiece(Piece):
+    async def execute(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0.01)
+        return {self.node.id: True, **inputs}
+
+async def create_session(db_path: str) -> AsyncSession:
+    """Creates a session on a fresh SQLite database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)()
+
+async def create_run(session: AsyncSession, width: int) -> tuple[WorkflowDefinition, WorkflowRun]:
+    """Creates a start -> width parallel nodes -> end workflow and a run record."""
+    nodes = [Node(id="start", type=NodeType.TRIGGER, piece_type="echo")]
+    nodes += [Node(id=f"n{i}", type=NodeType.ACTION, piece_type="echo") for i in range(width)]
+    nodes.append(Node(id="end", type=NodeType.ACTION, piece_type="echo"))
+    edges = [Edge(id=f"a{i}", source_node_id="start", target_node_id=f"n{i}") for i in range(width)]
+    edges += [Edge(id=f"b{i}", source_node_id=f"n{i}", target_node_id="end") for i in range(width)]
+    wf_def = WorkflowDefinition(id="wf", name="Wide", nodes=nodes, edges=edges)
+    session.add(WorkflowDefinitionDB(id=wf_def.id, name=wf_def.name, nodes=[], edges=[], version=1))
+    wf_run = WorkflowRun(id="run", workflow_id=wf_def.id, workflow_version=1, trigger_data={"x": 1})
+    session.add(WorkflowRunDB(id=wf_run.id, workflow_id=wf_def.id, workflow_version=1,
+                              status=WorkflowStatus.IDLE, node_states={}, node_outputs={}))
+    await session.commit()
+    return wf_def, wf_run
+
+@pytest.mark.asyncio
+async def test_executor_batches_node_state_writes():
+    """Node states end up in the node state table and on the run row with few commits."""
+    registry = PieceRegistry()
+    registry.register("echo", EchoPiece)
+    with tempfile.TemporaryDirectory() as tmp:
+        session = await create_session(os.path.join(tmp, "wf.db"))
+        wf_def, wf_run = await create_run(session, width=20)
+
+        executor = WorkflowExecutor(wf_def, wf_run, registry, session, state_flush_interval=0.05)
+        await executor.execute()
+
+        assert wf_run.status == WorkflowStatus.COMPLETED
+        # 22 nodes x 3 transitions would be 66 commits when written one by one
+        assert executor.state_store.commits < 30
+
+        rows = (await session.execute(select(WorkflowRunNodeStateDB))).scalars().all()
+        assert len(rows) == 22
+        assert all(row.status == NodeStatus.COMPLETED for row in rows)
+
+        snapshot = await load_run_snapshot(session, "run")
+        assert snapshot.status == WorkflowStatus.COMPLETED
+        assert snapshot.node_states["end"] == NodeStatus.COMPLETED
+        assert snapshot.node_outputs["end"]["n19"] is True
+        assert snapshot.node_outputs["end"]["x"] == 1
+
+        db_run = await session.get(WorkflowRunDB, "run")
+        assert db_run.node_states["n0"] == NodeStatus.COMPLETED
+        await session.close()
+
+@pytest.mark.asyncio
+async def test_store_writes_only_changed_nodes():
+    """Each flush writes the nodes changed since the previous one, in one commit."""
+    with tempfile.TemporaryDirectory() as tmp:
+        session = await create_session(os.path.join(tmp, "wf.db"))
+        await create_run(session, width=1)
+        store = RunStateStore(session, "run", flush_interval=0)
+
+        store.record("a", NodeStatus.RUNNING)
+        store.record("b", NodeStatus.PENDING)
+        await store.flush()
+        store.record("a", NodeStatus.COMPLETED, {"value": 1})
+        await store.flush({"status": WorkflowStatus.RUNNING})
+        await store.flush()
+
+        assert store.commits == 2
+        assert store.rows_written == 3
+        snapshot = await load_run_snapshot(session, "run")
+        assert snapshot.status == WorkflowStatus.RUNNING
+        assert snapshot.node_states == {"a": NodeStatus.COMPLETED, "b": NodeStatus.PENDING}
+        assert snapshot.node_outputs == {"a": {"value": 1}}
+        await session.close()
+
+if __name__ == "__main__":
+    asyncio.run(test_executor_batches_node_state_writes())
+    asyncio.run(test_store_writes_only_changed_nodes())